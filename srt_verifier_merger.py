@@ -13,7 +13,6 @@ import tkinter as tk
 from datetime import datetime
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
-import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Set, Callable
 
@@ -45,18 +44,89 @@ try:
 except (OSError, AttributeError):
     _HAS_IMM = False
 
-try:
-    from google import genai
-    from google.genai import types as genai_types
-    _HAS_GEMINI = True
-except ImportError:
-    genai = None
-    genai_types = None
-    _HAS_GEMINI = False
+# GUI 독립 코어 (파싱·병합·QA·번역 엔진) — tkinter 의존성 없음
+from subbridge.align import align_translation_lines
+from subbridge.cassette import default_cassette_path
+from subbridge.constants import (
+    AI_MODEL_AUTO,
+    AI_MODEL_FALLBACKS,
+    AI_MODEL_IDS,
+    AI_TRANSLATE_EMPTY_PLACEHOLDER,
+    BATCH_CHUNK_SIZE,
+    GLOSSARY_PROMPT_MAX_TERMS,
+    LANG_OPTIONS,
+    PROVENANCE_AI,
+    PROVENANCE_MANUAL,
+    PROVENANCE_NONE,
+    PROVENANCE_TXT,
+    QA_REPLACEMENT_CHAR,
+)
+from subbridge.encoding import AUTO_ENCODING, encoding_label
+from subbridge.fake_client import fake_client_spec
+from subbridge.fanout import (
+    FANOUT_DEFAULT_CONCURRENCY,
+    FanoutResult,
+    FanoutTarget,
+    LanguageResult,
+    merged_srt_name,
+    translate_fanout,
+)
+from subbridge.glossary import (
+    GlossaryMatcher,
+    glossary_dict_to_text as _glossary_dict_to_text,
+    glossary_text_to_dict as _glossary_text_to_dict,
+)
+from subbridge.glossary_io import (
+    CONFLICT_KEEP,
+    CONFLICT_OVERWRITE,
+    export_glossary,
+    format_import_report,
+    import_glossary,
+)
+from subbridge.glossary_store import SEARCH_PREFIX, SEARCH_SUBSTRING, GlossaryStore
+from subbridge.parse_cache import ParseCache, ParsedFile
+from subbridge.paths import BASE_DIR, CASSETTE_DIR
+from subbridge.progress import JobProgress, format_eta, format_progress
+from subbridge.project import (
+    AUTOSAVE_PROJECT_PATH,
+    PROJECT_EXTENSION,
+    ProjectWriter,
+    glossary_version,
+    load_project,
+)
+from subbridge.qa import (
+    DEFAULT_QA_PROFILE_NAME,
+    QA_PROFILE_NAMES,
+    QAIssue,
+    evaluate_qa,
+    get_qa_profile,
+    is_warning_text,
+    run_qa_checks as _run_qa_checks,
+)
+from subbridge.recut import carry_over_translations
+from subbridge.reflow import reflow_rows
+from subbridge.selectors import ROW_PREDICATES, match_row_predicates
+from subbridge.srt import merge_data, search_rows
+from subbridge.stats import StatsManager
+from subbridge import tracing
+from subbridge.timecode import FPS_PRESETS, TimecodeTable, format_ms, parse_time_ms
+from subbridge.translation import (
+    TranslationEngine,
+    is_gemini_available,
+    map_translation_response_lines as _map_translation_response_lines,
+    parse_json_translation_response as _parse_json_translation_response,
+    translate_chunk_single_fallback as _translate_chunk_single_fallback,
+)
+from subbridge.usage import TokenUsage, estimate_cost, format_usage
+from subbridge.writer import write_srt, write_txt
 
 # 설정 파일 경로 (언어 선택 저장) — exe 실행 시 exe와 같은 폴더에 저장
-_base_dir = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).resolve().parent
+_base_dir = BASE_DIR
 PREFS_PATH = _base_dir / "settings.json"
+# 이 행 수 이상을 저장할 때만 상태바에 진행률 표시
+WRITE_PROGRESS_MIN_ROWS = 20000
+# 프로젝트 자동 저장 지연 (마지막 변경 후 이 시간 동안 추가 변경이 없으면 기록)
+AUTOSAVE_DELAY_MS = 1500
 GLOSSARY_PATH = _base_dir / "glossary.json"
 README_PATH = _base_dir / "readme.txt"
 # Gemini API 키를 읽을 .env 후보 (배포 exe에서는 exe 폴더만 사용, 개발 시에만 GEMINI_ENV_PATH 추가)
@@ -71,15 +141,21 @@ _ICON_PNG_CANDIDATES = ("icon.png", "Gemini_Generated_Image_28x0ow28x0ow28x0.png
 MANUAL_SIMPLE = """SRT 자막 검수 및 병합 도구 (SubBridge)
 • 원본 SRT 열기: 자막 파일 로드
 • 추출하기: 원본 텍스트만 TXT로 저장 (언어 코드 선택)
-• 번역 TXT 열기: 번역문 로드 후 3번째 컬럼에 매칭
+• 번역 TXT 열기: 번역문 로드 후 3번째 컬럼에 매칭 (줄이 빠지거나 늘어도 내용 기준으로 맞춤, 애매한 행은 주황색)
 • AI 번역하기: Gemini API로 선택 구간 또는 전체 자동 번역 (범위 입력 또는 [모두 번역] 체크)
+• 조건 재번역: 빈 칸·<빈줄>·[통신 오류]·QA 위반·용어집 미준수 행만 골라 다시 번역
+• 여러 언어 번역: 고른 언어마다 전체를 한 번에 번역해 언어별 SRT 저장 (언어별 용어집)
 • 용어집 설정: 원본:번역 형식 용어집으로 번역 결과 고정
 • 병합하기: 타임코드+번역문으로 새 SRT 저장
+• 타임코드 조정: 전체 이동(ms) / FPS 변환(23.976↔25 등) / 2점 싱크 맞춤
+• 프로젝트 저장/열기: 번역·수정 내용을 .sbproj로 저장, 작업은 자동 저장되어 다음 실행 시 복원
 • 글자 크기: 상단 우측 5단계 (저장됨)
 • 번역 셀 더블클릭: 번역 열만 수정 가능, 병합 시 반영
 • 검색: Ctrl+F → 검색창, 원본/번역 모두 검색
-• 검토 필요 찾기: 45자 초과 또는 "빈줄" 항목을 순차 이동하며 검토
-• 주황색 강조: 45자 초과 / "빈줄" 포함 번역 텍스트 자동 표시
+• QA 기준: 기본(45자) / 스트리밍 / 방송 / CJK — 줄 길이·줄 수·CPS·표시 시간·간격 기준 (저장됨)
+• 줄 맞춤: 글자 수·줄 수 초과 번역을 API 없이 자동 줄 나눔, 안 되는 행만 AI 줄이기 일괄 요청
+• 검토 필요 찾기: QA 기준 위반 또는 "빈줄" 항목을 순차 이동하며 검토 (상태바에 위반 사유 표시)
+• 주황색 강조: QA 기준 위반 / "빈줄" 포함 행 자동 표시
 • 단축키: F4(검토 찾기), F3(용어집), Ctrl+S(병합), Ctrl+Enter(AI번역), ↑↓/PgUp/PgDn(탐색)
 ? 클릭 시 자세한 메뉴얼 표시"""
 
@@ -94,16 +170,62 @@ MANUAL_DETAILED = """■ SRT 자막 검수 및 병합 도구 (SubBridge) — 자
 
 【2. 상단 버튼 및 설정】
   • 원본 SRT 열기: .srt 자막 파일을 엽니다. (컬럼 1: 순번/타임코드, 컬럼 2: 원본 텍스트, 컬럼 3: 번역 텍스트)
+    번역이 있는 상태에서 수정본 SRT를 열면 "번역 이어받기"를 물어봅니다. 원문이 같은 자막은 번역을 그대로 옮기고(타임코드는 새 파일 기준),
+    새로 생기거나 바뀐 자막만 비워 둔 뒤 그 줄만 AI로 번역할지 묻습니다.
+    큰 파일도 불러오는 동안 창이 멈추지 않고, 읽은 자막부터 표에 바로 나타납니다 (하단 진행 바에 진행률 표시).
+    [불러오기 취소 (Esc)]로 멈추면 이전 작업이 그대로 남습니다. 불러오기가 끝날 때까지 편집·번역·병합은 잠시 막힙니다.
+    UTF-8이 아닌 파일(CP949·Shift-JIS·CP1251·UTF-16 등)은 인코딩을 자동으로 알아내 UTF-8로 바꿔 읽고, 알아낸 인코딩을 로그에 남깁니다.
+    글자가 깨진 줄(�)이 있으면 로그에 [경고]로 알리고, 그 줄을 AI 번역하기 전에 한 번 더 묻습니다.
   • 번역 TXT 열기: 번역된 한 줄씩 텍스트를 불러와 컬럼 3에 순서대로 채웁니다.
+    - 줄 수가 SRT 블록 수와 다르거나 중간이 어긋나 보이면, 길이·줄바꿈(<br/>)·숫자·문장 끝 부호(? ! …)를 비교해 줄을 자막에 맞춥니다.
+      빠진 줄은 빈 칸, 남는 줄은 로그에 줄 번호로 남고, 한 자막을 두 줄로 나눈 번역은 <br/>로 합칩니다.
+    - 맞춤이 애매한 행은 "TXT 정렬 신뢰도 낮음"으로 주황색 표시되며(F4로 이동), 직접 고치면 표시가 사라집니다.
+    - 줄 앞에 [[순번]] ID가 있는 TXT(추출하기에서 ID 체크)는 줄 순서와 상관없이 ID로 정확히 매칭합니다.
   • AI 번역하기: Gemini API로 원본 텍스트를 번역합니다.
   • 모두 번역: 체크 시 [번역 범위]에 입력한 시작 번호부터 끝까지 전체를 번역합니다. 체크 해제 시 범위 입력(예: 1-10, 1,3,5)으로 구간만 번역(최대 50개).
+    시작 전 확인 창에 예상 호출 수·토큰·비용(과거 기록 또는 텍스트 길이 기준)이 표시되며, 작업이 끝나면 실제 사용량이 로그에 [Tokens]로 남습니다.
+  • 번역 중 하단 상태바에 완료 줄 수·처리 속도(줄/s)·요청 중 배치 수·폴백 수·남은 시간이 실시간으로 표시됩니다.
+  • 조건 재번역…: 큰 작업 뒤 문제 있는 행만 골라 다시 번역합니다 (50개 제한 없음, 모두 번역과 같은 진행 창·취소).
+    - 조건: 번역 없음(빈 칸) / <빈줄> / [통신 오류] / 글자 수·줄 수 초과 / QA 기준 위반 / 용어집 미준수 (하나라도 해당하면 포함)
+    - "직접 수정한 행은 제외"(기본 켜짐)를 두면 손으로 고친 번역은 덮어쓰지 않습니다.
+    - 조건마다 해당 줄 수와 예상 요청 수가 표시되며, 요청은 고른 줄 수만큼만 나갑니다 (10줄당 1회).
+  • 여러 언어 번역…: 대상 언어를 여러 개 체크하고 저장 폴더를 고르면, 원본 전체를 언어마다 번역해 바로 SRT로 저장합니다.
+    - 파일명은 병합하기와 같습니다: (원본 또는 번역 TXT 파일이름)_(언어코드)(_flash 등).srt  예: video_EN_flash.srt, video_JA_flash.srt
+    - 언어마다 그 언어의 용어집을 씁니다. 모든 언어의 요청을 함께 나눠 보내므로, 전체 시간은 언어 하나를 번역하는 시간에 가깝습니다.
+    - 지금 표의 번역 열은 바뀌지 않습니다. 진행 창에서 취소하면 끝난 언어 파일만 남습니다.
   • 번역 범위: 일반 모드에서는 "1-10" 또는 "1,3,5" 형식. 모두 번역 모드에서는 시작 순번만 입력(예: 1).
   • AI 모델: 자동 또는 고정 모델(gemini-2.5-flash 등) 선택. 저장됩니다.
   • AI 번역 대상 언어: 번역 결과 언어(English, 한국어 등). 병합 파일명에도 반영됩니다.
   • 용어집 설정: "원본단어:번역단어" 한 줄씩 입력하면 AI 번역 시 해당 단어가 지정대로 번역됩니다. 설정 파일에 저장됩니다.
+    - 번역이 끝난 배치마다 원문에 나온 용어가 지정 번역어로 옮겨졌는지 검사합니다. 지키지 않은 행은 작업 끝에 모아 한 번에 다시 요청하고,
+      그래도 남은 행은 "용어집 미준수"로 주황색 표시됩니다 (F4로 이동).
+    - 용어집 창 위쪽 [검색]에 입력하는 대로 목록이 걸러집니다 ("앞부분 일치" 또는 원본·번역 "포함"). 수만 개 용어도 바로 열리고 스크롤됩니다.
+    - 추가/수정·삭제는 누르는 즉시 저장됩니다 (glossary.db). 예전 glossary.json은 처음 실행할 때 자동으로 옮겨집니다.
+    - [가져오기…]: CSV·TSV·TBX 용어 파일을 한 번에 불러옵니다. 열 머리글·언어 코드(English, en, ko-KR, KR 등)로 언어를 나누고,
+      "target"/"번역" 열이나 머리글 없는 2열 파일은 고른 "번역 열 언어"로 들어갑니다. [미리 보기]로 추가·수정·충돌 수를 먼저 확인하고,
+      이미 있는 단어의 번역이 다를 때 "기존 유지" 또는 "덮어쓰기"를 고릅니다.
+    - [내보내기…]: 모든 언어 용어집을 CSV·TSV·TBX 한 파일로 저장합니다 (원본 열 + 언어별 열).
   • 추출하기: 원본 텍스트만 TXT로 저장. 오른쪽 언어 선택에 따라 파일명에 _EN, _KR 등이 붙습니다.
+    [ID]를 체크하면 줄마다 "[[12]] 텍스트"처럼 순번 ID를 붙입니다. 외부 번역 도구에서 ID를 지우지 않으면 다시 불러올 때 줄이 밀리지 않습니다.
   • 언어 선택: 추출 시 파일명에 붙을 언어 코드(EN, RU, KR 등). 저장됩니다.
   • 병합하기(Merge): 컬럼 1(타임코드)과 컬럼 3(번역)을 합쳐 새 .srt 파일로 저장합니다.
+  • 타임코드 조정: 모든 자막의 타이밍을 한 번에 바꿉니다. 병합 시 조정된 타임코드로 저장됩니다.
+    - 전체 이동: 밀리초 단위로 앞(-)/뒤(+)로 이동 (예: 1500, -500)
+    - FPS 변환: 원본 fps → 대상 fps (예: 23.976 → 25)
+    - 2점 싱크: 앞쪽·뒤쪽 기준 순번의 올바른 시작 시간(00:01:02,500)을 입력하면 그 사이를 비례 보정
+    - 적용 후 겹치는 자막 수를 로그에 표시합니다.
+  • QA 기준: 검수 기준(클라이언트 프로필)을 선택합니다. 저장됩니다.
+    - 기본 (45자): 한 줄 45자 초과·"빈줄"·깨진 문자만 검사 (기존 동작)
+    - 스트리밍 / 방송 / CJK: 한 줄 글자 수, 최대 줄 수(2줄), 읽기 속도(CPS, 초당 글자 수),
+      최소·최대 표시 시간, 다음 자막과의 최소 간격, 자막 겹침까지 검사
+    - 글자 수는 <i> 등 서식 태그를 제외하고 셉니다. 기준을 바꾸면 전체 행을 즉시 다시 검사합니다.
+  • 줄 맞춤: 현재 QA 기준의 글자 수·줄 수를 넘는 번역문을 한 번에 다시 나눕니다 (API 호출 없음).
+    - 줄 길이가 최대한 고르게 되도록 <br/> 위치를 정하고, 최대 2줄(또는 QA 기준의 줄 수)까지 나눕니다.
+    - 중국어·일본어는 글자 사이에서 나누되 。、」 등은 줄 첫머리에, 「（ 등은 줄 끝에 오지 않게 합니다.
+      한국어·태국어·영어 등은 띄어쓰기 위치에서만 나눕니다.
+    - 줄 나눔만으로 해결되지 않는 행이 있으면, 확인 후 AI에 묶어서 한 번에 문장 줄이기를 요청합니다.
+  • 프로젝트 저장 / 프로젝트 열기: 현재 작업(타임코드·원본·번역, AI/직접 수정 구분, 원본 경로, 모델)을 .sbproj 파일로 저장·복원합니다.
+    - 작업 내용은 변경 1.5초 뒤 자동 저장되며(저장한 프로젝트가 없으면 autosave.sbproj), 프로그램을 다시 켜면 마지막 작업이 바로 복원됩니다.
   • 글자 크기: 뷰어 표 글자 크기 5단계(매우 작게·작게·보통·크게·매우 크게). 저장됩니다.
 
 【3. 중단 표(검수 뷰어)】
@@ -112,20 +234,24 @@ MANUAL_DETAILED = """■ SRT 자막 검수 및 병합 도구 (SubBridge) — 자
   • 스크롤 가능, 홀/짝 행 색 구분.
   • SRT 블록 수와 TXT 줄 수가 다르면 경고 후에도 로드되며, 화면에서 어긋난 부분을 확인할 수 있습니다.
   • 번역 텍스트 직접 수정: [번역 텍스트] 열 셀 더블클릭 → 입력창에서 수정. Enter 또는 다른 곳 클릭으로 저장, Esc로 취소. 병합 시 반영됩니다.
-  • 주황색 강조 표시: 번역 텍스트가 45자를 초과하거나 "빈줄"을 포함하면 해당 행이 주황색으로 표시됩니다.
+  • 주황색 강조 표시: 선택한 QA 기준을 위반하거나(기본: 45자 초과) "빈줄"을 포함하면 해당 행이 주황색으로 표시됩니다.
     수정 후 조건이 해소되면 자동으로 기본 색상으로 복원됩니다.
 
 【4. 하단 검색 및 검토 필요 찾기】
   • 검색창에 단어 입력 후 [찾기(Find)] 또는 Enter: 원본·번역 양쪽에서 검색, 다음 결과로 이동.
   • Ctrl+F: 검색 입력창으로 포커스 이동.
-  • 검토 필요 찾기 (총 N건): 45자 초과 또는 "빈줄" 포함 항목의 개수를 실시간으로 표시합니다.
+  • 검토 필요 찾기 (총 N건): QA 기준 위반 또는 "빈줄" 포함 항목의 개수를 실시간으로 표시합니다.
     버튼 클릭 시 다음 경고 항목으로 자동 이동하며, 마지막 항목 이후 처음으로 되돌아갑니다.
+    이동한 항목의 위반 사유(예: 읽기 속도 초과.(23.5CPS > 20))가 상태바에 표시됩니다.
     항목이 0건이면 버튼이 비활성화됩니다. 번역·편집·파일 로드 시 카운트가 자동 갱신됩니다.
 
 【5. 작업 내용 로그】
   • 상단 [작업 내용] 체크박스를 켜면 로그 창이 표시됩니다.
   • 45자 초과 경고는 번역 중 발생 즉시 실시간으로 로그에 출력됩니다.
     형식: [경고] Line {번호} 45자 초과.(길이:{실제글자수}자)
+  • 로그 창 상단 [트레이스 기록]을 켜면 번역·파일 로드·병합 등 작업 구간 시간이 기록되고,
+    [트레이스 저장]으로 JSON 파일로 저장할 수 있습니다 (성능 문제 보고용, ui.perfetto.dev에서 열기).
+  • 선택한 QA 기준의 줄 수·CPS·표시 시간 위반도 배치마다 [경고] Line {번호} ... 형식으로 출력됩니다.
 
 【6. 단축키】
   • F4: 검토 필요 찾기 (다음 경고 항목으로 이동)
@@ -135,6 +261,7 @@ MANUAL_DETAILED = """■ SRT 자막 검수 및 병합 도구 (SubBridge) — 자
   • Ctrl+F: 검색 입력창 포커스
   • ↑/↓: Treeview 항목 위/아래 이동
   • Page Up/Down: 20행 단위 페이지 이동
+  • Esc: 파일 불러오기 취소
 
 【7. 기본 파일명】
   • 추출: (원본 SRT 파일이름)_(언어코드).txt  예: video_KR.txt
@@ -223,35 +350,12 @@ MAX_LOG_LIMIT = 500
 PRUNE_COUNT = 100
 LOG_HISTORY_PATH = _base_dir / "log_history.json"
 
-# AI 번역 배치 크기 (한 번에 API에 보낼 최대 블록 수). 10줄 단위 청크로 순번 동기화 강제
-BATCH_CHUNK_SIZE = 10
 # 구간 번역 시에도 동일한 청크 크기 사용 (레거시 호환용 이름 유지)
 AI_TRANSLATE_BATCH_SIZE = BATCH_CHUNK_SIZE
 # 번역 구간 지정 시 한 번에 최대 개수
 AI_TRANSLATE_RANGE_MAX = 50
 # 번역 범위 입력 placeholder
 TRANSLATE_RANGE_PLACEHOLDER = "예: 1-10 또는 1,3,5 (최대 50개)"
-# AI 번역 결과가 빈 줄/내용 없을 때 표시 (라인 밀림 방지)
-AI_TRANSLATE_EMPTY_PLACEHOLDER = "<빈줄>"
-# QA: 번역 텍스트 한 줄당 최대 글자 수 (초과 시 경고)
-QA_MAX_CHARS = 45
-# 유니코드 대체 문자 (인코딩 깨짐 표시)
-QA_REPLACEMENT_CHAR = "\uFFFD"
-
-
-# 언어 옵션: (코드, 표시명) — 1.영어 2.러시아어 3.한국어, 이하 사용량 순
-LANG_OPTIONS: List[Tuple[str, str]] = [
-    ("EN", "English"),
-    ("RU", "Русский"),
-    ("KR", "한국어"),
-    ("ZH", "中文"),
-    ("ES", "Español"),
-    ("JA", "日本語"),
-    ("FR", "Français"),
-    ("DE", "Deutsch"),
-    ("PT", "Português"),
-    ("AR", "العربية"),
-]
 
 # 뷰어 글자 크기 옵션: (표시명, pt)
 FONT_SIZE_OPTIONS: List[Tuple[str, int]] = [
@@ -266,11 +370,6 @@ FONT_ROWHEIGHT: Dict[int, int] = {9: 24, 10: 26, 11: 28, 13: 32, 16: 38}
 # 폰트 크기별 첫 번째 열(순번/타임코드) 고정 너비 (텍스트 잘리지 않게)
 FONT_COLUMN_WIDTH: Dict[int, int] = {9: 180, 10: 210, 11: 250, 13: 320, 16: 400}
 
-# AI 번역 모델 옵션 (Google AI Studio 텍스트 출력 모델 기준) — "자동"은 API 목록에서 첫 사용 가능 모델 사용
-AI_MODEL_AUTO = "자동"
-AI_MODEL_FALLBACKS = ("gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.5-flash-lite")
-AI_MODEL_IDS: List[str] = [AI_MODEL_AUTO, *AI_MODEL_FALLBACKS]
-
 # 모델 ID → UI 표시명 (품질 제외)
 MODEL_ID_TO_DISPLAY_NAME: Dict[str, str] = {
     "gemini-2.5-pro": "Gemini 2.5 Pro",
@@ -286,26 +385,6 @@ MODEL_QUALITY: Dict[str, str] = {
 }
 
 
-def _glossary_dict_to_text(d: Dict[str, str]) -> str:
-    """용어집 딕셔너리를 '원본:번역' 한 줄씩 텍스트로 변환."""
-    return "\n".join(f"{k}:{v}" for k, v in (d or {}).items() if (k or "").strip())
-
-
-def _glossary_text_to_dict(text: str) -> Dict[str, str]:
-    """'원본:번역' 형식 텍스트를 딕셔너리로 파싱."""
-    result: Dict[str, str] = {}
-    for line in (text or "").strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        if ":" in line:
-            k, _, v = line.partition(":")
-            key = k.strip()
-            if key:
-                result[key] = v.strip()
-    return result
-
-
 def _model_quality_for_id(model_id: str) -> str:
     """모델 ID에 해당하는 품질 등급 반환."""
     return MODEL_QUALITY.get(model_id, "-")
@@ -320,9 +399,6 @@ FONT_LABELS: List[str] = [label for label, _ in FONT_SIZE_OPTIONS]
 DEFAULT_FONT_LABEL = "보통"
 DEFAULT_FONT_PT = 11
 
-# 모델별 성능 데이터 영구 저장 경로
-MODEL_PERF_PATH = _base_dir / "model_performance.json"
-
 # 로그 창 글자 크기 기본값 (메인 프로그램과 별도)
 LOG_FONT_DEFAULT_LABEL = "작게"
 LOG_FONT_DEFAULT_PT = 10
@@ -343,121 +419,7 @@ LOG_HIGHLIGHT_PATTERNS = (
 )
 
 
-class StatsManager:
-    """모델별 번역 성능 데이터를 영구 저장하고 평균 속도를 계산한다."""
-
-    def __init__(self, path: Path = MODEL_PERF_PATH):
-        self._path = path
-        self._data: Dict[str, Dict[str, float]] = {}
-        self._load()
-
-    # ── 내부 I/O ──
-
-    def _load(self) -> None:
-        if self._path.exists():
-            try:
-                self._data = json.loads(self._path.read_text(encoding="utf-8"))
-            except Exception:
-                self._data = {}
-
-    def _save(self) -> None:
-        try:
-            self._path.write_text(
-                json.dumps(self._data, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-        except Exception:
-            pass
-
-    # ── 공개 API ──
-
-    def accumulate(self, model: str, elapsed_seconds: float, items: int) -> None:
-        """번역 완료 시 소요 시간과 처리 개수를 누적 합산한다."""
-        if not model or items <= 0 or elapsed_seconds <= 0:
-            return
-        if model not in self._data:
-            self._data[model] = {"total_time": 0.0, "total_items": 0}
-        self._data[model]["total_time"] += round(elapsed_seconds, 3)
-        self._data[model]["total_items"] += items
-        self._save()
-
-    def get_average(self, model: str) -> Optional[Tuple[float, int]]:
-        """(평균 초/개, 누적 총 개수) 반환. 데이터 없으면 None."""
-        entry = self._data.get(model)
-        if not entry or entry.get("total_items", 0) <= 0:
-            return None
-        avg = entry["total_time"] / entry["total_items"]
-        return (round(avg, 2), int(entry["total_items"]))
-
-
-# --- 데이터 계층 (UI와 로직 분리) --------------------------------------------
-
-def parse_srt(content: str) -> List[Dict[str, Any]]:
-    """
-    SRT 내용을 파싱하여 블록 리스트 반환.
-    각 블록: {"index": int, "timecode": str, "original": str}
-    """
-    # UTF-8 BOM 제거 (BOM이 있으면 첫 블록의 index가 '\ufeff1'이 되어 파싱 실패)
-    content = content.lstrip("\ufeff")
-    blocks = []
-    # 빈 줄 기준으로 블록 분리 (연속 빈 줄도 처리)
-    raw_blocks = re.split(r'\n\s*\n', content.strip())
-    for raw in raw_blocks:
-        # 줄 단위로 분리 시 \r 제거 (Windows 줄바꿈)
-        lines = [ln.strip().replace("\r", "") for ln in raw.strip().split("\n") if ln.strip()]
-        if len(lines) < 2:
-            continue
-        try:
-            index = int(lines[0])
-        except ValueError:
-            continue
-        # 두 번째 줄: 타임코드 (00:00:00,000 --> 00:00:00,000)
-        timecode = lines[1]
-        text = '\n'.join(lines[2:]) if len(lines) > 2 else ''
-        # 자막 내용의 줄바꿈을 <br/>로 치환 (추출/뷰어에서 한 줄로 통일)
-        text = text.replace("\n", "<br/>")
-        blocks.append({
-            "index": index,
-            "timecode": timecode,
-            "original": text,
-        })
-    return blocks
-
-
-def parse_txt_lines(content: str) -> List[str]:
-    """TXT 파일 내용을 줄 단위 리스트로 반환 (strip 적용)."""
-    return [ln.strip() for ln in content.strip().split('\n')]
-
-
-def merge_data(srt_blocks: List[Dict[str, Any]], txt_lines: List[str]) -> List[Dict[str, Any]]:
-    """
-    SRT 블록 리스트에 TXT 라인을 순서대로 매칭.
-    반환 리스트의 각 항목에 "translated" 키 추가 (없으면 "").
-    """
-    result = []
-    for i, block in enumerate(srt_blocks):
-        row = dict(block)
-        row["translated"] = txt_lines[i] if i < len(txt_lines) else ""
-        result.append(row)
-    return result
-
-
-def build_srt_from_merged(rows: List[Dict[str, Any]]) -> str:
-    """병합된 데이터로 SRT 문자열 생성. 번역 텍스트의 <br/>는 줄바꿈(\\n)으로 복원."""
-    out = []
-    for r in rows:
-        out.append(str(r["index"]))
-        out.append(r["timecode"])
-        trans = (r.get("translated", "") or "").replace("<br/>", "\n")
-        out.append(trans)
-        out.append("")
-    return "\n".join(out).rstrip()
-
-
-def extract_text_lines(rows: List[Dict[str, Any]]) -> str:
-    """순번·타임코드 제외, 순수 텍스트만 블록당 한 줄로 추출. (원본은 이미 <br/>로 저장됨, SRT 블록 수 = TXT 라인 수)"""
-    return "\n".join(r.get("original", "") for r in rows)
-
+# --- 데이터 계층은 subbridge 패키지 (parse_srt, merge_data, StatsManager 등) ---
 
 def _lang_code_for_display(display: str) -> str:
     """표시명(예: English)에 해당하는 언어 코드 반환."""
@@ -467,16 +429,6 @@ def _lang_code_for_display(display: str) -> str:
     return LANG_OPTIONS[0][0]
 
 
-def _read_file_utf(path: str, encoding: str, error_title: str) -> Optional[str]:
-    """파일을 UTF로 읽기. 실패 시 메시지 박스 후 None 반환."""
-    try:
-        with open(path, "r", encoding=encoding) as f:
-            return f.read()
-    except Exception as e:
-        messagebox.showerror(error_title, f"파일 읽기 실패:\n{e}")
-        return None
-
-
 # --- 로그 뷰어 (메인 윈도우 우측 자석 배치, 이동 시 따라감) ---
 
 # 설정 파일 경로 (로그 창 크기 저장 — PREFS_PATH와 동일한 settings.json 사용)
@@ -675,6 +627,12 @@ class LogViewer:
         font_label = self._load_log_font_size()
         self._log_font_combo.set(font_label if font_label in FONT_LABELS else LOG_FONT_DEFAULT_LABEL)
         ttk.Button(self._header_frame, text="크기 초기화", command=self._on_reset_size).pack(side="right")
+        # 성능 추적: 켜 두면 번역 배치·파일 로드·병합·그리드 갱신 구간을 기록해 Chrome trace JSON으로 저장
+        ttk.Button(self._header_frame, text="트레이스 저장", command=self._on_export_trace).pack(side="right", padx=(0, 4))
+        self._trace_var = tk.BooleanVar(value=tracing.is_enabled())
+        ttk.Checkbutton(
+            self._header_frame, text="트레이스 기록", variable=self._trace_var, command=self._on_toggle_trace
+        ).pack(side="right", padx=(0, 4))
         frame = ttk.Frame(self.win, padding=4)
         frame.pack(fill="both", expand=True)
         log_pt = self._get_log_font_pt()
@@ -697,6 +655,36 @@ class LogViewer:
         if self.on_user_close:
             self.on_user_close()
 
+    def _on_toggle_trace(self) -> None:
+        """트레이스 기록 체크박스: 켜면 기록 시작, 끄면 기록 중지(버퍼 폐기)."""
+        if self._trace_var.get():
+            tracing.enable()
+            self.append("트레이스 기록 시작")
+        else:
+            tracing.disable()
+            self.append("트레이스 기록 중지")
+
+    def _on_export_trace(self) -> None:
+        """트레이스 저장 버튼: 기록된 구간을 Chrome trace JSON으로 저장 (chrome://tracing, ui.perfetto.dev)."""
+        if not tracing.is_enabled():
+            messagebox.showinfo("트레이스", "트레이스 기록이 꺼져 있습니다.\n'트레이스 기록'을 켠 뒤 작업을 실행해 주세요.", parent=self.win)
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.win,
+            title="트레이스 저장",
+            defaultextension=".json",
+            initialfile=f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            filetypes=[("Chrome trace", "*.json"), ("모든 파일", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            count = tracing.export_chrome_trace(Path(path))
+        except OSError as e:
+            messagebox.showerror("오류", f"트레이스 저장 실패:\n{e}", parent=self.win)
+            return
+        self.append(f"트레이스 저장: {path} ({count}개 구간)")
+
     def _on_reset_size(self) -> None:
         """크기 초기화 버튼: 기본 크기로 복원."""
         if self.win is None or not self.win.winfo_exists():
@@ -797,148 +785,7 @@ class LogViewer:
         self.text = None
 
 
-def _map_translation_response_lines(
-    response_lines: List[str],
-    batch_rows: List[Dict[str, Any]],
-    requested_len: int,
-    log_callback: Optional[Any] = None,
-) -> List[str]:
-    """
-    API 응답 줄을 배치 행 수에 맞게 매핑.
-    <br/>로 인한 줄 분리 시 행별로 병합하여 반환.
-    log_callback(msg)가 있으면 로그 메시지 전달, 없으면 print.
-    """
-    response_len = len(response_lines)
-    expected_per_row = [
-        1 + ((r.get("original") or "").count("<br/>"))
-        for r in batch_rows
-    ]
-    total_expected = sum(expected_per_row)
-
-    def _log(msg: str) -> None:
-        if log_callback:
-            log_callback(msg)
-        else:
-            print(msg, file=sys.stderr)
-
-    if response_len == requested_len:
-        return response_lines
-    if response_len == total_expected and response_len > requested_len:
-        lines_final = []
-        idx = 0
-        for take in expected_per_row:
-            chunk = response_lines[idx : idx + take]
-            lines_final.append("<br/>".join(chunk) if chunk else "")
-            idx += take
-        _log(f"<br/> 줄 분리 보정: 요청={requested_len}행, 응답={response_len}줄 -> 행별 병합 후 {len(lines_final)}행")
-        return lines_final
-    if response_len > requested_len:
-        merged = "<br/>".join(response_lines[requested_len - 1 :])
-        lines_final = response_lines[: requested_len - 1] + [merged]
-    else:
-        lines_final = response_lines + [""] * (requested_len - response_len)
-    _log(f"번역 줄 수 불일치 보정: 요청={requested_len}, 응답={response_len} -> {len(lines_final)}줄로 매핑")
-    return lines_final
-
-
-def _parse_json_translation_response(raw: str) -> Optional[List[Dict[str, Any]]]:
-    """
-    AI 응답에서 JSON 배열 추출. ```json ... ``` 래퍼 제거 후 json.loads.
-    성공 시 [{"id": "1", "text": "..."}, ...] 형태 리스트 반환, 실패 시 None.
-    """
-    if not (raw or "").strip():
-        return None
-    text = raw.strip()
-    # 마크다운 코드 블록 제거
-    if text.startswith("```"):
-        lines = text.split("\n")
-        out = []
-        in_block = False
-        for line in lines:
-            if line.strip().startswith("```"):
-                in_block = not in_block
-                if in_block and "json" in line.lower():
-                    continue
-                if not in_block:
-                    continue
-            if in_block:
-                out.append(line)
-        text = "\n".join(out)
-    try:
-        data = json.loads(text)
-        if not isinstance(data, list):
-            return None
-        return data
-    except (json.JSONDecodeError, TypeError):
-        return None
-
-
-def _translate_chunk_single_fallback(
-    client: Any,
-    config: Any,
-    model_name: str,
-    batch_rows: List[Dict[str, Any]],
-    target_lang: str,
-    system_instruction: Any = None,
-    log_callback: Optional[Callable[[str], None]] = None,
-) -> Tuple[bool, Optional[str]]:
-    """
-    배치 JSON 실패 시 해당 청크만 1줄씩 개별 번역. batch_rows를 직접 수정.
-    성공 시 (True, None), API 오류(429/503 등) 시 (False, err_msg) 반환.
-    """
-    for row in batch_rows:
-        orig = (row.get("original") or "").replace("\r\n", "<br/>").replace("\n", "<br/>").strip()
-        prompt = (
-            f"아래 문장을 **{target_lang}**로 번역해 주세요. `<br/>`는 그대로 두고, 번역 결과 한 줄만 출력.\n\n{orig}"
-        )
-        try:
-            response = client.models.generate_content(
-                model=model_name, contents=prompt, config=config
-            )
-            text = (response.text or "").strip()
-            line = text.split("\n")[0].strip() if text else ""
-            row["translated"] = line if line else AI_TRANSLATE_EMPTY_PLACEHOLDER
-        except Exception as e:
-            err_msg = str(e)
-            if "429" in err_msg or "Resource Exhausted" in err_msg or "quota" in err_msg.lower() or "exceeded" in err_msg.lower():
-                return (False, "API 사용량이 초과되었습니다. 잠시 후 다시 시도하거나 API 키를 확인해주세요. (429)")
-            if "503" in err_msg or "UNAVAILABLE" in err_msg:
-                return (False, f"503_UNAVAILABLE|{model_name}")
-            row["translated"] = "[통신 오류]"
-            return (False, f"통신 오류: {err_msg}")
-    return (True, None)
-
-
-def _run_qa_checks(
-    batch_rows: List[Dict[str, Any]],
-    log_callback: Optional[Callable[[str], None]] = None,
-    overflow_callback: Optional[Callable[[str], None]] = None,
-) -> None:
-    """
-    AI 번역 결과 QA 검수: 글자 수 초과, 인코딩 깨짐(\\uFFFD) 감지.
-    overflow_callback: 45자 초과 경고 전용 콜백 (인라인 연속 출력용). 없으면 log_callback 사용.
-    """
-    for row in batch_rows:
-        trans = (row.get("translated") or "").strip()
-        if trans == AI_TRANSLATE_EMPTY_PLACEHOLDER or not trans:
-            continue
-        idx = row.get("index", 0)
-        # 45자 초과 검증 (각 줄별)
-        for line in trans.replace("<br/>", "\n").split("\n"):
-            ln = line.strip()
-            if not ln:
-                continue
-            n = len(ln)
-            if n > QA_MAX_CHARS:
-                msg = f"Line {idx} 45자 초과.(길이:{n}자)"
-                if overflow_callback:
-                    overflow_callback(msg)
-                elif log_callback:
-                    log_callback(msg)
-                break  # 행당 한 번만 로그
-        # 유니코드 대체 문자(깨진 문자) 감지 — 즉시 출력
-        if QA_REPLACEMENT_CHAR in trans and log_callback:
-            log_callback(f"[오류] Line {idx}: 번역 결과에 깨진 문자()가 감지되었습니다.")
+# --- 번역 헬퍼(_map_translation_response_lines, _run_qa_checks 등)와 배치 번역 엔진은 subbridge 패키지 ---
 
 
 # --- UI 애플리케이션 ---------------------------------------------------------
@@ -966,8 +813,9 @@ class SrtVerifierMergerApp:
 
         # 마지막 AI 번역에 사용한 모델 (병합 시 파일명 네이밍에 사용)
         self._last_ai_model: Optional[str] = None
-        # 언어별 용어집 { "English": {"원본": "번역"}, ... } — glossary.json 저장
-        self._glossary_data: Dict[str, Dict[str, str]] = {}
+        # 언어별 용어집 색인 저장소 (glossary.db) + 언어별 {원본: 번역} 캐시 (store revision 기준)
+        self._glossary_store: Optional[GlossaryStore] = None
+        self._glossary_cache: Dict[str, Tuple[int, Dict[str, str]]] = {}
 
         # 모두 번역(Translate All) 모드 상태
         self.translate_all_var = tk.BooleanVar(value=False)
@@ -981,16 +829,54 @@ class SrtVerifierMergerApp:
 
         self._log_viewer: Optional[LogViewer] = None  # AI 번역 등 로그 창
         self._log_viewer_visible_var = tk.BooleanVar(value=False)  # 작업 내용 체크박스
+        self._export_ids_var = tk.BooleanVar(value=False)  # 추출하기: 줄마다 [[순번]] ID
         self._stats_manager = StatsManager()  # 모델별 누적 성능 데이터
+        self._parse_cache = ParseCache()  # 파싱 결과 디스크 캐시 (같은 파일 재오픈 시 디코딩·파싱 생략)
+        # 백그라운드 파일 불러오기 상태 (_start_file_load): 세대 번호가 바뀌면 이전 작업 스레드의 결과는 버린다
+        self._load_generation = 0
+        self._load_active = False  # 읽기부터 표 채우기까지 진행 중 (행 편집·행 번호를 쓰는 작업을 막음)
+        self._load_cancel: Optional[threading.Event] = None  # 작업 스레드가 읽는 동안만 설정
+        self._load_callbacks: Optional[Tuple[Callable[..., None], Callable[..., None]]] = None  # (apply, finish)
+        self._load_done: Optional[Callable[[], None]] = None  # 표를 다 맞춘 뒤 호출
+        self._load_preview: Optional[List[Dict[str, Any]]] = None  # 파싱되는 대로 받은 SRT 블록 (미리 보기)
+        self._load_preview_len = 0  # 표 앞쪽에서 미리 보기 값(원본만)으로 넣은 항목 수
+        self._load_tree_len = 0  # 표에 있는 항목 수 (r_0 ...)
+        self._load_sync_pos: Optional[int] = None  # 행 교체 뒤 표 맞추기 위치 (None이면 미리 보기 단계)
+        self._load_pump_after_id: Optional[str] = None
+        self._load_label = ""
+        # 프로젝트(.sbproj) 자동 저장: 변경 행을 모아 두었다가 AUTOSAVE_DELAY_MS 뒤 한 번에 기록
+        self._project_writer = ProjectWriter(AUTOSAVE_PROJECT_PATH)
+        self._autosave_after_id: Optional[str] = None
+        self._autosave_all: bool = False  # True면 스냅숏(전체), False면 변경 행만 저널에 추가
+        self._autosave_rows: set = set()
         self._translation_start_time: float = 0.0  # 번역 시작 시각 (time.time())
         self._icon_photo: Optional[Any] = None  # 창 아이콘 참조 유지
         self._icon_ico_path: Optional[str] = None  # app.ico 경로 (하위 창에 적용용)
         # (45자 초과 경고는 실시간 출력으로 변경됨 — 수집 리스트 불필요)
+        # QA 기준(프로필) 이름과 마지막 검사 결과 {행 인덱스: [QAIssue, ...]} — 강조·F4 네비게이션에 사용
+        self._qa_profile_name: str = DEFAULT_QA_PROFILE_NAME
+        # settings.json "record_cassettes": true면 번역 API 호출을 cassettes/ 폴더에 녹화 (문제 재현용)
+        self._record_cassettes = False
+        # settings.json "translate_workers": 동시에 요청하는 배치 수 (기본 1 = 순차, python -m subbridge.throughput으로 모델별 값 결정)
+        self._translate_workers = 1
+        # settings.json "fanout_workers" / "requests_per_minute": 여러 언어 번역이 함께 쓰는 요청 풀 크기·분당 요청 한도 (0 = 한도 없음)
+        self._fanout_workers = FANOUT_DEFAULT_CONCURRENCY
+        self._requests_per_minute = 0.0
+        # 여러 언어 번역 창에서 마지막으로 고른 언어 코드
+        self._fanout_langs: List[str] = []
+        self._qa_issues: Dict[int, list] = {}
+        # 번역 TXT 정렬 신뢰도가 낮은 행 (TXT 출처로 남아 있는 동안 검토 필요로 표시)
+        self._align_review: Set[int] = set()
+        self._last_align: Any = None
+        # 용어집 준수 검사기 캐시 ((언어, 용어집 항목) 키가 바뀔 때만 다시 컴파일)
+        self._glossary_matcher: Optional[GlossaryMatcher] = None
+        self._glossary_matcher_key: Any = None
         write_readme()  # 실행 시 readme.txt 생성(간단·세부 메뉴얼 기록, 실행 없이 읽기용)
         self._build_ui()
         self._setup_styles()
         self._set_window_icon()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(0, self._restore_last_project)  # 마지막 작업(.sbproj) 복원
         # 통합 Configure 이벤트 바인딩 (로그 창 우측 + 프로그레스바 좌측 동시 갱신)
         self.root.bind("<Configure>", self._on_main_configure)
 
@@ -1121,7 +1007,7 @@ class SrtVerifierMergerApp:
         style.map("Treeview", background=[("selected", "#0078d4")])
         self.tree.tag_configure("odd", background="#f5f5f5")
         self.tree.tag_configure("even", background="#ffffff")
-        # 45자 초과 또는 "빈줄" 포함 시 주황색 강조
+        # QA 기준 위반(기본: 45자 초과) 또는 "빈줄" 포함 시 주황색 강조
         self.tree.tag_configure("warning_odd", background="#f5f5f5", foreground="#D35400")
         self.tree.tag_configure("warning_even", background="#ffffff", foreground="#D35400")
 
@@ -1221,9 +1107,30 @@ class SrtVerifierMergerApp:
         # 2행: 추출하기 그룹 (AI 번역하기와 같은 시작 컬럼)
         self.export_btn = ttk.Button(top, text="추출하기", command=self._on_export)
         self.export_btn.grid(row=1, column=2, padx=4)
-        self.lang_combo = ttk.Combobox(top, values=LANG_DISPLAYS, state="readonly", width=12)
-        self.lang_combo.grid(row=1, column=3, padx=4)
+        export_opts = ttk.Frame(top)
+        export_opts.grid(row=1, column=3, padx=4)
+        self.lang_combo = ttk.Combobox(export_opts, values=LANG_DISPLAYS, state="readonly", width=12)
+        self.lang_combo.pack(side="left")
         self.lang_combo.bind("<<ComboboxSelected>>", lambda e: self._save_preferences())
+        ttk.Checkbutton(
+            export_opts, text="ID", variable=self._export_ids_var, command=self._save_preferences
+        ).pack(side="left", padx=(4, 0))
+        self.retime_btn = ttk.Button(top, text="타임코드 조정", command=self._on_retime)
+        self.retime_btn.grid(row=1, column=4, padx=(8, 2), sticky="w")
+        more_translate = ttk.Frame(top)
+        more_translate.grid(row=1, column=5, padx=2, sticky="w")
+        self.repair_btn = ttk.Button(more_translate, text="조건 재번역…", command=self._on_translate_by_predicate)
+        self.repair_btn.pack(side="left")
+        self.fanout_btn = ttk.Button(more_translate, text="여러 언어 번역…", command=self._on_translate_fanout)
+        self.fanout_btn.pack(side="left", padx=(4, 0))
+        ttk.Label(top, text="QA 기준:").grid(row=1, column=6, padx=(8, 2))
+        self.qa_profile_combo = ttk.Combobox(top, values=QA_PROFILE_NAMES, state="readonly", width=32)
+        self.qa_profile_combo.grid(row=1, column=7, padx=2)
+        self.qa_profile_combo.bind("<<ComboboxSelected>>", self._on_qa_profile_changed)
+        self.reflow_btn = ttk.Button(top, text="줄 맞춤", command=self._on_reflow)
+        self.reflow_btn.grid(row=1, column=8, padx=4)
+        ttk.Button(top, text="프로젝트 열기", command=self._on_open_project).grid(row=1, column=9, padx=4)
+        ttk.Button(top, text="프로젝트 저장", command=self._on_save_project).grid(row=1, column=11, padx=4)
 
         # ---- B. 중단: Treeview + 스크롤 ----
         mid = ttk.Frame(main)
@@ -1287,8 +1194,12 @@ class SrtVerifierMergerApp:
         self.progress_var = tk.DoubleVar(value=0.0)
         self.progress_bar = ttk.Progressbar(bottom, variable=self.progress_var, maximum=100)
         self.progress_bar.grid(row=2, column=0, columnspan=4, sticky="ew", pady=(4, 0))
-        self.progress_bar.grid_remove()  # 번역 중에만 표시
-        self._progress_after_id: Optional[str] = None  # Fake Progress 타이머 (root.after id)
+        self.progress_bar.grid_remove()  # 번역·파일 불러오기 중에만 표시
+        self.load_cancel_btn = ttk.Button(bottom, text="불러오기 취소 (Esc)", command=self._cancel_file_load)
+        self.load_cancel_btn.grid(row=2, column=3, sticky="e", padx=(4, 0), pady=(4, 0))
+        self.load_cancel_btn.grid_remove()  # 파일을 읽는 동안만 표시
+        self._progress_after_id: Optional[str] = None  # 진행률 갱신 타이머 (root.after id)
+        self._job_progress: Optional[JobProgress] = None  # 진행 중인 번역 작업의 진행 추적
         self._translation_done_flag = False
         bottom.columnconfigure(1, weight=1)
 
@@ -1304,6 +1215,7 @@ class SrtVerifierMergerApp:
         self.root.bind("<Control-s>", self._on_merge)
         self.root.bind("<Control-S>", self._on_merge)
         self.root.bind("<Control-Return>", self._on_ai_translate)
+        self.root.bind("<Escape>", self._cancel_file_load)
         # ---- Treeview 방향키 & 페이지 네비게이션 (Treeview + 전역) ----
         # Treeview 자체 기본 Up/Down 동작을 차단하고 커스텀 핸들러로 대체
         self.tree.bind("<Up>", self._on_tree_key_up)
@@ -1432,8 +1344,8 @@ class SrtVerifierMergerApp:
         return f"r_{row_index}"
 
     def _on_tree_double_click(self, event: tk.Event) -> None:
-        """Treeview 더블클릭: 번역 텍스트 열(#3)일 때만 인라인 편집 시작."""
-        if self._inplace_entry:
+        """Treeview 더블클릭: 번역 텍스트 열(#3)일 때만 인라인 편집 시작 (파일 불러오는 중에는 무시)."""
+        if self._inplace_entry or self._load_active:
             return
         item = self.tree.identify_row(event.y)
         col = self.tree.identify_column(event.x)
@@ -1480,15 +1392,14 @@ class SrtVerifierMergerApp:
         self._inplace_row_index = None
         if iid and row_index is not None and 0 <= row_index < len(self.rows):
             self.tree.set(iid, "translated", value)
-            self.rows[row_index]["translated"] = value
-            # 편집 후 45자 초과 / "빈줄" 여부에 따라 주황색 강조 갱신
+            if value != (self.rows[row_index].get("translated") or ""):
+                self.rows[row_index]["translated"] = value
+                self.rows[row_index]["provenance"] = PROVENANCE_MANUAL
+                self._mark_project_dirty([row_index])
+            # 편집 후 QA 기준 위반 여부에 따라 주황색 강조 갱신 (텍스트만 바뀌므로 해당 행만 다시 태깅)
+            self._recompute_qa()
             stripe = "even" if row_index % 2 == 0 else "odd"
-            needs_warning = any(
-                len(ln.strip()) > QA_MAX_CHARS
-                for ln in value.replace("<br/>", "\n").split("\n")
-                if ln.strip()
-            ) or ("빈줄" in value)
-            tag = f"warning_{stripe}" if needs_warning else stripe
+            tag = f"warning_{stripe}" if row_index in self._qa_issues else stripe
             self.tree.item(iid, tags=(tag,))
             self._update_merge_button_state()
             self._update_warning_count()
@@ -1506,21 +1417,42 @@ class SrtVerifierMergerApp:
     @staticmethod
     def _is_warning_text(text: str) -> bool:
         """번역 텍스트가 경고 조건(45자 초과 또는 '빈줄' 포함)에 해당하는지 판별."""
-        if "빈줄" in text:
-            return True
-        for ln in text.replace("<br/>", "\n").split("\n"):
-            if ln.strip() and len(ln.strip()) > QA_MAX_CHARS:
-                return True
-        return False
+        return is_warning_text(text)
 
     def _get_warning_indices(self) -> list:
-        """경고 조건에 해당하는 행 인덱스 목록을 반환."""
-        indices = []
-        for i, row in enumerate(self.rows):
-            trans = row.get("translated", "") or ""
-            if self._is_warning_text(trans):
-                indices.append(i)
-        return indices
+        """마지막 QA 검사(_recompute_qa)에서 위반으로 판정된 행 인덱스 목록 (오름차순)."""
+        return sorted(self._qa_issues)
+
+    def _get_glossary_matcher(self, lang: Optional[str] = None) -> GlossaryMatcher:
+        """언어(기본: AI 번역 대상 언어) 용어집의 준수 검사기 (언어나 용어집 항목이 바뀔 때만 다시 색인)."""
+        lang = lang or self.ai_lang_combo.get() or "English"
+        terms = self._get_glossary_dict(lang)
+        key = (lang, self._glossary_store.revision(lang) if self._glossary_store else 0)
+        if self._glossary_matcher is None or key != self._glossary_matcher_key:
+            self._glossary_matcher = GlossaryMatcher(terms)
+            self._glossary_matcher_key = key
+        return self._glossary_matcher
+
+    def _recompute_qa(self) -> None:
+        """선택된 QA 기준으로 전체 행을 일괄 검사해 self._qa_issues 갱신 (TXT 정렬 신뢰도 낮은 행·용어집 미준수 포함)."""
+        issues = evaluate_qa(self.rows, get_qa_profile(self._qa_profile_name))
+        for i, terms in self._get_glossary_matcher().violations(self.rows).items():
+            issues.setdefault(i, []).append(QAIssue("glossary", f"용어집 미준수: {', '.join(terms)}"))
+        for i in self._align_review:
+            # 직접 고치거나 AI로 다시 번역한 행은 확인된 것으로 본다
+            if i < len(self.rows) and self.rows[i].get("provenance") in (PROVENANCE_TXT, PROVENANCE_NONE):
+                issues.setdefault(i, []).append(QAIssue("align", "TXT 정렬 신뢰도 낮음 (원문과 맞는지 확인)"))
+        self._qa_issues = issues
+
+    def _on_qa_profile_changed(self, event=None) -> None:
+        """QA 기준 변경: 저장 후 전체 재검사·강조 갱신."""
+        self._qa_profile_name = self.qa_profile_combo.get() or DEFAULT_QA_PROFILE_NAME
+        self._save_preferences()
+        if self.rows and not self._load_active:  # 불러오는 중이면 행 교체 때 새 기준으로 검사된다
+            self._refresh_tree()
+            self._update_warning_count()
+            self._mark_project_dirty([])
+            self.status_var.set(f"QA 기준 변경: {self._qa_profile_name} — 검토 필요 {len(self._qa_issues)}건.")
 
     def _update_warning_count(self) -> None:
         """경고 항목 개수를 세어 버튼 텍스트를 갱신하고, 0건이면 비활성화."""
@@ -1601,6 +1533,8 @@ class SrtVerifierMergerApp:
 
     def _on_warning_nav(self, event=None) -> None:
         """다음 경고 항목으로 순차 이동. 마지막 도달 후 처음으로 되돌아감(wrap-around)."""
+        if self._file_load_busy():
+            return
         warning_indices = self._get_warning_indices()
         if not warning_indices:
             self.status_var.set("검토할 항목이 없습니다.")
@@ -1635,26 +1569,29 @@ class SrtVerifierMergerApp:
         # 상태바에 현재 위치 표시
         pos = warning_indices.index(next_idx) + 1
         total = len(warning_indices)
-        self.status_var.set(f"검토 필요 항목 {pos}/{total} (Line {self.rows[next_idx].get('index', '?')})")
+        reasons = ", ".join(issue.message for issue in self._qa_issues.get(next_idx, []))
+        self.status_var.set(f"검토 필요 항목 {pos}/{total} (Line {self.rows[next_idx].get('index', '?')}) — {reasons}")
 
     def _refresh_tree(self):
         """self.rows 기준으로 Treeview 갱신 (Zebra stripe 적용). 행 간격 한 줄 기준 고정."""
+        with tracing.span("refresh_tree", rows=len(self.rows)):
+            self._rebuild_tree()
+
+    def _rebuild_tree(self):
+        """Treeview 항목 전체 재생성 (_refresh_tree 본체)."""
         if self._inplace_entry and self._inplace_entry.winfo_exists():
             self._commit_inplace_edit()
         for item in self.tree.get_children():
             self.tree.delete(item)
         # 행 간격 한 줄 기준, 현재 글자 크기에 맞는 행 높이 유지
         ttk.Style().configure("Treeview", rowheight=self._get_viewer_rowheight())
+        # 선택된 QA 기준(줄 길이·CPS·표시 시간·간격 등) 위반 행은 주황색 강조
+        self._recompute_qa()
+        issues = self._qa_issues
         for i, row in enumerate(self.rows):
             stripe = "even" if i % 2 == 0 else "odd"
             trans = row.get("translated", "") or ""
-            # 45자 초과 또는 "빈줄" 포함 시 주황색 강조
-            needs_warning = any(
-                len(ln.strip()) > QA_MAX_CHARS
-                for ln in trans.replace("<br/>", "\n").split("\n")
-                if ln.strip()
-            ) or ("빈줄" in trans)
-            tag = f"warning_{stripe}" if needs_warning else stripe
+            tag = f"warning_{stripe}" if i in issues else stripe
             self.tree.insert(
                 "",
                 "end",
@@ -1667,44 +1604,353 @@ class SrtVerifierMergerApp:
                 tags=(tag,),
             )
 
+    # ---- 파일 불러오기 (작업 스레드에서 읽기·파싱·병합, 표는 타이머로 조금씩 채움, self.rows는 끝에 한 번에 교체) ----
+    LOAD_TREE_BATCH = 300  # 타이머 한 번에 표에 넣거나 고치는 행 수 (그 사이 화면이 다시 그려짐)
+    LOAD_TICK_MS = 1
+    LOAD_PARSE_SHARE = 70.0  # 진행 바에서 읽기·파싱이 차지하는 비율 (%), 나머지는 표 채우기
+
+    def _file_load_busy(self) -> bool:
+        """파일을 불러오는 중이면 상태바에 안내하고 True. 행 목록을 바꾸거나 행 번호로 표를 다루는 작업 앞에서 확인."""
+        if not self._load_active:
+            return False
+        self.status_var.set("파일을 불러오는 중입니다. 끝난 뒤 다시 시도하세요. (Esc: 불러오기 취소)")
+        return True
+
+    def _start_file_load(
+        self,
+        path: str,
+        kind: str,
+        build: Callable[[List[Any]], Tuple[List[Dict[str, Any]], Any]],
+        apply: Callable[[List[Any], List[Dict[str, Any]], Any], None],
+        finish: Callable[[List[Any], Any], None],
+    ) -> None:
+        """
+        path를 작업 스레드에서 파싱 캐시 경유로 읽는다 (인코딩 자동 감지). SRT는 파싱되는 블록을 바로 표에 흘려 보여 준다 (번역 칸은 빈 채로).
+        build(data) → (행 목록, extra): 같은 작업 스레드에서 최종 행을 만든다 (self.rows는 건드리지 않음).
+        apply(data, rows, extra): 메인 스레드에서 상태와 self.rows를 한 번에 교체. 그 뒤 표를 조각씩 맞추고 나서 finish(data, extra).
+        취소·실패하면 self.rows는 그대로이고 표만 원래대로 되돌린다.
+        """
+        if self._job_progress is not None:
+            messagebox.showwarning("알림", "AI 번역이 끝난 뒤 파일을 열어 주세요.")
+            return
+        if self._inplace_entry and self._inplace_entry.winfo_exists():
+            self._commit_inplace_edit()
+        self._load_generation += 1
+        gen = self._load_generation
+        cancel = threading.Event()
+        self._load_cancel = cancel
+        self._load_active = True
+        self._load_callbacks = (apply, finish)
+        self._load_done = None
+        self._load_preview = None
+        self._load_preview_len = 0
+        self._load_tree_len = len(self.tree.get_children())
+        self._load_sync_pos = None
+        self._load_label = "원본 SRT" if kind == "srt" else "번역 TXT"
+        self.progress_bar.grid(columnspan=3)
+        self.progress_var.set(0)
+        self.load_cancel_btn.grid()
+        self.status_var.set(f"{self._load_label} 불러오는 중... {Path(path).name} (Esc: 취소)")
+
+        def on_chunk(items: List[Any], done: int, total: int) -> None:
+            fraction = done / total if total else 1.0
+            self.root.after(0, self._on_load_chunk, gen, items if kind == "srt" else None, fraction)
+
+        def worker() -> None:
+            rows = extra = None
+            with tracing.span("load_file", kind=kind) as sp:
+                result = self._parse_cache.load(
+                    path, kind, AUTO_ENCODING, chunk_callback=on_chunk, cancel_check=cancel.is_set
+                )
+                sp.set(ok=result.ok, from_cache=result.from_cache, items=len(result.data or ()))
+            error = result.error
+            if result.ok and not cancel.is_set():
+                try:
+                    rows, extra = build(result.data)
+                except Exception as e:
+                    error = str(e)
+            self.root.after(0, self._on_file_loaded, gen, result, rows, extra, error)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _cancel_file_load(self, event=None) -> None:
+        """불러오기 취소 (Esc). 읽기·파싱 단계에서만 멈출 수 있고, 이후 표 채우기는 끝까지 진행된다."""
+        if self._load_cancel is None or self._load_cancel.is_set():
+            return
+        self._load_cancel.set()
+        self.load_cancel_btn.grid_remove()
+        self.status_var.set(f"{self._load_label} 불러오기 취소 중...")
+
+    def _on_load_chunk(self, gen: int, items: Optional[List[Any]], fraction: float) -> None:
+        """작업 스레드가 파싱한 조각 (메인 스레드). SRT 블록이면 미리 보기로 표에 쌓고, 진행 바·상태바 갱신."""
+        if gen != self._load_generation or self._load_cancel is None or self._load_cancel.is_set():
+            return
+        if items:
+            if self._load_preview is None:
+                # 첫 조각: 이전 작업의 표를 비우고 새 원본 미리 보기를 시작
+                self.tree.delete(*self.tree.get_children())
+                self._load_tree_len = 0
+                self._load_preview = []
+            self._load_preview.extend(items)
+            self._schedule_load_pump()
+        self.progress_var.set(fraction * self.LOAD_PARSE_SHARE)
+        shown = f" {len(self._load_preview):,}개 블록" if self._load_preview else ""
+        self.status_var.set(f"{self._load_label} 불러오는 중...{shown} ({fraction:.0%}) (Esc: 취소)")
+
+    def _on_file_loaded(
+        self, gen: int, result: ParsedFile, rows: Optional[List[Dict[str, Any]]], extra: Any, error: Optional[str]
+    ) -> None:
+        """작업 스레드 완료 (메인 스레드): 성공이면 상태·self.rows를 한 번에 교체하고 표 맞추기 시작, 아니면 표만 되돌림."""
+        if gen != self._load_generation:
+            return
+        cancelled = self._load_cancel is not None and self._load_cancel.is_set()
+        self._load_cancel = None
+        self.load_cancel_btn.grid_remove()
+        apply, finish = self._load_callbacks
+        if rows is None or cancelled:
+            failed = bool(error) and not cancelled
+            if failed:
+                message = f"{self._load_label} 불러오기 실패."
+            else:
+                message = f"{self._load_label} 불러오기 취소됨. 이전 작업을 그대로 유지합니다."
+            if self._load_preview is None:
+                self._end_file_load()
+                self.status_var.set(message)
+            else:
+                # 미리 보기로 바꾼 표를 기존 행으로 되돌린다
+                self._load_preview_len = 0
+                self._load_done = lambda: self.status_var.set(message)
+                self._start_load_sync()
+            if failed:
+                messagebox.showerror("오류", f"파일 읽기 실패:\n{error}")
+            return
+        data = result.data
+        apply(data, rows, extra)
+        self._report_file_encoding(result)
+        self._recompute_qa()
+
+        def done() -> None:
+            self._after_rows_replaced()
+            finish(data, extra)
+
+        self._load_done = done
+        self._start_load_sync()
+
+    def _start_load_sync(self) -> None:
+        """미리 보기를 끝내고 표를 self.rows에 맞추기 시작."""
+        self._load_preview = None
+        self._load_sync_pos = 0
+        self._schedule_load_pump()
+
+    def _report_file_encoding(self, result: ParsedFile) -> None:
+        """자동 감지한 인코딩이 UTF-8이 아니거나 읽을 수 없는 바이트가 깨진 글자로 바뀌었으면 로그에 남긴다."""
+        if result.encoding and result.encoding not in ("utf-8", "utf-8-sig"):
+            self._append_log(f"{self._load_label} 인코딩 자동 감지: {encoding_label(result.encoding)} (UTF-8로 변환해 읽음)")
+        if result.replacements:
+            self._append_log(
+                f"[경고] {self._load_label}에서 읽을 수 없는 글자 {result.replacements:,}개를 {QA_REPLACEMENT_CHAR}로 바꿨습니다. "
+                "원본 인코딩을 확인하세요."
+            )
+
+    def _schedule_load_pump(self) -> None:
+        if self._load_pump_after_id is None:
+            self._load_pump_after_id = self.root.after(self.LOAD_TICK_MS, self._pump_load_tree)
+
+    def _pump_load_tree(self) -> None:
+        """
+        타이머 콜백: 표에 LOAD_TREE_BATCH행씩 반영.
+        파싱 중에는 받은 블록을 미리 보기로 덧붙이고, 행 교체 뒤에는 self.rows와 다른 항목만 고치거나 추가한다.
+        """
+        self._load_pump_after_id = None
+        if not self._load_active:
+            return
+        tree = self.tree
+        if self._load_sync_pos is None:
+            preview = self._load_preview or []
+            end = min(len(preview), self._load_tree_len + self.LOAD_TREE_BATCH)
+            for i in range(self._load_tree_len, end):
+                block = preview[i]
+                tree.insert(
+                    "",
+                    "end",
+                    iid=self._tree_iid(i),
+                    values=(f'{block["index"]} ({block["timecode"]})', block.get("original", ""), ""),
+                    tags=("even" if i % 2 == 0 else "odd",),
+                )
+            self._load_tree_len = self._load_preview_len = end
+            if end < len(preview):
+                self._schedule_load_pump()
+            return
+        rows = self.rows
+        issues = self._qa_issues
+        start = self._load_sync_pos
+        end = min(len(rows), start + self.LOAD_TREE_BATCH)
+        for i in range(start, end):
+            row = rows[i]
+            stripe = "even" if i % 2 == 0 else "odd"
+            trans = row.get("translated", "") or ""
+            tag = f"warning_{stripe}" if i in issues else stripe
+            if i < self._load_preview_len and not trans and tag == stripe:
+                continue  # 미리 보기와 같음 (원본·타임코드는 같은 블록)
+            values = (f'{row["index"]} ({row["timecode"]})', row.get("original", ""), trans)
+            if i < self._load_tree_len:
+                tree.item(self._tree_iid(i), values=values, tags=(tag,))
+            else:
+                tree.insert("", "end", iid=self._tree_iid(i), values=values, tags=(tag,))
+        self._load_sync_pos = end
+        self._load_tree_len = max(self._load_tree_len, end)
+        if rows:
+            share = self.LOAD_PARSE_SHARE
+            self.progress_var.set(share + (100.0 - share) * end / len(rows))
+            self.status_var.set(f"{self._load_label} 표시 중... {end:,} / {len(rows):,}행")
+        if end < len(rows):
+            self._schedule_load_pump()
+            return
+        if self._load_tree_len > len(rows):
+            tree.delete(*(self._tree_iid(i) for i in range(len(rows), self._load_tree_len)))
+        done = self._load_done
+        self._end_file_load()
+        if done is not None:
+            done()
+
+    def _end_file_load(self) -> None:
+        """불러오기 상태 정리: 진행 바·취소 버튼 숨김 (진행 바는 번역용 배치로 되돌림)."""
+        if self._load_pump_after_id is not None:
+            self.root.after_cancel(self._load_pump_after_id)
+            self._load_pump_after_id = None
+        self._load_active = False
+        self._load_cancel = None
+        self._load_callbacks = None
+        self._load_done = None
+        self._load_preview = None
+        self._load_sync_pos = None
+        self.load_cancel_btn.grid_remove()
+        self.progress_bar.grid(columnspan=4)
+        self.progress_bar.grid_remove()
+
     def _on_open_srt(self):
+        if self._file_load_busy():
+            return
         path = filedialog.askopenfilename(
             title="원본 SRT 선택",
             filetypes=[("SRT 파일", "*.srt"), ("모든 파일", "*.*")],
         )
         if not path:
             return
-        content = _read_file_utf(path, "utf-8-sig", "오류")
-        if content is None:
+        # 번역이 있는 작업 위에 새 원본을 열면 재편집본으로 보고 번역 이어받기를 제안 (파일을 읽기 전에 묻는다)
+        carry_from: Optional[List[Dict[str, Any]]] = None
+        if self.rows and self._rows_have_translated() and messagebox.askyesno(
+            "번역 이어받기",
+            "현재 작업에 번역이 있습니다.\n\n"
+            "새 SRT를 같은 영상의 수정본으로 보고, 원문이 같은 자막의 번역을 이어받을까요?\n"
+            "(아니오: 번역 없이 새로 엽니다)",
+        ):
+            if self._inplace_entry and self._inplace_entry.winfo_exists():
+                self._commit_inplace_edit()
+            carry_from = self.rows
+        txt_lines = self.txt_lines
+
+        def build(blocks: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Any]:
+            # 작업 스레드: 이어받기 또는 현재 번역 TXT와 병합 (→ 행 목록, (정렬 결과, 이어받기 결과))
+            if carry_from is not None:
+                recut = carry_over_translations(carry_from, blocks)
+                return recut.rows, (None, recut)
+            rows, aligned = self._merge_rows(blocks, txt_lines)
+            return rows, (aligned, None)
+
+        def apply(blocks: List[Dict[str, Any]], rows: List[Dict[str, Any]], extra: Any) -> None:
+            aligned, recut = extra
+            self.srt_file_path = path
+            self.srt_blocks = blocks
+            if recut is not None:
+                self.txt_lines = []
+            # 새 원본이므로 기존 프로젝트 파일에 덮어쓰지 않도록 자동 저장 위치로 되돌림
+            self._project_writer = ProjectWriter(AUTOSAVE_PROJECT_PATH)
+            self._set_rows(rows, aligned)
+
+        def finish(blocks: List[Dict[str, Any]], extra: Any) -> None:
+            recut = extra[1]
+            if self.rows:
+                first_index = self.rows[0].get("index", 1)
+                self.translate_range_var.set(str(first_index))
+                self._translate_range_placeholder_active = False
+            self.status_var.set(f"원본 SRT 로드됨: {path} — 총 {len(self.srt_blocks)}개 블록.")
+            if recut is not None:
+                self._on_recut_loaded(recut)
+
+        self._start_file_load(path, "srt", build, apply, finish)
+
+    def _on_recut_loaded(self, recut: Any) -> None:
+        """번역 이어받기 결과를 로그에 남기고, 번역이 빈 행(바뀐·새 자막)만 번역할지 묻는다."""
+        pending = recut.pending
+        self._append_log(
+            f"번역 이어받기: {len(recut.carried):,}줄 이어받음 (타임코드만 변경 {recut.retimed:,}), "
+            f"새로 생기거나 바뀐 자막 {len(recut.changed):,}줄, 짝 없는 이전 자막 {recut.removed:,}줄"
+        )
+        self.status_var.set(
+            f"번역 이어받기: {len(recut.carried):,}줄 유지, 번역 필요 {len(pending):,}줄 / 전체 {len(self.rows):,}줄."
+        )
+        if not pending:
+            return
+        batch_size = BATCH_CHUNK_SIZE  # 모두 번역과 같은 배치 크기
+        if not messagebox.askyesno(
+            "번역 이어받기",
+            f"이어받은 번역 {len(recut.carried):,}줄 / 번역 필요 {len(pending):,}줄\n\n"
+            f"번역이 빈 {len(pending):,}줄만 AI로 번역할까요?\n"
+            f"(요청 약 {(len(pending) + batch_size - 1) // batch_size:,}회)",
+        ):
             return
-        self.srt_file_path = path
-        self.srt_blocks = parse_srt(content)
-        self._merge_and_refresh()
-        if self.rows:
-            first_index = self.rows[0].get("index", 1)
-            self.translate_range_var.set(str(first_index))
-            self._translate_range_placeholder_active = False
-        self.status_var.set(f"원본 SRT 로드됨: {path} — 총 {len(self.srt_blocks)}개 블록.")
+        api_key = self._get_api_key_for_translate()
+        if not api_key:
+            return
+        target_lang = self.ai_lang_combo.get() or "English"
+        self._start_translation_job(
+            api_key, target_lang, pending, batch_size, cancellable=True, title="바뀐 자막 번역 진행 중", label="바뀐 자막 번역"
+        )
 
     def _on_open_txt(self):
+        if self._file_load_busy():
+            return
         path = filedialog.askopenfilename(
             title="번역 TXT 선택",
             filetypes=[("텍스트 파일", "*.txt"), ("모든 파일", "*.*")],
         )
         if not path:
             return
-        content = _read_file_utf(path, "utf-8", "오류")
-        if content is None:
-            return
-        self.txt_file_path = path
-        self.txt_lines = parse_txt_lines(content)
-        self._merge_and_refresh()
+        srt_blocks = self.srt_blocks
+
+        def build(lines: List[str]) -> Tuple[List[Dict[str, Any]], Any]:
+            return self._merge_rows(srt_blocks, lines)
+
+        def apply(lines: List[str], rows: List[Dict[str, Any]], aligned: Any) -> None:
+            self.txt_file_path = path
+            self.txt_lines = lines
+            self._set_rows(rows, aligned)
+
+        def finish(lines: List[str], aligned: Any) -> None:
+            self._on_txt_loaded(path, aligned)
+
+        self._start_file_load(path, "txt", build, apply, finish)
+
+    def _on_txt_loaded(self, path: str, aligned: Any) -> None:
+        """번역 TXT를 표에 다 채운 뒤: 정렬 요약을 상태바·로그에 남기고, 줄 수가 다르면 경고."""
         self.status_var.set(f"번역 TXT 로드됨: {path} — 총 {len(self.txt_lines)}줄.")
+        if aligned is None or (aligned.method == "positional" and not aligned.low_confidence):
+            return
+        method = "[[순번]] ID" if aligned.method == "id" else "내용 비교"
+        summary = (
+            f"{method}로 맞춤: 번역 없는 블록 {len(aligned.missing):,}개, 남는 줄 {len(aligned.extra_lines):,}개, "
+            f"확인 필요 {len(aligned.low_confidence):,}개"
+        )
+        self._append_log(f"번역 TXT 정렬 ({Path(path).name}): {summary}")
+        if aligned.extra_lines:
+            self._append_log(f"  - 쓰이지 않은 TXT 줄: {', '.join(str(j + 1) for j in aligned.extra_lines[:20])}")
+        self.status_var.set(f"번역 TXT 로드됨: {len(self.txt_lines)}줄 — {summary}. F4로 확인 필요 항목 이동.")
         if self.srt_blocks and len(self.srt_blocks) != len(self.txt_lines):
             messagebox.showwarning(
                 "라인 수 불일치",
-                f"SRT 블록 수({len(self.srt_blocks)})와 TXT 라인 수({len(self.txt_lines)})가 다릅니다.\n"
-                "로딩은 완료되었습니다. 화면에서 어디가 밀렸는지 확인해 주세요.",
+                f"SRT 블록 수({len(self.srt_blocks)})와 TXT 라인 수({len(self.txt_lines)})가 다릅니다.\n\n"
+                f"{summary}.\n신뢰도가 낮은 행은 주황색으로 표시됩니다 (F4로 이동).",
             )
 
     def _rows_have_translated(self) -> bool:
@@ -1726,24 +1972,47 @@ class SrtVerifierMergerApp:
         """원본 텍스트에 내용이 하나라도 있으면 추출하기·AI번역 관련 메뉴 활성화, 없으면 비활성화(암전)."""
         has_original = self._rows_have_original()
         self.export_btn.config(state="normal" if has_original else "disabled")
+        self.retime_btn.config(state="normal" if self.rows else "disabled")
+        self.reflow_btn.config(state="normal" if self.rows else "disabled")
         self.ai_translate_btn.config(state="normal" if has_original else "disabled")
+        self.repair_btn.config(state="normal" if has_original else "disabled")
+        self.fanout_btn.config(state="normal" if has_original else "disabled")
         self.translate_range_entry.config(state="normal" if has_original else "disabled")
         self.ai_model_combo.config(state="readonly" if has_original else "disabled")
         # ai_lang_combo(번역 언어): 상시 활성화 (원본 파일 로드 여부 무관)
 
-    def _merge_and_refresh(self):
-        """SRT 블록과 TXT 라인을 병합한 뒤 Treeview 갱신."""
-        if not self.srt_blocks:
-            self.rows = []
-        else:
-            self.rows = merge_data(self.srt_blocks, self.txt_lines)
+    def _merge_rows(
+        self, srt_blocks: List[Dict[str, Any]], txt_lines: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Any]:
+        """SRT 블록과 TXT 라인을 병합한 행 목록과 TXT 정렬 결과(TXT가 없으면 None). 불러오기 작업 스레드에서 호출."""
+        if not srt_blocks:
+            return [], None
+        aligned = None
+        lines = txt_lines or []
+        if lines:
+            # 위치가 아니라 내용(길이·<br/>·숫자·문장 부호 또는 [[순번]] ID)으로 줄을 블록에 맞춘다
+            with tracing.span("align", blocks=len(srt_blocks), lines=len(lines)):
+                aligned = align_translation_lines(srt_blocks, lines)
+            lines = aligned.lines
+        with tracing.span("merge", blocks=len(srt_blocks), lines=len(lines)):
+            return merge_data(srt_blocks, lines), aligned
+
+    def _set_rows(self, rows: List[Dict[str, Any]], aligned: Any = None) -> None:
+        """행 목록을 통째로 교체 (한 번의 대입이라 편집과 섞이지 않음). 정렬 신뢰도 낮은 행·검색 위치도 새로 시작."""
+        self._align_review = set(aligned.low_confidence) if aligned is not None else set()
+        self._last_align = aligned
+        self.rows = rows
         self.search_current_index = -1
         self.search_matches = []
-        self._refresh_tree()
-        self.tree.heading("translated", text="번역 텍스트 (Translated)")
+
+    def _after_rows_replaced(self) -> None:
+        """행 목록을 바꾸고 표를 다시 채운 뒤: 번역 열 제목·버튼 상태·경고 수 갱신, 프로젝트 전체 저장 예약."""
+        has_ai = any(r.get("provenance") == PROVENANCE_AI for r in self.rows)
+        self.tree.heading("translated", text="번역 텍스트 (AI)" if has_ai else "번역 텍스트 (Translated)")
         self._update_merge_button_state()
         self._update_export_and_ai_translate_state()
         self._update_warning_count()
+        self._mark_project_dirty()
 
     def _get_selected_lang_code(self) -> str:
         """추출하기용 언어 드롭다운에서 선택된 언어 코드 반환 (예: EN, KR)."""
@@ -1817,7 +2086,25 @@ class SrtVerifierMergerApp:
             self.ai_model_combo.set(display)
         else:
             self.ai_model_combo.set(AI_MODEL_AUTO)
-        # 언어별 용어집 (glossary.json)
+        # QA 기준 (기본: 기존 45자 기준)
+        qa_profile = prefs.get("qa_profile", DEFAULT_QA_PROFILE_NAME)
+        self._qa_profile_name = qa_profile if qa_profile in QA_PROFILE_NAMES else DEFAULT_QA_PROFILE_NAME
+        self.qa_profile_combo.set(self._qa_profile_name)
+        self._export_ids_var.set(bool(prefs.get("export_ids", False)))
+        # API 호출 녹화 (UI 없음 — settings.json에서 직접 켬)
+        self._record_cassettes = bool(prefs.get("record_cassettes", False))
+        workers = prefs.get("translate_workers", 1)
+        self._translate_workers = max(1, min(8, int(workers))) if isinstance(workers, (int, float)) else 1
+        fanout_workers = prefs.get("fanout_workers", FANOUT_DEFAULT_CONCURRENCY)
+        self._fanout_workers = (
+            max(1, min(32, int(fanout_workers))) if isinstance(fanout_workers, (int, float)) else FANOUT_DEFAULT_CONCURRENCY
+        )
+        rpm = prefs.get("requests_per_minute", 0)
+        self._requests_per_minute = max(0.0, float(rpm)) if isinstance(rpm, (int, float)) else 0.0
+        fanout_langs = prefs.get("fanout_langs", [])
+        valid_codes = {code for code, _ in LANG_OPTIONS}
+        self._fanout_langs = [c for c in fanout_langs if c in valid_codes] if isinstance(fanout_langs, list) else []
+        # 언어별 용어집 (glossary.db, 처음 한 번 glossary.json에서 가져옴)
         self._load_glossary_data()
         # 메인 창 크기·위치
         mw = prefs.get("main_win_width")
@@ -1859,7 +2146,11 @@ class SrtVerifierMergerApp:
             prefs["font_size"] = self.font_size_combo.get()
             prefs["ai_lang"] = self.ai_lang_combo.get()
             prefs["ai_model"] = self._get_selected_model_id()
+            prefs["qa_profile"] = self._qa_profile_name
+            prefs["last_project"] = str(self._project_writer.path)
             prefs["log_viewer_visible"] = self._log_viewer_visible_var.get()
+            prefs["export_ids"] = self._export_ids_var.get()
+            prefs["fanout_langs"] = self._fanout_langs
             # 메인 창 크기·위치
             try:
                 prefs["main_win_width"] = self.root.winfo_width()
@@ -1873,60 +2164,203 @@ class SrtVerifierMergerApp:
         except Exception:
             pass
 
+    # ---- 프로젝트(.sbproj) 저장·복원 ----
+
+    def _project_meta(self) -> Dict[str, Any]:
+        """프로젝트 파일에 함께 저장할 메타 정보."""
+        target_lang = self.ai_lang_combo.get() or "English"
+        return {
+            "srt_path": self.srt_file_path,
+            "txt_path": self.txt_file_path,
+            "model": self._last_ai_model,
+            "target_lang": target_lang,
+            "glossary_version": glossary_version(self._get_glossary_text_for_lang(target_lang)),
+            "qa_profile": self._qa_profile_name,
+        }
+
+    def _mark_project_dirty(self, indices: Optional[List[int]] = None) -> None:
+        """자동 저장 예약 (디바운스). indices가 없으면 전체 스냅숏, 있으면 해당 행만 저널에 추가."""
+        if indices is None:
+            self._autosave_all = True
+        else:
+            self._autosave_rows.update(indices)
+        if self._autosave_after_id is not None:
+            self.root.after_cancel(self._autosave_after_id)
+        self._autosave_after_id = self.root.after(AUTOSAVE_DELAY_MS, self._autosave)
+
+    def _autosave(self) -> None:
+        """예약된 자동 저장 실행 (메인 스레드)."""
+        self._autosave_after_id = None
+        save_all, changed = self._autosave_all, self._autosave_rows
+        self._autosave_all = False
+        self._autosave_rows = set()
+        if not self.rows:
+            return
+        try:
+            if save_all:
+                self._project_writer.save_snapshot(self.rows, self._project_meta())
+            else:
+                self._project_writer.append_rows(self.rows, changed, self._project_meta())
+        except OSError as e:
+            self._append_log(f"[오류] 프로젝트 자동 저장 실패: {e}")
+
+    def _apply_project(self, path: Path) -> bool:
+        """프로젝트 파일을 읽어 현재 작업으로 교체. 성공 시 True."""
+        start = time.perf_counter()
+        data = load_project(path)
+        if not data.ok or not data.rows:
+            return False
+        meta = data.meta
+        self.rows = data.rows
+        self.srt_blocks = [
+            {k: r.get(k) for k in ("index", "timecode", "start_ms", "end_ms", "original")} for r in self.rows
+        ]
+        self.txt_lines = []
+        self._align_review = set()
+        self._last_align = None
+        self.srt_file_path = meta.get("srt_path")
+        self.txt_file_path = meta.get("txt_path")
+        self._last_ai_model = meta.get("model")
+        self._project_writer = ProjectWriter(path)
+        self.search_current_index = -1
+        self.search_matches = []
+        self._refresh_tree()
+        has_ai = any(r.get("provenance") == PROVENANCE_AI for r in self.rows)
+        self.tree.heading("translated", text="번역 텍스트 (AI)" if has_ai else "번역 텍스트 (Translated)")
+        self._update_merge_button_state()
+        self._update_export_and_ai_translate_state()
+        self._update_warning_count()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.status_var.set(f"작업 복원됨: {path} — 총 {len(self.rows)}행 ({elapsed_ms:.0f}ms).")
+        self._append_log(f"프로젝트 불러옴: {path} ({len(self.rows)}행, {elapsed_ms:.0f}ms)")
+        return True
+
+    def _restore_last_project(self) -> None:
+        """시작 시 마지막 프로젝트(없으면 자동 저장 파일)를 복원."""
+        path = AUTOSAVE_PROJECT_PATH
+        try:
+            if PREFS_PATH.exists():
+                last = json.loads(PREFS_PATH.read_text(encoding="utf-8")).get("last_project")
+                if last and Path(last).exists():
+                    path = Path(last)
+        except Exception:
+            pass
+        if path.exists():
+            self._apply_project(path)
+
+    def _on_open_project(self) -> None:
+        if self._file_load_busy():
+            return
+        path = filedialog.askopenfilename(
+            title="프로젝트 열기",
+            filetypes=[("SubBridge 프로젝트", f"*{PROJECT_EXTENSION}"), ("모든 파일", "*.*")],
+        )
+        if not path:
+            return
+        if not self._apply_project(Path(path)):
+            messagebox.showerror("오류", "프로젝트 파일을 열 수 없습니다.")
+
+    def _on_save_project(self) -> None:
+        if self._file_load_busy():
+            return
+        if not self.rows:
+            messagebox.showwarning("알림", "저장할 작업이 없습니다.")
+            return
+        initial = Path(self.srt_file_path).stem if self.srt_file_path else "project"
+        path = filedialog.asksaveasfilename(
+            title="프로젝트 저장",
+            defaultextension=PROJECT_EXTENSION,
+            initialfile=f"{initial}{PROJECT_EXTENSION}",
+            filetypes=[("SubBridge 프로젝트", f"*{PROJECT_EXTENSION}")],
+        )
+        if not path:
+            return
+        self._project_writer = ProjectWriter(Path(path))
+        try:
+            self._project_writer.save_snapshot(self.rows, self._project_meta())
+        except OSError as e:
+            messagebox.showerror("오류", f"프로젝트 저장 실패:\n{e}")
+            return
+        self._save_preferences()
+        self.status_var.set(f"프로젝트 저장됨: {path} (이후 변경은 자동 저장)")
+
     def _on_close(self):
-        """창 닫기: 설정 저장 후 종료."""
+        """창 닫기: 대기 중인 자동 저장 반영·설정 저장 후 종료."""
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+        if self._autosave_after_id is not None:
+            self.root.after_cancel(self._autosave_after_id)
+            self._autosave()
         self._save_preferences()
+        self._stats_manager.flush()
         if self._log_viewer:
             self._log_viewer.destroy()
             self._log_viewer = None
         self.root.destroy()
 
+    def _new_cassette_path(self, label: str) -> Optional[Path]:
+        """API 호출 녹화가 켜져 있으면 이번 작업의 카세트 경로, 아니면 None."""
+        if not self._record_cassettes:
+            return None
+        return default_cassette_path(CASSETTE_DIR, label)
+
     def _get_gemini_api_key(self) -> Optional[str]:
-        """사용 중인 Gemini API 키 반환 (.env 등에서 로드)."""
-        return load_gemini_api_key()
+        """사용 중인 Gemini API 키 반환 (.env 등에서 로드). 가짜 클라이언트(SUBBRIDGE_FAKE_GEMINI) 사용 시 키 없이도 진행."""
+        key = load_gemini_api_key()
+        if not key and fake_client_spec() is not None:
+            return "fake"
+        return key
 
     def _load_glossary_data(self) -> None:
-        """glossary.json에서 언어별 용어집 로드. 없으면 기존 settings.json glossary 마이그레이션 시도."""
-        self._glossary_data = {}
+        """
+        용어집 저장소(glossary.db) 열기. DB가 비어 있으면 기존 glossary.json을 한 번 가져오고(파일은 그대로 둠),
+        그것도 없으면 settings.json의 예전 glossary 텍스트를 첫 번째 언어로 이전한다.
+        """
+        store = GlossaryStore()
+        self._glossary_store = store
+        self._glossary_cache.clear()
+        if store.error:
+            self._append_log(f"[용어집] glossary.db를 열 수 없어 이번 실행 동안만 메모리에 보관합니다: {store.error}")
+        if not store.is_empty():
+            return
         if GLOSSARY_PATH.exists():
-            try:
-                raw = json.loads(GLOSSARY_PATH.read_text(encoding="utf-8"))
-                if isinstance(raw, dict):
-                    self._glossary_data = {
-                        k: (v if isinstance(v, dict) else {})
-                        for k, v in raw.items()
-                        if isinstance(k, str)
-                    }
-            except Exception:
-                pass
-        if not self._glossary_data:
-            # 마이그레이션: settings.json의 기존 glossary → 첫 번째 언어로 이전
-            try:
-                if PREFS_PATH.exists():
-                    prefs = json.loads(PREFS_PATH.read_text(encoding="utf-8"))
-                    old = (prefs.get("glossary") or "").strip()
-                    if old:
-                        d = _glossary_text_to_dict(old)
-                        if d:
-                            first_lang = LANG_DISPLAYS[0]
-                            self._glossary_data[first_lang] = d
-                            self._save_glossary_data()
-            except Exception:
-                pass
-
-    def _save_glossary_data(self) -> None:
-        """현재 _glossary_data를 glossary.json에 저장."""
+            count = store.import_json(GLOSSARY_PATH)
+            if count:
+                self._append_log(f"[용어집] glossary.json에서 {count}개 항목을 glossary.db로 옮겼습니다.")
+                return
+        # 마이그레이션: settings.json의 기존 glossary → 첫 번째 언어로 이전
         try:
-            GLOSSARY_PATH.write_text(
-                json.dumps(self._glossary_data, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            if PREFS_PATH.exists():
+                prefs = json.loads(PREFS_PATH.read_text(encoding="utf-8"))
+                old = (prefs.get("glossary") or "").strip()
+                if old:
+                    d = _glossary_text_to_dict(old)
+                    if d:
+                        store.bulk_upsert(LANG_DISPLAYS[0], d.items())
         except Exception:
             pass
 
+    def _get_glossary_dict(self, lang_display: str) -> Dict[str, str]:
+        """언어 용어집 {원본: 번역} (저장소가 바뀌었을 때만 다시 읽음). 호출자는 수정하지 않는다."""
+        store = self._glossary_store
+        if store is None:
+            return {}
+        lang = lang_display or ""
+        rev = store.revision(lang)
+        cached = self._glossary_cache.get(lang)
+        if cached is None or cached[0] != rev:
+            cached = (rev, store.as_dict(lang))
+            self._glossary_cache[lang] = cached
+        return cached[1]
+
     def _get_glossary_text_for_lang(self, lang_display: str) -> str:
-        """선택된 타겟 언어에 해당하는 용어집을 프롬프트용 '원본:번역' 텍스트로 반환."""
-        d = self._glossary_data.get(lang_display or "", {}) or {}
+        """
+        선택된 타겟 언어에 해당하는 용어집을 프롬프트용 '원본:번역' 텍스트로 반환.
+        GLOSSARY_PROMPT_MAX_TERMS개를 넘는 큰 용어집은 현재 파일 원문에 나오는 용어만 넣는다.
+        """
+        d = self._get_glossary_dict(lang_display)
+        if len(d) > GLOSSARY_PROMPT_MAX_TERMS:
+            d = self._get_glossary_matcher(lang_display).used_terms(r.get("original") or "" for r in self.rows)
         return _glossary_dict_to_text(d)
 
     def _load_glossary_font_size(self) -> str:
@@ -1998,7 +2432,13 @@ class SrtVerifierMergerApp:
             pass
 
     def _on_glossary_settings(self, event=None) -> None:
-        """용어집 설정 팝업: 독립 언어 선택 + 2열 Treeview + 글자 크기 + 추가/수정/삭제."""
+        """
+        용어집 설정 팝업: 독립 언어 선택 + 검색(입력하는 대로 필터) + 가상 스크롤 2열 Treeview + 글자 크기 + 추가/수정/삭제.
+        표에는 보이는 행만 glossary.db에서 읽어 채우고(10만 항목도 즉시 열림), 추가·수정·삭제는 항목 단위로 바로 저장한다.
+        """
+        store = self._glossary_store
+        if store is None:
+            return
         # 초기: 메인 프로그램 선택 언어로 동기화
         init_lang = (self.ai_lang_combo.get() or "").strip() or LANG_DISPLAYS[0]
         win_w, win_h, col_orig, col_trans = self._load_glossary_layout()
@@ -2014,10 +2454,21 @@ class SrtVerifierMergerApp:
         def get_glossary_lang() -> str:
             return (lang_combo_glossary.get() or "").strip() or LANG_DISPLAYS[0]
 
-        current_glossary_lang = [init_lang]  # mutable로 현재 편집 중 언어 추적
+        # 가상 스크롤 상태: 전체 결과 중 offset번째부터 visible개를 표에 표시
+        view: Dict[str, Any] = {
+            "lang": init_lang if init_lang in LANG_DISPLAYS else LANG_DISPLAYS[0],
+            "query": "",
+            "mode": SEARCH_PREFIX,
+            "total": 0,
+            "offset": 0,
+            "visible": 12,
+            "page": [],
+            "selected": None,   # 선택한 항목의 원본 단어 (페이지를 넘겨도 유지)
+            "filter_job": None,
+        }
 
         # 하단 프레임: 항상 고정 (pack side=bottom 먼저)
-        bottom_frame = ttk.LabelFrame(win, text="단어 추가/수정/삭제")
+        bottom_frame = ttk.LabelFrame(win, text="단어 추가/수정/삭제 (바로 저장됨)")
         bottom_frame.pack(side="bottom", fill="x", padx=10, pady=(4, 10))
         bottom_frame.columnconfigure(1, weight=1)
         bottom_frame.columnconfigure(3, weight=1)
@@ -2044,12 +2495,30 @@ class SrtVerifierMergerApp:
         ttk.Label(top_frame, text="언어:").pack(side="left", padx=(0, 4))
         lang_combo_glossary = ttk.Combobox(top_frame, values=LANG_DISPLAYS, state="readonly", width=12)
         lang_combo_glossary.pack(side="left", padx=(0, 16))
-        lang_combo_glossary.set(init_lang if init_lang in LANG_DISPLAYS else LANG_DISPLAYS[0])
+        lang_combo_glossary.set(view["lang"])
         ttk.Label(top_frame, text="글자 크기:").pack(side="left", padx=(0, 4))
         font_combo = ttk.Combobox(top_frame, values=FONT_LABELS, state="readonly", width=10)
         font_combo.pack(side="left", padx=(0, 12))
         font_label = self._load_glossary_font_size()
         font_combo.set(font_label if font_label in FONT_LABELS else GLOSSARY_FONT_DEFAULT_LABEL)
+        export_btn = ttk.Button(top_frame, text="내보내기…")
+        export_btn.pack(side="right")
+        import_btn = ttk.Button(top_frame, text="가져오기…")
+        import_btn.pack(side="right", padx=(0, 4))
+
+        # 검색: 입력하는 대로 필터 (앞부분 일치는 색인 조회, 포함은 원본·번역 모두 검색)
+        search_frame = ttk.Frame(win)
+        search_frame.pack(fill="x", padx=10, pady=(0, 4))
+        ttk.Label(search_frame, text="검색:").pack(side="left", padx=(0, 4))
+        filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(search_frame, textvariable=filter_var, width=24)
+        filter_entry.pack(side="left", padx=(0, 8))
+        mode_labels = {SEARCH_PREFIX: "앞부분 일치", SEARCH_SUBSTRING: "포함 (원본·번역)"}
+        mode_combo = ttk.Combobox(search_frame, values=list(mode_labels.values()), state="readonly", width=16)
+        mode_combo.pack(side="left", padx=(0, 12))
+        mode_combo.set(mode_labels[SEARCH_PREFIX])
+        count_label = ttk.Label(search_frame, text="")
+        count_label.pack(side="left")
 
         def get_font_pt() -> int:
             lb = font_combo.get()
@@ -2058,84 +2527,187 @@ class SrtVerifierMergerApp:
                     return pt
             return GLOSSARY_FONT_DEFAULT_PT
 
-        def on_font_changed() -> None:
-            pt = get_font_pt()
-            style = ttk.Style()
-            style.configure("Glossary.Treeview", font=("Segoe UI", pt), rowheight=FONT_ROWHEIGHT.get(pt, 28))
-            style.configure("Glossary.Treeview.Heading", font=("Segoe UI", pt, "bold"))
-            self._save_glossary_font_size(font_combo.get())
-
-        font_combo.bind("<<ComboboxSelected>>", lambda e: on_font_changed())
-
-        # Treeview 2열 (상단·중간 영역, expand로 남은 공간 채움)
-        trans_col = f"번역단어({get_glossary_lang()})"
+        # Treeview 2열 (중간 영역, expand로 남은 공간 채움). 항목은 보이는 만큼만 두고 값만 바꿔 끼운다.
         tree_frame = ttk.Frame(win)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=4)
-        scroll = ttk.Scrollbar(tree_frame)
         tree = ttk.Treeview(
             tree_frame,
             columns=("original", "translated"),
             show="headings",
             height=12,
-            yscrollcommand=scroll.set,
             selectmode="browse",
             style="Glossary.Treeview",
         )
         tree.heading("original", text="원본단어")
-        tree.heading("translated", text=trans_col)
+        tree.heading("translated", text=f"번역단어({view['lang']})")
         tree.column("original", width=col_orig, minwidth=80)
         tree.column("translated", width=col_trans, minwidth=80)
-        scroll.config(command=tree.yview)
         tree.pack(side="left", fill="both", expand=True)
-        scroll.pack(side="right", fill="y")
-        style = ttk.Style()
-        pt = get_font_pt()
-        style.configure("Glossary.Treeview", font=("Segoe UI", pt), rowheight=FONT_ROWHEIGHT.get(pt, 28))
-        style.configure("Glossary.Treeview.Heading", font=("Segoe UI", pt, "bold"))
         tree.tag_configure("odd", background="#f5f5f5")
         tree.tag_configure("even", background="#ffffff")
 
-        def load_glossary_for_lang(lang: str) -> None:
-            """선택된 언어의 용어집 데이터를 표에 로드. 헤더·데이터 갱신."""
-            d = dict(self._glossary_data.get(lang, {}) or {})
-            tree.heading("translated", text=f"번역단어({lang})")
-            for item in tree.get_children():
-                tree.delete(item)
-            for i, (orig, trans) in enumerate(sorted(d.items())):
-                tag = "even" if i % 2 == 0 else "odd"
-                tree.insert("", "end", values=(orig, trans or ""), tags=(tag,))
+        def apply_tree_font() -> None:
+            pt = get_font_pt()
+            style = ttk.Style()
+            style.configure("Glossary.Treeview", font=("Segoe UI", pt), rowheight=FONT_ROWHEIGHT.get(pt, 28))
+            style.configure("Glossary.Treeview.Heading", font=("Segoe UI", pt, "bold"))
+
+        apply_tree_font()
+
+        def render() -> None:
+            """view의 offset부터 visible개를 저장소에서 읽어 표의 고정 항목에 채운다."""
+            page = store.search(view["lang"], view["query"], view["mode"], view["offset"], view["visible"])
+            view["page"] = page
+            items = tree.get_children()
+            for extra in items[len(page):]:
+                tree.delete(extra)
+            for k, (orig, trans) in enumerate(page):
+                iid = f"g{k}"
+                tag = "even" if (view["offset"] + k) % 2 == 0 else "odd"
+                if k < len(items):
+                    tree.item(iid, values=(orig, trans or ""), tags=(tag,))
+                else:
+                    tree.insert("", "end", iid=iid, values=(orig, trans or ""), tags=(tag,))
+            sel = [f"g{k}" for k, (orig, _t) in enumerate(page) if orig == view["selected"]]
+            if tuple(sel) != tree.selection():
+                tree.selection_set(sel)
+            total = view["total"]
+            if total:
+                scroll.set(view["offset"] / total, min(1.0, (view["offset"] + len(page)) / total))
+            else:
+                scroll.set(0.0, 1.0)
+
+        def set_offset(offset: int) -> None:
+            offset = max(0, min(offset, view["total"] - view["visible"]))
+            if offset != view["offset"]:
+                view["offset"] = offset
+                render()
+
+        def requery(keep_offset: bool = False) -> None:
+            """검색 조건·언어가 바뀌었거나 항목이 추가·삭제되었을 때 전체 수를 다시 세고 표시."""
+            view["total"] = store.count(view["lang"], view["query"], view["mode"])
+            if view["query"]:
+                count_label.config(text=f"{view['total']:,}개 일치 / 전체 {store.count(view['lang']):,}개")
+            else:
+                count_label.config(text=f"전체 {view['total']:,}개")
+            offset = view["offset"] if keep_offset else 0
+            view["offset"] = max(0, min(offset, view["total"] - view["visible"]))
+            render()
+
+        def reveal(source: str) -> None:
+            """source 항목이 보이도록 스크롤하고 선택 (현재 검색 조건에 맞을 때)."""
+            view["selected"] = source
+            pos = store.index_of(view["lang"], source, view["query"], view["mode"])
+            if pos >= 0 and not (view["offset"] <= pos < view["offset"] + view["visible"]):
+                view["offset"] = max(0, min(pos - view["visible"] // 2, view["total"] - view["visible"]))
+            render()
+
+        def on_scrollbar(*args: Any) -> None:
+            if not args:
+                return
+            if args[0] == "moveto":
+                set_offset(int(float(args[1]) * view["total"]))
+            elif args[0] == "scroll":
+                step = int(args[1])
+                set_offset(view["offset"] + (step * max(1, view["visible"] - 1) if args[2] == "pages" else step))
+
+        scroll = ttk.Scrollbar(tree_frame, command=on_scrollbar)
+        scroll.pack(side="right", fill="y")
+
+        def update_visible(height: int) -> None:
+            # 제목 행을 빼고 화면에 온전히 보이는 행 수
+            row_h = FONT_ROWHEIGHT.get(get_font_pt(), 28)
+            visible = max(1, (height - row_h - 4) // row_h)
+            if visible != view["visible"]:
+                view["visible"] = visible
+                view["offset"] = max(0, min(view["offset"], view["total"] - visible))
+                render()
+
+        tree.bind("<Configure>", lambda e: update_visible(e.height))
+
+        def on_wheel(event: tk.Event) -> str:
+            if getattr(event, "num", None) == 4:
+                delta = -3
+            elif getattr(event, "num", None) == 5:
+                delta = 3
+            else:
+                delta = -3 if event.delta > 0 else 3
+            set_offset(view["offset"] + delta)
+            return "break"
+
+        tree.bind("<MouseWheel>", on_wheel)
+        tree.bind("<Button-4>", on_wheel)
+        tree.bind("<Button-5>", on_wheel)
+
+        def move_selection(step: int) -> str:
+            """↑↓/PgUp/PgDn: 페이지 끝에서는 표를 스크롤하며 선택 이동."""
+            page = view["page"]
+            if not page:
+                return "break"
+            sel = tree.selection()
+            pos = view["offset"] + (tree.index(sel[0]) if sel else -1 if step > 0 else len(page))
+            pos = max(0, min(pos + step, view["total"] - 1))
+            if pos < view["offset"]:
+                view["offset"] = pos
+            elif pos >= view["offset"] + view["visible"]:
+                view["offset"] = max(0, pos - view["visible"] + 1)
+            view["selected"] = None
+            render()
+            k = pos - view["offset"]
+            if 0 <= k < len(view["page"]):
+                tree.selection_set(f"g{k}")
+                tree.focus(f"g{k}")
+            return "break"
+
+        tree.bind("<Up>", lambda e: move_selection(-1))
+        tree.bind("<Down>", lambda e: move_selection(1))
+        tree.bind("<Prior>", lambda e: move_selection(-max(1, view["visible"] - 1)))
+        tree.bind("<Next>", lambda e: move_selection(max(1, view["visible"] - 1)))
+
+        def on_font_changed() -> None:
+            apply_tree_font()
+            self._save_glossary_font_size(font_combo.get())
+            update_visible(tree.winfo_height())
+
+        font_combo.bind("<<ComboboxSelected>>", lambda e: on_font_changed())
+
+        def apply_filter() -> None:
+            view["filter_job"] = None
+            view["query"] = (filter_var.get() or "").strip()
+            view["mode"] = next((m for m, lb in mode_labels.items() if lb == mode_combo.get()), SEARCH_PREFIX)
+            requery()
+
+        def schedule_filter(*_args: Any) -> None:
+            # 입력이 잠깐 멈췄을 때 한 번만 조회 (부분 문자열 검색은 전체를 훑으므로)
+            if view["filter_job"] is not None:
+                win.after_cancel(view["filter_job"])
+            view["filter_job"] = win.after(150, apply_filter)
+
+        filter_var.trace_add("write", schedule_filter)
+        mode_combo.bind("<<ComboboxSelected>>", lambda e: apply_filter())
+        filter_entry.bind("<Return>", lambda e: apply_filter())
 
         def on_glossary_lang_changed() -> None:
-            """용어집 창 언어 변경: 현재 표 데이터 저장 후 새 언어 로드. 메인 창은 변경 없음."""
-            self._glossary_data[current_glossary_lang[0]] = tree_to_dict()
-            new_lang = get_glossary_lang()
-            current_glossary_lang[0] = new_lang
-            load_glossary_for_lang(new_lang)
+            """용어집 창 언어 변경: 새 언어 로드 (항목은 이미 저장되어 있음). 메인 창은 변경 없음."""
+            view["lang"] = get_glossary_lang()
+            view["selected"] = None
+            tree.heading("translated", text=f"번역단어({view['lang']})")
             orig_var.set("")
             trans_var.set("")
+            requery()
 
         lang_combo_glossary.bind("<<ComboboxSelected>>", lambda e: on_glossary_lang_changed())
 
-        lang_dict = dict(self._glossary_data.get(get_glossary_lang(), {}) or {})
-        for i, (orig, trans) in enumerate(sorted(lang_dict.items())):
-            tag = "even" if i % 2 == 0 else "odd"
-            tree.insert("", "end", values=(orig, trans or ""), tags=(tag,))
-
-        def tree_to_dict() -> Dict[str, str]:
-            out: Dict[str, str] = {}
-            for item in tree.get_children():
-                v = tree.item(item, "values")
-                if v and len(v) >= 2 and (v[0] or "").strip():
-                    out[(v[0] or "").strip()] = (v[1] or "").strip()
-            return out
-
-        def refresh_tree() -> None:
-            for item in tree.get_children():
-                tree.delete(item)
-            d = tree_to_dict()
-            for i, (orig, trans) in enumerate(sorted(d.items())):
-                tag = "even" if i % 2 == 0 else "odd"
-                tree.insert("", "end", values=(orig, trans or ""), tags=(tag,))
+        def set_status(text: str) -> None:
+            if count_label.winfo_exists():
+                count_label.config(text=text)
+
+        def after_bulk_change() -> None:
+            if win.winfo_exists():
+                requery(keep_offset=True)
+
+        import_btn.config(command=lambda: self._on_glossary_import(win, view["lang"], after_bulk_change))
+        export_btn.config(command=lambda: self._on_glossary_export(win, set_status, after_bulk_change))
 
         def on_select(event: tk.Event) -> None:
             sel = tree.selection()
@@ -2143,24 +2715,23 @@ class SrtVerifierMergerApp:
                 return
             item = tree.item(sel[0], "values")
             if item and len(item) >= 2:
+                # 스크롤·추가로 같은 항목이 다시 선택된 경우에는 입력창(작성 중이거나 비운 상태)을 덮어쓰지 않음
+                if item[0] == view["selected"] and (orig_var.get() or "").strip() in ("", item[0]):
+                    return
+                view["selected"] = item[0] or None
                 orig_var.set(item[0] or "")
                 trans_var.set(item[1] or "")
 
-        def _rebuild_tree_from_dict(d: Dict[str, str]) -> None:
-            for item in tree.get_children():
-                tree.delete(item)
-            for i, (orig, trans) in enumerate(sorted(d.items())):
-                tag = "even" if i % 2 == 0 else "odd"
-                tree.insert("", "end", values=(orig, trans or ""), tags=(tag,))
-
         def add_or_update() -> None:
             o = (orig_var.get() or "").strip()
             if not o:
                 return
             t = (trans_var.get() or "").strip()
-            d = tree_to_dict()
-            d[o] = t
-            _rebuild_tree_from_dict(d)
+            if not store.upsert(view["lang"], o, t):
+                messagebox.showerror("용어집", f"'{o}' 항목을 저장하지 못했습니다.", parent=win)
+                return
+            requery(keep_offset=True)
+            reveal(o)
             orig_var.set("")
             trans_var.set("")
             orig_entry.focus_set()
@@ -2172,10 +2743,9 @@ class SrtVerifierMergerApp:
                 if sel:
                     vals = tree.item(sel[0], "values")
                     o = (vals[0] or "").strip() if vals else ""
-            if o:
-                d = tree_to_dict()
-                d.pop(o, None)
-                _rebuild_tree_from_dict(d)
+            if o and store.delete(view["lang"], o):
+                view["selected"] = None
+                requery(keep_offset=True)
                 orig_var.set("")
                 trans_var.set("")
 
@@ -2207,43 +2777,213 @@ class SrtVerifierMergerApp:
             _force_ime_commit()
             win.focus_set()
             win.update()
-            # 미등록 텍스트 감지: 입력창에 작성 중인 단어가 있으면 확인 팝업
+            # 미등록 텍스트 감지: 입력창에 작성 중인 단어가 있고 저장된 내용과 다르면 확인 팝업
             has_orig = (orig_var.get() or "").strip()
             has_trans = (trans_var.get() or "").strip()
-            if has_orig or has_trans:
+            if (has_orig or has_trans) and store.get(view["lang"], has_orig) != has_trans:
                 result = messagebox.askyesnocancel(
                     "저장 확인",
-                    "입력창에 작성 중인 단어가 있습니다.\n이 단어를 용어집에 적용한 후 저장하시겠습니까?",
+                    "입력창에 작성 중인 단어가 있습니다.\n이 단어를 용어집에 적용한 후 닫으시겠습니까?",
                     parent=win,
                 )
                 if result is None:  # 취소 → 창 유지
                     return
-                if result:  # 예 → 추가/수정 후 저장
+                if result:  # 예 → 추가/수정 후 닫기
                     add_or_update()
-                # 아니요 → 입력창 무시하고 저장
-            self._glossary_data[current_glossary_lang[0]] = tree_to_dict()
-            self._save_glossary_data()
+                # 아니요 → 입력창 무시하고 닫기
+            if view["filter_job"] is not None:
+                win.after_cancel(view["filter_job"])
             self._save_glossary_layout(win, tree)
             self._save_preferences()
             win.destroy()
 
         ttk.Button(btn_row, text="추가/수정", command=add_or_update).pack(side="left", padx=(0, 4))
         ttk.Button(btn_row, text="삭제 (Del)", command=delete_selected).pack(side="left", padx=(0, 4))
-        ttk.Button(btn_row, text="저장 후 닫기 (Ctrl+S)", command=save_and_close).pack(side="right", padx=4)
+        ttk.Button(btn_row, text="닫기 (Ctrl+S)", command=save_and_close).pack(side="right", padx=4)
         win.protocol("WM_DELETE_WINDOW", save_and_close)
 
         # ---- 용어집 창 전용 단축키 ----
-        win.bind("<Delete>", lambda e: delete_selected())
+        tree.bind("<Delete>", lambda e: delete_selected())
         def _on_ctrl_s(e):
             _force_ime_commit()          # 키 이벤트 시점에 즉시 IME 확정
-            win.after(50, save_and_close) # 약간의 지연 후 저장 (IME 처리 완료 대기)
+            win.after(50, save_and_close) # 약간의 지연 후 닫기 (IME 처리 완료 대기)
             return "break"
         win.bind("<Control-s>", _on_ctrl_s)
         win.bind("<Control-S>", _on_ctrl_s)
+        def _on_ctrl_f(e):
+            filter_entry.focus_set()
+            filter_entry.select_range(0, "end")
+            return "break"
+        win.bind("<Control-f>", _on_ctrl_f)
         win.bind("<Escape>", lambda e: save_and_close())
 
+        requery()
         orig_entry.focus_set()
 
+    def _on_glossary_import(self, parent: tk.Toplevel, default_lang: str, on_done: Callable[[], None]) -> None:
+        """
+        용어집 가져오기 (CSV/TSV/TBX): 원문 언어·번역 열 언어·충돌 처리를 고른 뒤 미리 보기(저장 안 함) 또는 가져오기.
+        파일 읽기·DB 반영은 워커 스레드에서 하고 진행률·보고서만 root.after로 표시한다.
+        """
+        store = self._glossary_store
+        if store is None:
+            return
+        path = filedialog.askopenfilename(
+            parent=parent,
+            title="용어집 가져오기",
+            filetypes=[("용어집 (CSV, TSV, TBX)", "*.csv *.tsv *.tab *.tbx *.xml"), ("모든 파일", "*.*")],
+        )
+        if not path:
+            return
+        name = Path(path).name
+        auto_label = "자동 (파일 기준)"
+
+        dlg = tk.Toplevel(parent)
+        self._apply_icon_to_toplevel(dlg)
+        dlg.title("용어집 가져오기")
+        dlg.transient(parent)
+        dlg.resizable(False, False)
+        dlg.grab_set()
+        frame = ttk.Frame(dlg, padding=12)
+        frame.pack(fill="both", expand=True)
+        ttk.Label(frame, text=f"파일: {name}").grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
+        ttk.Label(frame, text="원문 언어:").grid(row=1, column=0, sticky="w", padx=(0, 8))
+        source_combo = ttk.Combobox(frame, values=[auto_label, *LANG_DISPLAYS], state="readonly", width=18)
+        source_combo.grid(row=1, column=1, sticky="w", pady=2)
+        source_combo.set(auto_label)
+        ttk.Label(frame, text="번역 열 언어:").grid(row=2, column=0, sticky="w", padx=(0, 8))
+        target_combo = ttk.Combobox(frame, values=LANG_DISPLAYS, state="readonly", width=18)
+        target_combo.grid(row=2, column=1, sticky="w", pady=2)
+        target_combo.set(default_lang if default_lang in LANG_DISPLAYS else LANG_DISPLAYS[0])
+        ttk.Label(frame, text="(\"target\"/\"번역\" 열 또는 머리글 없는 2열 파일)", foreground="gray").grid(
+            row=3, column=1, sticky="w"
+        )
+        ttk.Label(frame, text="충돌 시:").grid(row=4, column=0, sticky="w", padx=(0, 8), pady=(6, 0))
+        conflict_var = tk.StringVar(value=CONFLICT_KEEP)
+        conflict_row = ttk.Frame(frame)
+        conflict_row.grid(row=4, column=1, sticky="w", pady=(6, 0))
+        ttk.Radiobutton(conflict_row, text="기존 유지", variable=conflict_var, value=CONFLICT_KEEP).pack(side="left")
+        ttk.Radiobutton(conflict_row, text="덮어쓰기", variable=conflict_var, value=CONFLICT_OVERWRITE).pack(
+            side="left", padx=(8, 0)
+        )
+        pb_var = tk.DoubleVar(value=0.0)
+        ttk.Progressbar(frame, variable=pb_var, maximum=100, length=360).grid(
+            row=5, column=0, columnspan=2, sticky="ew", pady=(10, 4)
+        )
+        report_label = ttk.Label(frame, text="미리 보기로 추가·수정·충돌 수를 먼저 확인할 수 있습니다.", justify="left", wraplength=420)
+        report_label.grid(row=6, column=0, columnspan=2, sticky="w", pady=(0, 8))
+        btn_row = ttk.Frame(frame)
+        btn_row.grid(row=7, column=0, columnspan=2, sticky="e")
+        preview_btn = ttk.Button(btn_row, text="미리 보기")
+        preview_btn.pack(side="left", padx=(0, 4))
+        run_btn = ttk.Button(btn_row, text="가져오기")
+        run_btn.pack(side="left", padx=(0, 4))
+        close_btn = ttk.Button(btn_row, text="닫기")
+        close_btn.pack(side="left")
+
+        cancel = threading.Event()
+        running = [False]
+
+        def finished(report) -> None:
+            running[0] = False
+            if not report.dry_run:
+                on_done()
+                self._append_log(f"[용어집] 가져오기 {name}: " + format_import_report(report).replace("\n", " / "))
+            if not dlg.winfo_exists():
+                return
+            report_label.config(text=format_import_report(report))
+            preview_btn.config(state="normal")
+            run_btn.config(state="normal")
+            close_btn.config(text="닫기")
+
+        def start(dry_run: bool) -> None:
+            source = source_combo.get()
+            options = dict(
+                source_lang=None if source == auto_label else source,
+                default_lang=target_combo.get() or default_lang,
+                on_conflict=conflict_var.get(),
+                dry_run=dry_run,
+            )
+            running[0] = True
+            cancel.clear()
+            pb_var.set(0.0)
+            preview_btn.config(state="disabled")
+            run_btn.config(state="disabled")
+            close_btn.config(text="취소")
+            report_label.config(text="미리 보는 중…" if dry_run else "가져오는 중…")
+
+            def progress(done: int, total: int) -> None:
+                self.root.after(0, lambda: pb_var.set(done * 100.0 / max(1, total)) if dlg.winfo_exists() else None)
+
+            def worker() -> None:
+                with tracing.span("glossary_import", dry_run=dry_run):
+                    report = import_glossary(
+                        store, path, progress_callback=progress, cancel_check=cancel.is_set, **options
+                    )
+                self.root.after(0, lambda: finished(report))
+
+            threading.Thread(target=worker, daemon=True).start()
+
+        def close() -> None:
+            if running[0]:
+                cancel.set()
+                return
+            dlg.destroy()
+            if parent.winfo_exists():
+                parent.grab_set()
+
+        preview_btn.config(command=lambda: start(True))
+        run_btn.config(command=lambda: start(False))
+        close_btn.config(command=close)
+        dlg.protocol("WM_DELETE_WINDOW", close)
+        dlg.bind("<Escape>", lambda e: close())
+
+    def _on_glossary_export(
+        self, parent: tk.Toplevel, set_status: Callable[[str], None], on_done: Callable[[], None]
+    ) -> None:
+        """
+        용어집 내보내기: 항목이 있는 모든 언어를 원어 기준으로 합쳐 CSV/TSV/TBX 한 파일로 (워커 스레드).
+        TBX의 원문 언어는 추출 언어 선택(원본 자막 언어)을 쓴다.
+        """
+        store = self._glossary_store
+        if store is None:
+            return
+        present = store.languages()
+        langs = [lang for lang in LANG_DISPLAYS if lang in present] + [lang for lang in present if lang not in LANG_DISPLAYS]
+        if not langs:
+            messagebox.showinfo("용어집 내보내기", "내보낼 용어가 없습니다.", parent=parent)
+            return
+        path = filedialog.asksaveasfilename(
+            parent=parent,
+            title="용어집 내보내기",
+            defaultextension=".csv",
+            initialfile="glossary.csv",
+            filetypes=[("CSV", "*.csv"), ("TSV", "*.tsv"), ("TBX", "*.tbx")],
+        )
+        if not path:
+            return
+        source_lang = self.lang_combo.get() or LANG_DISPLAYS[0]
+        set_status("내보내는 중…")
+
+        def progress(done: int, total: int) -> None:
+            self.root.after(0, lambda: set_status(f"내보내는 중… {done * 100 // max(1, total)}%"))
+
+        def finished(report) -> None:
+            on_done()
+            if report.ok:
+                self._append_log(f"[용어집] 내보내기: {report.entries:,}개 → {path}")
+                if parent.winfo_exists():
+                    messagebox.showinfo("용어집 내보내기", f"{report.entries:,}개 원어를 저장했습니다.\n{path}", parent=parent)
+            elif parent.winfo_exists():
+                messagebox.showerror("용어집 내보내기", f"저장하지 못했습니다: {report.error}", parent=parent)
+
+        def worker() -> None:
+            with tracing.span("glossary_export", langs=len(langs)):
+                report = export_glossary(store, path, langs, source_lang=source_lang, progress_callback=progress)
+            self.root.after(0, lambda: finished(report))
+
+        threading.Thread(target=worker, daemon=True).start()
+
     def _on_translate_range_focus_in(self, event: tk.Event) -> None:
         if self._translate_range_placeholder_active:
             self.translate_range_var.set("")
@@ -2495,28 +3235,37 @@ class SrtVerifierMergerApp:
         indices_0based = [n - 1 for n in parsed]
         return (True, indices_0based)
 
-    # ---- Fake Progress (0% → 99% in 5s, 50ms/1%; 완료 시 100% 후 0.5초 뒤 숨김) ----
-    FAKE_PROGRESS_INTERVAL_MS = 50  # 5000ms / 100단계 ≈ 50ms
-    FAKE_PROGRESS_CAP = 99
+    # ---- 작업 진행률 (JobProgress 스냅샷을 주기적으로 읽어 진행 바·상태바 갱신; 완료 시 100% 후 0.5초 뒤 숨김) ----
+    PROGRESS_POLL_MS = 250
     HIDE_PROGRESS_AFTER_MS = 500
 
-    def _start_fake_progress(self) -> None:
-        """프로그레스 바 표시, 0%로 초기화, 1%씩 증가하는 타이머 시작 (5초에 99% 도달)."""
+    def _start_job_progress(self, progress: JobProgress) -> None:
+        """프로그레스 바 표시 후 진행 추적 폴링 시작 (완료 행·진행 중 배치 기준, 완료 전에는 99%까지만)."""
         self._translation_done_flag = False
+        self._job_progress = progress
         self.progress_bar.grid()
         self.progress_var.set(0)
-        self._progress_after_id = self.root.after(self.FAKE_PROGRESS_INTERVAL_MS, self._tick_fake_progress)
+        self._progress_after_id = self.root.after(self.PROGRESS_POLL_MS, self._tick_job_progress)
 
-    def _tick_fake_progress(self) -> None:
-        """타이머 콜백: 1% 증가, 99% 미만이고 번역 미완료일 때만 다음 타이머 예약."""
+    def _tick_job_progress(self) -> None:
+        """타이머 콜백: 진행률·처리 속도·요청 중 배치·폴백·남은 시간 표시. 번역 완료 시 중지."""
         self._progress_after_id = None
-        if self._translation_done_flag:
+        progress = self._job_progress
+        if self._translation_done_flag or progress is None:
             return
-        current = self.progress_var.get()
-        if current >= self.FAKE_PROGRESS_CAP:
-            return  # 99%에서 대기, 타이머 중지
-        self.progress_var.set(current + 1)
-        self._progress_after_id = self.root.after(self.FAKE_PROGRESS_INTERVAL_MS, self._tick_fake_progress)
+        snap = progress.snapshot()
+        self.progress_var.set(min(99.0, snap.fraction * 100.0))
+        self.status_var.set(f"AI 번역 중... {format_progress(snap)}")
+        if self._translate_all_mode_active:
+            self._update_translate_all_progress_ui(snap)
+        self._progress_after_id = self.root.after(self.PROGRESS_POLL_MS, self._tick_job_progress)
+
+    def _expected_model(self) -> str:
+        """이번 작업에 쓰일 것으로 보이는 모델 (자동이면 마지막 사용 모델, 없으면 우선순위 첫 모델) — 추정용."""
+        selected = self._get_selected_model_id()
+        if selected and selected != AI_MODEL_AUTO:
+            return selected
+        return self._last_ai_model or AI_MODEL_FALLBACKS[0]
 
     def _hide_progress_bar(self) -> None:
         """프로그레스 바 숨기기 (메인 스레드에서만 호출)."""
@@ -2524,8 +3273,8 @@ class SrtVerifierMergerApp:
 
     # ---- 모두 번역(Translate All) 전용 진행 다이얼로그 ----
 
-    def _start_translate_all_progress(self, total_batches: int) -> None:
-        """모두 번역 모드용 모달 진행 다이얼로그 생성."""
+    def _start_translate_all_progress(self, total_batches: int, title: str = "모두 번역 진행 중") -> None:
+        """모두 번역(조건 재번역 포함) 모드용 모달 진행 다이얼로그 생성."""
         self._translate_all_total_batches = max(1, total_batches)
         self._translate_all_current_batch = 0
         self._translate_all_cancel_requested = False
@@ -2538,12 +3287,12 @@ class SrtVerifierMergerApp:
 
         win = tk.Toplevel(self.root)
         self._apply_icon_to_toplevel(win)
-        win.title("모두 번역 진행 중")
+        win.title(title)
         win.resizable(False, False)
         win.transient(self.root)
         # grab_set 미사용 — 메인 윈도우 드래그 가능하도록
 
-        status_var = tk.StringVar(value=f"진행 중... (0/{self._translate_all_total_batches} 단계)")
+        status_var = tk.StringVar(value=f"진행 중... (0/{self._translate_all_total_batches} 단계)\n남은 시간 계산 중")
         pb_var = tk.DoubleVar(value=0.0)
         ttk.Label(win, textvariable=status_var).pack(padx=12, pady=(10, 4))
         pb = ttk.Progressbar(win, variable=pb_var, maximum=100, length=280)
@@ -2560,15 +3309,19 @@ class SrtVerifierMergerApp:
         win.update_idletasks()
         self._update_translate_all_dialog_position()
 
-    def _update_translate_all_progress_ui(self, current_batch: int, total_batches: int) -> None:
-        """모두 번역 배치 완료 시 진행률/상태 라벨 갱신 (메인 스레드)."""
+    def _update_translate_all_progress_ui(self, snap: Any) -> None:
+        """모두 번역 진행 다이얼로그 갱신 (메인 스레드, ProgressSnapshot 기준). 취소 요청 후에는 안내 문구 유지."""
         if self._translate_all_progress_var is None or self._translate_all_status_var is None:
             return
-        total_batches = max(1, total_batches)
-        current_batch = max(0, min(current_batch, total_batches))
-        percent = (current_batch / total_batches) * 100.0
-        self._translate_all_progress_var.set(percent)
-        self._translate_all_status_var.set(f"진행 중... ({current_batch}/{total_batches} 단계)")
+        self._translate_all_progress_var.set(min(99.0, snap.fraction * 100.0))
+        if self._translate_all_cancel_requested:
+            return
+        total_batches = self._translate_all_total_batches
+        done = min(snap.batches_done, total_batches)
+        self._translate_all_status_var.set(
+            f"진행 중... ({done}/{total_batches} 단계, {snap.rows_done:,}/{snap.rows_total:,}줄)\n"
+            f"{snap.rows_per_sec:.1f}줄/s · 요청 중 {snap.in_flight} · 폴백 {snap.fallbacks} · 남은 시간 {format_eta(snap.eta_seconds)}"
+        )
 
     def _on_translate_all_cancel(self) -> None:
         """모두 번역 진행 중 취소 요청."""
@@ -2578,9 +3331,9 @@ class SrtVerifierMergerApp:
         if self._translate_all_status_var is not None:
             self._translate_all_status_var.set("취소 요청 중... 현재 배치 완료 후 중단됩니다.")
 
-    def _on_translation_done(self, success: bool, arg1: Any, arg2: Any, elapsed: float = 0.0) -> None:
-        """번역 스레드 완료 시 메인 스레드에서 호출: 100% 강제, 타이머 중지, UI 갱신 후 0.5초 뒤 바 숨김."""
-         # 모두 번역 진행 다이얼로그 정리
+    def _end_job_progress(self) -> None:
+        """번역 작업 종료 (메인 스레드): 모두 번역 진행 다이얼로그 정리, 진행 추적 타이머 중지, 진행 바 100%."""
+        # 모두 번역 진행 다이얼로그 정리
         if self._translate_all_dialog is not None and self._translate_all_dialog.winfo_exists():
             try:
                 self._translate_all_dialog.destroy()
@@ -2597,7 +3350,13 @@ class SrtVerifierMergerApp:
             except (tk.TclError, OSError, ValueError):
                 pass
             self._progress_after_id = None
+        self._job_progress = None
         self.progress_var.set(100)
+
+    def _on_translation_done(self, success: bool, arg1: Any, arg2: Any, elapsed: float = 0.0) -> None:
+        """번역 스레드 완료 시 메인 스레드에서 호출: 100% 강제, 타이머 중지, UI 갱신 후 0.5초 뒤 바 숨김."""
+        self._end_job_progress()
+        self._mark_project_dirty()
         if success:
             chosen_name, total = arg1, arg2
             self._last_ai_model = chosen_name
@@ -2616,11 +3375,18 @@ class SrtVerifierMergerApp:
             # 로그: 작업 평균 vs 누적 평균 (가독성 강화)
             cum = self._stats_manager.get_average(chosen_name) if chosen_name else None
             cum_str = f"{cum[0]:.2f}s/개 (총 {cum[1]:,}개 기준)" if cum else "(데이터 수집 중...)"
+            recent = self._stats_manager.get_latency(chosen_name, days=7) if chosen_name else None
+            recent_str = (
+                f"p50 {recent.p50:.1f}s / p95 {recent.p95:.1f}s / p99 {recent.p99:.1f}s "
+                f"(배치 {recent.batches:,}개, 오류 {recent.error_rate:.0%}, 폴백 {recent.fallback_rate:.0%})"
+                if recent else "(데이터 수집 중...)"
+            )
             self._append_log(
                 "[OK] [작업 완료] 모든 번역이 끝났습니다.\n"
                 f"[Stats] 작업 내역 (Model: {model_label})\n"
                 f"   |- 작업 평균: {per_line:.2f}s/개\n"
-                f"   |- 누적 평균: {cum_str}"
+                f"   |- 누적 평균: {cum_str}\n"
+                f"   |- 최근 7일 배치 지연: {recent_str}"
             )
             messagebox.showinfo("AI 번역 완료", f"모델: {model_label}\n총 {total}줄 번역 완료.\n소요 시간: {elapsed:.1f}초 ({per_line:.2f}s/줄)")
         else:
@@ -2707,162 +3473,100 @@ class SrtVerifierMergerApp:
         row_indices_0based: Optional[List[int]] = None,
     ) -> Tuple[bool, Any, Any]:
         """번역 실행 (워커 스레드에서만 호출). self.rows를 직접 수정. row_indices_0based가 있으면 해당 행만 번역. (success, chosen_name_or_err, total_or_none) 반환."""
+        engine = TranslationEngine(
+            api_key=api_key,
+            target_lang=target_lang,
+            model=AI_MODEL_AUTO if use_auto else selected_model,
+            glossary_text=glossary_text,
+            batch_size=batch_size,
+            qa_profile=get_qa_profile(self._qa_profile_name),
+            record_path=self._new_cassette_path("translate"),
+            max_workers=self._translate_workers,
+            # 자동 선택: 최근 오류가 잦은 모델은 다른 모델이 모두 실패할 때만 사용
+            avoid_models=self._stats_manager.unhealthy_models(AI_MODEL_FALLBACKS) if use_auto else (),
+        )
+        log_cb = lambda m: self.root.after(0, lambda msg=m: self._append_log(msg))
+        overflow_cb = lambda m: self.root.after(0, lambda msg=m: self._append_length_warning_log(msg))
+
+        def on_rows_done(done: List[int]) -> None:
+            # 완료된 배치 행은 자동 저장 대상 (긴 작업 중 비정상 종료 대비)
+            self.root.after(0, lambda d=done: self._mark_project_dirty(d))
+
+        def on_batch_done(current_batch: int, batch_total: int) -> None:
+            # 모두 번역 모드: 그리드 즉시 갱신 (진행률은 _tick_job_progress가 JobProgress로 표시)
+            if self._translate_all_mode_active:
+                self.root.after(0, self._refresh_tree)
+
+        rows_count = len(row_indices_0based) if row_indices_0based is not None else len(self.rows)
         try:
-            client = genai.Client(api_key=api_key)
-            system_instruction = (
-                f"너는 뛰어난 **{target_lang}** 번역 전문가야. 문맥을 고려해 자연스럽게 번역해 줘.\n\n"
-                "【필수 규칙 — <br/> 처리 (최우선)】\n"
-                "- 원본 텍스트에 있는 `<br/>`는 **HTML 태그가 아니라 그대로 복사해야 할 문자 열(문자 그대로)**이다.\n"
-                "- `<br/>`는 번역하지 말고, 삭제하지 말고, 공백·줄바꿈으로 바꾸지 말고, **원문과 동일한 문자 `<br/>` 그대로** 번역 결과에 넣어야 한다.\n"
-                "- 원본에 `Hello<br/>World`가 있으면 번역문에도 반드시 `(번역된앞부분)<br/>(번역된뒷부분)` 형태로 `<br/>`를 그대로 포함할 것.\n"
-                "- `<br/>` 앞뒤 문장만 번역하고, `<br/>` 자체는 한 글자도 바꾸지 말 것."
-            )
-            if (glossary_text or "").strip():
-                system_instruction += (
-                    "\n\n【필수 번역 용어집】\n"
-                    "다음은 사용자가 지정한 '필수 번역 용어집'이다. 본문에 해당 단어가 나오면 반드시 아래 지정된 대로 번역해야 한다.\n"
-                    "---\n"
-                    f"{glossary_text.strip()}\n"
-                    "---"
+            with tracing.span("translate_job", rows=rows_count, batch_size=batch_size, workers=self._translate_workers) as job_span:
+                result = engine.translate(
+                    self.rows,
+                    row_indices_0based,
+                    log_callback=log_cb,
+                    overflow_callback=overflow_cb,
+                    batch_callback=on_batch_done,
+                    rows_callback=on_rows_done,
+                    # 모두 번역 모드에서 취소 요청이 들어오면 다음 배치부터 중단
+                    cancel_check=lambda: self._translate_all_mode_active and self._translate_all_cancel_requested,
+                    progress=self._job_progress,
                 )
-            config = genai_types.GenerateContentConfig(system_instruction=system_instruction)
-            chosen_name = None
-            if use_auto:
-                try:
-                    for m in client.models.list():
-                        name = getattr(m, "name", None) or ""
-                        if not name:
-                            continue
-                        short_name = name.replace("models/", "", 1) if name.startswith("models/") else name
-                        try:
-                            client.models.generate_content(model=short_name, contents="Hi", config=config)
-                            chosen_name = short_name
-                            break
-                        except Exception:
-                            continue
-                except Exception:
-                    pass
-                if chosen_name is None:
-                    for name in AI_MODEL_FALLBACKS:
-                        try:
-                            client.models.generate_content(model=name, contents="Hi", config=config)
-                            chosen_name = name
-                            break
-                        except Exception:
-                            continue
-            else:
-                try:
-                    client.models.generate_content(model=selected_model, contents="Hi", config=config)
-                    chosen_name = selected_model
-                except Exception:
-                    pass
-            if chosen_name is None:
-                if use_auto:
-                    return (False, "사용 가능한 Gemini 모델을 찾지 못했습니다. API 키와 Google AI Studio 권한을 확인해 주세요.", None)
-                return (False, f"선택한 모델 '{selected_model}'을(를) 사용할 수 없습니다.", None)
-
-            indices = row_indices_0based if row_indices_0based is not None else list(range(len(self.rows)))
-            for batch_idx, batch_start in enumerate(range(0, total, batch_size)):
-                # 모두 번역 모드에서 취소 요청이 들어오면 다음 배치부터 중단
-                if self._translate_all_mode_active and self._translate_all_cancel_requested:
-                    completed_rows = batch_start
-                    first_idx = self.rows[indices[0]].get("index", 1) if indices else 1
-                    last_idx = self.rows[indices[completed_rows - 1]].get("index", completed_rows) if completed_rows > 0 else 0
-                    cancel_info = f"사용자 중단|{chosen_name}|{completed_rows}|{total}|{batch_idx}|{num_batches}|{first_idx}|{last_idx}"
-                    return (False, cancel_info, None)
-                batch_end = min(batch_start + batch_size, total)
-                batch_indices = indices[batch_start:batch_end]
-                batch_rows = [self.rows[i] for i in batch_indices]
-                log_cb = lambda m: self.root.after(0, lambda msg=m: self._append_log(msg))
-                # JSON 입출력 배치 번역: id 유지로 순번 강제
-                input_arr = [
-                    {"id": str(r.get("index", i + 1)), "text": (r.get("original", "") or "").replace("\r\n", "<br/>").replace("\n", "<br/>").strip()}
-                    for i, r in enumerate(batch_rows)
-                ]
-                user_prompt = (
-                    "【필수】 아래는 자막 블록 배열(JSON)이다. 각 항목의 `id`는 순번이므로 **절대 변경·누락·추가하지 마라**. "
-                    "각 `text`를 **" + target_lang + "**로 번역한 뒤, **입력과 동일한 id**를 유지하여 아래 형식의 **유효한 JSON 배열만** 출력하라. "
-                    "부연 설명·코드 블록 설명·마크다운은 절대 금지. `<br/>`는 번역문에 문자 그대로 포함.\n\n"
-                    "입력:\n" + json.dumps(input_arr, ensure_ascii=False) + "\n\n"
-                    "출력 형식(이 형식의 JSON 배열만 출력): [{\"id\": \"1\", \"text\": \"번역문\"}, {\"id\": \"2\", \"text\": \"번역문\"}, ...]"
-                )
-                batch_ok = False
-                batch_error: Optional[Exception] = None
-                line_start = batch_rows[0].get("index", batch_indices[0] + 1)
-                line_end = batch_rows[-1].get("index", batch_indices[-1] + 1)
-
-                def _try_batch_api() -> bool:
-                    nonlocal batch_ok, batch_error
-                    batch_error = None
-                    try:
-                        response = client.models.generate_content(
-                            model=chosen_name, contents=user_prompt, config=config
-                        )
-                        text = (response.text or "").strip()
-                        parsed = _parse_json_translation_response(text)
-                        if parsed is not None and len(parsed) == len(batch_rows):
-                            expected_ids = {str(r.get("index", 0)) for r in batch_rows}
-                            id_to_text: Dict[str, str] = {}
-                            for item in parsed:
-                                if not isinstance(item, dict):
-                                    break
-                                kid = item.get("id") or item.get("id_")
-                                trans = (item.get("text") or item.get("translated") or "").strip()
-                                if kid is not None:
-                                    id_to_text[str(kid)] = trans
-                            if set(id_to_text.keys()) == expected_ids:
-                                for row in batch_rows:
-                                    raw = id_to_text.get(str(row.get("index", "")), "").strip()
-                                    row["translated"] = raw if raw else AI_TRANSLATE_EMPTY_PLACEHOLDER
-                                batch_ok = True
-                        return batch_ok
-                    except Exception as e:
-                        batch_error = e
-                        return False
-
-                # 배치 시도
-                _try_batch_api()
-                # 배치 실패 시 단일 번역(1줄씩) 폴백
-                if not batch_ok:
-                    if batch_error:
-                        err_msg = str(batch_error)
-                        if "429" in err_msg or "Resource Exhausted" in err_msg or "quota" in err_msg.lower() or "exceeded" in err_msg.lower():
-                            return (False, "API 사용량이 초과되었습니다. 잠시 후 다시 시도하거나 API 키를 확인해주세요. (429)", None)
-                        if "503" in err_msg or "UNAVAILABLE" in err_msg:
-                            return (False, f"503_UNAVAILABLE|{chosen_name}", None)
-                    self.root.after(0, lambda m=f"[경고] 배치 번역 실패 (순번 불일치). 해당 구간(Line {line_start}~{line_end}) 단일 번역으로 재시도합니다.": self._append_log(m))
-                    fallback_ok, fallback_err = _translate_chunk_single_fallback(
-                        client, config, chosen_name, batch_rows, target_lang, system_instruction, log_cb
-                    )
-                    if not fallback_ok and fallback_err:
-                        if "503_UNAVAILABLE" in fallback_err:
-                            return (False, fallback_err, None)
-                        if "429" in fallback_err or "API 사용량" in fallback_err:
-                            return (False, fallback_err, None)
-                        return (False, fallback_err, None)
-                    for row in batch_rows:
-                        if not (row.get("translated") or "").strip():
-                            row["translated"] = "[통신 오류]"
-
-                # 빈줄 감지 시 로그 (모든 모드)
-                empty_count = sum(1 for r in batch_rows if (r.get("translated") or "").strip() == "" or r.get("translated") == AI_TRANSLATE_EMPTY_PLACEHOLDER)
-                if empty_count > 0:
-                    start_1 = batch_rows[0].get("index", batch_indices[0] + 1)
-                    end_1 = batch_rows[-1].get("index", batch_indices[-1] + 1)
-                    msg = f"Line {start_1}-{end_1}: 빈 줄 {empty_count}건 감지되어 <빈줄> 처리"
-                    self.root.after(0, lambda m=msg: self._append_log(m))
-                # QA 검수: 45자 초과·인코딩 깨짐 모두 실시간 로그 출력
-                overflow_cb = lambda m: self.root.after(0, lambda msg=m: self._append_length_warning_log(msg))
-                _run_qa_checks(batch_rows, log_cb, overflow_callback=overflow_cb)
-                # 모두 번역 모드: 진행률 갱신 + 그리드 즉시 갱신
-                if self._translate_all_mode_active:
-                    if num_batches > 0:
-                        current_batch = batch_idx + 1
-                        self.root.after(0, lambda c=current_batch, t=num_batches: self._update_translate_all_progress_ui(c, t))
-                    self.root.after(0, self._refresh_tree)
-            return (True, chosen_name, total)
-        except Exception as e:
-            return (False, str(e), None)
+                job_span.set(model=result.model, success=result.success, translated=result.total)
+        finally:
+            engine.close()
+        if engine.record_path is not None:
+            log_cb(f"API 호출 녹화 저장: {engine.record_path.name}")
+        self._record_engine_stats(engine, result, log_cb)
+        if result.success:
+            return (True, result.model, result.total)
+        return (False, result.error, None)
+
+    def _record_engine_stats(self, engine: TranslationEngine, result: Any, log_cb: Callable[[str], None]) -> None:
+        """번역 작업 1건의 배치 결과·지연·토큰 사용량 누적 (워커 스레드에서 호출 — StatsManager는 메인 스레드에서만 갱신)."""
+        if result.model:
+            # 배치 응답 처리 결과(구조화/보정/폴백) 누적
+            outcomes = dict(engine.batch_outcomes)
+            self.root.after(0, lambda: self._stats_manager.record_batch_outcomes(result.model, outcomes))
+            # 배치별 소요 시간 → 일별 지연 분위수 스케치 (오류·폴백 배치 수 포함)
+            batch_seconds, batch_errors = list(engine.batch_seconds), engine.batch_errors
+            self.root.after(0, lambda: self._stats_manager.record_batches(
+                result.model, batch_seconds, result.total or 0, batch_errors, outcomes["fallback"]
+            ))
+            if outcomes["fallback"]:
+                log_cb(f"배치 응답: 구조화 {outcomes['structured']}건, 보정 {outcomes['repaired']}건, 폴백 {outcomes['fallback']}건 (추가 호출 {outcomes['fallback_calls']}회)")
+        self._report_token_usage(engine, result.model, result.total or 0, "translate")
+
+    def _report_token_usage(self, engine: TranslationEngine, model: Optional[str], rows: int, kind: str) -> None:
+        """작업 1건의 토큰 사용량 로그 + 누적 (워커 스레드에서 호출 — 로그·StatsManager 갱신은 메인 스레드로 넘김)."""
+        usage = engine.usage
+        if not model or usage.calls <= 0:
+            return
+        line = f"[Tokens] {format_usage(usage, estimate_cost(model, usage))}"
+        if engine.glossary_tokens and usage.prompt_tokens:
+            # 용어집은 호출마다 시스템 인스트럭션에 붙으므로 호출 수만큼 프롬프트를 늘린다
+            share = min(1.0, engine.glossary_tokens * usage.calls / usage.prompt_tokens)
+            line += f" — 용어집 비중 약 {share:.0%}"
+        lang = engine.target_lang
+        glossary_tokens = engine.glossary_tokens
+        self.root.after(0, lambda: self._append_log(line))
+        self.root.after(0, lambda: self._stats_manager.record_usage(model, lang, usage, rows, glossary_tokens, kind))
+
+    def _format_translate_estimate(self, target_lang: str, row_indices_0based: List[int], batch_size: int) -> str:
+        """모두 번역 확인용 사전 추정 문구 (과거 행당 토큰 기록, 없으면 실제 프롬프트 길이 기준)."""
+        model = self._expected_model()
+        engine = TranslationEngine(
+            target_lang=target_lang,
+            model=model,
+            glossary_text=self._get_glossary_text_for_lang(target_lang),
+            batch_size=batch_size,
+        )
+        est = engine.estimate(self.rows, row_indices_0based, self._stats_manager.get_tokens_per_row(model, target_lang))
+        basis = "과거 기록 기준" if est.from_history else "텍스트 길이 기준, 폴백 제외"
+        text = f"예상 사용량 ({model}, {basis}):\n{format_usage(est.usage, est.cost_usd)}"
+        seconds = self._stats_manager.estimate_seconds(model, len(row_indices_0based), batch_size, self._translate_workers)
+        if seconds is not None:
+            text += f"\n예상 소요: 약 {max(1, round(seconds / 60))}분 (최근 배치 평균 기준)"
+        return text
 
     def _run_translation_worker(
         self,
@@ -2884,11 +3588,11 @@ class SrtVerifierMergerApp:
         elapsed = time.time() - self._translation_start_time
         self.root.after(0, lambda: self._on_translation_done(result[0], result[1], result[2], elapsed))
 
-    def _on_ai_translate(self, event=None):
-        """AI 번역하기: Fake Progress 표시 후 백그라운드 스레드에서 Gemini API 번역 실행."""
-        if not _HAS_GEMINI or genai is None:
+    def _get_api_key_for_translate(self) -> Optional[str]:
+        """번역 시작 전 확인: google-genai 설치·API 키·원본 로드. 문제가 있으면 안내 후 None."""
+        if not is_gemini_available():
             messagebox.showerror("오류", "Gemini API를 사용하려면\npip install google-genai\n를 실행해 주세요.")
-            return
+            return None
         api_key = self._get_gemini_api_key()
         if not api_key:
             folder_hint = "실행 파일(SubBridgeAI.exe)이 있는 폴더" if getattr(sys, "frozen", False) else "프로그램 폴더"
@@ -2898,9 +3602,18 @@ class SrtVerifierMergerApp:
                 f"{folder_hint}에 .env 파일을 만들고 다음 한 줄을 넣어 주세요:\n\n"
                 "GEMINI_API_KEY=여기에_API_키_입력"
             )
-            return
+            return None
         if not self.rows:
             messagebox.showwarning("알림", "먼저 원본 SRT를 열어주세요.")
+            return None
+        return api_key
+
+    def _on_ai_translate(self, event=None):
+        """AI 번역하기: 진행률(JobProgress) 표시 후 백그라운드 스레드에서 Gemini API 번역 실행."""
+        if self._file_load_busy():
+            return
+        api_key = self._get_api_key_for_translate()
+        if not api_key:
             return
         max_index = len(self.rows)
 
@@ -2913,27 +3626,67 @@ class SrtVerifierMergerApp:
             start_index = self._get_translate_all_start_index(max_index)
             if start_index is None:
                 return
-            # 사전 경고
+            row_indices_0based = list(range(start_index - 1, max_index))
+            batch_size = 10  # 모두 번역 전용: 10개씩 끊어서 호출
+            # 사전 경고 + 토큰·비용 추정
             proceed = messagebox.askyesno(
                 "모두 번역 확인",
-                "전체 번역은 시간이 오래 걸릴 수 있습니다.\n진행하시겠습니까?",
+                "전체 번역은 시간이 오래 걸릴 수 있습니다.\n\n"
+                f"{self._format_translate_estimate(target_lang, row_indices_0based, batch_size)}\n\n"
+                "진행하시겠습니까?",
             )
             if not proceed:
                 return
-            row_indices_0based = list(range(start_index - 1, max_index))
-            total = len(row_indices_0based)
-            batch_size = 10  # 모두 번역 전용: 10개씩 끊어서 호출
         else:
             ok, row_indices_0based = self._validate_translate_range_and_maybe_correct(max_index)
             if not ok:
                 return
-            if row_indices_0based is not None:
-                total = len(row_indices_0based)
-            else:
-                total = len(self.rows)
+            if row_indices_0based is None:
                 row_indices_0based = list(range(len(self.rows)))
             batch_size = AI_TRANSLATE_BATCH_SIZE
 
+        self._start_translation_job(api_key, target_lang, row_indices_0based, batch_size, cancellable=is_translate_all)
+
+    def _confirm_source_text(self, row_indices: List[int]) -> bool:
+        """
+        번역할 원문에 깨진 글자(U+FFFD)가 있으면 API 호출 전에 계속할지 묻는다.
+        인코딩을 잘못 읽은 원문은 번역해도 결과가 쓸모없으므로, 비용을 쓰기 전에 알린다.
+        """
+        broken = [
+            i for i in row_indices
+            if 0 <= i < len(self.rows) and QA_REPLACEMENT_CHAR in (self.rows[i].get("original") or "")
+        ]
+        if not broken:
+            return True
+        examples = ", ".join(str(self.rows[i].get("index", i + 1)) for i in broken[:10])
+        more = " 외" if len(broken) > 10 else ""
+        self._append_log(f"[경고] 번역할 원문 {len(broken):,}줄에 깨진 글자({QA_REPLACEMENT_CHAR}) 있음: Line {examples}{more}")
+        return messagebox.askyesno(
+            "깨진 글자 확인",
+            f"번역할 원문 {len(broken):,}줄에 깨진 글자({QA_REPLACEMENT_CHAR})가 있습니다.\n"
+            f"(Line {examples}{more})\n\n"
+            "원본 파일의 인코딩을 잘못 읽었을 수 있습니다. 이 줄들은 제대로 번역되지 않습니다.\n"
+            "그래도 번역을 시작할까요?",
+            icon="warning",
+        )
+
+    def _start_translation_job(
+        self,
+        api_key: str,
+        target_lang: str,
+        row_indices_0based: List[int],
+        batch_size: int,
+        cancellable: bool = False,
+        title: str = "모두 번역 진행 중",
+        label: str = "",
+    ) -> None:
+        """
+        번역 작업 시작 (AI 번역하기·모두 번역·조건 재번역 공통): 진행 추적 준비 후 워커 스레드 실행.
+        cancellable=True면 모두 번역과 같은 진행 다이얼로그(취소 버튼 포함)를 띄운다.
+        """
+        if not self._confirm_source_text(row_indices_0based):
+            return
+        total = len(row_indices_0based)
         num_batches = (total + batch_size - 1) // batch_size
         selected_model = self._get_selected_model_id()
         use_auto = not selected_model or selected_model == AI_MODEL_AUTO
@@ -2941,15 +3694,24 @@ class SrtVerifierMergerApp:
 
         self.status_var.set("AI 번역 중...")
         self.ai_translate_btn.config(state="disabled")
+        self.repair_btn.config(state="disabled")
+        self.fanout_btn.config(state="disabled")
         # (45자 초과 경고는 실시간 출력 — 수집 리스트 불필요)
         # 로그 뷰어 표시 및 작업 시작 로그
-        self._append_log(f"AI 번역 작업 시작 (대상: {total}줄, {target_lang})")
-        if is_translate_all:
+        self._append_log(f"AI {label or '번역'} 작업 시작 (대상: {total}줄, {target_lang})")
+        # 진행 추적: 같은 모델의 최근 30일 행당 지연을 초기 추정으로 쓰고, 실측이 쌓일수록 실측 비중을 높인다
+        history = self._stats_manager.get_latency(self._expected_model(), days=30)
+        progress = JobProgress(
+            total,
+            history_seconds_per_row=history.seconds_per_row if history else None,
+            workers=self._translate_workers,
+        )
+        if cancellable:
             self._translate_all_mode_active = True
-            self._start_translate_all_progress(num_batches)
+            self._start_translate_all_progress(num_batches, title)
         else:
             self._translate_all_mode_active = False
-            self._start_fake_progress()
+        self._start_job_progress(progress)
 
         thread = threading.Thread(
             target=self._run_translation_worker,
@@ -2958,8 +3720,526 @@ class SrtVerifierMergerApp:
         )
         thread.start()
 
+    def _on_translate_by_predicate(self, event=None) -> None:
+        """
+        조건 재번역 팝업: 빈 칸·<빈줄>·[통신 오류]·글자 수 초과·QA 위반·용어집 미준수 행만 골라 배치 엔진으로 다시 번역.
+        범위 입력(최대 50개) 제한 없이 모두 번역과 같은 진행 다이얼로그·취소를 쓰고, 요청 수는 고른 행 수에만 비례한다.
+        """
+        if self._file_load_busy():
+            return
+        api_key = self._get_api_key_for_translate()
+        if not api_key:
+            return
+        if self._inplace_entry and self._inplace_entry.winfo_exists():
+            self._commit_inplace_edit()
+        target_lang = self.ai_lang_combo.get() or "English"
+        profile = get_qa_profile(self._qa_profile_name)
+        glossary = self._get_glossary_dict(target_lang)
+        matches = match_row_predicates(self.rows, profile=profile, glossary=glossary)
+        batch_size = BATCH_CHUNK_SIZE  # 모두 번역과 같은 배치 크기
+
+        win = tk.Toplevel(self.root)
+        self._apply_icon_to_toplevel(win)
+        win.title(f"조건 재번역 ({target_lang})")
+        win.transient(self.root)
+        win.resizable(False, False)
+
+        frame = ttk.LabelFrame(win, text="다시 번역할 행 (하나라도 해당하면 포함)")
+        frame.pack(fill="x", padx=10, pady=(10, 4))
+        pred_vars: Dict[str, tk.BooleanVar] = {}
+        for name, label in ROW_PREDICATES.items():
+            default = name in ("empty", "placeholder", "error")
+            pred_vars[name] = tk.BooleanVar(value=default)
+            ttk.Checkbutton(
+                frame, text=f"{label} ({len(matches[name]):,}줄)", variable=pred_vars[name], command=lambda: update_count()
+            ).pack(anchor="w", padx=8, pady=1)
+        skip_manual_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            win, text="직접 수정한 행은 제외", variable=skip_manual_var, command=lambda: update_count()
+        ).pack(anchor="w", padx=18, pady=(4, 2))
+        count_var = tk.StringVar()
+        ttk.Label(win, textvariable=count_var).pack(padx=10, pady=(2, 6))
+        selected: List[int] = []
+
+        def update_count() -> None:
+            names = [name for name, var in pred_vars.items() if var.get()]
+            found = set()
+            for name in names:
+                found.update(matches[name])
+            if skip_manual_var.get():
+                found = {i for i in found if self.rows[i].get("provenance") != PROVENANCE_MANUAL}
+            selected[:] = sorted(found) if names else []
+            batches = (len(selected) + batch_size - 1) // batch_size
+            count_var.set(f"대상 {len(selected):,}줄 → 요청 약 {batches:,}회")
+            start_btn.config(state="normal" if selected else "disabled")
+
+        def on_start() -> None:
+            if not selected:
+                return
+            indices = list(selected)
+            if not messagebox.askyesno(
+                "조건 재번역 확인",
+                f"{self._format_translate_estimate(target_lang, indices, batch_size)}\n\n진행하시겠습니까?",
+                parent=win,
+            ):
+                return
+            win.destroy()
+            self._start_translation_job(
+                api_key, target_lang, indices, batch_size, cancellable=True, title="조건 재번역 진행 중", label="조건 재번역"
+            )
+
+        btn_frame = ttk.Frame(win)
+        btn_frame.pack(pady=(0, 10))
+        start_btn = ttk.Button(btn_frame, text="번역 시작", command=on_start)
+        start_btn.pack(side="left", padx=4)
+        ttk.Button(btn_frame, text="닫기", command=win.destroy).pack(side="left", padx=4)
+        update_count()
+
+    def _on_translate_fanout(self, event=None) -> None:
+        """
+        여러 언어 번역 팝업: 고른 언어마다 원본 전체를 번역해 언어별 병합 SRT를 바로 저장한다 (현재 표의 번역 열은 그대로).
+        모든 언어 × 배치 요청이 요청 풀 하나(동시 요청 수·분당 한도)를 함께 써서 총 시간이 가장 느린 언어 하나에 가깝다.
+        """
+        if self._file_load_busy():
+            return
+        api_key = self._get_api_key_for_translate()
+        if not api_key:
+            return
+        batch_size = BATCH_CHUNK_SIZE  # 모두 번역과 같은 배치 크기
+        stem, initial_dir = self._merge_name_base()
+        chosen = set(self._fanout_langs or [self._get_ai_lang_code()])
+
+        win = tk.Toplevel(self.root)
+        self._apply_icon_to_toplevel(win)
+        win.title("여러 언어 번역")
+        win.transient(self.root)
+        win.resizable(False, False)
+
+        frame = ttk.LabelFrame(win, text="대상 언어 (언어마다 그 언어의 용어집 사용)")
+        frame.pack(fill="x", padx=10, pady=(10, 4))
+        lang_vars: Dict[str, tk.BooleanVar] = {}
+        for pos, (code, label) in enumerate(LANG_OPTIONS):
+            lang_vars[code] = tk.BooleanVar(value=code in chosen)
+            terms = len(self._get_glossary_dict(label))
+            text = f"{label} ({code})" + (f" · 용어 {terms:,}개" if terms else "")
+            ttk.Checkbutton(frame, text=text, variable=lang_vars[code], command=lambda: update_info()).grid(
+                row=pos // 2, column=pos % 2, sticky="w", padx=8, pady=1
+            )
+
+        dir_frame = ttk.Frame(win)
+        dir_frame.pack(fill="x", padx=10, pady=(6, 2))
+        ttk.Label(dir_frame, text="저장 폴더:").pack(side="left")
+        dir_var = tk.StringVar(value=initial_dir or str(BASE_DIR))
+        ttk.Entry(dir_frame, textvariable=dir_var, width=40).pack(side="left", padx=4, fill="x", expand=True)
+
+        def browse() -> None:
+            path = filedialog.askdirectory(parent=win, title="저장 폴더 선택", initialdir=dir_var.get() or None)
+            if path:
+                dir_var.set(path)
+
+        ttk.Button(dir_frame, text="찾기…", command=browse).pack(side="left")
+        info_var = tk.StringVar()
+        ttk.Label(win, textvariable=info_var, justify="left").pack(anchor="w", padx=12, pady=(4, 6))
+        selected: List[str] = []
+
+        def update_info() -> None:
+            selected[:] = [code for code, _ in LANG_OPTIONS if lang_vars[code].get()]
+            model = self._expected_model()
+            requests = (len(self.rows) + batch_size - 1) // batch_size * len(selected)
+            limit = f", 분당 {self._requests_per_minute:g}회 한도" if self._requests_per_minute > 0 else ""
+            names = [merged_srt_name(stem, code, model) for code in selected]
+            info_var.set(
+                f"대상 {len(selected)}개 언어 × {len(self.rows):,}줄 → 요청 약 {requests:,}회 (동시 요청 {self._fanout_workers}{limit})\n"
+                f"파일: {', '.join(names[:2]) + (' …' if len(names) > 2 else '') if names else '-'}"
+            )
+            start_btn.config(state="normal" if selected else "disabled")
+
+        def on_start() -> None:
+            if not selected:
+                return
+            out_dir = Path(dir_var.get().strip() or ".")
+            if not out_dir.is_dir():
+                messagebox.showwarning("여러 언어 번역", f"저장 폴더가 없습니다.\n{out_dir}", parent=win)
+                return
+            model = self._expected_model()
+            existing = [name for name in (merged_srt_name(stem, code, model) for code in selected) if (out_dir / name).exists()]
+            overwrite = (
+                f"\n\n이미 있는 파일 {len(existing)}개를 덮어씁니다: {', '.join(existing[:3])}{' …' if len(existing) > 3 else ''}"
+                if existing else ""
+            )
+            if not messagebox.askyesno(
+                "여러 언어 번역 확인",
+                f"{self._format_fanout_estimate(selected, batch_size)}{overwrite}\n\n진행하시겠습니까?",
+                parent=win,
+            ):
+                return
+            self._fanout_langs = list(selected)
+            self._save_preferences()
+            win.destroy()
+            self._start_fanout_job(api_key, list(selected), out_dir, stem, batch_size)
+
+        btn_frame = ttk.Frame(win)
+        btn_frame.pack(pady=(0, 10))
+        start_btn = ttk.Button(btn_frame, text="번역 시작", command=on_start)
+        start_btn.pack(side="left", padx=4)
+        ttk.Button(btn_frame, text="닫기", command=win.destroy).pack(side="left", padx=4)
+        update_info()
+
+    def _format_fanout_estimate(self, codes: List[str], batch_size: int) -> str:
+        """여러 언어 번역 확인용 사전 추정 문구 (언어별 용어집·과거 행당 토큰 기록을 반영해 합산)."""
+        model = self._expected_model()
+        labels = dict(LANG_OPTIONS)
+        usage = TokenUsage()
+        from_history = True
+        for code in codes:
+            engine = TranslationEngine(
+                target_lang=labels[code],
+                model=model,
+                glossary_text=self._get_glossary_text_for_lang(labels[code]),
+                batch_size=batch_size,
+            )
+            est = engine.estimate(self.rows, None, self._stats_manager.get_tokens_per_row(model, labels[code]))
+            usage = usage.plus(est.usage)
+            from_history = from_history and est.from_history
+        basis = "과거 기록 기준" if from_history else "텍스트 길이 기준, 폴백 제외"
+        text = f"예상 사용량 ({model}, {len(codes)}개 언어, {basis}):\n{format_usage(usage, estimate_cost(model, usage))}"
+        seconds = self._stats_manager.estimate_seconds(model, len(self.rows) * len(codes), batch_size, self._fanout_workers)
+        if seconds is not None:
+            text += f"\n예상 소요: 약 {max(1, round(seconds / 60))}분 (최근 배치 평균 기준)"
+        return text
+
+    def _start_fanout_job(self, api_key: str, codes: List[str], out_dir: Path, stem: str, batch_size: int) -> None:
+        """여러 언어 번역 시작: 모두 번역과 같은 진행 다이얼로그(취소)·진행 바를 띄우고 워커 스레드 실행."""
+        if not self._confirm_source_text(list(range(len(self.rows)))):
+            return
+        selected_model = self._get_selected_model_id()
+        model = AI_MODEL_AUTO if not selected_model or selected_model == AI_MODEL_AUTO else selected_model
+        labels = dict(LANG_OPTIONS)
+        targets = [FanoutTarget(code, labels[code], self._get_glossary_text_for_lang(labels[code])) for code in codes]
+        num_batches = (len(self.rows) + batch_size - 1) // batch_size * len(targets)
+
+        self.status_var.set("AI 여러 언어 번역 중...")
+        self.ai_translate_btn.config(state="disabled")
+        self.repair_btn.config(state="disabled")
+        self.fanout_btn.config(state="disabled")
+        self._append_log(
+            f"AI 여러 언어 번역 작업 시작 (대상: {len(self.rows)}줄 × {len(targets)}개 언어 {', '.join(codes)}, "
+            f"동시 요청 {self._fanout_workers}) → {out_dir}"
+        )
+        history = self._stats_manager.get_latency(self._expected_model(), days=30)
+        progress = JobProgress(
+            len(self.rows) * len(targets),
+            history_seconds_per_row=history.seconds_per_row if history else None,
+            workers=self._fanout_workers,
+        )
+        self._translate_all_mode_active = True
+        self._start_translate_all_progress(num_batches, "여러 언어 번역 진행 중")
+        self._start_job_progress(progress)
+        # 작업 중 표를 고치거나 다른 파일을 열어도 영향이 없도록 지금 행을 복사해 넘긴다
+        rows = [dict(r) for r in self.rows]
+        thread = threading.Thread(
+            target=self._run_fanout_worker,
+            args=(api_key, rows, targets, out_dir, stem, model, batch_size),
+            daemon=True,
+        )
+        thread.start()
+
+    def _run_fanout_worker(
+        self,
+        api_key: str,
+        rows: List[Dict[str, Any]],
+        targets: List[FanoutTarget],
+        out_dir: Path,
+        stem: str,
+        model: str,
+        batch_size: int,
+    ) -> None:
+        """워커 스레드 엔트리: 여러 언어 번역 실행 (언어가 끝날 때마다 통계 누적·로그) 후 메인 스레드에 완료 콜백 예약."""
+        log_cb = lambda m: self.root.after(0, lambda msg=m: self._append_log(msg))
+
+        def on_language(lang_result: LanguageResult) -> None:
+            if lang_result.engine is not None:
+                self._record_engine_stats(lang_result.engine, lang_result.result, log_cb)
+            self.root.after(0, lambda: self._on_fanout_language_done(lang_result))
+
+        record_path = self._new_cassette_path("fanout")
+        result = translate_fanout(
+            rows,
+            targets,
+            out_dir,
+            stem,
+            api_key=api_key,
+            model=model,
+            batch_size=batch_size,
+            max_concurrent=self._fanout_workers,
+            requests_per_minute=self._requests_per_minute,
+            qa_profile=get_qa_profile(self._qa_profile_name),
+            record_path=record_path,
+            avoid_models=self._stats_manager.unhealthy_models(AI_MODEL_FALLBACKS) if model == AI_MODEL_AUTO else (),
+            log_callback=log_cb,
+            language_callback=on_language,
+            cancel_check=lambda: self._translate_all_mode_active and self._translate_all_cancel_requested,
+            progress=self._job_progress,
+        )
+        if record_path is not None:
+            log_cb(f"API 호출 녹화 저장: {record_path.name}")
+        self.root.after(0, lambda: self._on_fanout_done(result))
+
+    def _on_fanout_language_done(self, lang_result: LanguageResult) -> None:
+        """여러 언어 번역 중 언어 하나가 끝났을 때 (메인 스레드): 저장 파일 또는 실패 사유 로그."""
+        code = lang_result.target.code
+        err = lang_result.result.error or ""
+        if lang_result.path is not None:
+            self._append_log(f"[OK] [{code}] 번역 완료 ({lang_result.result.total:,}줄) → {lang_result.path.name}")
+            left = len(lang_result.engine.glossary_violations) if lang_result.engine is not None else 0
+            if left:
+                self._append_log(f"[경고] [{code}] 용어집 미준수 {left}줄 남음 — 파일을 열어 확인하세요.")
+        elif lang_result.write_error:
+            self._append_log(f"[오류] [{code}] 저장 실패: {lang_result.write_error}")
+        elif err.startswith("사용자 중단"):
+            self._append_log(f"[{code}] 사용자 중단 — 파일을 저장하지 않았습니다.")
+        else:
+            if err.startswith("503_UNAVAILABLE|"):
+                err = "모델 서버가 일시적으로 응답하지 않습니다. (503)"
+            self._append_log(f"[오류] [{code}] 번역 실패: {err}")
+
+    def _on_fanout_done(self, result: FanoutResult) -> None:
+        """여러 언어 번역 완료 (메인 스레드): 진행 표시 정리, 요약 로그·안내."""
+        self._end_job_progress()
+        self._update_export_and_ai_translate_state()
+        self.root.after(self.HIDE_PROGRESS_AFTER_MS, self._hide_progress_bar)
+        if result.error:
+            self._append_log(f"AI 여러 언어 번역 실패: {result.error}")
+            self.status_var.set("AI 여러 언어 번역 실패.")
+            messagebox.showerror("여러 언어 번역", result.error)
+            return
+        saved = [lr for lr in result.languages if lr.path is not None]
+        failed = [lr.target.code for lr in result.languages if lr.path is None]
+        self._append_log(
+            f"[Stats] 여러 언어 번역 (Model: {result.model}): {len(saved)}/{len(result.languages)}개 언어 저장, "
+            f"{result.elapsed:.1f}s, 요청 {result.calls:,}회 (풀 대기 합계 {result.wait_seconds:.1f}s)"
+        )
+        if result.cancelled:
+            self.status_var.set(f"AI 여러 언어 번역 중단. ({len(saved)}개 언어 저장)")
+            return
+        self.status_var.set(f"AI 여러 언어 번역 완료: {len(saved)}/{len(result.languages)}개 언어, {result.elapsed:.1f}초.")
+        files = "\n".join(f"• {lr.path.name}" for lr in saved if lr.path is not None)
+        if failed:
+            messagebox.showwarning(
+                "여러 언어 번역",
+                f"{len(saved)}개 언어 저장, {len(failed)}개 실패 ({', '.join(failed)}).\n\n{files}\n\n실패 사유는 작업 내용 로그를 확인하세요.",
+            )
+        else:
+            messagebox.showinfo("여러 언어 번역 완료", f"모델: {result.model}\n{len(saved)}개 언어 저장 ({result.elapsed:.1f}초)\n\n{files}")
+
+    def _on_reflow(self, event=None) -> None:
+        """줄 맞춤: 글자 수·줄 수 위반 행을 로컬에서 일괄 줄 나눔, 해결 못한 행은 AI 줄이기를 한 번에 요청."""
+        if self._file_load_busy():
+            return
+        if not self.rows:
+            return
+        if self._inplace_entry and self._inplace_entry.winfo_exists():
+            self._commit_inplace_edit()
+        profile = get_qa_profile(self._qa_profile_name)
+        max_lines = profile.max_lines or 2
+        self._recompute_qa()
+        targets = [
+            i for i, found in sorted(self._qa_issues.items())
+            if any(issue.code in ("chars", "lines") for issue in found)
+        ]
+        if not targets:
+            self.status_var.set("줄 맞춤: 글자 수·줄 수 초과 항목이 없습니다.")
+            return
+        fixed, failed = reflow_rows(self.rows, targets, profile.max_line_chars, max_lines)
+        self._mark_project_dirty(fixed)
+        self._refresh_tree()
+        self._update_merge_button_state()
+        self._update_warning_count()
+        self._append_log(f"줄 맞춤: 대상 {len(targets)}건 중 {len(fixed)}건 자동 줄 나눔, 미해결 {len(failed)}건")
+        self.status_var.set(f"줄 맞춤 완료: {len(fixed)}건 수정, 미해결 {len(failed)}건.")
+        if not failed:
+            return
+        api_key = self._get_gemini_api_key()
+        if not is_gemini_available() or not api_key:
+            return
+        if not messagebox.askyesno(
+            "줄 맞춤",
+            f"{len(failed)}건은 줄 나눔만으로 {profile.max_line_chars}자·{max_lines}줄 안에 들어가지 않습니다.\n"
+            "AI에 한 번에 묶어 문장 줄이기를 요청할까요?",
+        ):
+            return
+        target_lang = self.ai_lang_combo.get() or "English"
+        engine = TranslationEngine(
+            api_key=api_key,
+            target_lang=target_lang,
+            model=self._get_selected_model_id() or AI_MODEL_AUTO,
+            glossary_text=self._get_glossary_text_for_lang(target_lang),
+            qa_profile=profile,
+            record_path=self._new_cassette_path("shorten"),
+        )
+        log_cb = lambda m: self.root.after(0, lambda msg=m: self._append_log(msg))
+        self.reflow_btn.config(state="disabled")
+        self.status_var.set(f"AI 줄이기 요청 중... ({len(failed)}건)")
+        # 작업 스레드는 복사본만 고친다 — 그동안 파일 열기·편집·번역이 self.rows를 바꿔도 섞이지 않게 완료 시 메인 스레드에서 반영
+        live = [self.rows[i] for i in failed]
+        copies = [dict(row) for row in live]
+        before = [row.get("translated") for row in live]
+        gen = self._load_generation
+
+        def worker() -> None:
+            try:
+                result = engine.shorten(
+                    copies, list(range(len(copies))), profile.max_line_chars, max_lines, log_callback=log_cb
+                )
+            finally:
+                engine.close()
+            self._report_token_usage(engine, result.model, len(failed), "shorten")
+            self.root.after(0, lambda: self._on_shorten_done(result, gen, failed, live, before, copies))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_shorten_done(
+        self,
+        result: Any,
+        gen: int,
+        indices: List[int],
+        live: List[Dict[str, Any]],
+        before: List[Any],
+        copies: List[Dict[str, Any]],
+    ) -> None:
+        """
+        AI 줄이기 완료 (메인 스레드). 복사본의 번역을 원래 행에 반영한다.
+        그사이 다른 파일을 열었거나, 행이 바뀌었거나, 번역 칸이 고쳐진 행은 건너뛴다.
+        """
+        self.reflow_btn.config(state="normal" if self.rows else "disabled")
+        applied: List[int] = []
+        skipped = 0
+        for i, row, old, done in zip(indices, live, before, copies):
+            if done.get("translated") == old:
+                continue
+            if (
+                gen != self._load_generation
+                or i >= len(self.rows)
+                or self.rows[i] is not row
+                or row.get("translated") != old
+            ):
+                skipped += 1
+                continue
+            row["translated"] = done.get("translated")
+            row["provenance"] = done.get("provenance")
+            applied.append(i)
+        if skipped:
+            self._append_log(f"[경고] AI 줄이기: 작업 중 행이 바뀌어 {skipped}건은 반영하지 않았습니다.")
+        self._mark_project_dirty(applied)
+        self._refresh_tree()
+        self._update_merge_button_state()
+        self._update_warning_count()
+        if result.success:
+            self._append_log(f"AI 줄이기 완료 (모델: {result.model}, {len(applied)}건)")
+            self.status_var.set(f"AI 줄이기 완료: {len(applied)}건 반영. 남은 검토 필요 {len(self._qa_issues)}건.")
+        else:
+            err = result.error or ""
+            if err.startswith("503_UNAVAILABLE|"):
+                err = "모델 서버가 일시적으로 응답하지 않습니다. (503)"
+            self._append_log(f"[오류] AI 줄이기 실패: {err}")
+            self.status_var.set(f"AI 줄이기 실패: {err}")
+
+    def _on_retime(self, event=None) -> None:
+        """타임코드 조정 팝업: 전체 이동 / FPS 변환 / 2점 싱크를 모든 행에 일괄 적용."""
+        if self._file_load_busy():
+            return
+        if not self.rows:
+            messagebox.showwarning("알림", "먼저 원본 SRT를 열어주세요.")
+            return
+        win = tk.Toplevel(self.root)
+        self._apply_icon_to_toplevel(win)
+        win.title("타임코드 조정")
+        win.transient(self.root)
+        win.resizable(False, False)
+        fps_labels = [label for label, _ in FPS_PRESETS]
+        fps_by_label = dict(FPS_PRESETS)
+
+        def apply(op: Callable[[TimecodeTable], None], desc: str) -> None:
+            table = TimecodeTable.from_rows(self.rows)
+            try:
+                op(table)
+            except ValueError as e:
+                messagebox.showwarning("입력 오류", str(e), parent=win)
+                return
+            table.apply_to_rows(self.rows)
+            self._refresh_tree()
+            self._mark_project_dirty()
+            overlaps = table.find_overlaps()
+            self.status_var.set(f"타임코드 조정 완료: {desc}")
+            self._append_log(f"타임코드 조정: {desc} (총 {len(table)}개, 겹침 {len(overlaps)}건)")
+
+        # 1) 전체 이동
+        shift_frame = ttk.LabelFrame(win, text="전체 이동 (ms, 음수는 앞으로)")
+        shift_frame.pack(fill="x", padx=10, pady=(10, 4))
+        shift_var = tk.StringVar(value="0")
+        ttk.Entry(shift_frame, textvariable=shift_var, width=12).pack(side="left", padx=8, pady=6)
+
+        def on_shift() -> None:
+            try:
+                delta = int((shift_var.get() or "0").strip().replace("+", ""))
+            except ValueError:
+                messagebox.showwarning("입력 오류", "이동 값은 정수(ms)로 입력하세요. 예: 1500, -500", parent=win)
+                return
+            apply(lambda t: t.shift(delta), f"{delta:+d}ms 이동")
+
+        ttk.Button(shift_frame, text="적용", command=on_shift).pack(side="right", padx=8)
+
+        # 2) FPS 변환
+        fps_frame = ttk.LabelFrame(win, text="FPS 변환 (원본 → 대상)")
+        fps_frame.pack(fill="x", padx=10, pady=4)
+        src_combo = ttk.Combobox(fps_frame, values=fps_labels, state="readonly", width=8)
+        src_combo.set("23.976")
+        src_combo.pack(side="left", padx=(8, 4), pady=6)
+        ttk.Label(fps_frame, text="→").pack(side="left")
+        dst_combo = ttk.Combobox(fps_frame, values=fps_labels, state="readonly", width=8)
+        dst_combo.set("25")
+        dst_combo.pack(side="left", padx=4)
+
+        def on_fps() -> None:
+            src, dst = src_combo.get(), dst_combo.get()
+            apply(lambda t: t.convert_fps(fps_by_label[src], fps_by_label[dst]), f"{src} → {dst} fps 변환")
+
+        ttk.Button(fps_frame, text="적용", command=on_fps).pack(side="right", padx=8)
+
+        # 3) 2점 싱크
+        sync_frame = ttk.LabelFrame(win, text="2점 싱크 (기준 순번 → 올바른 시작 시간)")
+        sync_frame.pack(fill="x", padx=10, pady=4)
+        first, last = self.rows[0], self.rows[-1]
+        point_vars: List[Tuple[tk.StringVar, tk.StringVar]] = []
+        for r_i, row in enumerate((first, last)):
+            idx_var = tk.StringVar(value=str(row.get("index", "")))
+            time_var = tk.StringVar(value=format_ms(row["start_ms"]) if isinstance(row.get("start_ms"), int) else "")
+            ttk.Label(sync_frame, text="순번:").grid(row=r_i, column=0, padx=(8, 2), pady=3)
+            ttk.Entry(sync_frame, textvariable=idx_var, width=8).grid(row=r_i, column=1, padx=2)
+            ttk.Label(sync_frame, text="시작:").grid(row=r_i, column=2, padx=(8, 2))
+            ttk.Entry(sync_frame, textvariable=time_var, width=14).grid(row=r_i, column=3, padx=(2, 8))
+            point_vars.append((idx_var, time_var))
+
+        def on_sync() -> None:
+            points: List[Tuple[int, int]] = []
+            for idx_var, time_var in point_vars:
+                row = next((r for r in self.rows if str(r.get("index")) == idx_var.get().strip()), None)
+                new_ms = parse_time_ms(time_var.get())
+                if row is None or new_ms is None or not isinstance(row.get("start_ms"), int):
+                    messagebox.showwarning("입력 오류", "기준 순번과 시작 시간(예: 00:01:02,500)을 확인해 주세요.", parent=win)
+                    return
+                points.append((row["start_ms"], new_ms))
+            (old_a, new_a), (old_b, new_b) = points
+            apply(lambda t: t.resync(old_a, new_a, old_b, new_b), "2점 싱크")
+
+        ttk.Button(sync_frame, text="적용", command=on_sync).grid(row=0, column=4, rowspan=2, padx=8)
+        ttk.Button(win, text="닫기", command=win.destroy).pack(pady=(6, 10))
+        win.bind("<Escape>", lambda e: win.destroy())
+
     def _on_export(self):
         """현재 [컬럼 2] 원본 텍스트만 추출하여 저장."""
+        if self._file_load_busy():
+            return
         if not self.rows:
             messagebox.showwarning("알림", "먼저 원본 SRT를 열어주세요.")
             return
@@ -2976,27 +4256,34 @@ class SrtVerifierMergerApp:
         if not path:
             return
         try:
-            text = extract_text_lines(self.rows)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(text)
+            with tracing.span("write_txt", rows=len(self.rows)):
+                write_txt(
+                    path, self.rows, "original", "utf-8",
+                    progress_callback=self._on_write_progress, with_ids=self._export_ids_var.get(),
+                )
         except Exception as e:
             messagebox.showerror("오류", f"저장 실패:\n{e}")
             return
-        self.status_var.set(f"추출 완료: {path}")
+        self.status_var.set(f"추출 완료{' (ID 포함)' if self._export_ids_var.get() else ''}: {path}")
+
+    def _on_write_progress(self, done: int, total: int) -> None:
+        """스트리밍 저장 진행률을 상태바에 표시 (큰 파일에서만 화면 갱신)."""
+        if total >= WRITE_PROGRESS_MIN_ROWS:
+            self.status_var.set(f"저장 중... {done}/{total}")
+            self.root.update_idletasks()
 
-    def _model_suffix_for_merge(self) -> str:
-        """마지막 AI 번역 모델명에서 병합 파일명 접미사 반환: _flash_lite, _flash, _pro 또는 빈 문자열."""
-        name = (self._last_ai_model or "").lower()
-        if "flash-lite" in name or "flash_lite" in name:
-            return "_flash_lite"
-        if "flash" in name:
-            return "_flash"
-        if "pro" in name:
-            return "_pro"
-        return ""
+    def _merge_name_base(self) -> Tuple[str, Optional[str]]:
+        """병합 파일명 앞부분과 기본 폴더: 번역 TXT를 열었으면 TXT, 아니면 원본 SRT 기준."""
+        if self.txt_file_path:
+            return Path(self.txt_file_path).stem, str(Path(self.txt_file_path).parent)
+        if self.srt_file_path:
+            return Path(self.srt_file_path).stem, str(Path(self.srt_file_path).parent)
+        return "merged", None
 
     def _on_merge(self, event=None):
         """[컬럼 1] 타임코드 + [컬럼 3] 번역으로 SRT 저장."""
+        if self._file_load_busy():
+            return
         if not self.rows:
             messagebox.showwarning("알림", "먼저 원본 SRT를 열어주세요.")
             return
@@ -3009,21 +4296,16 @@ class SrtVerifierMergerApp:
                 f"비어 있는 행 예: {empty_indices[:10]}{'…' if len(empty_indices) > 10 else ''}",
             )
             return
-        if self.srt_blocks and self.txt_lines and len(self.srt_blocks) != len(self.txt_lines):
+        unchecked = [i for i, found in self._qa_issues.items() if any(issue.code == "align" for issue in found)]
+        if unchecked:
             messagebox.showwarning(
-                "라인 수 불일치",
-                f"SRT 블록 수({len(self.srt_blocks)})와 번역 TXT 라인 수({len(self.txt_lines)})가 다릅니다.\n"
-                "병합 결과가 어긋날 수 있으니 확인 후 진행하세요.",
+                "정렬 확인 필요",
+                f"번역 TXT 정렬 신뢰도가 낮은 행 {len(unchecked)}개를 아직 확인하지 않았습니다.\n"
+                f"예: {[self.rows[i].get('index') for i in sorted(unchecked)[:10]]}\n"
+                "병합 결과가 어긋날 수 있으니 확인 후 진행하세요 (F4로 이동).",
             )
-        model_suffix = self._model_suffix_for_merge()
-        ai_lang_code = self._get_ai_lang_code()
-        if self.txt_file_path:
-            default_name = Path(self.txt_file_path).stem + "_" + ai_lang_code + model_suffix + ".srt"
-            initial_dir = str(Path(self.txt_file_path).parent)
-        else:
-            base = Path(self.srt_file_path).stem if self.srt_file_path else "merged"
-            default_name = base + "_" + ai_lang_code + model_suffix + ".srt"
-            initial_dir = str(Path(self.srt_file_path).parent) if self.srt_file_path else None
+        stem, initial_dir = self._merge_name_base()
+        default_name = merged_srt_name(stem, self._get_ai_lang_code(), self._last_ai_model)
         path = filedialog.asksaveasfilename(
             title="병합 SRT 저장",
             defaultextension=".srt",
@@ -3034,9 +4316,8 @@ class SrtVerifierMergerApp:
         if not path:
             return
         try:
-            content = build_srt_from_merged(self.rows)
-            with open(path, "w", encoding="utf-8-sig") as f:
-                f.write(content)
+            with tracing.span("write_srt", rows=len(self.rows)):
+                write_srt(path, self.rows, "utf-8-sig", progress_callback=self._on_write_progress)
         except Exception as e:
             messagebox.showerror("오류", f"저장 실패:\n{e}")
             return
@@ -3044,17 +4325,7 @@ class SrtVerifierMergerApp:
 
     def _collect_search_matches(self):
         """원본·번역 양쪽에서 검색어가 포함된 row index 수집."""
-        q = self.search_var.get().strip()
-        if not q:
-            return []
-        q_lower = q.lower()
-        indices = []
-        for i, row in enumerate(self.rows):
-            orig = (row.get("original") or "").lower()
-            trans = (row.get("translated") or "").lower()
-            if q_lower in orig or q_lower in trans:
-                indices.append(i)
-        return indices
+        return search_rows(self.rows, self.search_var.get())
 
     def _focus_search_entry(self):
         """검색 입력창으로 포커스 이동 (Ctrl+F)."""
@@ -3063,6 +4334,8 @@ class SrtVerifierMergerApp:
 
     def _on_find(self):
         """찾기: 다음 검색 결과로 이동 및 포커스."""
+        if self._file_load_busy():
+            return
         query = self.search_var.get().strip()
         if not query:
             self.status_var.set("검색어를 입력한 뒤 찾기를 실행하세요.")
@@ -3093,6 +4366,24 @@ class SrtVerifierMergerApp:
         self.root.mainloop()
 
 
+def _trace_path_from_argv(argv: List[str]) -> Optional[Path]:
+    """--trace [경로] 옵션: 실행 내내 추적하고 종료 시 저장할 경로 (생략 시 프로그램 폴더의 trace.json)."""
+    if "--trace" not in argv:
+        return None
+    i = argv.index("--trace")
+    if i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+        return Path(argv[i + 1])
+    return BASE_DIR / "trace.json"
+
+
 if __name__ == "__main__":
+    trace_path = _trace_path_from_argv(sys.argv[1:])
+    if trace_path is not None:
+        tracing.enable()
     app = SrtVerifierMergerApp()
-    app.run()
+    try:
+        app.run()
+    finally:
+        if trace_path is not None and tracing.is_enabled():
+            count = tracing.export_chrome_trace(trace_path)
+            print(f"트레이스 저장: {trace_path} ({count}개 구간)")
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+SubBridge 코어 패키지 (tkinter 의존성 없음).
+SRT 파싱·병합·생성, QA 검수, 용어집, 배치 번역 엔진을 다른 Python 서비스에서 바로 import 해 사용할 수 있다.
+GUI(srt_verifier_merger.py)는 이 패키지의 얇은 클라이언트이다.
+"""
+
+from .align import AlignResult, align_translation_lines
+from .cassette import RecordingClient, ReplayClient, summarize_cassette
+from .constants import (
+    AI_MODEL_AUTO,
+    AI_MODEL_FALLBACKS,
+    AI_TRANSLATE_EMPTY_PLACEHOLDER,
+    AI_TRANSLATE_ERROR_PLACEHOLDER,
+    BATCH_CHUNK_SIZE,
+    LANG_OPTIONS,
+    MODEL_PRICING,
+    QA_MAX_CHARS,
+)
+from .encoding import AUTO_ENCODING, DecodedText, EncodingGuess, decode_bytes, sniff_encoding
+from .fake_client import FakeGeminiClient, FaultRates, GeminiClient
+from .fanout import FanoutResult, FanoutTarget, LanguageResult, RequestPool, merged_srt_name, translate_fanout
+from .glossary import (
+    GlossaryMatcher,
+    glossary_dict_to_text,
+    glossary_text_to_dict,
+    glossary_violations,
+    load_glossary,
+    save_glossary,
+)
+from .glossary_io import GlossaryExportReport, GlossaryImportReport, export_glossary, import_glossary
+from .glossary_store import GlossaryStore
+from .parse_cache import ParseCache, ParsedFile
+from .qa import QA_PROFILES, QAIssue, QAProfile, evaluate_qa, is_warning_text, run_qa_checks, warning_indices
+from .recut import RecutResult, carry_over_translations
+from .reflow import reflow_rows, reflow_text
+from .selectors import ROW_PREDICATES, match_row_predicates, select_rows
+from .srt import (
+    build_srt_from_merged,
+    extract_text_lines,
+    iter_srt_blocks,
+    merge_data,
+    parse_srt,
+    parse_txt_lines,
+    search_rows,
+)
+from .stats import StatsManager
+from .textio import FileReadResult, read_text_file
+from .translation import TranslationEngine, TranslationResult, create_client, is_gemini_available
+from .usage import JobEstimate, TokenUsage, estimate_cost
+from .writer import write_srt, write_txt
+
+__all__ = [
+    "AI_MODEL_AUTO",
+    "AI_MODEL_FALLBACKS",
+    "AI_TRANSLATE_EMPTY_PLACEHOLDER",
+    "AI_TRANSLATE_ERROR_PLACEHOLDER",
+    "AUTO_ENCODING",
+    "BATCH_CHUNK_SIZE",
+    "LANG_OPTIONS",
+    "MODEL_PRICING",
+    "QA_MAX_CHARS",
+    "QA_PROFILES",
+    "ROW_PREDICATES",
+    "AlignResult",
+    "DecodedText",
+    "EncodingGuess",
+    "FakeGeminiClient",
+    "FanoutResult",
+    "FanoutTarget",
+    "FaultRates",
+    "FileReadResult",
+    "GeminiClient",
+    "GlossaryExportReport",
+    "GlossaryImportReport",
+    "GlossaryMatcher",
+    "GlossaryStore",
+    "JobEstimate",
+    "LanguageResult",
+    "ParseCache",
+    "ParsedFile",
+    "QAIssue",
+    "QAProfile",
+    "RecordingClient",
+    "RecutResult",
+    "ReplayClient",
+    "RequestPool",
+    "StatsManager",
+    "TokenUsage",
+    "TranslationEngine",
+    "TranslationResult",
+    "align_translation_lines",
+    "build_srt_from_merged",
+    "carry_over_translations",
+    "create_client",
+    "decode_bytes",
+    "estimate_cost",
+    "evaluate_qa",
+    "export_glossary",
+    "extract_text_lines",
+    "glossary_dict_to_text",
+    "glossary_text_to_dict",
+    "glossary_violations",
+    "import_glossary",
+    "is_gemini_available",
+    "is_warning_text",
+    "iter_srt_blocks",
+    "load_glossary",
+    "match_row_predicates",
+    "merged_srt_name",
+    "merge_data",
+    "parse_srt",
+    "parse_txt_lines",
+    "read_text_file",
+    "reflow_rows",
+    "reflow_text",
+    "run_qa_checks",
+    "save_glossary",
+    "search_rows",
+    "select_rows",
+    "sniff_encoding",
+    "summarize_cassette",
+    "translate_fanout",
+    "warning_indices",
+    "write_srt",
+    "write_txt",
+]
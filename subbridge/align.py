@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+번역 TXT 줄 ↔ SRT 블록 정렬.
+merge_data()는 i번째 블록에 i번째 줄을 붙이므로 외부 번역본에서 한 줄이 빠지거나 늘면 그 뒤가 모두 밀린다.
+여기서는 길이 비율·<br/> 수·숫자·문장 끝 부호(?, !, …)를 비교하는 비용으로 띠(band) 동적 계획법 정렬을 해
+빠진 줄(블록만 있음)·남는 줄(줄만 있음)·한 블록을 두 줄로 나눈 경우를 찾아낸다.
+띠 폭이 고정이라 O(블록 수 × 띠 폭)으로 큰 파일도 거의 선형 시간에 끝난다.
+
+줄마다 "[[순번]] 텍스트" 형식의 고정 ID가 붙어 있으면(추출하기 → ID 포함) 위치와 무관하게 ID로 바로 매칭한다.
+"""
+
+import math
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# 대각선(블록 i ↔ 줄 i×m/n) 양쪽으로 허용하는 최대 어긋남 (연속으로 빠지거나 남는 줄 수)
+ALIGN_BAND = 40
+# 이 값 미만의 신뢰도는 검토 대상으로 표시
+LOW_CONFIDENCE = 0.5
+# 빠지거나 남는 줄 바로 옆 블록의 신뢰도 상한 (경계가 한 줄 어긋났을 수 있음)
+SKIP_NEIGHBOR_CONFIDENCE = 0.4
+# 줄의 이 비율 이상에 ID가 있으면 ID 매칭
+ID_LINE_MIN_RATIO = 0.9
+
+# 비용 가중치
+_W_LEN = 1.0       # |log(길이 비율 ÷ 전체 평균 비율)|
+_W_BR = 0.6        # <br/> 수 차이 (최대 2)
+_W_NUM = 2.0       # 숫자 집합 불일치 (1 - Jaccard)
+_W_PUNCT = 0.5     # 문장 끝 ?, !, … 불일치
+_SKIP = 2.0        # 블록만 있거나 줄만 있는 경우
+_MERGE = 2.0       # 한 블록 ↔ 두 줄
+
+# 역추적 코드
+_OP_PAIR, _OP_BLOCK_ONLY, _OP_LINE_ONLY, _OP_TWO_LINES = 1, 2, 3, 4
+
+ID_LINE_RE = re.compile(r"^\[\[(\d+)\]\]\s?(.*)$")
+_TAG_RE = re.compile(r"<[^>]+>")
+_NUM_RE = re.compile(r"\d+")
+_SPACE_RE = re.compile(r"\s+")
+
+# (글자 수, <br/> 수, 숫자 집합, 끝 부호)
+_Feature = Tuple[int, int, frozenset, str]
+
+
+class AlignResult(NamedTuple):
+    """정렬 결과. lines/confidence는 SRT 블록 순서, extra_lines는 쓰이지 않은 TXT 줄 번호(0-based)."""
+
+    lines: List[str]
+    confidence: List[float]
+    low_confidence: List[int]
+    extra_lines: List[int]
+    method: str     # "positional" / "dp" / "id"
+
+    @property
+    def missing(self) -> List[int]:
+        """짝이 되는 줄이 없는 블록 (0-based)."""
+        return [i for i, c in enumerate(self.confidence) if c == 0.0]
+
+
+def format_id_line(index: Any, text: str) -> str:
+    """고정 ID 줄 ("[[12]] 텍스트")."""
+    return f"[[{index}]] {text}"
+
+
+def split_id_lines(lines: List[str]) -> Optional[Dict[int, str]]:
+    """
+    줄 대부분(ID_LINE_MIN_RATIO 이상)에 [[순번]] ID가 있으면 {순번: 텍스트}, 아니면 None.
+    ID가 없는 줄은 무시하고, 같은 ID가 여러 번 나오면 마지막 줄을 쓴다.
+    """
+    non_empty = [ln for ln in lines if ln.strip()]
+    if not non_empty:
+        return None
+    out: Dict[int, str] = {}
+    for ln in non_empty:
+        m = ID_LINE_RE.match(ln.strip())
+        if m:
+            out[int(m.group(1))] = m.group(2).strip()
+    return out if len(out) >= ID_LINE_MIN_RATIO * len(non_empty) else None
+
+
+def _feature(text: str) -> _Feature:
+    plain = _TAG_RE.sub("", text or "")
+    compact = _SPACE_RE.sub("", plain)
+    if compact.endswith(("?", "？", "؟")):
+        end = "?"
+    elif compact.endswith(("!", "！")):
+        end = "!"
+    elif compact.endswith(("…", "...")):
+        end = "…"
+    else:
+        end = ""
+    return (len(compact), (text or "").count("<br/>"), frozenset(_NUM_RE.findall(plain)), end)
+
+
+def _join_features(a: _Feature, b: _Feature) -> _Feature:
+    return (a[0] + b[0], a[1] + b[1] + 1, a[2] | b[2], b[3])
+
+
+def _pair_cost(s: _Feature, t: _Feature, log_ratio: float) -> float:
+    cost = _W_LEN * abs(math.log((t[0] + 2) / (s[0] + 2)) - log_ratio)
+    if s[1] != t[1]:
+        cost += _W_BR * min(2, abs(s[1] - t[1]))
+    if s[2] or t[2]:
+        cost += _W_NUM * (1.0 - len(s[2] & t[2]) / len(s[2] | t[2]))
+    if s[3] != t[3] and (s[3] or t[3]):
+        cost += _W_PUNCT
+    return cost
+
+
+def _confidence(cost: float) -> float:
+    return math.exp(-cost / 2.0)
+
+
+def _result(
+    lines: List[str], confidence: List[float], extra: List[int], method: str
+) -> AlignResult:
+    low = [i for i, c in enumerate(confidence) if c < LOW_CONFIDENCE]
+    return AlignResult(lines, confidence, low, extra, method)
+
+
+def _align_by_id(blocks: List[Dict[str, Any]], lines: List[str], by_id: Dict[int, str]) -> AlignResult:
+    out: List[str] = []
+    confidence: List[float] = []
+    used = set()
+    for block in blocks:
+        idx = block.get("index")
+        if idx in by_id:
+            out.append(by_id[idx])
+            confidence.append(1.0)
+            used.add(idx)
+        else:
+            out.append("")
+            confidence.append(0.0)
+    extra = []
+    for j, ln in enumerate(lines):
+        m = ID_LINE_RE.match(ln.strip())
+        if ln.strip() and (m is None or int(m.group(1)) not in used):
+            extra.append(j)
+    return _result(out, confidence, extra, "id")
+
+
+def align_translation_lines(
+    blocks: List[Dict[str, Any]], lines: List[str], band: int = ALIGN_BAND
+) -> AlignResult:
+    """
+    SRT 블록(원문 "original")과 번역 TXT 줄을 정렬해 블록별 번역 줄·신뢰도(0~1)를 돌려준다.
+    결과의 lines를 merge_data(blocks, result.lines)에 넘기면 정렬된 병합 행이 된다.
+    """
+    by_id = split_id_lines(lines)
+    if by_id is not None:
+        return _align_by_id(blocks, lines, by_id)
+    n, m = len(blocks), len(lines)
+    if n == 0:
+        # 붙일 블록이 없으면 모든 줄이 남는 줄 (빈 행의 띠로는 (0, m)까지 역추적할 수 없다)
+        return _result([], [], list(range(m)), "dp")
+    src = [_feature(b.get("original", "")) for b in blocks]
+    tgt = [_feature(ln) for ln in lines]
+    total_s = sum(f[0] for f in src)
+    total_t = sum(f[0] for f in tgt)
+    log_ratio = math.log((total_t + 2) / (total_s + 2))
+
+    # 줄 수가 같고 모든 짝의 신뢰도가 충분하면 위치 그대로 (DP 생략)
+    if n == m:
+        costs = [_pair_cost(s, t, log_ratio) for s, t in zip(src, tgt)]
+        confidence = [_confidence(c) for c in costs]
+        if all(c >= LOW_CONFIDENCE for c in confidence):
+            return _result(list(lines), confidence, [], "positional")
+
+    ops = _banded_dp(src, tgt, log_ratio, band)
+    out = [""] * n
+    confidence = [0.0] * n
+    extra: List[int] = []
+    neighbors = set()
+    i = j = 0
+    for op, cost in ops:
+        if op == _OP_PAIR:
+            out[i], confidence[i] = lines[j], _confidence(cost)
+            i, j = i + 1, j + 1
+        elif op == _OP_TWO_LINES:
+            out[i], confidence[i] = f"{lines[j]}<br/>{lines[j + 1]}", _confidence(cost)
+            i, j = i + 1, j + 2
+        elif op == _OP_BLOCK_ONLY:
+            neighbors.update((i - 1, i + 1))
+            i += 1
+        else:
+            extra.append(j)
+            neighbors.update((i - 1, i))
+            j += 1
+    for k in neighbors:
+        if 0 <= k < n and confidence[k] > 0.0:
+            confidence[k] = min(confidence[k], SKIP_NEIGHBOR_CONFIDENCE)
+    return _result(out, confidence, extra, "dp")
+
+
+def _banded_dp(src: List[_Feature], tgt: List[_Feature], log_ratio: float, band: int) -> List[Tuple[int, float]]:
+    """대각선 띠 안에서 최소 비용 정렬 → [(연산, 비용), ...] (앞에서부터)."""
+    n, m = len(src), len(tgt)
+    inf = float("inf")
+    slope = m / n if n else 0.0
+    # 블록 하나에 대각선이 band보다 많이 움직이면 이웃 행의 띠가 끊기므로 넓힌다
+    band = max(band, int(slope) + 3)
+
+    def bounds(i: int) -> Tuple[int, int]:
+        center = int(round(i * slope))
+        return max(0, center - band), min(m, center + band)
+
+    # 0행: 블록 없이 줄만 소비
+    prev_lo, hi0 = bounds(0)
+    prev_cost = [j * _SKIP for j in range(prev_lo, hi0 + 1)]
+    # rows_back[i] = (lo, [(연산, 비용), ...]) — j - lo 위치가 (i, j) 칸
+    rows_back: List[Tuple[int, List[Tuple[int, float]]]] = [(prev_lo, [(_OP_LINE_ONLY, _SKIP)] * len(prev_cost))]
+    for i in range(1, n + 1):
+        lo, hi = bounds(i)
+        s = src[i - 1]
+        prev_hi = prev_lo + len(prev_cost) - 1
+        cost_row = [inf] * (hi - lo + 1)
+        back_row: List[Tuple[int, float]] = [(_OP_BLOCK_ONLY, _SKIP)] * (hi - lo + 1)
+        for j in range(lo, hi + 1):
+            best, best_op, best_step = inf, _OP_BLOCK_ONLY, _SKIP
+            # 블록 ↔ 줄 하나
+            if j >= 1 and prev_lo <= j - 1 <= prev_hi:
+                base = prev_cost[j - 1 - prev_lo]
+                if base < inf:
+                    step = _pair_cost(s, tgt[j - 1], log_ratio)
+                    if base + step < best:
+                        best, best_op, best_step = base + step, _OP_PAIR, step
+            # 블록만 (번역 줄 빠짐)
+            if prev_lo <= j <= prev_hi and prev_cost[j - prev_lo] + _SKIP < best:
+                best, best_op, best_step = prev_cost[j - prev_lo] + _SKIP, _OP_BLOCK_ONLY, _SKIP
+            # 블록 ↔ 줄 둘 (번역에서 한 자막을 두 줄로 나눔)
+            if j >= 2 and prev_lo <= j - 2 <= prev_hi:
+                base = prev_cost[j - 2 - prev_lo]
+                if base < inf:
+                    step = _pair_cost(s, _join_features(tgt[j - 2], tgt[j - 1]), log_ratio) + _MERGE
+                    if base + step < best:
+                        best, best_op, best_step = base + step, _OP_TWO_LINES, step
+            # 줄만 (번역에 남는 줄)
+            if j > lo and cost_row[j - 1 - lo] + _SKIP < best:
+                best, best_op, best_step = cost_row[j - 1 - lo] + _SKIP, _OP_LINE_ONLY, _SKIP
+            cost_row[j - lo] = best
+            back_row[j - lo] = (best_op, best_step)
+        rows_back.append((lo, back_row))
+        prev_lo, prev_cost = lo, cost_row
+
+    # (n, m)에서 역추적 — 끝점은 항상 띠 중심
+    ops: List[Tuple[int, float]] = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        lo, back_row = rows_back[i]
+        op, step = back_row[j - lo]
+        ops.append((op, step))
+        if op == _OP_PAIR:
+            i, j = i - 1, j - 1
+        elif op == _OP_TWO_LINES:
+            i, j = i - 1, j - 2
+        elif op == _OP_BLOCK_ONLY:
+            i -= 1
+        else:
+            j -= 1
+    ops.reverse()
+    return ops
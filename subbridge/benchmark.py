@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+"""
+코어 처리 단계 벤치마크.
+시드 기반 합성 SRT(1천~100만 큐)로 파싱·병합·SRT 생성·저장·QA·응답 줄 매핑·경고/검색 스캔의
+단계별 시간과 최대 메모리를 측정하고, 기준값(baseline) JSON과 비교해 성능 저하를 표시한다.
+
+    python -m subbridge.benchmark                                  # 1k,10k,100k 측정
+    python -m subbridge.benchmark --sizes 1m --stages parse_srt,merge_data
+    python -m subbridge.benchmark --save bench_baseline.json       # 기준값 저장
+    python -m subbridge.benchmark --compare bench_baseline.json    # 비교 (저하 시 종료 코드 1)
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .qa import QA_PROFILES, evaluate_qa, run_qa_checks, warning_indices
+from .srt import build_srt_from_merged, merge_data, parse_srt, parse_txt_lines, search_rows
+from .timecode import format_timecode
+from .translation import map_translation_response_lines
+from .writer import write_srt
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# 성능 저하로 판정하는 기준: 기준값 대비 비율 초과 + 절대 차이(노이즈 하한) 초과
+DEFAULT_THRESHOLD = 0.25
+_MIN_TIME_DELTA = 0.005       # 초
+_MIN_MEMORY_DELTA = 1 << 20   # 바이트
+
+# ── 합성 데이터 생성 ──
+
+_LATIN_WORDS = (
+    "the", "you", "what", "are", "doing", "here", "we", "have", "to", "go", "now", "I", "know",
+    "never", "again", "tonight", "listen", "please", "wait", "everything", "going", "be", "fine",
+    "don't", "believe", "him", "it's", "over", "come", "back", "home", "Captain", "Seoul", "tomorrow",
+)
+
+
+def _latin(rng: random.Random, length: int) -> str:
+    words: List[str] = []
+    size = 0
+    while size < length:
+        w = rng.choice(_LATIN_WORDS)
+        words.append(w)
+        size += len(w) + 1
+    text = " ".join(words)
+    return text[0].upper() + text[1:] + rng.choice((".", "?", "!", ",", "..."))
+
+
+def _cjk(rng: random.Random, length: int) -> str:
+    # 한자 + 가나 혼합, 공백 없음, 문장 부호는 전각
+    chars = [chr(rng.randint(0x4E00, 0x9FA5)) if rng.random() < 0.6 else chr(rng.randint(0x3041, 0x3093)) for _ in range(length)]
+    return "".join(chars) + rng.choice(("。", "？", "！", "…"))
+
+
+def _hangul(rng: random.Random, length: int) -> str:
+    words: List[str] = []
+    size = 0
+    while size < length:
+        w = "".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(1, 4)))
+        words.append(w)
+        size += len(w) + 1
+    return " ".join(words) + rng.choice((".", "?", "!"))
+
+
+def _rtl(rng: random.Random, length: int) -> str:
+    # 아랍 문자·히브리 문자 단어 (오른쪽→왼쪽 문자 처리 비용 확인용)
+    lo, hi = ((0x0621, 0x064A), (0x05D0, 0x05EA))[rng.random() < 0.3]
+    words: List[str] = []
+    size = 0
+    while size < length:
+        w = "".join(chr(rng.randint(lo, hi)) for _ in range(rng.randint(2, 7)))
+        words.append(w)
+        size += len(w) + 1
+    return " ".join(words) + rng.choice((".", "؟", "!"))
+
+
+SCRIPT_GENERATORS: Dict[str, Callable[[random.Random, int], str]] = {
+    "latin": _latin,
+    "cjk": _cjk,
+    "hangul": _hangul,
+    "rtl": _rtl,
+}
+DEFAULT_SCRIPTS = tuple(SCRIPT_GENERATORS)
+
+# 잘못된 블록 종류: 번호 없음 / 타임코드 깨짐 / 본문 없음 / 빈 줄 중복
+_MALFORMED_KINDS = ("no_index", "bad_timecode", "no_text", "extra_blank")
+
+
+def _line_length(rng: random.Random, script: str) -> int:
+    """한 줄 길이: 대부분 짧고 일부는 QA 기준(45자)을 넘는 분포. CJK는 글자당 폭이 넓어 짧게."""
+    base = rng.choice((8, 14, 20, 28, 36, 42, 50, 64, 80))
+    return max(2, base // 2) if script == "cjk" else base
+
+
+def generate_cue_texts(
+    n: int,
+    seed: int = 0,
+    scripts: Sequence[str] = DEFAULT_SCRIPTS,
+    br_density: float = 0.3,
+) -> List[str]:
+    """
+    큐 n개의 본문(여러 줄은 <br/>로 연결). br_density: 두 줄 이상인 큐의 비율.
+    스크립트는 큐마다 무작위로 섞는다.
+    """
+    rng = random.Random(seed)
+    gens = [SCRIPT_GENERATORS[s] for s in scripts]
+    names = list(scripts)
+    out: List[str] = []
+    for _ in range(n):
+        k = rng.randrange(len(gens))
+        lines = 1
+        if rng.random() < br_density:
+            lines = 2 if rng.random() < 0.85 else 3
+        out.append("<br/>".join(gens[k](rng, _line_length(rng, names[k])) for _ in range(lines)))
+    return out
+
+
+def generate_srt(
+    n: int,
+    seed: int = 0,
+    scripts: Sequence[str] = DEFAULT_SCRIPTS,
+    br_density: float = 0.3,
+    malformed_rate: float = 0.005,
+) -> str:
+    """
+    큐 n개의 SRT 문자열. 표시 시간 0.3~8초, 간격 0~0.6초(일부 겹침),
+    malformed_rate 비율로 잘못된 블록(_MALFORMED_KINDS)을 섞는다.
+    """
+    texts = generate_cue_texts(n, seed, scripts, br_density)
+    rng = random.Random(seed + 1)
+    parts: List[str] = []
+    t = 1000
+    for i, text in enumerate(texts, 1):
+        dur = rng.randint(300, 8000)
+        start, end = t, t + dur
+        gap = rng.randint(0, 600) if rng.random() > 0.02 else -rng.randint(1, 300)
+        t = max(0, end + gap)
+        index, timecode, body = str(i), format_timecode(start, end), text.replace("<br/>", "\n")
+        if rng.random() < malformed_rate:
+            kind = rng.choice(_MALFORMED_KINDS)
+            if kind == "no_index":
+                index = "#"
+            elif kind == "bad_timecode":
+                timecode = timecode.replace(",", ":", 1)
+            elif kind == "no_text":
+                body = ""
+            else:
+                body += "\n\n"
+        parts.append(f"{index}\n{timecode}\n{body}\n\n" if body else f"{index}\n{timecode}\n\n")
+    return "".join(parts)
+
+
+def generate_txt(n: int, seed: int = 0, scripts: Sequence[str] = DEFAULT_SCRIPTS, br_density: float = 0.3) -> str:
+    """번역 TXT(블록당 한 줄, 여러 줄은 <br/>) — SRT와 다른 시드로 생성."""
+    return "\n".join(generate_cue_texts(n, seed + 7, scripts, br_density))
+
+
+# ── 단계 정의 ──
+
+
+class StageResult(NamedTuple):
+    """단계 측정 결과. peak_bytes는 메모리 측정을 생략하면 None."""
+
+    seconds: float
+    peak_bytes: Optional[int]
+
+
+def _split_response(rows: List[Dict[str, Any]]) -> List[str]:
+    """<br/>가 실제 줄로 분리된 것처럼 만든 배치 응답 줄 (map_translation_response_lines 보정 경로)."""
+    out: List[str] = []
+    for r in rows:
+        out.extend((r.get("translated") or "x").split("<br/>"))
+    return out
+
+
+def _build_stages(ctx: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """ctx(srt_text, txt_text, blocks, lines, rows, tmp_path)를 쓰는 단계별 측정 함수."""
+    streaming = QA_PROFILES["스트리밍 (42자·20CPS)"]
+    discard = lambda msg: None
+
+    def map_lines() -> None:
+        rows = ctx["rows"]
+        for start in range(0, len(rows), 10):
+            batch = rows[start:start + 10]
+            map_translation_response_lines(_split_response(batch), batch, len(batch), discard)
+
+    return {
+        "parse_srt": lambda: parse_srt(ctx["srt_text"]),
+        "parse_txt_lines": lambda: parse_txt_lines(ctx["txt_text"]),
+        "merge_data": lambda: merge_data(ctx["blocks"], ctx["lines"]),
+        "build_srt_from_merged": lambda: build_srt_from_merged(ctx["rows"]),
+        "write_srt": lambda: write_srt(ctx["tmp_path"], ctx["rows"]),
+        "evaluate_qa": lambda: evaluate_qa(ctx["rows"]),
+        "evaluate_qa_timing": lambda: evaluate_qa(ctx["rows"], streaming),
+        "run_qa_checks": lambda: run_qa_checks(ctx["rows"], discard, discard),
+        "map_response_lines": map_lines,
+        "warning_scan": lambda: warning_indices(ctx["rows"]),
+        "search_scan": lambda: (search_rows(ctx["rows"], "tonight"), search_rows(ctx["rows"], "zzz-no-match")),
+    }
+
+
+STAGE_NAMES = tuple(_build_stages({}))
+
+
+def _measure(fn: Callable[[], Any], repeat: int, memory: bool) -> StageResult:
+    """repeat회 중 최소 시간(GC 정지 상태)과, memory면 추가 1회 실행의 tracemalloc 최대 사용량."""
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    peak: Optional[int] = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return StageResult(best, peak)
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    stages: Optional[Sequence[str]] = None,
+    seed: int = 0,
+    repeat: int = 3,
+    memory: bool = True,
+    scripts: Sequence[str] = DEFAULT_SCRIPTS,
+    br_density: float = 0.3,
+    malformed_rate: float = 0.005,
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """
+    크기별·단계별 측정. 반환: {"meta": {...}, "results": {"10000": {"parse_srt": {"seconds", "peak_bytes"}, ...}}}
+    앞 단계 출력(blocks·rows)은 측정 밖에서 한 번 만들어 다음 단계 입력으로 쓴다.
+    """
+    selected = list(stages) if stages else list(STAGE_NAMES)
+    unknown = [s for s in selected if s not in STAGE_NAMES]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계: {', '.join(unknown)}")
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    fd, tmp_path = tempfile.mkstemp(suffix=".srt")
+    os.close(fd)
+    try:
+        for n in sizes:
+            ctx: Dict[str, Any] = {
+                "srt_text": generate_srt(n, seed, scripts, br_density, malformed_rate),
+                "txt_text": generate_txt(n, seed, scripts, br_density),
+                "tmp_path": tmp_path,
+            }
+            ctx["blocks"] = parse_srt(ctx["srt_text"])
+            ctx["lines"] = parse_txt_lines(ctx["txt_text"])
+            ctx["rows"] = merge_data(ctx["blocks"], ctx["lines"])
+            fns = _build_stages(ctx)
+            per_size: Dict[str, Dict[str, Any]] = {}
+            for name in selected:
+                res = _measure(fns[name], repeat, memory)
+                per_size[name] = {"seconds": round(res.seconds, 6), "peak_bytes": res.peak_bytes}
+                if progress:
+                    progress(_format_row(n, name, per_size[name]))
+            results[str(n)] = per_size
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "scripts": list(scripts),
+        "br_density": br_density,
+        "malformed_rate": malformed_rate,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    return {"meta": meta, "results": results}
+
+
+class Regression(NamedTuple):
+    """기준값 대비 성능 저하 항목. metric: "seconds" 또는 "peak_bytes"."""
+
+    size: str
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """
+    양쪽에 모두 있는 (크기, 단계)만 비교. 비율이 1+threshold를 넘고 절대 차이가 노이즈 하한
+    (시간 5ms, 메모리 1MB)을 넘으면 저하로 판정한다.
+    """
+    out: List[Regression] = []
+    base_results = baseline.get("results") or {}
+    for size, stages in (current.get("results") or {}).items():
+        for stage, cur in stages.items():
+            base = (base_results.get(size) or {}).get(stage)
+            if not base:
+                continue
+            for metric, floor in (("seconds", _MIN_TIME_DELTA), ("peak_bytes", _MIN_MEMORY_DELTA)):
+                b, c = base.get(metric), cur.get(metric)
+                if b is None or c is None:
+                    continue
+                if c > b * (1.0 + threshold) and c - b > floor:
+                    out.append(Regression(size, stage, metric, b, c))
+    return out
+
+
+# ── CLI ──
+
+
+def _format_bytes(n: Optional[int]) -> str:
+    if n is None:
+        return "-"
+    return f"{n / (1 << 20):.1f}MB" if n >= (1 << 20) else f"{n / 1024:.0f}KB"
+
+
+def _format_row(n: int, stage: str, res: Dict[str, Any]) -> str:
+    return f"{n:>9,}  {stage:<22} {res['seconds'] * 1000:>10.1f}ms  {_format_bytes(res['peak_bytes']):>9}"
+
+
+def _parse_size(text: str) -> int:
+    """"1k", "100K", "1m", "2500" → 정수."""
+    t = text.strip().lower().replace("_", "")
+    mult = 1
+    if t.endswith("k"):
+        mult, t = 1_000, t[:-1]
+    elif t.endswith("m"):
+        mult, t = 1_000_000, t[:-1]
+    return int(float(t) * mult)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m subbridge.benchmark", description="SubBridge 코어 단계 벤치마크")
+    parser.add_argument("--sizes", default="1k,10k,100k", help="큐 개수 목록 (예: 1k,10k,100k,1m)")
+    parser.add_argument("--stages", default="", help=f"측정할 단계 (기본: 전체) — {', '.join(STAGE_NAMES)}")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수 (최소 시간 채택)")
+    parser.add_argument("--scripts", default=",".join(DEFAULT_SCRIPTS), help="문자 체계 (latin,cjk,hangul,rtl)")
+    parser.add_argument("--br-density", type=float, default=0.3, help="여러 줄 큐 비율")
+    parser.add_argument("--malformed-rate", type=float, default=0.005, help="잘못된 블록 비율")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략 (큰 크기에서 빠름)")
+    parser.add_argument("--save", metavar="PATH", help="결과를 기준값 JSON으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="기준값 JSON과 비교, 저하 시 종료 코드 1")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="저하 판정 비율 (기본 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [_parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    scripts = [s.strip() for s in args.scripts.split(",") if s.strip()]
+    unknown = [s for s in scripts if s not in SCRIPT_GENERATORS]
+    if unknown:
+        parser.error(f"알 수 없는 문자 체계: {', '.join(unknown)}")
+    print(f"{'cues':>9}  {'stage':<22} {'time':>12}  {'peak':>9}")
+    try:
+        report = run_benchmarks(
+            sizes, stages, args.seed, args.repeat, not args.no_memory,
+            scripts, args.br_density, args.malformed_rate, progress=print,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.save}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건 (기준: +{args.threshold:.0%}):")
+            for r in regressions:
+                fmt: Callable[[float], str] = (lambda v: f"{v * 1000:.1f}ms") if r.metric == "seconds" else (lambda v: _format_bytes(int(v)))
+                print(f"  {int(r.size):>9,}  {r.stage:<22} {r.metric:<10} {fmt(r.baseline)} → {fmt(r.current)} (x{r.ratio:.2f})")
+            return 1
+        print("\n기준값 대비 성능 저하 없음.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+API 호출 녹화/재생(cassette).
+RecordingClient는 실제(또는 가짜) 클라이언트를 감싸 요청·응답·지연·오류를 gzip JSON Lines 파일에 한 줄씩 기록하고,
+ReplayClient는 그 파일을 읽어 같은 요청에 같은 응답(오류 포함)을 원래 지연 또는 time_scale 배율로 돌려준다.
+할당량을 쓰지 않고 실제 트래픽과 동일한 입력으로 엔진 변경 전후를 비교하거나, 문제 작업을 그대로 재현할 때 사용한다.
+
+레코드(한 줄 = JSON 객체):
+    {"op": "header", "v": 1, "created": "..."}                            파일 첫 줄
+    {"op": "generate", "seq", "t", "model", "contents", "json_mode", "latency_ms", "text", "error", "usage"}
+    {"op": "list", "seq", "t", "models", "latency_ms", "error"}
+녹화 중 프로그램이 종료돼도 그 전까지 기록된 레코드는 읽을 수 있다 (레코드마다 압축 스트림 동기화).
+"""
+
+import gzip
+import json
+import threading
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, NamedTuple, Optional, Tuple
+
+from .fake_client import FakeResponse, FakeUsage, GeminiClient, _config_value, _FakeModel
+from .usage import usage_tokens
+
+CASSETTE_EXTENSION = ".jsonl.gz"
+_FORMAT_VERSION = 1
+
+
+class CassetteMissError(Exception):
+    """재생 중 녹화에 없는 요청. 엔진에서는 통신 오류로 처리된다."""
+
+
+class ReplayedAPIError(Exception):
+    """녹화된 API 오류를 같은 메시지로 다시 발생 (429/503 판별 로직이 그대로 동작)."""
+
+
+class CassetteSummary(NamedTuple):
+    """카세트 요약: 호출 수, 오류 수, 지연 합계(ms), 프롬프트/출력 토큰 합계."""
+
+    calls: int
+    errors: int
+    total_latency_ms: float
+    prompt_tokens: int
+    output_tokens: int
+
+
+def _usage_dict(response: Any) -> Optional[Dict[str, int]]:
+    if getattr(response, "usage_metadata", None) is None:
+        return None
+    prompt, output = usage_tokens(response)
+    return {"prompt": prompt, "output": output}
+
+
+def iter_cassette(path: Path) -> Iterator[Dict[str, Any]]:
+    """카세트 레코드를 순서대로 반환. 녹화가 중간에 끊겨 잘린 마지막 줄은 건너뛴다."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        while True:
+            try:
+                line = f.readline()
+            except (EOFError, zlib.error, OSError):
+                return
+            if not line:
+                return
+            try:
+                yield json.loads(line)
+            except ValueError:
+                return
+
+
+def summarize_cassette(path: Path) -> CassetteSummary:
+    """generate 레코드의 호출·오류·지연·토큰 합계."""
+    calls = errors = prompt = output = 0
+    latency = 0.0
+    for rec in iter_cassette(path):
+        if rec.get("op") != "generate":
+            continue
+        calls += 1
+        errors += 1 if rec.get("error") else 0
+        latency += float(rec.get("latency_ms") or 0.0)
+        usage = rec.get("usage") or {}
+        prompt += int(usage.get("prompt", 0))
+        output += int(usage.get("output", 0))
+    return CassetteSummary(calls, errors, round(latency, 1), prompt, output)
+
+
+class _RecordingModels:
+    def __init__(self, owner: "RecordingClient"):
+        self._owner = owner
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> Any:
+        inner = self._owner.inner.models
+        start = time.perf_counter()
+        rec: Dict[str, Any] = {
+            "op": "generate",
+            "model": model,
+            "contents": contents if isinstance(contents, str) else str(contents),
+            "json_mode": _config_value(config, "response_mime_type") == "application/json",
+        }
+        try:
+            response = inner.generate_content(model=model, contents=contents, config=config)
+        except Exception as e:
+            rec.update(latency_ms=(time.perf_counter() - start) * 1000.0, text=None, error=str(e), usage=None)
+            self._owner._write(rec, start)
+            raise
+        rec.update(
+            latency_ms=(time.perf_counter() - start) * 1000.0,
+            text=getattr(response, "text", None),
+            error=None,
+            usage=_usage_dict(response),
+        )
+        self._owner._write(rec, start)
+        return response
+
+    def list(self) -> Any:
+        start = time.perf_counter()
+        rec: Dict[str, Any] = {"op": "list"}
+        try:
+            models = list(self._owner.inner.models.list())
+        except Exception as e:
+            rec.update(latency_ms=(time.perf_counter() - start) * 1000.0, models=[], error=str(e))
+            self._owner._write(rec, start)
+            raise
+        rec.update(
+            latency_ms=(time.perf_counter() - start) * 1000.0,
+            models=[getattr(m, "name", "") or "" for m in models],
+            error=None,
+        )
+        self._owner._write(rec, start)
+        return iter(models)
+
+
+class RecordingClient:
+    """
+    inner 클라이언트를 감싸 모든 호출을 path 카세트에 기록 (스레드 안전).
+    파일은 첫 기록 시 생성되며, close() 전에 종료돼도 기록된 레코드는 유지된다.
+    """
+
+    def __init__(self, inner: GeminiClient, path: Path):
+        self.inner = inner
+        self.path = Path(path)
+        self.models = _RecordingModels(self)
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._seq = 0
+        self._t0 = time.perf_counter()
+
+    def _write(self, rec: Dict[str, Any], start: float) -> None:
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = gzip.open(self.path, "wb")
+                header = {"op": "header", "v": _FORMAT_VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+                self._file.write((json.dumps(header, ensure_ascii=False) + "\n").encode("utf-8"))
+            self._seq += 1
+            rec["seq"] = self._seq
+            rec["t"] = round(start - self._t0, 4)
+            rec["latency_ms"] = round(rec["latency_ms"], 2)
+            self._file.write((json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8"))
+            # 레코드 단위로 압축 스트림을 비워 두면 비정상 종료 후에도 여기까지 읽을 수 있다
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "RecordingClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class _ReplayModels:
+    def __init__(self, owner: "ReplayClient"):
+        self._owner = owner
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> Any:
+        prompt = contents if isinstance(contents, str) else str(contents)
+        rec = self._owner._take(("generate", model, prompt))
+        self._owner._wait(rec)
+        if rec.get("error"):
+            raise ReplayedAPIError(rec["error"])
+        usage = rec.get("usage")
+        meta = None
+        if usage:
+            meta = FakeUsage(usage.get("prompt", 0), usage.get("output", 0), usage.get("prompt", 0) + usage.get("output", 0))
+        return FakeResponse(rec.get("text") or "", usage_metadata=meta)
+
+    def list(self) -> Any:
+        rec = self._owner._take(("list", "", ""))
+        self._owner._wait(rec)
+        if rec.get("error"):
+            raise ReplayedAPIError(rec["error"])
+        return iter([_FakeModel(name) for name in rec.get("models") or ()])
+
+
+class ReplayClient:
+    """
+    카세트를 재생하는 클라이언트 (스레드 안전).
+    같은 (모델, 프롬프트) 요청이 여러 번 녹화돼 있으면 녹화 순서대로 소비한다.
+    time_scale: 녹화된 지연의 배율 (1.0 = 원래 속도, 0 = 대기 없음).
+    녹화에 없는 요청은 CassetteMissError (엔진 변경으로 프롬프트가 달라진 경우 등).
+    """
+
+    def __init__(self, path: Path, time_scale: float = 1.0):
+        self.path = Path(path)
+        self.time_scale = max(0.0, float(time_scale))
+        self.models = _ReplayModels(self)
+        self._lock = threading.Lock()
+        self._queues: Dict[Tuple[str, str, str], Deque[Dict[str, Any]]] = {}
+        self.misses = 0
+        for rec in iter_cassette(self.path):
+            op = rec.get("op")
+            if op == "generate":
+                key = ("generate", rec.get("model") or "", rec.get("contents") or "")
+            elif op == "list":
+                key = ("list", "", "")
+            else:
+                continue
+            self._queues.setdefault(key, deque()).append(rec)
+
+    @property
+    def remaining(self) -> int:
+        """아직 재생되지 않은 레코드 수."""
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+
+    def _take(self, key: Tuple[str, str, str]) -> Dict[str, Any]:
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                return queue.popleft()
+            self.misses += 1
+        raise CassetteMissError(f"카세트에 없는 요청입니다: {key[0]} {key[1]}".rstrip())
+
+    def _wait(self, rec: Dict[str, Any]) -> None:
+        ms = float(rec.get("latency_ms") or 0.0) * self.time_scale
+        if ms > 0:
+            time.sleep(ms / 1000.0)
+
+
+def default_cassette_path(directory: Path, label: str = "") -> Path:
+    """directory 안의 새 카세트 파일 경로 (시각_라벨.jsonl.gz)."""
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in label)
+    name = f"{stamp}_{safe}" if safe else stamp
+    path = Path(directory) / f"{name}{CASSETTE_EXTENSION}"
+    n = 1
+    while path.exists():
+        n += 1
+        path = Path(directory) / f"{name}_{n}{CASSETTE_EXTENSION}"
+    return path
+
+
+def replay_spec(spec: str) -> Tuple[str, float]:
+    """"경로[,time_scale]" 형식 문자열 → (경로, 배율). 배율 생략 시 1.0."""
+    path, sep, scale = (spec or "").rpartition(",")
+    if sep and path:
+        try:
+            return path, float(scale)
+        except ValueError:
+            pass
+    return spec, 1.0
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""번역·QA·언어·모델 관련 공용 상수 (GUI와 코어가 함께 사용)."""
+
+from typing import Dict, List, Tuple
+
+# AI 번역 배치 크기 (한 번에 API에 보낼 최대 블록 수). 10줄 단위 청크로 순번 동기화 강제
+BATCH_CHUNK_SIZE = 10
+# 줄 나눔으로 해결되지 않은 행을 AI로 줄일 때 한 번에 요청할 최대 행 수
+SHORTEN_CHUNK_SIZE = 50
+# 작업 끝에 용어집 미준수 행을 모아 다시 요청할 때 한 번에 보낼 최대 행 수
+GLOSSARY_REPAIR_CHUNK_SIZE = 50
+# 용어집이 이보다 크면 프롬프트에는 현재 파일 원문에 나오는 용어만 넣는다
+GLOSSARY_PROMPT_MAX_TERMS = 500
+# AI 번역 결과가 빈 줄/내용 없을 때 표시 (라인 밀림 방지)
+AI_TRANSLATE_EMPTY_PLACEHOLDER = "<빈줄>"
+# API 오류로 번역을 채우지 못한 행 표시
+AI_TRANSLATE_ERROR_PLACEHOLDER = "[통신 오류]"
+# QA: 번역 텍스트 한 줄당 최대 글자 수 (초과 시 경고)
+QA_MAX_CHARS = 45
+# 유니코드 대체 문자 (인코딩 깨짐 표시)
+QA_REPLACEMENT_CHAR = "\uFFFD"
+
+# 행별 번역 출처 (row["provenance"]) — 프로젝트 파일(.sbproj)에 함께 저장
+PROVENANCE_NONE = ""
+PROVENANCE_TXT = "txt"          # 번역 TXT에서 불러옴
+PROVENANCE_AI = "ai"            # AI 번역 / AI 줄이기
+PROVENANCE_REFLOW = "reflow"    # 줄 맞춤(로컬 줄 나눔)으로 수정
+PROVENANCE_MANUAL = "manual"    # 셀 직접 수정
+
+# 언어 옵션: (코드, 표시명) — 1.영어 2.러시아어 3.한국어, 이하 사용량 순
+LANG_OPTIONS: List[Tuple[str, str]] = [
+    ("EN", "English"),
+    ("RU", "Русский"),
+    ("KR", "한국어"),
+    ("ZH", "中文"),
+    ("ES", "Español"),
+    ("JA", "日本語"),
+    ("FR", "Français"),
+    ("DE", "Deutsch"),
+    ("PT", "Português"),
+    ("AR", "العربية"),
+]
+
+# AI 번역 모델 옵션 (Google AI Studio 텍스트 출력 모델 기준) — "자동"은 API 목록에서 첫 사용 가능 모델 사용
+AI_MODEL_AUTO = "자동"
+AI_MODEL_FALLBACKS = ("gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.5-flash-lite")
+AI_MODEL_IDS: List[str] = [AI_MODEL_AUTO, *AI_MODEL_FALLBACKS]
+# 모델별 단가 (USD / 100만 토큰: 입력, 출력) — Google AI Studio 유료 등급 공시가 기준의 근사치.
+# 비용 표시는 추정용이며, 단가가 바뀌면 여기만 고치면 된다. 없는 모델은 비용을 표시하지 않는다.
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+}
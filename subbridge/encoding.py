@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+자막 파일 인코딩 자동 감지와 변환.
+예전 SRT/TXT는 UTF-8이 아닌 경우가 많다 (한국어 CP949, 러시아어 CP1251, 일본어 Shift-JIS, 메모장 UTF-16 등).
+UTF-8로만 읽으면 열리지 않거나, 바꿔 읽으면 깨진 글자(U+FFFD)가 섞인 채 번역 비용을 쓰게 된다.
+
+- BOM이 있으면 그대로 따른다 (UTF-8 / UTF-16 / UTF-32).
+- BOM이 없으면 앞부분(SNIFF_BYTES)이 UTF-8로 읽히는지 보고, NUL 바이트 분포로 BOM 없는 UTF-16을 찾는다.
+- 그 밖에는 후보 코덱(LEGACY_ENCODINGS)으로 앞부분을 디코딩해, 비ASCII 글자가 한 문자 체계로 일관되게 나오는지 점수를 매긴다.
+  (한글 완성형·가나·키릴 문자 대소문자·라틴 악센트 문자가 단어 안에서 ASCII와 섞이는 모양 등)
+- decode_bytes()는 고른 코덱의 증분 디코더로 한 번에 훑으며 줄바꿈을 정리하고 깨진 글자 수를 센다.
+"""
+
+import codecs
+import re
+from typing import Dict, NamedTuple
+
+from .constants import QA_REPLACEMENT_CHAR
+
+AUTO_ENCODING = "auto"
+# BOM 없는 파일에서 시험하는 코덱 (앞쪽이 우선, 점수가 같으면 먼저 나온 코덱). cp932 = Windows Shift-JIS
+LEGACY_ENCODINGS = ("cp949", "cp932", "cp1251", "cp1252")
+SNIFF_BYTES = 64 * 1024
+DECODE_CHUNK = 1024 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+# 글자 종류
+_HANGUL, _KANA, _HALF_KANA, _CJK, _CJK_PUNCT = "hangul", "kana", "half_kana", "cjk", "cjk_punct"
+_CYR_UPPER, _CYR_LOWER, _LATIN_UPPER, _LATIN_LOWER = "cyr_upper", "cyr_lower", "latin_upper", "latin_lower"
+_PUNCT, _SYMBOL, _BAD, _REPLACEMENT, _OTHER = "punct", "symbol", "bad", "replacement", "other"
+
+# 코덱별 글자 종류 가중치 (표에 없는 종류는 _OTHER). 위치에 따라 달라지는 한글·키릴·라틴 글자는 _score에서 조정
+_WEIGHTS: Dict[str, Dict[str, float]] = {
+    "cp949": {_HANGUL: 1.0, _CJK: 0.2, _CJK_PUNCT: 0.6, _PUNCT: 0.6, _SYMBOL: 0.3, _KANA: 0.1},
+    "cp932": {_KANA: 1.0, _CJK: 0.8, _CJK_PUNCT: 0.8, _PUNCT: 0.6, _SYMBOL: 0.3, _HALF_KANA: 0.1},
+    "cp1251": {_CYR_UPPER: 1.0, _CYR_LOWER: 1.0, _PUNCT: 0.6, _SYMBOL: 0.3},
+    "cp1252": {_LATIN_UPPER: 1.0, _LATIN_LOWER: 1.0, _PUNCT: 0.6, _SYMBOL: 0.3},
+}
+_PENALTY = {_OTHER: -0.5, _BAD: -2.0, _REPLACEMENT: -1.5}
+
+_LABELS: Dict[str, str] = {
+    "utf-8": "UTF-8",
+    "utf-8-sig": "UTF-8 (BOM)",
+    "utf-16": "UTF-16",
+    "utf-16-le": "UTF-16 LE",
+    "utf-16-be": "UTF-16 BE",
+    "utf-32": "UTF-32",
+    "cp949": "CP949 (한국어)",
+    "cp932": "Shift-JIS (일본어)",
+    "cp1251": "CP1251 (키릴 문자)",
+    "cp1252": "CP1252 (서유럽)",
+}
+
+
+class EncodingGuess(NamedTuple):
+    """감지 결과. score는 비ASCII 글자당 평균 점수 (BOM·UTF-8이면 1.0)."""
+
+    encoding: str
+    score: float = 1.0
+    bom: bool = False
+
+
+class DecodedText(NamedTuple):
+    """decode_bytes 결과. 줄바꿈은 \\n으로 정리되어 있고, replacements는 깨진 글자(U+FFFD) 수."""
+
+    text: str
+    encoding: str
+    replacements: int = 0
+    bom: bool = False
+
+
+def _classify(o: int) -> str:
+    if 0xAC00 <= o <= 0xD7A3 or 0x1100 <= o <= 0x11FF or 0x3130 <= o <= 0x318F:
+        return _HANGUL
+    if 0x3040 <= o <= 0x30FF:
+        return _KANA
+    if 0xFF61 <= o <= 0xFF9F:
+        return _HALF_KANA
+    if 0x4E00 <= o <= 0x9FFF or 0x3400 <= o <= 0x4DBF or 0xF900 <= o <= 0xFAFF:
+        return _CJK
+    if 0x3000 <= o <= 0x303F or 0xFF00 <= o <= 0xFF60 or 0xFFE0 <= o <= 0xFFEF:
+        return _CJK_PUNCT
+    if 0x0400 <= o <= 0x042F:
+        return _CYR_UPPER
+    if 0x0430 <= o <= 0x045F:
+        return _CYR_LOWER
+    if 0x00C0 <= o <= 0x024F and o not in (0xD7, 0xF7):
+        return _LATIN_LOWER if chr(o).islower() else _LATIN_UPPER
+    if 0x2010 <= o <= 0x206F or o in (0xAB, 0xBB, 0xA0, 0x2116):
+        return _PUNCT
+    if 0x00A1 <= o <= 0x00BF or 0x2100 <= o <= 0x2BFF or o in (0xD7, 0xF7):
+        return _SYMBOL
+    if o == 0xFFFD:
+        return _REPLACEMENT
+    if 0x80 <= o <= 0x9F or 0xE000 <= o <= 0xF8FF:
+        return _BAD
+    return _OTHER
+
+
+def _is_ascii_letter(ch: str) -> bool:
+    return ("a" <= ch <= "z") or ("A" <= ch <= "Z")
+
+
+def _score(text: str, encoding: str) -> float:
+    """비ASCII 글자당 평균 점수. 비ASCII가 없으면 0."""
+    weights = _WEIGHTS.get(encoding, {})
+    total = 0.0
+    count = 0
+    euc_kr: Dict[str, bool] = {}
+    n = len(text)
+    for i, ch in enumerate(text):
+        if ch < "\x80":
+            continue
+        count += 1
+        kind = _classify(ord(ch))
+        if kind in _PENALTY:
+            total += _PENALTY[kind]
+            continue
+        w = weights.get(kind, _PENALTY[_OTHER])
+        prev = text[i - 1] if i else ""
+        nxt = text[i + 1] if i + 1 < n else ""
+        if kind == _HANGUL and encoding == "cp949":
+            # 실제 한국어는 거의 KS X 1001 완성형 2,350자 안에서 나온다 (확장 영역은 다른 코덱 바이트를 잘못 읽은 경우가 많음)
+            # (파이썬 euc_kr은 완성형에 없는 글자를 8바이트 조합으로 인코딩하므로 2바이트인지 본다)
+            if ch not in euc_kr:
+                try:
+                    euc_kr[ch] = len(ch.encode("euc_kr")) == 2
+                except UnicodeEncodeError:
+                    euc_kr[ch] = False
+            if not euc_kr[ch]:
+                w = 0.3
+        elif kind in (_CYR_UPPER, _CYR_LOWER) and w > 0:
+            # 키릴 단어 안에 ASCII 라틴 글자가 붙거나, 대소문자가 단어 중간에서 뒤섞이면(소문자→대문자, 대문자→대문자→소문자)
+            # 다른 코덱을 잘못 읽은 것. 러시아어 기본 33자 밖의 글자(і ї ј ѕ 등)는 조금 낮게 본다
+            if _is_ascii_letter(prev) or _is_ascii_letter(nxt):
+                w = -0.5
+            elif kind == _CYR_UPPER and prev.isalpha() and (prev.islower() or nxt.islower()):
+                w = -0.5
+            elif not (0x0410 <= ord(ch) <= 0x044F or ch in "Ёё"):
+                w = 0.7
+        elif kind in (_PUNCT, _SYMBOL) and prev.isalpha() and nxt.isalpha() and not prev.isascii():
+            # 기호가 비ASCII 글자 사이에 끼어 있으면 다른 코덱의 2바이트 글자를 잘라 읽은 것
+            w = -0.5
+        elif kind in (_LATIN_UPPER, _LATIN_LOWER) and w > 0:
+            # 서유럽 악센트 문자는 ASCII 글자와 한 단어를 이룬다 (악센트 문자만으로 된 단어는 키릴 등을 잘못 읽은 것)
+            if not (_is_ascii_letter(prev) or _is_ascii_letter(nxt)):
+                w = 0.3
+            elif kind == _LATIN_UPPER and prev and (prev.islower() and prev.isalpha()):
+                w = -0.5
+        total += w
+    return total / count if count else 0.0
+
+
+def _utf16_without_bom(head: bytes) -> str:
+    """NUL 바이트가 한쪽(짝수/홀수 위치)에 몰려 있으면 BOM 없는 UTF-16으로 본다. 아니면 빈 문자열."""
+    sample = head[: len(head) - len(head) % 2]
+    if len(sample) < 8:
+        return ""
+    pairs = len(sample) // 2
+    even_nul = sample[0::2].count(0)
+    odd_nul = sample[1::2].count(0)
+    if odd_nul >= pairs * 0.3 and even_nul < pairs * 0.05:
+        return "utf-16-le"
+    if even_nul >= pairs * 0.3 and odd_nul < pairs * 0.05:
+        return "utf-16-be"
+    return ""
+
+
+def sniff_encoding(head: bytes) -> EncodingGuess:
+    """
+    파일 앞부분 바이트로 인코딩 추정.
+    BOM → UTF-8로 읽힘(순수 ASCII 포함) → BOM 없는 UTF-16 → LEGACY_ENCODINGS 점수 순.
+    """
+    for bom, name in _BOMS:
+        if head.startswith(bom):
+            return EncodingGuess(name, bom=True)
+    try:
+        # 잘린 마지막 글자는 오류로 보지 않도록 증분 디코더(final=False)로 확인
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        if 0 not in head:
+            return EncodingGuess("utf-8")
+    except UnicodeDecodeError:
+        pass
+    utf16 = _utf16_without_bom(head)
+    if utf16:
+        return EncodingGuess(utf16)
+    best = EncodingGuess("utf-8", score=float("-inf"))
+    for name in LEGACY_ENCODINGS:
+        text = codecs.getincrementaldecoder(name)(errors="replace").decode(head, final=False)
+        score = _score(text, name)
+        if score > best.score:
+            best = EncodingGuess(name, score)
+    return best
+
+
+def _sample(raw: bytes) -> bytes:
+    """감지용 표본: 앞부분 SNIFF_BYTES. 앞부분이 모두 ASCII(UTF-16 제외)면 처음 비ASCII 바이트가 있는 줄부터."""
+    head = raw[:SNIFF_BYTES]
+    if len(raw) <= SNIFF_BYTES or 0 in head or _NON_ASCII.search(head):
+        return head
+    found = _NON_ASCII.search(raw)
+    if found is None:
+        return head
+    start = raw.rfind(b"\n", 0, found.start()) + 1
+    return raw[start:start + SNIFF_BYTES]
+
+
+def decode_bytes(raw: bytes, encoding: str = AUTO_ENCODING, chunk_size: int = DECODE_CHUNK) -> DecodedText:
+    """
+    raw를 한 번 훑어 디코딩하고 줄바꿈(\\r\\n, \\r)을 \\n으로 정리한다.
+    encoding이 AUTO_ENCODING이면 sniff_encoding으로 고르고, 디코딩할 수 없는 바이트는 U+FFFD로 바꿔 그 수를 센다.
+    코덱을 지정하면 엄격하게 디코딩한다 (UnicodeDecodeError / LookupError 발생).
+    """
+    bom = False
+    errors = "strict"
+    if encoding == AUTO_ENCODING:
+        guess = sniff_encoding(_sample(raw))
+        encoding, bom, errors = guess.encoding, guess.bom, "replace"
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    view = memoryview(raw)
+    parts = []
+    replacements = 0
+    carry = ""
+    size = max(1, chunk_size)
+    for start in range(0, max(len(raw), 1), size):
+        final = start + size >= len(raw)
+        text = carry + decoder.decode(view[start:start + size], final=final)
+        carry = ""
+        if not final and text.endswith("\r"):
+            # 다음 조각이 \n으로 시작할 수 있으므로 \r은 넘겨서 함께 정리
+            carry, text = "\r", text[:-1]
+        if errors == "replace":
+            replacements += text.count(QA_REPLACEMENT_CHAR)
+        parts.append(text.replace("\r\n", "\n").replace("\r", "\n"))
+    return DecodedText("".join(parts), encoding, replacements, bom)
+
+
+def encoding_label(encoding: str) -> str:
+    """로그·상태바용 이름 (예: cp949 → CP949 (한국어))."""
+    return _LABELS.get(encoding, encoding.upper())
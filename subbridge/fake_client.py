@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+네트워크 없이 번역 파이프라인을 돌려 보기 위한 가짜 Gemini 클라이언트.
+TranslationEngine이 사용하는 클라이언트 인터페이스(GeminiClient)를 그대로 구현하며,
+지연 시간 분포·오류 주입(429/503/타임아웃/깨진 JSON/누락 행/<br/> 줄 분리)·토큰 집계를 시드 기반으로 재현한다.
+
+사용 예:
+    client = FakeGeminiClient(seed=1, latency_ms=300, faults=FaultRates(quota=0.01, malformed=0.05))
+    TranslationEngine(client=client, model="gemini-2.5-flash").translate(rows)
+
+환경 변수 SUBBRIDGE_FAKE_GEMINI에 사양 문자열(예: "seed=1,latency_ms=300,malformed=0.05")을 넣으면
+GUI 포함 모든 TranslationEngine이 실제 API 대신 이 클라이언트를 사용한다 (translation.create_client).
+"""
+
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Protocol
+
+from .constants import AI_MODEL_FALLBACKS
+from .usage import estimate_tokens
+
+FAKE_CLIENT_ENV = "SUBBRIDGE_FAKE_GEMINI"
+
+# 주입 가능한 오류 종류 (FaultRates 필드명과 동일)
+FAULT_KINDS = ("quota", "unavailable", "timeout", "malformed", "short", "split_br")
+
+
+class ModelsAPI(Protocol):
+    """client.models 인터페이스 (google-genai Client.models와 같은 호출 형식)."""
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> Any: ...
+
+    def list(self) -> Any: ...
+
+
+class GeminiClient(Protocol):
+    """TranslationEngine이 사용하는 클라이언트 인터페이스. 실제 genai.Client와 FakeGeminiClient가 만족한다."""
+
+    models: ModelsAPI
+
+
+class FaultRates(NamedTuple):
+    """호출당 오류 주입 확률 (0~1). 한 호출에는 최대 한 종류만 발생한다."""
+
+    quota: float = 0.0         # 429 RESOURCE_EXHAUSTED
+    unavailable: float = 0.0   # 503 UNAVAILABLE
+    timeout: float = 0.0       # timeout_s 대기 후 TimeoutError
+    malformed: float = 0.0     # 잘리거나 코드 블록으로 감싼 JSON
+    short: float = 0.0         # 마지막 항목 누락
+    split_br: float = 0.0      # <br/>를 실제 줄바꿈으로 바꿔 응답
+
+
+class FakeAPIError(Exception):
+    """가짜 API 오류. 메시지 형식은 google-genai APIError와 같아 _is_quota_error 등 판별 로직이 그대로 동작한다."""
+
+    def __init__(self, code: int, status: str, message: str):
+        super().__init__(f"{code} {status}. {{'error': {{'code': {code}, 'message': '{message}', 'status': '{status}'}}}}")
+        self.code = code
+        self.status = status
+
+
+class FakeUsage(NamedTuple):
+    """response.usage_metadata 대역."""
+
+    prompt_token_count: int
+    candidates_token_count: int
+    total_token_count: int
+
+
+class FakeResponse(NamedTuple):
+    """generate_content 응답 대역 (text / parsed / usage_metadata)."""
+
+    text: str
+    parsed: Any = None
+    usage_metadata: Optional[FakeUsage] = None
+
+
+class _FakeModel(NamedTuple):
+    name: str
+
+
+def fake_client_spec() -> Optional[str]:
+    """환경 변수 SUBBRIDGE_FAKE_GEMINI 값 (설정되지 않았으면 None). 빈 문자열도 기본 설정으로 사용."""
+    return os.environ.get(FAKE_CLIENT_ENV)
+
+
+def _default_translate(text: str, target_lang: str) -> str:
+    """기본 가짜 번역: 원문 앞에 대상 언어 표시를 붙임 (<br/>는 보존)."""
+    return f"[{target_lang}] {text}"
+
+
+def _config_value(config: Any, key: str) -> Any:
+    if config is None:
+        return None
+    if isinstance(config, dict):
+        return config.get(key)
+    return getattr(config, key, None)
+
+
+# 프롬프트에서 입력 JSON 배열과 대상 언어를 찾는 패턴 (build_batch_prompt / build_shorten_prompt / 단일 폴백 형식)
+_INPUT_RE = re.compile(r"입력:\n(\[.*?\])\n\n", re.S)
+_LANG_RE = re.compile(r"\*\*([^*]+)\*\*로")
+
+
+class _FakeModels:
+    def __init__(self, owner: "FakeGeminiClient"):
+        self._owner = owner
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> FakeResponse:
+        return self._owner._generate(model, contents, config)
+
+    def list(self) -> Iterator[_FakeModel]:
+        return iter([_FakeModel(f"models/{name}") for name in self._owner.available_models])
+
+
+class FakeGeminiClient:
+    """
+    시드 기반 가짜 Gemini 클라이언트 (스레드 안전).
+    - 지연: 중앙값 latency_ms의 로그정규 분포(latency_sigma) + 출력 토큰당 per_token_ms. time_scale로 실제 대기 배율 조절(0이면 대기 없음).
+    - 오류: faults 확률 또는 script(호출 순서대로 소비되는 오류 이름 목록, None은 정상)로 주입.
+    - 집계: usage에 호출 수·토큰 수·오류 종류별 횟수, latencies_ms에 호출별 지연.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        latency_ms: float = 0.0,
+        latency_sigma: float = 0.35,
+        per_token_ms: float = 0.0,
+        faults: FaultRates = FaultRates(),
+        script: Optional[List[Optional[str]]] = None,
+        timeout_s: float = 60.0,
+        time_scale: float = 1.0,
+        available_models: Optional[List[str]] = None,
+        translate_fn: Callable[[str, str], str] = _default_translate,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.latency_ms = max(0.0, float(latency_ms))
+        self.latency_sigma = max(0.0, float(latency_sigma))
+        self.per_token_ms = max(0.0, float(per_token_ms))
+        self.faults = faults
+        self.timeout_s = timeout_s
+        self.time_scale = max(0.0, float(time_scale))
+        self.available_models = list(available_models) if available_models is not None else list(AI_MODEL_FALLBACKS)
+        self.translate_fn = translate_fn
+        self.models = _FakeModels(self)
+        self._sleep = sleep
+        self._script = list(script or [])
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.usage: Dict[str, int] = {"calls": 0, "prompt_tokens": 0, "output_tokens": 0, "errors": 0}
+        self.usage.update(dict.fromkeys(FAULT_KINDS, 0))
+        self.latencies_ms: List[float] = []
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "FakeGeminiClient":
+        """
+        "key=value,..." 사양 문자열로 생성 (환경 변수용).
+        키: seed, latency_ms, latency_sigma, per_token_ms, timeout_s, time_scale, models(공백 구분) 및 FAULT_KINDS 확률.
+        """
+        kwargs: Dict[str, Any] = {}
+        rates: Dict[str, float] = {}
+        for part in (spec or "").split(","):
+            key, sep, value = part.partition("=")
+            key, value = key.strip(), value.strip()
+            if not sep or not key:
+                continue
+            if key in FAULT_KINDS:
+                rates[key] = float(value)
+            elif key == "seed":
+                kwargs["seed"] = int(value)
+            elif key == "models":
+                kwargs["available_models"] = value.split()
+            elif key in ("latency_ms", "latency_sigma", "per_token_ms", "timeout_s", "time_scale"):
+                kwargs[key] = float(value)
+            else:
+                raise ValueError(f"알 수 없는 가짜 클라이언트 옵션: {key}")
+        return cls(faults=FaultRates(**rates), **kwargs)
+
+    # ── 내부 ──
+
+    def _draw(self) -> Dict[str, Any]:
+        """호출 1회분 난수 (오류 종류, 지연 배수)를 잠금 안에서 뽑음 → 스레드가 섞여도 호출 순서 기준으로 재현된다."""
+        with self._lock:
+            if self._script:
+                fault = self._script.pop(0)
+            else:
+                fault = None
+                roll = self._rng.random()
+                acc = 0.0
+                for kind in FAULT_KINDS:
+                    acc += getattr(self.faults, kind)
+                    if roll < acc:
+                        fault = kind
+                        break
+            jitter = math.exp(self._rng.gauss(0.0, self.latency_sigma)) if self.latency_sigma else 1.0
+            pick = self._rng.random()
+        return {"fault": fault, "jitter": jitter, "pick": pick}
+
+    def _account(self, prompt_tokens: int, output_tokens: int, latency_ms: float, fault: Optional[str], error: bool) -> None:
+        with self._lock:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += prompt_tokens
+            self.usage["output_tokens"] += output_tokens
+            if fault:
+                self.usage[fault] += 1
+            if error:
+                self.usage["errors"] += 1
+            self.latencies_ms.append(latency_ms)
+
+    def _wait(self, ms: float) -> None:
+        if ms > 0 and self.time_scale > 0:
+            self._sleep(ms * self.time_scale / 1000.0)
+
+    def _answer(self, prompt: str, json_mode: bool, fault: Optional[str], pick: float) -> FakeResponse:
+        lang_match = _LANG_RE.search(prompt)
+        target_lang = lang_match.group(1) if lang_match else "English"
+        input_match = _INPUT_RE.search(prompt)
+        if input_match is None:
+            # 단일 행 폴백·모델 확인("Hi") 등 자유 형식 요청: 마지막 문단을 번역
+            if prompt == "Hi":
+                return FakeResponse("Hi")
+            source = prompt.rsplit("\n\n", 1)[-1].strip()
+            text = self.translate_fn(source, target_lang)
+            if fault == "split_br":
+                text = text.replace("<br/>", "\n")
+            return FakeResponse(text)
+        items = json.loads(input_match.group(1))
+        out = [{"id": it.get("id"), "text": self.translate_fn(it.get("text", ""), target_lang)} for it in items]
+        if fault == "short" and out:
+            out.pop()
+        if fault == "split_br":
+            for it in out:
+                it["text"] = it["text"].replace("<br/>", "\n")
+        text = json.dumps(out, ensure_ascii=False)
+        if fault == "malformed":
+            # 절반은 코드 블록 래핑(보정 파서로 복구 가능), 절반은 중간에 잘린 JSON(복구 불가)
+            if pick < 0.5:
+                return FakeResponse(f"```json\n{text}\n```")
+            return FakeResponse(text[: max(1, len(text) // 2)])
+        return FakeResponse(text, parsed=out if json_mode else None)
+
+    def _generate(self, model: str, contents: Any, config: Any) -> FakeResponse:
+        draw = self._draw()
+        fault = draw["fault"]
+        prompt = contents if isinstance(contents, str) else str(contents)
+        system = _config_value(config, "system_instruction") or ""
+        prompt_tokens = estimate_tokens(prompt) + estimate_tokens(str(system))
+        base_ms = self.latency_ms * draw["jitter"]
+        if model not in self.available_models:
+            self._account(prompt_tokens, 0, 0.0, None, True)
+            raise FakeAPIError(404, "NOT_FOUND", f"models/{model} is not found")
+        if fault == "quota":
+            self._account(prompt_tokens, 0, 0.0, fault, True)
+            raise FakeAPIError(429, "RESOURCE_EXHAUSTED", "Resource has been exhausted (e.g. check quota).")
+        if fault == "unavailable":
+            self._wait(base_ms)
+            self._account(prompt_tokens, 0, base_ms, fault, True)
+            raise FakeAPIError(503, "UNAVAILABLE", "The model is overloaded. Please try again later.")
+        if fault == "timeout":
+            wait_ms = self.timeout_s * 1000.0
+            self._wait(wait_ms)
+            self._account(prompt_tokens, 0, wait_ms, fault, True)
+            raise TimeoutError("The read operation timed out")
+        json_mode = _config_value(config, "response_mime_type") == "application/json"
+        response = self._answer(prompt, json_mode, fault, draw["pick"])
+        output_tokens = estimate_tokens(response.text)
+        latency = base_ms + self.per_token_ms * output_tokens
+        self._wait(latency)
+        self._account(prompt_tokens, output_tokens, latency, fault, False)
+        usage = FakeUsage(prompt_tokens, output_tokens, prompt_tokens + output_tokens)
+        return response._replace(usage_metadata=usage)
+
+    # ── 집계 ──
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지의 호출·토큰·오류 집계와 지연 분위수(p50/p95, ms)."""
+        with self._lock:
+            usage = dict(self.usage)
+            lat = sorted(self.latencies_ms)
+        if lat:
+            usage["p50_ms"] = round(lat[(len(lat) - 1) // 2], 1)
+            usage["p95_ms"] = round(lat[min(len(lat) - 1, int(math.ceil(len(lat) * 0.95)) - 1)], 1)
+        return usage
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+여러 대상 언어 한 번에 번역 (팬아웃).
+원본 행 하나로 언어마다 TranslationEngine(그 언어의 용어집)을 만들고, 모든 언어 × 배치 호출을
+하나의 RequestPool(동시 요청 수 + 분당 요청 한도)로 흘려보낸다. 언어가 끝나는 대로 병합 SRT를
+`{파일 이름}_{언어 코드}{모델 접미사}.srt`로 저장한다 (GUI 병합하기와 같은 파일명 규칙).
+
+언어를 차례로 돌리면 총 시간이 언어 수에 비례하지만, 풀을 함께 쓰면 요청이 풀 크기만큼 겹쳐
+총 시간이 가장 느린 언어 하나에 가까워진다 (풀 크기 ≥ 언어 수 × 언어당 동시 요청 수일 때).
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Collection, Deque, Dict, List, NamedTuple, Optional, Sequence
+
+from .cassette import RecordingClient
+from .constants import AI_MODEL_AUTO, BATCH_CHUNK_SIZE, PROVENANCE_NONE
+from .fake_client import GeminiClient
+from .progress import JobProgress
+from .qa import QAProfile
+from . import tracing
+from .translation import JobCancelled, TranslationEngine, TranslationResult, create_client
+from .writer import write_srt
+
+# 풀 기본 동시 요청 수 (settings.json "fanout_workers")
+FANOUT_DEFAULT_CONCURRENCY = 4
+# 풀 대기 중 취소 여부를 확인하는 간격(초)
+POOL_POLL_SECONDS = 0.2
+# 취소로 풀 대기를 빠져나온 호출의 메시지
+CANCELLED_MESSAGE = "사용자 중단"
+
+
+class PoolCancelled(JobCancelled):
+    """풀 대기 중 취소 요청. 대기하던 호출은 API에 보내지 않고, 엔진은 그 배치를 폴백 없이 사용자 중단으로 끝낸다."""
+
+
+def model_file_suffix(model: Optional[str]) -> str:
+    """모델명에서 병합 파일명 접미사: _flash_lite, _flash, _pro 또는 빈 문자열."""
+    name = (model or "").lower()
+    if "flash-lite" in name or "flash_lite" in name:
+        return "_flash_lite"
+    if "flash" in name:
+        return "_flash"
+    if "pro" in name:
+        return "_pro"
+    return ""
+
+
+def merged_srt_name(stem: str, lang_code: str, model: Optional[str] = None) -> str:
+    """병합 SRT 기본 파일명 (예: video_EN_flash.srt)."""
+    return f"{stem}_{lang_code}{model_file_suffix(model)}.srt"
+
+
+class RequestPool:
+    """
+    여러 엔진이 함께 쓰는 API 요청 풀 (스레드 안전).
+    진행 중인 호출을 max_concurrent개로, 호출 시작 간격을 분당 requests_per_minute회로 제한한다 (0 = 한도 없음).
+    빈 자리는 도착 순서대로 배정하므로 먼저 많이 제출한 언어가 풀을 독차지하지 않는다.
+    cancel_check()가 True가 되면 대기 중인 호출은 PoolCancelled로 끝난다.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = FANOUT_DEFAULT_CONCURRENCY,
+        requests_per_minute: float = 0.0,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.interval = 60.0 / requests_per_minute if requests_per_minute and requests_per_minute > 0 else 0.0
+        self._cancel_check = cancel_check
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queue: Deque[object] = deque()
+        self._active = 0
+        self._next_start = 0.0
+        # 통계: 보낸 호출 수, 자리·한도를 기다린 시간 합계(초)
+        self.calls = 0
+        self.wait_seconds = 0.0
+
+    def _cancelled(self) -> bool:
+        return self._cancel_check is not None and self._cancel_check()
+
+    def acquire(self) -> None:
+        """자리 하나를 얻고 분당 한도에 맞춰 시작 시각까지 기다린다. 취소되면 PoolCancelled."""
+        t0 = self._clock()
+        me = object()
+        with self._cond:
+            self._queue.append(me)
+            try:
+                while self._queue[0] is not me or self._active >= self.max_concurrent:
+                    if self._cancelled():
+                        raise PoolCancelled(CANCELLED_MESSAGE)
+                    self._cond.wait(POOL_POLL_SECONDS)
+            except BaseException:
+                self._queue.remove(me)
+                self._cond.notify_all()
+                raise
+            self._queue.popleft()
+            self._active += 1
+            start = now = self._clock()
+            if self.interval > 0:
+                start = max(now, self._next_start)
+                self._next_start = start + self.interval
+            # 자리가 남았으면 다음 대기자도 바로 진행
+            self._cond.notify_all()
+        try:
+            while True:
+                delay = start - self._clock()
+                if delay <= 0:
+                    break
+                if self._cancelled():
+                    raise PoolCancelled(CANCELLED_MESSAGE)
+                time.sleep(min(delay, POOL_POLL_SECONDS))
+        except BaseException:
+            self.release()
+            raise
+        with self._cond:
+            self.calls += 1
+            self.wait_seconds += self._clock() - t0
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def wrap(self, client: GeminiClient) -> "PooledClient":
+        """client의 모든 호출이 이 풀을 거치도록 감싼다."""
+        return PooledClient(client, self)
+
+
+class _PooledModels:
+    def __init__(self, owner: "PooledClient"):
+        self._owner = owner
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> Any:
+        pool = self._owner.pool
+        pool.acquire()
+        try:
+            return self._owner.inner.models.generate_content(model=model, contents=contents, config=config)
+        finally:
+            pool.release()
+
+    def list(self) -> Any:
+        pool = self._owner.pool
+        pool.acquire()
+        try:
+            return iter(list(self._owner.inner.models.list()))
+        finally:
+            pool.release()
+
+
+class PooledClient:
+    """inner 클라이언트 호출을 RequestPool 자리 안에서만 실행 (GeminiClient 인터페이스)."""
+
+    def __init__(self, inner: GeminiClient, pool: RequestPool):
+        self.inner = inner
+        self.pool = pool
+        self.models = _PooledModels(self)
+
+
+class FanoutTarget(NamedTuple):
+    """대상 언어 1개: 파일명용 코드(예: EN), 프롬프트용 언어명(예: English), 그 언어의 용어집 텍스트."""
+
+    code: str
+    target_lang: str
+    glossary_text: str = ""
+
+
+class LanguageResult(NamedTuple):
+    """언어 1개의 결과. path는 저장한 병합 SRT (번역 실패·취소·저장 실패 시 None)."""
+
+    target: FanoutTarget
+    result: TranslationResult
+    path: Optional[Path] = None
+    write_error: Optional[str] = None
+    # 사용량·배치 통계 (StatsManager 기록용)
+    engine: Optional[TranslationEngine] = None
+
+
+class FanoutResult(NamedTuple):
+    """팬아웃 작업 결과. error는 작업 전체 오류(모델 선택 실패 등), languages는 targets 순서."""
+
+    model: Optional[str]
+    languages: List[LanguageResult]
+    cancelled: bool = False
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    calls: int = 0
+    wait_seconds: float = 0.0
+
+
+def translate_fanout(
+    rows: List[Dict[str, Any]],
+    targets: Sequence[FanoutTarget],
+    out_dir: Path,
+    stem: str,
+    api_key: Optional[str] = None,
+    model: str = AI_MODEL_AUTO,
+    client: Optional[GeminiClient] = None,
+    batch_size: int = BATCH_CHUNK_SIZE,
+    max_concurrent: int = FANOUT_DEFAULT_CONCURRENCY,
+    requests_per_minute: float = 0.0,
+    qa_profile: Optional[QAProfile] = None,
+    record_path: Optional[Path] = None,
+    avoid_models: Collection[str] = (),
+    log_callback: Optional[Callable[[str], None]] = None,
+    language_callback: Optional[Callable[[LanguageResult], None]] = None,
+    cancel_check: Optional[Callable[[], bool]] = None,
+    progress: Optional[JobProgress] = None,
+    encoding: str = "utf-8-sig",
+) -> FanoutResult:
+    """
+    rows 전체를 targets 언어마다 번역해 out_dir에 언어별 병합 SRT를 저장한다. rows는 수정하지 않는다 (언어마다 복사본).
+    모델은 한 번만 확인하고(자동이면 첫 응답 모델) 모든 언어가 확인 요청 없이 같은 모델·파일명 접미사를 쓴다.
+    log_callback 메시지에는 "[언어 코드]"가 붙고, language_callback(LanguageResult)은 언어가 끝날 때마다 워커 스레드에서 호출된다.
+    progress가 있으면 전체 행 수 = 행 수 × 언어 수로 만들어 넘긴다.
+    """
+    t0 = time.perf_counter()
+    if not targets:
+        return FanoutResult(None, [], error="대상 언어를 하나 이상 선택하세요.")
+    cancelled = cancel_check or (lambda: False)
+    log = log_callback or (lambda m: None)
+    inner = client if client is not None else create_client(api_key, record_path)
+    pool = RequestPool(max_concurrent, requests_per_minute, cancel_check)
+    pooled = pool.wrap(inner)
+
+    def finish(chosen: Optional[str], languages: List[LanguageResult], error: Optional[str] = None) -> FanoutResult:
+        return FanoutResult(
+            chosen, languages, cancelled(), error, time.perf_counter() - t0, pool.calls, pool.wait_seconds
+        )
+
+    try:
+        probe = TranslationEngine(client=pooled, model=model, avoid_models=avoid_models)
+        chosen = probe.select_model()
+        if chosen is None:
+            if cancelled():
+                return finish(None, [])
+            if model == AI_MODEL_AUTO:
+                return finish(None, [], "사용 가능한 Gemini 모델을 찾지 못했습니다. API 키와 Google AI Studio 권한을 확인해 주세요.")
+            return finish(None, [], f"선택한 모델 '{model}'을(를) 사용할 수 없습니다.")
+
+        def run_language(target: FanoutTarget) -> LanguageResult:
+            def tagged(msg: str) -> None:
+                log(f"[{target.code}] {msg}")
+
+            lang_rows = [dict(r, translated="", provenance=PROVENANCE_NONE) for r in rows]
+            engine = TranslationEngine(
+                target_lang=target.target_lang,
+                model=chosen,
+                glossary_text=target.glossary_text,
+                batch_size=batch_size,
+                client=pooled,
+                qa_profile=qa_profile,
+                max_workers=max_concurrent,
+                # 위에서 한 번 확인한 모델 — 언어마다 확인 요청을 다시 보내지 않는다
+                model_checked=True,
+            )
+            with tracing.span("fanout_language", lang=target.code, rows=len(lang_rows)) as sp:
+                result = engine.translate(
+                    lang_rows, log_callback=tagged, overflow_callback=tagged, cancel_check=cancelled, progress=progress
+                )
+                sp.set(success=result.success, translated=result.total)
+            path: Optional[Path] = None
+            write_error: Optional[str] = None
+            if result.success:
+                path = Path(out_dir) / merged_srt_name(stem, target.code, chosen)
+                try:
+                    with tracing.span("write_srt", rows=len(lang_rows), lang=target.code):
+                        write_srt(str(path), lang_rows, encoding)
+                except OSError as e:
+                    path, write_error = None, str(e)
+            lang_result = LanguageResult(target, result, path, write_error, engine)
+            if language_callback is not None:
+                language_callback(lang_result)
+            return lang_result
+
+        with tracing.span("fanout_job", languages=len(targets), rows=len(rows), workers=pool.max_concurrent):
+            with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="fanout") as executor:
+                languages = list(executor.map(run_language, targets))
+        return finish(chosen, languages)
+    finally:
+        if client is None and isinstance(inner, RecordingClient):
+            inner.close()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""언어별 용어집 변환·로드·저장 ({언어 표시명: {원본: 번역}})."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def glossary_dict_to_text(d: Dict[str, str]) -> str:
+    """용어집 딕셔너리를 '원본:번역' 한 줄씩 텍스트로 변환."""
+    return "\n".join(f"{k}:{v}" for k, v in (d or {}).items() if (k or "").strip())
+
+
+def glossary_text_to_dict(text: str) -> Dict[str, str]:
+    """'원본:번역' 형식 텍스트를 딕셔너리로 파싱."""
+    result: Dict[str, str] = {}
+    for line in (text or "").strip().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if ":" in line:
+            k, _, v = line.partition(":")
+            key = k.strip()
+            if key:
+                result[key] = v.strip()
+    return result
+
+
+def load_glossary(path: Path) -> Dict[str, Dict[str, str]]:
+    """glossary.json 로드. 파일이 없거나 형식이 잘못되면 빈 딕셔너리."""
+    if not path.exists():
+        return {}
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {
+        k: (v if isinstance(v, dict) else {})
+        for k, v in raw.items()
+        if isinstance(k, str)
+    }
+
+
+def save_glossary(path: Path, data: Dict[str, Dict[str, str]]) -> bool:
+    """용어집 전체를 glossary.json에 저장. 성공 여부 반환."""
+    try:
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        return True
+    except Exception:
+        return False
+
+
+class GlossaryMatcher:
+    """
+    용어집 준수 검사기. 원어(소문자)를 앞 두 글자 → 가능한 길이 목록으로 색인해 두고, 원문을 한 번 훑으며
+    각 시작 위치에서 그 길이들의 부분 문자열만 사전에서 찾는다 (긴 것 우선, 겹치지 않게).
+    용어 수와 무관하게 위치당 조회가 몇 번뿐이고 색인 생성도 선형이라 10만 개 용어집도 즉시 준비된다.
+    찾은 원어의 지정 번역어가 번역문에 있는지만 확인한다 (찾은 용어 수만큼 부분 문자열 검사).
+    영문·숫자로 시작/끝나는 원어는 단어 경계에서만 찾는다 ("Tom"이 "Tomorrow"에 걸리지 않도록). 한글·CJK 원어는 조사가 붙어도 찾는다.
+    """
+
+    def __init__(self, glossary: Dict[str, str]):
+        # 원어(소문자) → (원어, 번역어, 번역어 소문자)
+        self._terms: Dict[str, Tuple[str, str, str]] = {}
+        for src, dst in (glossary or {}).items():
+            src, dst = (src or "").strip(), (dst or "").strip()
+            if src and dst:
+                self._terms.setdefault(src.lower(), (src, dst, dst.lower()))
+        # 앞 두 글자(한 글자 용어는 그 글자) → 원어 길이 (긴 것부터)
+        lengths: Dict[str, set] = {}
+        for key in self._terms:
+            lengths.setdefault(key[:_PREFIX_LEN], set()).add(len(key))
+        self._lengths: Dict[str, Tuple[int, ...]] = {p: tuple(sorted(v, reverse=True)) for p, v in lengths.items()}
+        self._has_short = any(len(p) < _PREFIX_LEN for p in self._lengths)
+
+    def __bool__(self) -> bool:
+        return bool(self._terms)
+
+    def find_terms(self, text: str) -> List[str]:
+        """text에 나온 원어 키(소문자)를 나온 순서대로 (같은 위치에서는 긴 용어 우선, 겹치지 않음)."""
+        low = (text or "").lower()
+        n = len(low)
+        terms, index = self._terms, self._lengths
+        found: List[str] = []
+        i = 0
+        while i < n:
+            ch = low[i]
+            # 영문·숫자 단어 중간에서는 시작하지 않음
+            if i and _is_word_char(ch) and _is_word_char(low[i - 1]):
+                i += 1
+                continue
+            candidates = index.get(low[i:i + _PREFIX_LEN], ())
+            if self._has_short:
+                candidates = candidates + index.get(ch, ())
+            hit = 0
+            for size in candidates:
+                end = i + size
+                if end > n:
+                    continue
+                key = low[i:end]
+                # 영문·숫자로 끝나는 용어는 뒤에 영문·숫자가 이어지면 안 됨
+                if key in terms and not (end < n and _is_word_char(key[-1]) and _is_word_char(low[end])):
+                    hit = size
+                    break
+            if hit:
+                found.append(low[i:i + hit])
+                i += hit
+            else:
+                i += 1
+        return found
+
+    def missing_terms(self, original: str, translated: str) -> List[str]:
+        """원문에 나온 원어 중 번역문에 지정 번역어가 없는 것 (나온 순서, 중복 없음). 번역이 비어 있으면 검사하지 않는다."""
+        trans = (translated or "").strip().lower()
+        if not self._terms or not trans or not original:
+            return []
+        missing: List[str] = []
+        seen = set()
+        for key in self.find_terms(original):
+            if key in seen:
+                continue
+            seen.add(key)
+            src, _dst, dst_low = self._terms[key]
+            if dst_low not in trans:
+                missing.append(src)
+        return missing
+
+    def violations(self, rows: List[Dict[str, Any]], indices: Optional[Iterable[int]] = None) -> Dict[int, List[str]]:
+        """rows 중 indices(0-based, 없으면 전체)의 미준수 행 → {행 인덱스: [원어, ...]}."""
+        out: Dict[int, List[str]] = {}
+        if not self._terms:
+            return out
+        for i in (range(len(rows)) if indices is None else indices):
+            row = rows[i]
+            missing = self.missing_terms(row.get("original") or "", row.get("translated") or "")
+            if missing:
+                out[i] = missing
+        return out
+
+    def used_terms(self, texts: Iterable[str]) -> Dict[str, str]:
+        """texts(원문들)에 한 번이라도 나온 용어만 {원어: 번역어}로 (용어집 순서)."""
+        keys = set()
+        for text in texts:
+            keys.update(self.find_terms(text))
+        return {src: dst for key, (src, dst, _low) in self._terms.items() if key in keys}
+
+    def target_for(self, term: str) -> str:
+        """원어의 지정 번역어 (용어집 표기 그대로, 없으면 빈 문자열)."""
+        return self._terms.get((term or "").lower(), ("", "", ""))[1]
+
+
+# 색인 키 길이 (원어 앞 글자 수)
+_PREFIX_LEN = 2
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def glossary_violations(rows: List[Dict[str, Any]], glossary: Dict[str, str]) -> Dict[int, List[str]]:
+    """
+    원문에 용어집 원어가 있는데 번역문에 지정 번역어가 없는 행 → {행 인덱스(0-based): [원어, ...]}.
+    여러 번 검사할 때는 GlossaryMatcher를 한 번 만들어 재사용한다.
+    """
+    return GlossaryMatcher(glossary).violations(rows)
@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+"""
+용어집 일괄 가져오기·내보내기 (CSV / TSV / TBX).
+파일 전체를 메모리에 올리지 않고 스트리밍으로 읽고 쓰며, 항목은 IMPORT_CHUNK개씩 묶어 GlossaryStore에 반영한다.
+
+- CSV/TSV: 첫 줄이 머리글. "source"/"원본" 열(또는 원문 언어 열, 없으면 첫 열)이 원어, 나머지 열은 머리글을 언어로 해석
+  ("English", "en", "en-US", "KR" …). "target"/"번역" 열과 머리글이 없는 2열 파일은 default_lang 용어집으로 들어간다.
+- TBX (v2 martif·termEntry·langSet / v3 tbx·conceptEntry·langSec): 원문 언어 langSet의 용어(동의어 모두)가
+  다른 언어 langSet의 첫 용어로 번역된다. 원문 언어를 지정하지 않으면 루트 xml:lang, 그것도 없으면 항목의 첫 langSet.
+- 가져오기 결과(GlossaryImportReport)는 추가·수정·동일·충돌(기존 또는 파일 앞쪽과 다른 번역어)·건너뜀 수와 언어별 수,
+  충돌 예시를 담는다. dry_run=True면 같은 통계만 내고 저장하지 않는다.
+- 작업은 IMPORT_CHUNK개 단위로 커밋하므로 중간에 취소하면 그때까지 반영된 항목은 남는다 (보고서의 cancelled).
+"""
+
+import csv
+import heapq
+import io
+import os
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape as _xml_escape
+
+from .constants import LANG_OPTIONS
+from .encoding import SNIFF_BYTES, sniff_encoding
+from .glossary_store import GlossaryStore
+from .writer import write_chunks_atomic
+
+FORMAT_CSV = "csv"
+FORMAT_TSV = "tsv"
+FORMAT_TBX = "tbx"
+GLOSSARY_FORMATS = (FORMAT_CSV, FORMAT_TSV, FORMAT_TBX)
+
+CONFLICT_OVERWRITE = "overwrite"
+CONFLICT_KEEP = "keep"
+
+# 한 번에 기존 항목을 조회·저장하는 항목 수
+IMPORT_CHUNK = 5000
+# 내보낼 때 한 번에 파일에 쓰는 행 수
+EXPORT_CHUNK = 2000
+# 보고서에 남길 충돌 예시 수
+CONFLICT_SAMPLE_LIMIT = 100
+
+# 용어집 언어 키(LANG_OPTIONS 표시명) → (ISO 639-1 코드, 영어 이름)
+LANG_ISO_CODES: Dict[str, Tuple[str, str]] = {
+    "English": ("en", "english"),
+    "Русский": ("ru", "russian"),
+    "한국어": ("ko", "korean"),
+    "中文": ("zh", "chinese"),
+    "Español": ("es", "spanish"),
+    "日本語": ("ja", "japanese"),
+    "Français": ("fr", "french"),
+    "Deutsch": ("de", "german"),
+    "Português": ("pt", "portuguese"),
+    "العربية": ("ar", "arabic"),
+}
+
+_SOURCE_HEADERS = {"source", "src", "source term", "term", "원본", "원문", "원본단어"}
+_TARGET_HEADERS = {"target", "tgt", "target term", "translation", "번역", "번역문", "번역단어"}
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+_ENTRY_TAGS = ("termEntry", "conceptEntry")
+_LANG_TAGS = ("langSet", "langSec")
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _build_aliases() -> Dict[str, str]:
+    aliases: Dict[str, str] = {}
+    for code, display in LANG_OPTIONS:
+        aliases[display.lower()] = display
+        aliases[code.lower()] = display
+        iso, english = LANG_ISO_CODES.get(display, ("", ""))
+        if iso:
+            aliases[iso] = display
+            aliases[english] = display
+    return aliases
+
+
+_LANG_ALIASES = _build_aliases()
+
+
+def resolve_language(label: str) -> Optional[str]:
+    """머리글·언어 코드("en-US", "KR", "Korean", "한국어" …) → 용어집 언어 키. 모르면 None."""
+    key = (label or "").strip().lower()
+    if not key:
+        return None
+    if key in _LANG_ALIASES:
+        return _LANG_ALIASES[key]
+    return _LANG_ALIASES.get(key.replace("_", "-").split("-")[0])
+
+
+def language_code(lang: str) -> str:
+    """용어집 언어 키 → TBX용 ISO 코드 (모르면 "und")."""
+    return LANG_ISO_CODES.get(lang, ("und", ""))[0]
+
+
+def detect_format(path: str) -> Optional[str]:
+    """확장자로 형식 판별 (.csv / .tsv·.tab / .tbx·.xml)."""
+    ext = Path(path).suffix.lower()
+    if ext == ".csv":
+        return FORMAT_CSV
+    if ext in (".tsv", ".tab"):
+        return FORMAT_TSV
+    if ext in (".tbx", ".xml"):
+        return FORMAT_TBX
+    return None
+
+
+class GlossaryConflict(NamedTuple):
+    """같은 원어에 다른 번역어가 들어온 경우. existing은 DB 또는 파일 앞쪽의 번역어."""
+
+    lang: str
+    source: str
+    existing: str
+    incoming: str
+
+
+class GlossaryImportReport(NamedTuple):
+    """가져오기(또는 미리 보기) 통계."""
+
+    entries: int = 0                 # 읽은 (언어, 원어, 번역어) 수
+    added: int = 0
+    updated: int = 0                 # 번역어를 바꾼 수 (빈 번역어 채움 + 덮어쓴 충돌)
+    unchanged: int = 0
+    conflicts: int = 0               # 기존과 다른 번역어가 들어온 수 (덮어썼든 유지했든)
+    kept: int = 0                    # 충돌했지만 기존 번역어 유지
+    skipped: int = 0                 # 원어·번역어가 비었거나 언어를 정할 수 없는 항목
+    by_lang: Dict[str, int] = {}     # 언어별 추가+수정 수
+    unmapped: List[str] = []         # 용어집 언어로 옮기지 못한 열 머리글·언어 코드
+    samples: List[GlossaryConflict] = []
+    dry_run: bool = False
+    cancelled: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class GlossaryExportReport(NamedTuple):
+    """내보내기 결과. entries는 쓴 행(원어) 수."""
+
+    entries: int = 0
+    cancelled: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.cancelled
+
+
+class _Cancelled(Exception):
+    pass
+
+
+# ── 읽기 ──
+
+def _sniff_encoding(path: str) -> str:
+    """앞부분으로 인코딩 추정 (UTF-8·UTF-16 BOM, 한국어 Excel CSV의 cp949 등 — subbridge.encoding)."""
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    guess = sniff_encoding(head).encoding
+    # BOM 없는 UTF-8도 utf-8-sig로 읽으면 같고, BOM이 있으면 첫 열 머리글에서 떨어진다
+    return "utf-8-sig" if guess == "utf-8" else guess
+
+
+def _iter_delimited(
+    f: io.TextIOBase, delimiter: str, source_lang: Optional[str], default_lang: Optional[str],
+    lang_map: Dict[str, str], unmapped: List[str], skipped: List[int],
+) -> Iterator[Tuple[str, str, str]]:
+    reader = csv.reader(f, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        return
+    labels = [(h or "").strip() for h in header]
+    # 열 역할: 원어 열 번호, 열 번호 → 용어집 언어
+    source_col: Optional[int] = None
+    targets: Dict[int, str] = {}
+    for col, label in enumerate(labels):
+        low = label.lower()
+        lang = lang_map.get(label) or resolve_language(label)
+        if source_col is None and (low in _SOURCE_HEADERS or (source_lang and lang == source_lang)):
+            source_col = col
+        elif low in _TARGET_HEADERS and default_lang:
+            targets[col] = default_lang
+        elif lang:
+            targets[col] = lang
+        elif label:
+            unmapped.append(label)
+    first_row: Optional[List[str]] = None
+    if source_col is None and not targets:
+        # 머리글이 없는 파일: 첫 줄도 데이터, 원어·번역어 2열
+        unmapped.clear()
+        first_row = header
+        source_col = 0
+        if default_lang and len(header) >= 2:
+            targets = {1: default_lang}
+    elif source_col is None:
+        source_col = 0
+        targets.pop(0, None)
+    rows: Iterable[List[str]] = reader if first_row is None else _prepend(first_row, reader)
+    for row in rows:
+        if len(row) <= source_col:
+            skipped[0] += 1
+            continue
+        source = row[source_col].strip()
+        for col, lang in targets.items():
+            target = row[col].strip() if col < len(row) else ""
+            if source and target:
+                yield (lang, source, target)
+            elif source or target:
+                skipped[0] += 1
+
+
+def _prepend(first: List[str], rest: Iterable[List[str]]) -> Iterator[List[str]]:
+    yield first
+    yield from rest
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _iter_tbx(
+    f, source_lang: Optional[str], lang_map: Dict[str, str], unmapped: List[str], skipped: List[int]
+) -> Iterator[Tuple[str, str, str]]:
+    root_code: Optional[str] = None
+    stack: List[ET.Element] = []
+    seen_unmapped = set()
+
+    def to_lang(code: str) -> Optional[str]:
+        lang = lang_map.get(code) or resolve_language(code)
+        if lang is None and code not in seen_unmapped:
+            seen_unmapped.add(code)
+            unmapped.append(code)
+        return lang
+
+    for event, elem in ET.iterparse(f, events=("start", "end")):
+        if event == "start":
+            if not stack and root_code is None:
+                root_code = elem.get(_XML_LANG)
+            stack.append(elem)
+            continue
+        stack.pop()
+        if _local(elem.tag) not in _ENTRY_TAGS:
+            continue
+        # 언어 코드 → 용어 목록 (문서 순서)
+        terms: List[Tuple[str, List[str]]] = []
+        for lang_elem in elem.iter():
+            if _local(lang_elem.tag) in _LANG_TAGS:
+                words = [
+                    "".join(t.itertext()).strip() for t in lang_elem.iter() if _local(t.tag) == "term"
+                ]
+                words = [w for w in words if w]
+                if words:
+                    terms.append(((lang_elem.get(_XML_LANG) or "").strip(), words))
+        # 다 읽은 항목은 부모에서 떼어 메모리를 돌려준다
+        if stack:
+            stack[-1].remove(elem)
+        if not terms:
+            continue
+        if source_lang:
+            is_source = [(lang_map.get(code) or resolve_language(code)) == source_lang for code, _w in terms]
+        elif root_code:
+            is_source = [code.lower() == root_code.lower() for code, _w in terms]
+        else:
+            is_source = [k == 0 for k in range(len(terms))]
+        sources = [w for (code, words), src in zip(terms, is_source) if src for w in words]
+        if not sources:
+            skipped[0] += 1
+            continue
+        for (code, words), src in zip(terms, is_source):
+            if src:
+                continue
+            lang = to_lang(code)
+            if lang is None:
+                continue
+            for source in sources:
+                yield (lang, source, words[0])
+
+
+# ── 가져오기 ──
+
+def import_glossary(
+    store: GlossaryStore,
+    path: str,
+    fmt: Optional[str] = None,
+    source_lang: Optional[str] = None,
+    default_lang: Optional[str] = None,
+    lang_map: Optional[Dict[str, str]] = None,
+    on_conflict: str = CONFLICT_KEEP,
+    dry_run: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> GlossaryImportReport:
+    """
+    CSV/TSV/TBX 파일을 store에 가져온다 (워커 스레드에서 호출해도 된다).
+    source_lang: 원문 언어(용어집 언어 키) — 이 언어 열·langSet이 원어. default_lang: "target" 열·머리글 없는 2열 파일의 언어.
+    lang_map: 머리글·언어 코드 → 용어집 언어 키 직접 지정. on_conflict: CONFLICT_KEEP(기존 유지) / CONFLICT_OVERWRITE.
+    progress_callback(읽은 바이트, 전체 바이트)는 IMPORT_CHUNK개마다 호출된다.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in GLOSSARY_FORMATS:
+        return GlossaryImportReport(dry_run=dry_run, error=f"지원하지 않는 형식입니다: {Path(path).suffix or path}")
+    lang_map = dict(lang_map or {})
+    unmapped: List[str] = []
+    skipped = [0]
+    try:
+        total_bytes = os.path.getsize(path)
+        raw = open(path, "rb")
+    except OSError as e:
+        return GlossaryImportReport(dry_run=dry_run, error=str(e))
+    counts = {"entries": 0, "added": 0, "updated": 0, "unchanged": 0, "conflicts": 0, "kept": 0}
+    by_lang: Dict[str, int] = {}
+    samples: List[GlossaryConflict] = []
+    # 이번 작업에서 이미 본 원어 → 현재 번역어 (파일 안 중복·미리 보기용)
+    seen: Dict[str, Dict[str, str]] = {}
+
+    def flush(chunk: List[Tuple[str, str, str]]) -> None:
+        grouped: Dict[str, List[Tuple[str, str]]] = {}
+        for lang, source, target in chunk:
+            grouped.setdefault(lang, []).append((source, target))
+        for lang, pairs in grouped.items():
+            lang_seen = seen.setdefault(lang, {})
+            existing = store.get_many(lang, [s for s, _t in pairs if s not in lang_seen])
+            writes: Dict[str, str] = {}
+            for source, target in pairs:
+                current = lang_seen.get(source, existing.get(source))
+                if current is None:
+                    counts["added"] += 1
+                elif current == target:
+                    counts["unchanged"] += 1
+                    continue
+                elif not current:
+                    counts["updated"] += 1
+                else:
+                    counts["conflicts"] += 1
+                    if len(samples) < CONFLICT_SAMPLE_LIMIT:
+                        samples.append(GlossaryConflict(lang, source, current, target))
+                    if on_conflict != CONFLICT_OVERWRITE:
+                        counts["kept"] += 1
+                        lang_seen[source] = current
+                        continue
+                    counts["updated"] += 1
+                lang_seen[source] = target
+                writes[source] = target
+                by_lang[lang] = by_lang.get(lang, 0) + 1
+            if writes and not dry_run and not store.bulk_upsert(lang, writes.items()):
+                raise OSError(f"용어집 DB에 쓰지 못했습니다 ({lang}).")
+
+    cancelled = False
+    error: Optional[str] = None
+    try:
+        with raw:
+            if fmt == FORMAT_TBX:
+                triples = _iter_tbx(raw, source_lang, lang_map, unmapped, skipped)
+            else:
+                text = io.TextIOWrapper(raw, encoding=_sniff_encoding(path), newline="")
+                delimiter = "\t" if fmt == FORMAT_TSV else ","
+                triples = _iter_delimited(text, delimiter, source_lang, default_lang, lang_map, unmapped, skipped)
+            chunk: List[Tuple[str, str, str]] = []
+            for triple in triples:
+                chunk.append(triple)
+                if len(chunk) >= IMPORT_CHUNK:
+                    counts["entries"] += len(chunk)
+                    flush(chunk)
+                    chunk = []
+                    if progress_callback is not None:
+                        progress_callback(raw.tell(), total_bytes)
+                    if cancel_check is not None and cancel_check():
+                        cancelled = True
+                        break
+            if chunk and not cancelled:
+                counts["entries"] += len(chunk)
+                flush(chunk)
+            if progress_callback is not None and not cancelled:
+                progress_callback(total_bytes, total_bytes)
+    except (ET.ParseError, csv.Error, UnicodeDecodeError, OSError, ValueError) as e:
+        error = str(e)
+    return GlossaryImportReport(
+        skipped=skipped[0],
+        by_lang=by_lang,
+        unmapped=unmapped,
+        samples=samples,
+        dry_run=dry_run,
+        cancelled=cancelled,
+        error=error,
+        **counts,
+    )
+
+
+def format_import_report(report: GlossaryImportReport) -> str:
+    """보고서를 로그·대화상자용 여러 줄 텍스트로."""
+    if report.error:
+        head = f"오류: {report.error}"
+    elif report.cancelled:
+        head = "취소됨 (그때까지 읽은 항목만 반영)" if not report.dry_run else "미리 보기 취소됨"
+    else:
+        head = "미리 보기 (저장하지 않음)" if report.dry_run else "가져오기 완료"
+    lines = [
+        head,
+        f"읽은 항목 {report.entries:,}개 — 추가 {report.added:,} / 수정 {report.updated:,} / 같음 {report.unchanged:,} / 건너뜀 {report.skipped:,}",
+        f"충돌 {report.conflicts:,}개 (기존 유지 {report.kept:,})",
+    ]
+    if report.by_lang:
+        lines.append("언어별: " + ", ".join(f"{lang} {n:,}" for lang, n in sorted(report.by_lang.items())))
+    if report.unmapped:
+        lines.append("알 수 없는 언어(건너뜀): " + ", ".join(report.unmapped[:10]))
+    for c in report.samples[:5]:
+        lines.append(f"  충돌 [{c.lang}] {c.source}: {c.existing} → {c.incoming}")
+    return "\n".join(lines)
+
+
+# ── 내보내기 ──
+
+def _merged_rows(store: GlossaryStore, langs: List[str]) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """언어별 정렬 흐름을 합쳐 원어 하나당 (원어, {언어: 번역어})."""
+    def tagged(k: int) -> Iterator[Tuple[str, str, int, str]]:
+        for key, source, target in store.iter_entries(langs[k]):
+            yield key, source, k, target
+
+    streams = [tagged(k) for k in range(len(langs))]
+    current: Optional[Tuple[str, str]] = None
+    row: Dict[str, str] = {}
+    for key, source, k, target in heapq.merge(*streams):
+        if current != (key, source):
+            if current is not None:
+                yield current[1], row
+            current, row = (key, source), {}
+        row[langs[k]] = target
+    if current is not None:
+        yield current[1], row
+
+
+def _delimited_chunks(rows: Iterator[Tuple[str, Dict[str, str]]], langs: List[str], delimiter: str,
+                      on_row: Callable[[], None]) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(["source", *langs])
+    n = 0
+    for source, targets in rows:
+        writer.writerow([source, *(targets.get(lang, "") for lang in langs)])
+        n += 1
+        on_row()
+        if n % EXPORT_CHUNK == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue()
+
+
+def _tbx_chunks(rows: Iterator[Tuple[str, Dict[str, str]]], source_lang: Optional[str],
+                on_row: Callable[[], None]) -> Iterator[str]:
+    src_code = language_code(source_lang or "")
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<martif type="TBX" xml:lang="{src_code}">\n'
+        "<martifHeader><fileDesc><sourceDesc><p>SubBridge glossary</p></sourceDesc></fileDesc></martifHeader>\n"
+        "<text><body>\n"
+    ]
+    n = 0
+    for source, targets in rows:
+        n += 1
+        on_row()
+        lang_sets = "".join(
+            f'<langSet xml:lang="{language_code(lang)}"><tig><term>{_xml_escape(target)}</term></tig></langSet>'
+            for lang, target in targets.items()
+        )
+        parts.append(
+            f'<termEntry id="t{n}"><langSet xml:lang="{src_code}"><tig><term>{_xml_escape(source)}</term></tig></langSet>'
+            f"{lang_sets}</termEntry>\n"
+        )
+        if n % EXPORT_CHUNK == 0:
+            yield "".join(parts)
+            parts = []
+    parts.append("</body></text>\n</martif>\n")
+    yield "".join(parts)
+
+
+def export_glossary(
+    store: GlossaryStore,
+    path: str,
+    langs: List[str],
+    fmt: Optional[str] = None,
+    source_lang: Optional[str] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> GlossaryExportReport:
+    """
+    langs 용어집을 원어 기준으로 합쳐 한 파일에 쓴다 (CSV/TSV: "source" + 언어별 열, TBX: 원어 하나당 termEntry).
+    임시 파일에 쓴 뒤 교체하므로 실패·취소 시 기존 파일은 그대로다. progress_callback(쓴 항목 수, 전체 항목 수).
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in GLOSSARY_FORMATS:
+        return GlossaryExportReport(error=f"지원하지 않는 형식입니다: {Path(path).suffix or path}")
+    total = sum(store.count(lang) for lang in langs)
+    done = [0]   # 쓴 원어 행 수
+
+    def on_row() -> None:
+        done[0] += 1
+        if done[0] % EXPORT_CHUNK == 0:
+            if cancel_check is not None and cancel_check():
+                raise _Cancelled()
+            if progress_callback is not None:
+                progress_callback(min(done[0], total), total)
+
+    rows = _merged_rows(store, langs)
+    if fmt == FORMAT_TBX:
+        chunks = _tbx_chunks(rows, source_lang, on_row)
+    else:
+        chunks = _delimited_chunks(rows, langs, "\t" if fmt == FORMAT_TSV else ",", on_row)
+    try:
+        # CSV는 Excel이 UTF-8로 알아보도록 BOM을 붙인다
+        write_chunks_atomic(path, chunks, encoding="utf-8-sig" if fmt != FORMAT_TBX else "utf-8")
+    except _Cancelled:
+        return GlossaryExportReport(done[0], cancelled=True)
+    except OSError as e:
+        return GlossaryExportReport(done[0], error=str(e))
+    if progress_callback is not None:
+        progress_callback(total, total)
+    return GlossaryExportReport(done[0])
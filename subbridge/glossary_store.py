@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+언어별 용어집 색인 저장소 (glossary.db, SQLite).
+glossary.json은 통째로 읽어 중첩 딕셔너리로 두고 저장할 때마다 파일 전체를 다시 쓰므로, 언어당 수만 개 용어에서는
+창 열기·저장이 느려진다. 여기서는 (언어, 원어 소문자) 색인 테이블에 항목을 두고 필요한 부분만 읽고 쓴다.
+
+- 접두사 검색은 색인 범위 조회, 부분 문자열 검색(원어·번역어)은 instr 스캔 (10만 항목에서 수십 ms).
+- 화면에는 search(offset, limit)로 보이는 만큼만 가져온다 (가상 스크롤).
+- 항목 단위 추가·수정·삭제는 바로 커밋한다 (WAL + synchronous=NORMAL이라 1ms 안팎).
+- 언어별 revision()은 쓰기마다 늘어나므로, as_dict() 결과나 GlossaryMatcher를 캐시할 때 키로 쓴다.
+- 여러 스레드에서 써도 되도록 연결 하나를 잠금으로 보호한다 (가져오기 작업 등).
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .glossary import load_glossary
+from .paths import GLOSSARY_DB_PATH
+
+SEARCH_PREFIX = "prefix"
+SEARCH_SUBSTRING = "substring"
+SEARCH_MODES = (SEARCH_PREFIX, SEARCH_SUBSTRING)
+
+# 접두사 범위 조회의 상한 (가장 큰 코드 포인트)
+_MAX_CHAR = "\U0010ffff"
+# IN (...) 조회 한 번에 넣는 최대 값 수 (SQLite 변수 개수 제한 아래)
+_IN_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    lang TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL DEFAULT '',
+    source_key TEXT NOT NULL,
+    target_key TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (lang, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS terms_lang_key ON terms (lang, source_key, source);
+"""
+
+
+class GlossaryStore:
+    """
+    용어집 항목 저장소. 정렬은 원어 소문자 → 원어 순서.
+    DB 파일을 열 수 없으면(읽기 전용 폴더 등) 메모리 DB로 대신 열고 error에 사유를 남긴다.
+    """
+
+    def __init__(self, path: Path = GLOSSARY_DB_PATH):
+        self.path = Path(path)
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._revisions: Dict[str, int] = {}
+        try:
+            self._conn = self._open(str(self.path))
+        except sqlite3.Error as e:
+            self.error = str(e)
+            self._conn = self._open(":memory:")
+
+    @staticmethod
+    def _open(target: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(target, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def revision(self, lang: str) -> int:
+        """lang 항목이 바뀔 때마다 늘어나는 값 (프로세스 안에서만 유효)."""
+        return self._revisions.get(lang, 0)
+
+    def _touch(self, lang: str) -> None:
+        self._revisions[lang] = self._revisions.get(lang, 0) + 1
+
+    # ── 조회 ──
+
+    @staticmethod
+    def _where(lang: str, query: str, mode: str) -> Tuple[str, tuple]:
+        q = (query or "").strip().lower()
+        if not q:
+            return "lang = ?", (lang,)
+        if mode == SEARCH_SUBSTRING:
+            return "lang = ? AND (instr(source_key, ?) > 0 OR instr(target_key, ?) > 0)", (lang, q, q)
+        return "lang = ? AND source_key >= ? AND source_key < ?", (lang, q, q + _MAX_CHAR)
+
+    def count(self, lang: str, query: str = "", mode: str = SEARCH_PREFIX) -> int:
+        """조건에 맞는 항목 수."""
+        where, params = self._where(lang, query, mode)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM terms WHERE {where}", params).fetchone()[0]
+
+    def search(
+        self,
+        lang: str,
+        query: str = "",
+        mode: str = SEARCH_PREFIX,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> List[Tuple[str, str]]:
+        """조건에 맞는 항목 중 offset번째부터 limit개 → [(원어, 번역어), ...]. query가 비어 있으면 전체."""
+        where, params = self._where(lang, query, mode)
+        sql = f"SELECT source, target FROM terms WHERE {where} ORDER BY source_key, source LIMIT ? OFFSET ?"
+        with self._lock:
+            return self._conn.execute(sql, params + (max(0, limit), max(0, offset))).fetchall()
+
+    def index_of(self, lang: str, source: str, query: str = "", mode: str = SEARCH_PREFIX) -> int:
+        """search() 결과에서 source 항목의 위치 (0-based). 없거나 조건에 맞지 않으면 -1."""
+        where, params = self._where(lang, query, mode)
+        with self._lock:
+            found = self._conn.execute(
+                f"SELECT source_key FROM terms WHERE {where} AND source = ?", params + (source,)
+            ).fetchone()
+            if found is None:
+                return -1
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM terms WHERE {where} AND (source_key, source) < (?, ?)",
+                params + (found[0], source),
+            ).fetchone()[0]
+
+    def get(self, lang: str, source: str) -> Optional[str]:
+        """원어의 번역어 (없으면 None)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT target FROM terms WHERE lang = ? AND source = ?", (lang, source)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_many(self, lang: str, sources: Iterable[str]) -> Dict[str, str]:
+        """여러 원어의 번역어 → {원어: 번역어} (없는 원어는 빠짐)."""
+        keys = list(dict.fromkeys(sources))
+        out: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(keys), _IN_CHUNK):
+                part = keys[start:start + _IN_CHUNK]
+                marks = ", ".join("?" * len(part))
+                out.update(self._conn.execute(
+                    f"SELECT source, target FROM terms WHERE lang = ? AND source IN ({marks})", [lang, *part]
+                ).fetchall())
+        return out
+
+    def iter_entries(self, lang: str, batch: int = 2000) -> Iterator[Tuple[str, str, str]]:
+        """lang 항목을 정렬 순서로 (원어 소문자, 원어, 번역어) 하나씩. batch개씩 끊어 읽으므로 도중에 다른 호출이 끼어도 된다."""
+        last: Optional[Tuple[str, str]] = None
+        while True:
+            with self._lock:
+                if last is None:
+                    rows = self._conn.execute(
+                        "SELECT source_key, source, target FROM terms WHERE lang = ? ORDER BY source_key, source LIMIT ?",
+                        (lang, batch),
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT source_key, source, target FROM terms WHERE lang = ? AND (source_key, source) > (?, ?)"
+                        " ORDER BY source_key, source LIMIT ?",
+                        (lang, last[0], last[1], batch),
+                    ).fetchall()
+            yield from rows
+            if len(rows) < batch:
+                return
+            last = (rows[-1][0], rows[-1][1])
+
+    def as_dict(self, lang: str) -> Dict[str, str]:
+        """lang 용어집 전체 → {원어: 번역어} (정렬 순서). 프롬프트·준수 검사용."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, target FROM terms WHERE lang = ? ORDER BY source_key, source", (lang,)
+            ).fetchall()
+        return dict(rows)
+
+    def languages(self) -> List[str]:
+        """항목이 있는 언어 목록."""
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT DISTINCT lang FROM terms ORDER BY lang")]
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM terms LIMIT 1").fetchone() is None
+
+    # ── 쓰기 (항목 단위 즉시 커밋) ──
+
+    def upsert(self, lang: str, source: str, target: str) -> bool:
+        """항목 추가 또는 번역어 수정. 원어가 비어 있거나 DB 오류면 False."""
+        source, target = (source or "").strip(), (target or "").strip()
+        if not source:
+            return False
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO terms (lang, source, target, source_key, target_key) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (lang, source) DO UPDATE SET target = excluded.target, target_key = excluded.target_key",
+                    (lang, source, target, source.lower(), target.lower()),
+                )
+        except sqlite3.Error:
+            return False
+        self._touch(lang)
+        return True
+
+    def delete(self, lang: str, source: str) -> bool:
+        """항목 삭제. 지운 항목이 있었는지 반환."""
+        try:
+            with self._lock, self._conn:
+                cur = self._conn.execute("DELETE FROM terms WHERE lang = ? AND source = ?", (lang, source))
+        except sqlite3.Error:
+            return False
+        if cur.rowcount:
+            self._touch(lang)
+        return cur.rowcount > 0
+
+    def bulk_upsert(self, lang: str, pairs: Iterable[Tuple[str, str]]) -> int:
+        """(원어, 번역어) 여러 개를 트랜잭션 하나로 추가·수정. 반영한 항목 수 (오류면 0, 모두 취소)."""
+        rows = []
+        for source, target in pairs:
+            source, target = (source or "").strip(), (target or "").strip()
+            if source:
+                rows.append((lang, source, target, source.lower(), target.lower()))
+        if not rows:
+            return 0
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT INTO terms (lang, source, target, source_key, target_key) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (lang, source) DO UPDATE SET target = excluded.target, target_key = excluded.target_key",
+                    rows,
+                )
+        except sqlite3.Error:
+            return 0
+        self._touch(lang)
+        return len(rows)
+
+    def import_json(self, path: Path) -> int:
+        """기존 glossary.json({언어: {원어: 번역어}})을 가져온다. 가져온 항목 수 (파일은 그대로 둔다)."""
+        total = 0
+        for lang, terms in load_glossary(Path(path)).items():
+            total += self.bulk_upsert(lang, ((str(k), str(v or "")) for k, v in terms.items()))
+        return total
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+파싱 결과 디스크 캐시.
+같은 SRT/TXT를 다시 열 때 디코딩·parse_srt를 건너뛰도록, 파싱된 블록을 (경로, 크기, mtime, 내용 해시) 키로 보관한다.
+
+- 경로·크기·mtime·요청 인코딩이 모두 같으면 원본 파일을 읽지 않고 캐시 항목만 읽는다.
+- mtime만 바뀐 경우(복사·touch 등) 원본 바이트의 해시로 다시 찾으므로 디코딩·파싱은 여전히 생략된다.
+- 항목 해시에는 요청 인코딩도 들어간다. 같은 바이트라도 다른 코덱으로 다시 열면(자동 감지가 틀려 직접 지정 등) 새로 디코딩한다.
+- 항목 형식: 헤더(struct) + marshal 직렬화된 튜플 목록 (JSON 대비 읽기 수 배 빠르고 작음).
+- 전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU, 항목 파일 mtime 기준).
+- encoding이 "auto"(AUTO_ENCODING, 기본값)면 BOM·UTF-8·CP949·Shift-JIS·CP1251 등을 자동 감지해 읽는다 (subbridge.encoding).
+- chunk_callback을 주면 파싱하는 대로 chunk_size개씩 넘겨 주고 cancel_check로 중간에 멈출 수 있다 (작업 스레드에서 큰 파일 열기).
+"""
+
+import codecs
+import hashlib
+import marshal
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .encoding import AUTO_ENCODING, decode_bytes
+from .paths import PARSE_CACHE_DIR
+from .srt import iter_srt_blocks, parse_srt, parse_txt_lines
+
+# 헤더: 매직(4) + 형식 버전(H) + marshal 버전(H) + 항목 수(I) + 깨진 글자 수(I) + 실제 코덱 이름(16, ASCII)
+_HEADER = struct.Struct("<4sHHII16s")
+_MAGIC = b"SBPC"
+_FORMAT_VERSION = 2
+_INDEX_NAME = "index.bin"
+# SRT 블록을 튜플로 저장할 때의 필드 순서
+_SRT_FIELDS = ("index", "timecode", "start_ms", "end_ms", "original")
+
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+# chunk_callback 한 번에 넘기는 블록/줄 수 기본값
+LOAD_CHUNK_ITEMS = 2000
+
+# (이번 조각의 블록/줄 목록, 진행 위치, 전체) — 진행 위치/전체는 파싱 중이면 글자 위치, 캐시 적중이면 항목 수
+ChunkCallback = Callable[[List[Any], int, int], None]
+
+
+class ParsedFile(NamedTuple):
+    """
+    캐시 경유 파싱 결과. data는 SRT면 블록 리스트, TXT면 줄 리스트. 실패 시 error에 사유, 취소 시 cancelled.
+    encoding(실제 코덱)과 replacements(깨진 글자 U+FFFD 수)는 캐시 항목에 함께 저장되어 캐시 적중 때도 같은 값이 온다.
+    """
+
+    data: Optional[List[Any]]
+    error: Optional[str] = None
+    from_cache: bool = False
+    cancelled: bool = False
+    encoding: Optional[str] = None
+    replacements: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.data is not None
+
+
+class ParseCache:
+    """파싱된 SRT 블록 / TXT 줄을 디스크에 보관하는 LRU 캐시. 작업 스레드에서 불러도 되며, load는 한 번에 하나씩 실행된다."""
+
+    def __init__(self, cache_dir: Path = PARSE_CACHE_DIR, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        self._dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        # 정규화 경로 → (크기, mtime_ns, 내용+인코딩 해시, 요청 인코딩)
+        self._index: Dict[str, Tuple[int, int, str, str]] = {}
+        self._lock = threading.Lock()
+        self._load_index()
+
+    # ── 내부 I/O ──
+
+    def _load_index(self) -> None:
+        try:
+            data = marshal.loads((self._dir / _INDEX_NAME).read_bytes())
+            if isinstance(data, dict):
+                self._index = data
+        except Exception:
+            self._index = {}
+
+    def _save_index(self) -> None:
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._dir / (_INDEX_NAME + ".tmp")
+            tmp.write_bytes(marshal.dumps(self._index))
+            os.replace(tmp, self._dir / _INDEX_NAME)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _encoding_key(encoding: str) -> str:
+        """요청 인코딩의 캐시 키용 이름 (별칭·대소문자 통일: "CP949"·"uhc" → "cp949")."""
+        if encoding == AUTO_ENCODING:
+            return AUTO_ENCODING
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            return encoding.lower()
+
+    def _entry_path(self, digest: str, kind: str) -> Path:
+        return self._dir / f"{digest}.{kind}"
+
+    def _read_entry(self, digest: str, kind: str) -> Optional[Tuple[List[Any], Optional[str], int]]:
+        """(항목 목록, 실제 코덱, 깨진 글자 수). 없거나 형식이 다르면 None."""
+        path = self._entry_path(digest, kind)
+        try:
+            blob = path.read_bytes()
+            magic, fmt, mver, count, replacements, codec = _HEADER.unpack_from(blob)
+            if magic != _MAGIC or fmt != _FORMAT_VERSION or mver != marshal.version:
+                return None
+            items = marshal.loads(blob[_HEADER.size:])
+            if len(items) != count:
+                return None
+            os.utime(path)  # LRU: 최근 사용 표시
+        except Exception:
+            return None
+        encoding = codec.rstrip(b"\0").decode("ascii", "replace") or None
+        if kind == "srt":
+            return [dict(zip(_SRT_FIELDS, t)) for t in items], encoding, replacements
+        return list(items), encoding, replacements
+
+    def _write_entry(self, digest: str, kind: str, data: List[Any], encoding: str, replacements: int) -> None:
+        if kind == "srt":
+            items = tuple(tuple(b.get(k) for k in _SRT_FIELDS) for b in data)
+        else:
+            items = tuple(data)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            path = self._entry_path(digest, kind)
+            tmp = path.with_name(path.name + ".tmp")
+            header = _HEADER.pack(
+                _MAGIC, _FORMAT_VERSION, marshal.version, len(items), replacements, encoding.encode("ascii", "replace")[:16]
+            )
+            tmp.write_bytes(header + marshal.dumps(items))
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
+    def _evict(self, keep: str = "") -> None:
+        """전체 항목 용량이 max_bytes를 넘으면 최근 사용이 가장 오래된 항목부터 삭제 (keep 해시 항목은 유지)."""
+        try:
+            entries = [(p.stat(), p) for p in self._dir.iterdir() if p.suffix in (".srt", ".txt")]
+        except OSError:
+            return
+        total = sum(st.st_size for st, _ in entries)
+        if total <= self.max_bytes:
+            return
+        removed = set()
+        for st, p in sorted(entries, key=lambda e: e[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            if p.stem == keep:
+                continue
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= st.st_size
+            removed.add(p.stem)
+        if removed:
+            self._index = {k: v for k, v in self._index.items() if v[2] not in removed}
+
+    # ── 공개 API ──
+
+    def load(
+        self,
+        path: str,
+        kind: str = "srt",
+        encoding: str = AUTO_ENCODING,
+        chunk_callback: Optional[ChunkCallback] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        chunk_size: int = LOAD_CHUNK_ITEMS,
+    ) -> ParsedFile:
+        """
+        path를 kind("srt" → parse_srt 블록, "txt" → parse_txt_lines 줄)로 읽어 반환.
+        encoding은 코덱 이름 또는 AUTO_ENCODING(자동 감지, 못 읽는 바이트는 U+FFFD). 캐시 적중 시 디코딩·파싱을 생략한다. 원본이 바뀌면(크기·mtime·해시) 다시 파싱해 캐시를 갱신.
+        chunk_callback을 주면 결과를 앞에서부터 chunk_size개씩 넘겨 준 뒤 반환한다 (SRT는 파싱하는 대로).
+        조각 사이에 cancel_check()가 True면 캐시에 쓰지 않고 ParsedFile(None, cancelled=True)로 끝낸다.
+        """
+        if kind not in ("srt", "txt"):
+            raise ValueError(f"지원하지 않는 kind: {kind}")
+        with self._lock:
+            return self._load(path, kind, encoding, chunk_callback, cancel_check, max(1, chunk_size))
+
+    def _load(
+        self,
+        path: str,
+        kind: str,
+        encoding: str,
+        chunk_callback: Optional[ChunkCallback],
+        cancel_check: Optional[Callable[[], bool]],
+        chunk_size: int,
+    ) -> ParsedFile:
+        key = os.path.normcase(os.path.abspath(path))
+        enc_key = self._encoding_key(encoding)
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            return ParsedFile(None, str(e))
+        known = self._index.get(key)
+        if known and len(known) == 4 and known[:2] == (st.st_size, st.st_mtime_ns) and known[3] == enc_key:
+            entry = self._read_entry(known[2], kind)
+            if entry is not None:
+                data, detected, replacements = entry
+                if not self._emit(data, chunk_callback, cancel_check, chunk_size):
+                    return ParsedFile(None, cancelled=True)
+                return ParsedFile(data, from_cache=True, encoding=detected, replacements=replacements)
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except Exception as e:
+            return ParsedFile(None, str(e))
+        hasher = hashlib.blake2b(raw, digest_size=16)
+        hasher.update(b"\0" + enc_key.encode("ascii", "replace"))
+        digest = hasher.hexdigest()
+        entry = self._read_entry(digest, kind)
+        from_cache = entry is not None
+        if entry is not None:
+            data, detected, replacements = entry
+            if not self._emit(data, chunk_callback, cancel_check, chunk_size):
+                return ParsedFile(None, cancelled=True)
+        else:
+            try:
+                decoded = decode_bytes(raw, encoding)
+            except Exception as e:
+                return ParsedFile(None, str(e))
+            content = decoded.text
+            if kind == "txt":
+                data = parse_txt_lines(content)
+                if not self._emit(data, chunk_callback, cancel_check, chunk_size):
+                    return ParsedFile(None, cancelled=True)
+            elif chunk_callback is None:
+                data = parse_srt(content)
+            else:
+                data = self._parse_srt_chunks(content, chunk_callback, cancel_check, chunk_size)
+                if data is None:
+                    return ParsedFile(None, cancelled=True)
+            detected, replacements = decoded.encoding, decoded.replacements
+            self._write_entry(digest, kind, data, detected, replacements)
+            self._evict(keep=digest)
+        self._index[key] = (st.st_size, st.st_mtime_ns, digest, enc_key)
+        self._save_index()
+        return ParsedFile(data, from_cache=from_cache, encoding=detected, replacements=replacements)
+
+    @staticmethod
+    def _emit(
+        data: List[Any],
+        chunk_callback: Optional[ChunkCallback],
+        cancel_check: Optional[Callable[[], bool]],
+        chunk_size: int,
+    ) -> bool:
+        """이미 다 읽은 data를 chunk_size개씩 넘긴다. 도중에 취소되면 False."""
+        if chunk_callback is None:
+            return True
+        total = len(data)
+        for start in range(0, total, chunk_size):
+            if cancel_check is not None and cancel_check():
+                return False
+            end = min(start + chunk_size, total)
+            chunk_callback(data[start:end], end, total)
+        return True
+
+    @staticmethod
+    def _parse_srt_chunks(
+        content: str,
+        chunk_callback: ChunkCallback,
+        cancel_check: Optional[Callable[[], bool]],
+        chunk_size: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """iter_srt_blocks로 파싱하며 chunk_size개마다 넘긴다. 도중에 취소되면 None."""
+        total = len(content)
+        blocks: List[Dict[str, Any]] = []
+        sent = 0
+        for pos, block in iter_srt_blocks(content):
+            blocks.append(block)
+            if len(blocks) - sent >= chunk_size:
+                if cancel_check is not None and cancel_check():
+                    return None
+                chunk_callback(blocks[sent:], pos, total)
+                sent = len(blocks)
+        if cancel_check is not None and cancel_check():
+            return None
+        if sent < len(blocks):
+            chunk_callback(blocks[sent:], total, total)
+        return blocks
+
+    def clear(self) -> None:
+        """캐시 항목과 인덱스를 모두 삭제."""
+        with self._lock:
+            self._index = {}
+            try:
+                for p in self._dir.iterdir():
+                    if p.suffix in (".srt", ".txt", ".bin", ".tmp"):
+                        p.unlink()
+            except OSError:
+                pass
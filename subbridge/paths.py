@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+SubBridge 데이터 파일 기준 경로.
+exe 실행 시 exe와 같은 폴더, 스크립트 실행 시 프로젝트 루트(이 패키지의 상위 폴더)를 사용한다.
+"""
+
+import sys
+from pathlib import Path
+
+BASE_DIR = (
+    Path(sys.executable).parent
+    if getattr(sys, "frozen", False)
+    else Path(__file__).resolve().parent.parent
+)
+
+# 모델별 성능 데이터 영구 저장 경로
+MODEL_PERF_PATH = BASE_DIR / "model_performance.json"
+# 파싱 결과 캐시 폴더 (subbridge.parse_cache)
+PARSE_CACHE_DIR = BASE_DIR / "cache"
+# API 호출 녹화(cassette) 기본 폴더 (subbridge.cassette)
+CASSETTE_DIR = BASE_DIR / "cassettes"
+# 언어별 용어집 색인 DB (subbridge.glossary_store)
+GLOSSARY_DB_PATH = BASE_DIR / "glossary.db"
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+번역 작업 진행률·남은 시간 추정.
+TranslationEngine이 배치 시작/종료마다 JobProgress에 알리고, UI는 주기적으로 snapshot()을 읽어 표시한다.
+
+- 진행률: 완료 행 수 + 진행 중 배치의 예상 진척(경과 ÷ 예상 배치 시간, 최대 90%)을 전체 행 수로 나눈 값
+- 남은 시간: 과거 기록(StatsManager 행당 지연)을 PRIOR_ROWS행 분량의 관측으로 보고 실측 처리 속도와 섞은 행당 시간 × 남은 행
+  → 작업 초반에는 과거 기록, 진행될수록 실측에 가까워진다. 과거 기록이 없으면 첫 배치 완료 전까지 None.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+# 과거 기록의 가중치 (이 행 수만큼 관측한 것으로 취급)
+PRIOR_ROWS = 50
+# 진행 중 배치에 줄 수 있는 최대 진척 비율 (완료 전 100%에 닿지 않도록)
+IN_FLIGHT_CREDIT_CAP = 0.9
+
+
+class ProgressSnapshot(NamedTuple):
+    """특정 시점의 작업 진행 상태."""
+
+    rows_done: int
+    rows_total: int
+    fraction: float
+    tokens: int
+    in_flight: int
+    batches_done: int
+    fallbacks: int
+    elapsed: float
+    rows_per_sec: float
+    eta_seconds: Optional[float]
+
+
+class JobProgress:
+    """
+    작업 1건의 진행 추적 (스레드 안전). 엔진 워커 스레드가 batch_started/batch_finished를 부르고,
+    UI 스레드가 snapshot()을 읽는다.
+    history_seconds_per_row: 과거 배치 지연 ÷ 행 수 (동시 요청 1개 기준, StatsManager.get_latency().seconds_per_row).
+    workers: 동시 요청 수 — 과거 기록을 처리 속도로 환산할 때 나눈다.
+    """
+
+    def __init__(
+        self,
+        total_rows: int,
+        history_seconds_per_row: Optional[float] = None,
+        workers: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.total_rows = max(0, int(total_rows))
+        self.workers = max(1, int(workers))
+        self.prior_seconds_per_row = (
+            history_seconds_per_row / self.workers if history_seconds_per_row and history_seconds_per_row > 0 else None
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._start = clock()
+        self._rows_done = 0
+        self._tokens = 0
+        self._batches_done = 0
+        self._fallbacks = 0
+        self._next_id = 0
+        # 진행 중 배치: id → (시작 시각, 행 수)
+        self._in_flight: Dict[int, Tuple[float, int]] = {}
+
+    # ── 엔진 쪽 (워커 스레드) ──
+
+    def batch_started(self, rows: int) -> int:
+        """배치 요청 시작. 반환한 id를 batch_finished/batch_failed에 넘긴다."""
+        with self._lock:
+            self._next_id += 1
+            self._in_flight[self._next_id] = (self._clock(), rows)
+            return self._next_id
+
+    def batch_finished(self, batch_id: int, rows: int, tokens: int = 0, fallback: bool = False) -> None:
+        """배치 완료 (rows행 반영, 토큰 합계, 1줄씩 폴백 여부)."""
+        with self._lock:
+            self._in_flight.pop(batch_id, None)
+            self._rows_done += rows
+            self._tokens += tokens
+            self._batches_done += 1
+            self._fallbacks += 1 if fallback else 0
+
+    def batch_failed(self, batch_id: int, tokens: int = 0) -> None:
+        """작업을 중단시키는 오류로 끝난 배치 (행은 완료로 세지 않음)."""
+        with self._lock:
+            self._in_flight.pop(batch_id, None)
+            self._tokens += tokens
+
+    # ── UI 쪽 ──
+
+    def _seconds_per_row(self, elapsed: float, rows_done: int) -> Optional[float]:
+        """과거 기록과 실측을 섞은 행당 처리 시간 (동시 요청 반영). 근거가 없으면 None."""
+        prior = self.prior_seconds_per_row
+        if prior is None:
+            return elapsed / rows_done if rows_done > 0 else None
+        return (prior * PRIOR_ROWS + elapsed) / (PRIOR_ROWS + rows_done)
+
+    def snapshot(self) -> ProgressSnapshot:
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._start)
+            rows_done = self._rows_done
+            in_flight = list(self._in_flight.values())
+            tokens, batches_done, fallbacks = self._tokens, self._batches_done, self._fallbacks
+        spr = self._seconds_per_row(elapsed, rows_done)
+        credit = 0.0
+        if spr is not None:
+            for started, rows in in_flight:
+                # 배치 하나는 worker 1개가 처리하므로 예상 시간 = 행 수 × 행당 시간 × 동시 요청 수
+                expected = rows * spr * self.workers
+                if expected > 0:
+                    credit += rows * min(IN_FLIGHT_CREDIT_CAP, (now - started) / expected)
+        total = self.total_rows
+        fraction = min(1.0, (rows_done + credit) / total) if total else 1.0
+        remaining = max(0.0, total - rows_done - credit)
+        return ProgressSnapshot(
+            rows_done=rows_done,
+            rows_total=total,
+            fraction=fraction,
+            tokens=tokens,
+            in_flight=len(in_flight),
+            batches_done=batches_done,
+            fallbacks=fallbacks,
+            elapsed=elapsed,
+            rows_per_sec=rows_done / elapsed if elapsed > 0 else 0.0,
+            eta_seconds=remaining * spr if spr is not None else None,
+        )
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """남은 시간 표시 (예: "약 2분 10초", 모르면 "계산 중")."""
+    if seconds is None:
+        return "계산 중"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"약 {seconds}초"
+    minutes, sec = divmod(seconds, 60)
+    if minutes < 60:
+        return f"약 {minutes}분 {sec}초"
+    hours, minutes = divmod(minutes, 60)
+    return f"약 {hours}시간 {minutes}분"
+
+
+def format_progress(snap: ProgressSnapshot) -> str:
+    """상태바용 한 줄 (완료 행·비율·처리 속도·요청 중·폴백·토큰·남은 시간)."""
+    return (
+        f"{snap.rows_done:,}/{snap.rows_total:,}줄 ({snap.fraction:.0%}) · {snap.rows_per_sec:.1f}줄/s · "
+        f"요청 중 {snap.in_flight} · 폴백 {snap.fallbacks} · 토큰 {snap.tokens:,} · 남은 시간 {format_eta(snap.eta_seconds)}"
+    )
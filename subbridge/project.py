@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+작업 중인 세션을 저장하는 프로젝트 파일(.sbproj).
+행 전체(타임코드·원본·번역·번역 출처)와 메타 정보(원본 경로·모델·용어집 버전 등)를 보관한다.
+
+파일 구조: 헤더 struct + 스냅숏(marshal) + 저널 레코드(길이 접두 marshal)*
+- 스냅숏: 전체 행을 한 번에 기록 (파일 열기·타임코드 조정 등 대량 변경 시, 또는 저널이 커지면 압축).
+- 저널: 편집·번역된 행만 파일 끝에 덧붙인다 (자동 저장 시 전체를 다시 쓰지 않음).
+- 로드: 파일을 한 번에 읽어 스냅숏 적용 후 저널을 순서대로 재생. 기록 도중 끊긴 마지막 레코드는 무시한다.
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from .constants import PROVENANCE_NONE
+from .paths import BASE_DIR
+
+PROJECT_EXTENSION = ".sbproj"
+# 사용자가 프로젝트로 저장하지 않은 작업의 자동 저장 위치
+AUTOSAVE_PROJECT_PATH = BASE_DIR / f"autosave{PROJECT_EXTENSION}"
+
+# 헤더: 매직(4) + 형식 버전(H) + marshal 버전(H) + 스냅숏 길이(Q)
+_HEADER = struct.Struct("<4sHHQ")
+_RECORD_LEN = struct.Struct("<I")
+_MAGIC = b"SBPJ"
+_FORMAT_VERSION = 1
+# 행을 튜플로 저장할 때의 필드 순서
+_ROW_FIELDS = ("index", "timecode", "start_ms", "end_ms", "original", "translated", "provenance")
+# 저널이 스냅숏 크기의 절반 또는 이 레코드 수를 넘으면 스냅숏으로 다시 씀
+_MAX_JOURNAL_RECORDS = 500
+
+
+class ProjectData(NamedTuple):
+    """프로젝트 로드 결과. 실패 시 error에 사유 문자열."""
+
+    rows: List[Dict[str, Any]]
+    meta: Dict[str, Any]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def glossary_version(glossary_text: str) -> str:
+    """용어집 내용의 짧은 해시 (어떤 용어집으로 번역했는지 프로젝트에 기록)."""
+    return hashlib.blake2b((glossary_text or "").strip().encode("utf-8"), digest_size=6).hexdigest()
+
+
+def _row_tuple(row: Dict[str, Any]) -> tuple:
+    return tuple(row.get(k, PROVENANCE_NONE if k == "provenance" else None) for k in _ROW_FIELDS)
+
+
+def _row_dict(t: tuple) -> Dict[str, Any]:
+    row = dict(zip(_ROW_FIELDS, t))
+    if row["translated"] is None:
+        row["translated"] = ""
+    return row
+
+
+def load_project(path: Path) -> ProjectData:
+    """프로젝트 파일을 한 번에 읽어 (rows, meta) 반환."""
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        magic, fmt, mver, snap_len = _HEADER.unpack_from(blob)
+        if magic != _MAGIC:
+            return ProjectData([], {}, "SubBridge 프로젝트 파일이 아닙니다.")
+        if fmt != _FORMAT_VERSION or mver != marshal.version:
+            return ProjectData([], {}, "다른 버전에서 저장된 프로젝트 파일입니다.")
+        pos = _HEADER.size
+        snap = marshal.loads(blob[pos:pos + snap_len])
+        pos += snap_len
+        meta: Dict[str, Any] = dict(snap["meta"])
+        rows = [_row_dict(t) for t in snap["rows"]]
+        # 저널 재생 (마지막 레코드가 잘렸으면 거기서 중단)
+        end = len(blob)
+        while pos + _RECORD_LEN.size <= end:
+            (rec_len,) = _RECORD_LEN.unpack_from(blob, pos)
+            pos += _RECORD_LEN.size
+            if pos + rec_len > end:
+                break
+            try:
+                rec = marshal.loads(blob[pos:pos + rec_len])
+            except (EOFError, ValueError, TypeError):
+                break
+            pos += rec_len
+            meta.update(rec.get("meta") or {})
+            for i, t in rec.get("rows") or ():
+                if 0 <= i < len(rows):
+                    rows[i] = _row_dict(t)
+        return ProjectData(rows, meta)
+    except Exception as e:
+        return ProjectData([], {}, str(e))
+
+
+class ProjectWriter:
+    """
+    프로젝트 파일 증분 기록기.
+    save_snapshot()은 전체를 원자적으로(임시 파일 → os.replace) 다시 쓰고,
+    append_rows()는 변경 행만 저널에 덧붙인다. 행 수가 다르거나 저널이 커지면 자동으로 스냅숏.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._row_count = -1       # 마지막 스냅숏의 행 수 (-1: 아직 스냅숏 없음)
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+        self._journal_records = 0
+
+    def save_snapshot(self, rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> None:
+        """전체 행과 메타를 새 스냅숏으로 기록 (저널 초기화)."""
+        full_meta = dict(meta)
+        full_meta["saved_at"] = time.time()
+        payload = marshal.dumps({"meta": full_meta, "rows": tuple(_row_tuple(r) for r in rows)})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, marshal.version, len(payload)))
+            f.write(payload)
+        os.replace(tmp, self.path)
+        self._row_count = len(rows)
+        self._snapshot_bytes = len(payload)
+        self._journal_bytes = 0
+        self._journal_records = 0
+
+    def append_rows(self, rows: List[Dict[str, Any]], indices: Iterable[int], meta: Dict[str, Any]) -> None:
+        """indices(0-based) 행과 현재 메타를 저널에 덧붙임. 필요하면 스냅숏으로 대체."""
+        if (
+            self._row_count != len(rows)
+            or not self.path.exists()
+            or self._journal_records >= _MAX_JOURNAL_RECORDS
+            or self._journal_bytes > self._snapshot_bytes // 2
+        ):
+            self.save_snapshot(rows, meta)
+            return
+        rec = {
+            "meta": dict(meta),
+            "rows": tuple((i, _row_tuple(rows[i])) for i in sorted(set(indices)) if 0 <= i < len(rows)),
+        }
+        payload = marshal.dumps(rec)
+        with open(self.path, "ab") as f:
+            f.write(_RECORD_LEN.pack(len(payload)) + payload)
+        self._journal_bytes += _RECORD_LEN.size + len(payload)
+        self._journal_records += 1
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+번역 결과 QA 검수 규칙 엔진.
+클라이언트별 QAProfile(줄 길이·줄 수·CPS·표시 시간·간격)을 전체 행에 일괄 적용한다.
+타이밍 규칙은 파싱된 start_ms/end_ms(TimecodeTable)를 사용한다.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .constants import AI_TRANSLATE_EMPTY_PLACEHOLDER, QA_MAX_CHARS, QA_REPLACEMENT_CHAR
+from .timecode import TimecodeTable
+
+
+class QAProfile(NamedTuple):
+    """QA 기준. 0인 항목은 검사하지 않는다."""
+
+    name: str
+    max_line_chars: int = QA_MAX_CHARS
+    max_lines: int = 0
+    max_cps: float = 0.0
+    min_duration_ms: int = 0
+    max_duration_ms: int = 0
+    min_gap_ms: int = 0
+    check_overlap: bool = False
+
+    @property
+    def uses_timing(self) -> bool:
+        return bool(self.max_cps or self.min_duration_ms or self.max_duration_ms or self.min_gap_ms or self.check_overlap)
+
+
+class QAIssue(NamedTuple):
+    """행 하나의 QA 위반. code: chars / lines / cps / min_duration / max_duration / gap / overlap / empty / encoding."""
+
+    code: str
+    message: str
+
+
+DEFAULT_QA_PROFILE_NAME = "기본 (45자)"
+# 클라이언트별 QA 기준 (이름 → 프로필). 기본은 기존 동작(45자 초과·빈줄·깨진 문자)과 동일.
+QA_PROFILES: Dict[str, QAProfile] = {
+    p.name: p
+    for p in (
+        QAProfile(DEFAULT_QA_PROFILE_NAME),
+        QAProfile("스트리밍 (42자·20CPS)", max_line_chars=42, max_lines=2, max_cps=20.0,
+                  min_duration_ms=833, max_duration_ms=7000, min_gap_ms=83, check_overlap=True),
+        QAProfile("방송 (37자·17CPS)", max_line_chars=37, max_lines=2, max_cps=17.0,
+                  min_duration_ms=1000, max_duration_ms=7000, min_gap_ms=120, check_overlap=True),
+        QAProfile("CJK (16자·12CPS)", max_line_chars=16, max_lines=2, max_cps=12.0,
+                  min_duration_ms=833, max_duration_ms=7000, min_gap_ms=83, check_overlap=True),
+    )
+}
+QA_PROFILE_NAMES: List[str] = list(QA_PROFILES)
+
+# 글자 수에서 제외할 서식 태그 (<i>, </b>, <font ...>, {\an8}). <br/>는 줄 구분자이므로 제외하지 않음
+_FORMAT_TAG_RE = re.compile(r"<(?!br/>)/?[a-zA-Z][^>]*>|\{\\[^}]*\}")
+
+
+def get_qa_profile(name: Optional[str]) -> QAProfile:
+    """이름으로 프로필 조회. 없으면 기본 프로필."""
+    return QA_PROFILES.get(name or "", QA_PROFILES[DEFAULT_QA_PROFILE_NAME])
+
+
+def visible_lines(text: str) -> List[str]:
+    """번역 텍스트를 <br/> 기준 줄로 나누고 서식 태그를 제거한 표시 줄 목록 (빈 줄 제외)."""
+    if "<" in text or "{" in text:
+        text = _FORMAT_TAG_RE.sub("", text)
+    return [ln.strip() for ln in text.replace("<br/>", "\n").split("\n") if ln.strip()]
+
+
+def is_warning_text(text: str) -> bool:
+    """번역 텍스트가 경고 조건(45자 초과 또는 '빈줄' 포함)에 해당하는지 판별."""
+    if "빈줄" in text:
+        return True
+    for ln in text.replace("<br/>", "\n").split("\n"):
+        if ln.strip() and len(ln.strip()) > QA_MAX_CHARS:
+            return True
+    return False
+
+
+def _text_issues(trans: str, duration_ms: int, profile: QAProfile) -> List[QAIssue]:
+    """번역 텍스트 기반 규칙 (빈줄·깨진 문자·줄 길이·줄 수·CPS)."""
+    out: List[QAIssue] = []
+    if "빈줄" in trans:
+        out.append(QAIssue("empty", "빈줄"))
+        return out
+    if QA_REPLACEMENT_CHAR in trans:
+        out.append(QAIssue("encoding", "깨진 문자 포함"))
+    lines = visible_lines(trans)
+    longest = max((len(ln) for ln in lines), default=0)
+    if longest > profile.max_line_chars:
+        out.append(QAIssue("chars", f"{profile.max_line_chars}자 초과.(길이:{longest}자)"))
+    if profile.max_lines and len(lines) > profile.max_lines:
+        out.append(QAIssue("lines", f"{profile.max_lines}줄 초과.({len(lines)}줄)"))
+    if profile.max_cps and duration_ms > 0:
+        cps = sum(len(ln) for ln in lines) * 1000.0 / duration_ms
+        if cps > profile.max_cps:
+            out.append(QAIssue("cps", f"읽기 속도 초과.({cps:.1f}CPS > {profile.max_cps:g})"))
+    return out
+
+
+def evaluate_qa(
+    rows: List[Dict[str, Any]],
+    profile: Optional[QAProfile] = None,
+    include_neighbors: bool = True,
+) -> Dict[int, List[QAIssue]]:
+    """
+    전체 행에 QA 규칙을 일괄 적용. 반환: {행 인덱스(0-based): [QAIssue, ...]} (위반 행만).
+    include_neighbors=False면 앞뒤 행이 필요한 간격·겹침 검사를 생략 (배치 단위 검사용).
+    """
+    profile = profile or QA_PROFILES[DEFAULT_QA_PROFILE_NAME]
+    issues: Dict[int, List[QAIssue]] = {}
+    table = TimecodeTable.from_rows(rows) if profile.uses_timing else None
+    durations = table.durations() if table is not None else None
+    min_dur, max_dur = profile.min_duration_ms, profile.max_duration_ms
+    for i, row in enumerate(rows):
+        trans = (row.get("translated") or "").strip()
+        dur = durations[i] if durations is not None else 0
+        found = _text_issues(trans, dur, profile) if trans else []
+        if dur > 0:
+            if min_dur and dur < min_dur:
+                found.append(QAIssue("min_duration", f"표시 시간 부족.({dur}ms < {min_dur}ms)"))
+            elif max_dur and dur > max_dur:
+                found.append(QAIssue("max_duration", f"표시 시간 초과.({dur}ms > {max_dur}ms)"))
+        if found:
+            issues[i] = found
+    if include_neighbors and table is not None:
+        if profile.check_overlap:
+            for i in table.find_overlaps():
+                issues.setdefault(i, []).append(QAIssue("overlap", f"다음 자막과 겹침.(Line {rows[i + 1].get('index', i + 2)})"))
+        if profile.min_gap_ms:
+            for i in table.find_gaps(profile.min_gap_ms):
+                issues.setdefault(i, []).append(QAIssue("gap", f"다음 자막과 간격 부족.({profile.min_gap_ms}ms 미만)"))
+    return issues
+
+
+def warning_indices(rows: List[Dict[str, Any]], profile: Optional[QAProfile] = None) -> List[int]:
+    """QA 위반 행 인덱스(0-based) 목록 (오름차순)."""
+    return sorted(evaluate_qa(rows, profile))
+
+
+def run_qa_checks(
+    batch_rows: List[Dict[str, Any]],
+    log_callback: Optional[Callable[[str], None]] = None,
+    overflow_callback: Optional[Callable[[str], None]] = None,
+    profile: Optional[QAProfile] = None,
+) -> None:
+    """
+    AI 번역 결과 QA 검수: 줄 길이·줄 수·CPS·표시 시간·인코딩 깨짐(\\uFFFD) 감지 후 로그 출력.
+    overflow_callback: 글자 수 초과 경고 전용 콜백 (인라인 연속 출력용). 없으면 log_callback 사용.
+    """
+    for i, found in evaluate_qa(batch_rows, profile, include_neighbors=False).items():
+        row = batch_rows[i]
+        if (row.get("translated") or "").strip() == AI_TRANSLATE_EMPTY_PLACEHOLDER:
+            continue
+        idx = row.get("index", 0)
+        for issue in found:
+            if issue.code == "chars":
+                msg = f"Line {idx} {issue.message}"
+                if overflow_callback:
+                    overflow_callback(msg)
+                elif log_callback:
+                    log_callback(msg)
+            elif issue.code == "encoding":
+                # 유니코드 대체 문자(깨진 문자) 감지 — 즉시 출력
+                if log_callback:
+                    log_callback(f"[오류] Line {idx}: 번역 결과에 깨진 문자()가 감지되었습니다.")
+            elif log_callback:
+                log_callback(f"[경고] Line {idx} {issue.message}")
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+원본 SRT 새 버전(재편집본)에 기존 번역 이어받기.
+이전 작업 행과 새 parse_srt() 블록을 원문 내용 해시 시퀀스로 정렬(difflib.SequenceMatcher)해,
+내용이 같은 자막은 번역·출처를 그대로 옮기고 새로 생기거나 바뀐 자막만 번역 대상으로 남긴다.
+순번·타임코드는 새 버전을 따른다 (타임코드만 바뀐 자막도 번역은 이어받음).
+"""
+
+import difflib
+import hashlib
+import re
+from typing import Any, Dict, List, NamedTuple
+
+from .constants import PROVENANCE_NONE
+
+_WS_RE = re.compile(r"\s+")
+
+
+class RecutResult(NamedTuple):
+    """이어받기 결과. 인덱스는 모두 새 버전 기준 0-based."""
+
+    rows: List[Dict[str, Any]]
+    carried: List[int]     # 번역을 이어받은 행
+    changed: List[int]     # 새로 생기거나 원문이 바뀐 행 (번역 필요)
+    removed: int           # 이전 버전에서 짝을 찾지 못한 자막 수 (삭제·수정)
+    retimed: int           # 원문은 같고 타임코드만 바뀐 자막 수
+
+    @property
+    def pending(self) -> List[int]:
+        """번역이 비어 있는 행 (바뀐 행 + 이전에도 번역이 없던 행)."""
+        return [i for i, row in enumerate(self.rows) if not (row.get("translated") or "").strip()]
+
+
+def cue_key(text: str) -> bytes:
+    """원문 비교용 해시 (<br/>·공백 차이는 무시, 대소문자·문장부호는 구분)."""
+    normalized = _WS_RE.sub(" ", (text or "").replace("<br/>", " ")).strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+
+
+def carry_over_translations(old_rows: List[Dict[str, Any]], new_blocks: List[Dict[str, Any]]) -> RecutResult:
+    """
+    old_rows(이전 작업 행, translated/provenance 포함)의 번역을 new_blocks(새 parse_srt 결과)에 옮긴다.
+    같은 원문이 여러 번 나와도 순서를 따라 정렬하므로 반복 대사("Yes." 등)가 엇갈려 붙지 않는다.
+    """
+    old_keys = [cue_key(r.get("original", "")) for r in old_rows]
+    new_keys = [cue_key(b.get("original", "")) for b in new_blocks]
+    rows = [dict(block, translated="", provenance=PROVENANCE_NONE) for block in new_blocks]
+    carried: List[int] = []
+    changed: List[int] = []
+    matched = retimed = 0
+    matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            changed.extend(range(j1, j2))
+            continue
+        for old, j in zip(old_rows[i1:i2], range(j1, j2)):
+            matched += 1
+            row = rows[j]
+            if (old.get("start_ms"), old.get("end_ms")) != (row.get("start_ms"), row.get("end_ms")):
+                retimed += 1
+            translated = old.get("translated") or ""
+            if translated.strip():
+                row["translated"] = translated
+                row["provenance"] = old.get("provenance") or PROVENANCE_NONE
+                carried.append(j)
+    return RecutResult(rows, carried, changed, len(old_rows) - matched, retimed)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 줄 나눔(reflow) 엔진.
+글자 수 초과 번역문을 API 호출 없이 최대 max_lines줄(<br/>)로 다시 나눈다.
+최소 들쭉날쭉(minimal raggedness) DP로 줄 길이를 고르게 맞추고,
+CJK는 글자 사이 분리(금칙 처리 포함), 태국어·한글·라틴 문자는 공백에서만 나눈다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import AI_TRANSLATE_ERROR_PLACEHOLDER, PROVENANCE_REFLOW, QA_MAX_CHARS
+from .qa import _FORMAT_TAG_RE
+
+# 줄 첫머리에 올 수 없는 문자 (닫는 괄호·구두점·작은 가나·장음 등)
+_NO_LINE_START = frozenset(
+    "、。，．・：；？！ー〜～…‥）〕］｝〉》」』】〙〗〟’”"
+    "ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶㇰㇱㇲㇳㇴㇵㇶㇷㇸㇹㇺㇻㇼㇽㇾㇿ々〻゛゜ゝゞヽヾ"
+    ",.!?:;)]}%"
+)
+# 줄 끝에 올 수 없는 문자 (여는 괄호·따옴표)
+_NO_LINE_END = frozenset("（〔［｛〈《「『【〘〖〝‘“([{")
+
+
+def _is_cjk(ch: str) -> bool:
+    """글자 사이에서 줄을 나눌 수 있는 문자(한자·가나·전각 기호). 한글·태국어는 공백 단위."""
+    o = ord(ch)
+    return (
+        0x3000 <= o <= 0x30FF      # CJK 기호·히라가나·가타카나
+        or 0x3400 <= o <= 0x4DBF   # 한자 확장 A
+        or 0x4E00 <= o <= 0x9FFF   # 한자
+        or 0xF900 <= o <= 0xFAFF   # 호환 한자
+        or 0xFF00 <= o <= 0xFFEF   # 전각·반각 형태
+        or 0x31F0 <= o <= 0x31FF   # 가타카나 음성 확장
+    )
+
+
+def _join_lines(text: str) -> str:
+    """기존 <br/> 줄을 한 줄로 합침. 경계가 CJK면 붙이고, 아니면 공백 하나로 잇는다."""
+    parts = [p.strip() for p in text.replace("\r\n", "\n").replace("\n", "<br/>").split("<br/>")]
+    out = ""
+    for p in parts:
+        if not p:
+            continue
+        if out and not (_is_cjk(out[-1]) or _is_cjk(p[0])):
+            out += " "
+        out += p
+    return out
+
+
+def _visible_prefix(text: str) -> Tuple[List[int], List[bool]]:
+    """
+    (vis, in_tag): vis[i] = text[:i]의 표시 글자 수(서식 태그 제외),
+    in_tag[i] = text[i]가 서식 태그 안의 문자인지.
+    """
+    in_tag = [False] * len(text)
+    if "<" not in text and "{" not in text:
+        return list(range(len(text) + 1)), in_tag
+    for m in _FORMAT_TAG_RE.finditer(text):
+        for k in range(m.start(), m.end()):
+            in_tag[k] = True
+    vis = [0] * (len(text) + 1)
+    for i, tagged in enumerate(in_tag):
+        vis[i + 1] = vis[i] + (0 if tagged else 1)
+    return vis, in_tag
+
+
+def _break_candidates(text: str, in_tag: List[bool]) -> List[Tuple[int, int]]:
+    """줄 나눔 후보 (줄 끝 위치, 다음 줄 시작 위치). 공백 나눔은 공백을 소비한다."""
+    cands: List[Tuple[int, int]] = []
+    n = len(text)
+    for p in range(1, n):
+        if in_tag[p]:
+            continue
+        ch = text[p]
+        if ch == " ":
+            # 연속 공백은 첫 공백에서 한 번만 후보로
+            if text[p - 1] != " ":
+                q = p
+                while q < n and text[q] == " ":
+                    q += 1
+                if q < n and text[q] not in _NO_LINE_START:
+                    cands.append((p, q))
+            continue
+        prev = text[p - 1]
+        if in_tag[p - 1] or prev == " ":
+            continue
+        if _is_cjk(prev) and _is_cjk(ch) and ch not in _NO_LINE_START and prev not in _NO_LINE_END:
+            cands.append((p, p))
+    return cands
+
+
+def reflow_text(text: str, max_chars: int = QA_MAX_CHARS, max_lines: int = 2) -> Optional[str]:
+    """
+    text를 줄당 max_chars자(서식 태그 제외) 이하, 최대 max_lines줄로 다시 나눈 결과(<br/> 구분) 반환.
+    줄 길이 편차 제곱합이 최소인 나눔을 고르고, 동점이면 윗줄이 짧은 쪽을 택한다.
+    나눌 수 없으면(분리 불가 구간이 너무 길거나 줄 수 부족) None.
+    """
+    if not text or "빈줄" in text or text.strip() == AI_TRANSLATE_ERROR_PLACEHOLDER:
+        return None
+    joined = _join_lines(text)
+    if not joined:
+        return None
+    vis, in_tag = _visible_prefix(joined)
+    if vis[-1] <= max_chars:
+        return joined
+    max_lines = max(1, max_lines)
+    # 노드: (줄 끝 위치, 다음 줄 시작 위치). 0번은 문장 시작, 마지막은 문장 끝
+    nodes = [(0, 0)] + _break_candidates(joined, in_tag) + [(len(joined), len(joined))]
+    inf = float("inf")
+    # cost[k][j]: 노드 j에서 k번째 줄이 끝날 때 최소 비용
+    cost = [[inf] * len(nodes) for _ in range(max_lines + 1)]
+    back = [[-1] * len(nodes) for _ in range(max_lines + 1)]
+    cost[0][0] = 0
+    for k in range(1, max_lines + 1):
+        for j in range(1, len(nodes)):
+            end = nodes[j][0]
+            # 뒤에서부터 줄 시작 후보를 넓혀 가다 max_chars를 넘으면 중단 (폭은 단조 증가)
+            for i in range(j - 1, -1, -1):
+                width = vis[end] - vis[nodes[i][1]]
+                if width > max_chars:
+                    break
+                if cost[k - 1][i] == inf:
+                    continue
+                c = cost[k - 1][i] + (max_chars - width) ** 2
+                # 동점이면 더 앞선 i(윗줄이 짧은 쪽)를 택하도록 <=
+                if c <= cost[k][j]:
+                    cost[k][j] = c
+                    back[k][j] = i
+    last = len(nodes) - 1
+    best_k = min(range(1, max_lines + 1), key=lambda k: cost[k][last])
+    if cost[best_k][last] == inf:
+        return None
+    lines: List[str] = []
+    j, k = last, best_k
+    while k > 0:
+        i = back[k][j]
+        lines.append(joined[nodes[i][1]:nodes[j][0]].strip())
+        j, k = i, k - 1
+    return "<br/>".join(reversed(lines))
+
+
+def reflow_rows(
+    rows: List[Dict[str, Any]],
+    indices: List[int],
+    max_chars: int = QA_MAX_CHARS,
+    max_lines: int = 2,
+) -> Tuple[List[int], List[int]]:
+    """
+    indices(0-based) 행의 "translated"를 일괄 reflow하여 직접 수정.
+    반환: (수정된 행 인덱스, 로컬에서 해결하지 못한 행 인덱스).
+    """
+    fixed: List[int] = []
+    failed: List[int] = []
+    for i in indices:
+        trans = (rows[i].get("translated") or "").strip()
+        if not trans:
+            continue
+        new_text = reflow_text(trans, max_chars, max_lines)
+        if new_text is None:
+            failed.append(i)
+        elif new_text != trans:
+            rows[i]["translated"] = new_text
+            rows[i]["provenance"] = PROVENANCE_REFLOW
+            fixed.append(i)
+    return fixed, failed
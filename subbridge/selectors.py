@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+조건으로 재번역 대상 행 고르기.
+큰 작업 뒤 실패·미흡 행(빈 칸, <빈줄>, [통신 오류], 글자 수 초과, QA 위반, 용어집 미준수)만 모아
+배치 엔진에 다시 넣을 때 사용한다. 직접 수정한 행(provenance = manual)은 기본적으로 제외한다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from .constants import AI_TRANSLATE_EMPTY_PLACEHOLDER, AI_TRANSLATE_ERROR_PLACEHOLDER, PROVENANCE_MANUAL
+from .glossary import glossary_violations
+from .qa import QAProfile, evaluate_qa
+
+# 조건 이름 → 표시명 (대화상자 표시 순서)
+ROW_PREDICATES: Dict[str, str] = {
+    "empty": "번역 없음 (빈 칸)",
+    "placeholder": f"{AI_TRANSLATE_EMPTY_PLACEHOLDER} 표시",
+    "error": f"{AI_TRANSLATE_ERROR_PLACEHOLDER} 표시",
+    "overlength": "글자 수·줄 수 초과",
+    "qa": "QA 기준 위반 (전체)",
+    "glossary": "용어집 미준수",
+}
+# 글자 수·줄 수 초과로 보는 QA 코드
+_OVERLENGTH_CODES = frozenset({"chars", "lines"})
+
+
+def match_row_predicates(
+    rows: List[Dict[str, Any]],
+    predicates: Optional[Iterable[str]] = None,
+    profile: Optional[QAProfile] = None,
+    glossary: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[int]]:
+    """
+    조건별 해당 행 인덱스(0-based, 오름차순). predicates를 생략하면 ROW_PREDICATES 전체.
+    QA·용어집 검사는 해당 조건을 요청했을 때만 한 번씩 수행한다.
+    """
+    wanted = list(predicates) if predicates is not None else list(ROW_PREDICATES)
+    out: Dict[str, List[int]] = {name: [] for name in wanted if name in ROW_PREDICATES}
+    simple = [name for name in ("empty", "placeholder", "error") if name in out]
+    if simple:
+        for i, row in enumerate(rows):
+            trans = (row.get("translated") or "").strip()
+            if not trans:
+                if "empty" in out:
+                    out["empty"].append(i)
+            elif trans == AI_TRANSLATE_EMPTY_PLACEHOLDER:
+                if "placeholder" in out:
+                    out["placeholder"].append(i)
+            elif trans == AI_TRANSLATE_ERROR_PLACEHOLDER:
+                if "error" in out:
+                    out["error"].append(i)
+    if "overlength" in out or "qa" in out:
+        issues = evaluate_qa(rows, profile)
+        if "qa" in out:
+            out["qa"] = sorted(issues)
+        if "overlength" in out:
+            out["overlength"] = sorted(i for i, found in issues.items() if any(x.code in _OVERLENGTH_CODES for x in found))
+    if "glossary" in out:
+        out["glossary"] = sorted(glossary_violations(rows, glossary or {}))
+    return out
+
+
+def select_rows(
+    rows: List[Dict[str, Any]],
+    predicates: Iterable[str],
+    profile: Optional[QAProfile] = None,
+    glossary: Optional[Dict[str, str]] = None,
+    skip_manual: bool = True,
+) -> List[int]:
+    """
+    조건 중 하나라도 해당하는 행(합집합, 0-based 오름차순). 조건이 없으면 전체 행.
+    skip_manual=True면 직접 수정한 행은 빼서, 사람이 고친 번역을 덮어쓰지 않는다.
+    """
+    predicates = list(predicates)
+    if predicates:
+        selected = set()
+        for found in match_row_predicates(rows, predicates, profile, glossary).values():
+            selected.update(found)
+    else:
+        selected = set(range(len(rows)))
+    if skip_manual:
+        selected = {i for i in selected if rows[i].get("provenance") != PROVENANCE_MANUAL}
+    return sorted(selected)
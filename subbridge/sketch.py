@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+병합 가능한 분위수 스케치 (로그 버킷 히스토그램, DDSketch 방식).
+값 x를 ceil(log_γ x) 버킷에 세기만 하므로 표본 수와 무관하게 크기가 작고(지연 1ms~10분 범위에서 최대 수백 버킷),
+두 스케치의 버킷을 더하면 합친 표본의 스케치가 된다 (일별 → 월별 → 전체 집계).
+분위수의 상대 오차는 accuracy(기본 2%) 이내다.
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+DEFAULT_ACCURACY = 0.02
+# 이 값 이하(초 단위면 1ms 이하)는 0 버킷으로 센다
+MIN_VALUE = 1e-3
+
+
+class QuantileSketch:
+    """상대 오차 accuracy 이내의 분위수를 돌려주는 로그 버킷 스케치. to_dict()/from_dict()로 JSON 저장."""
+
+    __slots__ = ("accuracy", "_gamma_log", "buckets", "zero_count", "count")
+
+    def __init__(self, accuracy: float = DEFAULT_ACCURACY):
+        self.accuracy = accuracy
+        self._gamma_log = math.log((1 + accuracy) / (1 - accuracy))
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        if count <= 0:
+            return
+        self.count += count
+        if value <= MIN_VALUE:
+            self.zero_count += count
+            return
+        idx = math.ceil(math.log(value) / self._gamma_log)
+        self.buckets[idx] = self.buckets.get(idx, 0) + count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """other의 표본을 합친다 (정확도가 같은 스케치끼리만)."""
+        if other.accuracy != self.accuracy:
+            raise ValueError("정확도가 다른 스케치는 합칠 수 없습니다.")
+        for idx, n in other.buckets.items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q(0~1) 분위수. 표본이 없으면 None."""
+        if self.count <= 0:
+            return None
+        rank = max(0.0, min(1.0, q)) * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        gamma = math.exp(self._gamma_log)
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if rank < seen:
+                # 버킷 (γ^(i-1), γ^i]의 대표값 — 상대 오차가 최소가 되는 지점
+                return 2 * gamma ** idx / (gamma + 1)
+        return 2 * gamma ** max(self.buckets) / (gamma + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "a": self.accuracy,
+            "z": self.zero_count,
+            "b": {str(idx): n for idx, n in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "QuantileSketch":
+        """to_dict() 결과에서 복원. 비어 있거나 형식이 맞지 않으면 빈 스케치."""
+        data = data or {}
+        sketch = cls(float(data.get("a", DEFAULT_ACCURACY)))
+        try:
+            sketch.zero_count = int(data.get("z", 0))
+            sketch.buckets = {int(idx): int(n) for idx, n in (data.get("b") or {}).items()}
+        except (TypeError, ValueError, AttributeError):
+            sketch.zero_count = 0
+            sketch.buckets = {}
+        sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+        return sketch
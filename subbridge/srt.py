@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""SRT/TXT 파싱, 병합, SRT 문자열 생성 (데이터 계층)."""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .constants import PROVENANCE_NONE, PROVENANCE_TXT
+from .timecode import parse_timecode
+from .writer import iter_srt_chunks, iter_txt_chunks
+
+
+# 블록 구분: 빈 줄(공백만 있는 줄 포함, 연속 빈 줄도 하나로)
+_BLOCK_SEP = re.compile(r'\n\s*\n')
+
+
+def _parse_block(raw: str) -> Optional[Dict[str, Any]]:
+    # 줄 단위로 분리 시 \r 제거 (Windows 줄바꿈)
+    lines = [ln.strip().replace("\r", "") for ln in raw.strip().split("\n") if ln.strip()]
+    if len(lines) < 2:
+        return None
+    try:
+        index = int(lines[0])
+    except ValueError:
+        return None
+    # 두 번째 줄: 타임코드 (00:00:00,000 --> 00:00:00,000)
+    timecode = lines[1]
+    text = '\n'.join(lines[2:]) if len(lines) > 2 else ''
+    # 자막 내용의 줄바꿈을 <br/>로 치환 (추출/뷰어에서 한 줄로 통일)
+    text = text.replace("\n", "<br/>")
+    parsed = parse_timecode(timecode)
+    return {
+        "index": index,
+        "timecode": timecode,
+        "start_ms": parsed[0] if parsed else None,
+        "end_ms": parsed[1] if parsed else None,
+        "original": text,
+    }
+
+
+def iter_srt_blocks(content: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    parse_srt와 같은 블록을 앞에서부터 하나씩 (content에서 블록이 끝나는 위치, 블록)으로 내보낸다.
+    위치 / len(content)를 진행률로 쓸 수 있어, 큰 파일을 작업 스레드에서 읽으며 화면에 조금씩 채울 때 사용.
+    """
+    # UTF-8 BOM 제거 (BOM이 있으면 첫 블록의 index가 '\ufeff1'이 되어 파싱 실패)
+    body = content.lstrip("\ufeff")
+    lead = len(content) - len(body)
+    lead += len(body) - len(body.lstrip())
+    body = body.strip()
+    pos = 0
+    for m in _BLOCK_SEP.finditer(body):
+        block = _parse_block(body[pos:m.start()])
+        if block is not None:
+            yield lead + m.end(), block
+        pos = m.end()
+    block = _parse_block(body[pos:])
+    if block is not None:
+        yield lead + len(body), block
+
+
+def parse_srt(content: str) -> List[Dict[str, Any]]:
+    """
+    SRT 내용을 파싱하여 블록 리스트 반환.
+    각 블록: {"index": int, "timecode": str, "start_ms": int|None, "end_ms": int|None, "original": str}
+    start_ms/end_ms는 타임코드를 한 번만 파싱한 정수 밀리초 (형식 오류 시 None).
+    """
+    return [block for _, block in iter_srt_blocks(content)]
+
+
+def parse_txt_lines(content: str) -> List[str]:
+    """TXT 파일 내용을 줄 단위 리스트로 반환 (strip 적용)."""
+    return [ln.strip() for ln in content.strip().split('\n')]
+
+
+def merge_data(srt_blocks: List[Dict[str, Any]], txt_lines: List[str]) -> List[Dict[str, Any]]:
+    """
+    SRT 블록 리스트에 TXT 라인을 순서대로 매칭.
+    반환 리스트의 각 항목에 "translated" 키(없으면 "")와 번역 출처 "provenance" 키 추가.
+    """
+    result = []
+    for i, block in enumerate(srt_blocks):
+        row = dict(block)
+        row["translated"] = txt_lines[i] if i < len(txt_lines) else ""
+        row["provenance"] = PROVENANCE_TXT if row["translated"] else PROVENANCE_NONE
+        result.append(row)
+    return result
+
+
+def build_srt_from_merged(rows: List[Dict[str, Any]]) -> str:
+    """
+    병합된 데이터로 SRT 문자열 생성. 타임코드는 저장된 start_ms/end_ms로 출력, 번역 텍스트의 <br/>는 줄바꿈(\\n)으로 복원.
+    파일로 저장할 때는 전체 문자열을 만들지 않는 writer.write_srt()를 사용한다.
+    """
+    return "".join(iter_srt_chunks(rows))
+
+
+def extract_text_lines(rows: List[Dict[str, Any]]) -> str:
+    """순번·타임코드 제외, 순수 텍스트만 블록당 한 줄로 추출. (원본은 이미 <br/>로 저장됨, SRT 블록 수 = TXT 라인 수)"""
+    return "".join(iter_txt_chunks(rows, "original"))
+
+
+def search_rows(rows: List[Dict[str, Any]], query: str) -> List[int]:
+    """원본·번역 중 하나에 query가 포함된 행 인덱스(0-based) 목록 (대소문자 무시)."""
+    q = (query or "").strip().lower()
+    if not q:
+        return []
+    return [
+        i for i, row in enumerate(rows)
+        if q in (row.get("original") or "").lower() or q in (row.get("translated") or "").lower()
+    ]
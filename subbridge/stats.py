@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+모델별 번역 성능 통계 (model_performance.json).
+누적 속도·배치 응답 결과·토큰 사용량과 함께, 배치 지연을 일별 분위수 스케치(sketch.QuantileSketch)로 저장한다.
+일별 구간은 DAILY_HISTORY_DAYS일까지 두고 그보다 오래된 날은 월별 구간으로 합치므로, 1년을 써도 모델당 구간 100여 개로 유지된다.
+기록은 SAVE_DELAY_S초 동안 모았다가 한 번에 파일에 쓴다 (종료 시 flush()).
+"""
+
+import atexit
+import json
+import math
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .paths import MODEL_PERF_PATH
+from .sketch import QuantileSketch
+from .usage import TokenUsage, estimate_cost
+
+# 작업별 토큰 기록 목록 (모델 이름과 겹치지 않는 최상위 키)
+JOBS_KEY = "_jobs"
+# 보관할 최근 작업 수 / 일별 집계 일수
+JOB_HISTORY_LIMIT = 200
+DAILY_HISTORY_DAYS = 90
+# 행당 토큰 평균을 사전 추정에 쓰기 위한 최소 누적 행 수
+MIN_ROWS_FOR_ESTIMATE = 20
+# 변경 후 파일에 쓰기까지 기다리는 시간 (연속 기록을 한 번의 쓰기로 묶음)
+SAVE_DELAY_S = 2.0
+# 자동 모델 선택에서 뒤로 미룰 최근 오류율 기준 (최근 HEALTH_WINDOW_DAYS일, 배치 HEALTH_MIN_BATCHES개 이상일 때만)
+HEALTH_WINDOW_DAYS = 7
+HEALTH_MAX_ERROR_RATE = 0.2
+HEALTH_MIN_BATCHES = 20
+
+
+class LatencySummary(NamedTuple):
+    """구간 내 배치 지연 요약. p50/p95/p99 = 배치 1개 소요 초, error_rate/fallback_rate = 배치 대비 비율."""
+
+    batches: int
+    rows: int
+    p50: float
+    p95: float
+    p99: float
+    mean: float
+    seconds_per_row: float
+    error_rate: float
+    fallback_rate: float
+
+
+def _empty_window() -> Dict[str, Any]:
+    # n: 배치 수, rows: 완료 행 수, sec: 배치 소요 합계, err: 오류로 끝난 배치, fb: 1줄씩 폴백한 배치, sk: 지연 스케치
+    return {"n": 0, "rows": 0, "sec": 0.0, "err": 0, "fb": 0, "sk": QuantileSketch().to_dict()}
+
+
+def _merge_window(into: Dict[str, Any], other: Dict[str, Any]) -> None:
+    for key in ("n", "rows", "sec", "err", "fb"):
+        into[key] = into.get(key, 0) + other.get(key, 0)
+    sketch = QuantileSketch.from_dict(into.get("sk"))
+    sketch.merge(QuantileSketch.from_dict(other.get("sk")))
+    into["sk"] = sketch.to_dict()
+
+
+class StatsManager:
+    """모델별 번역 성능 데이터를 영구 저장하고 평균 속도를 계산한다."""
+
+    def __init__(self, path: Path = MODEL_PERF_PATH):
+        self._path = path
+        # 모델 이름 → 누적 통계 (+ JOBS_KEY → 최근 작업 목록)
+        self._data: Dict[str, Any] = {}
+        self.save_delay = SAVE_DELAY_S
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._load()
+        atexit.register(self.flush)
+
+    # ── 내부 I/O ──
+
+    def _load(self) -> None:
+        if self._path.exists():
+            try:
+                self._data = json.loads(self._path.read_text(encoding="utf-8"))
+            except Exception:
+                self._data = {}
+
+    def _save(self) -> None:
+        """변경 표시. save_delay초 뒤 한 번만 파일에 쓴다 (0 이하면 즉시)."""
+        with self._lock:
+            self._dirty = True
+            if self.save_delay > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.save_delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """미저장 변경을 즉시 파일에 쓴다 (임시 파일 → 교체)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            text = json.dumps(self._data, ensure_ascii=False, indent=2)
+            self._dirty = False
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        try:
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, self._path)
+        except Exception:
+            pass
+
+    # ── 공개 API ──
+
+    def accumulate(self, model: str, elapsed_seconds: float, items: int) -> None:
+        """번역 완료 시 소요 시간과 처리 개수를 누적 합산한다."""
+        with self._lock:
+            if not model or items <= 0 or elapsed_seconds <= 0:
+                return
+            if model not in self._data:
+                self._data[model] = {"total_time": 0.0, "total_items": 0}
+            self._data[model]["total_time"] += round(elapsed_seconds, 3)
+            self._data[model]["total_items"] += items
+            self._save()
+
+    def record_batch_outcomes(self, model: str, outcomes: Dict[str, int]) -> None:
+        """
+        작업 1건의 배치 응답 처리 결과(structured / repaired / fallback / fallback_calls)를 모델별로 누적.
+        키는 "batch_structured"처럼 batch_ 접두사로 저장한다.
+        """
+        with self._lock:
+            if not model or not any(outcomes.values()):
+                return
+            entry = self._data.setdefault(model, {"total_time": 0.0, "total_items": 0})
+            for key, count in outcomes.items():
+                entry[f"batch_{key}"] = entry.get(f"batch_{key}", 0) + int(count)
+            self._save()
+
+    def get_fallback_rate(self, model: str) -> Optional[float]:
+        """전체 배치 중 1줄씩 폴백한 비율 (0~1). 기록이 없으면 None."""
+        with self._lock:
+            entry = self._data.get(model) or {}
+            batches = sum(entry.get(f"batch_{k}", 0) for k in ("structured", "repaired", "fallback"))
+            if batches <= 0:
+                return None
+            return entry.get("batch_fallback", 0) / batches
+
+    def get_average(self, model: str) -> Optional[Tuple[float, int]]:
+        """(평균 초/개, 누적 총 개수) 반환. 데이터 없으면 None."""
+        with self._lock:
+            entry = self._data.get(model)
+            if not entry or entry.get("total_items", 0) <= 0:
+                return None
+            avg = entry["total_time"] / entry["total_items"]
+            return (round(avg, 2), int(entry["total_items"]))
+
+    def record_usage(
+        self,
+        model: str,
+        lang: str,
+        usage: TokenUsage,
+        rows: int,
+        glossary_tokens: int = 0,
+        kind: str = "translate",
+    ) -> None:
+        """
+        작업 1건의 토큰 사용량을 모델 전체·언어별(by_lang)·일별(by_day)로 누적하고 최근 작업 목록에 추가.
+        rows = 실제로 처리된 행 수 (중단·실패 시 완료분). glossary_tokens = 호출 1회당 용어집 토큰.
+        """
+        with self._lock:
+            if not model or usage.calls <= 0:
+                return
+            entry = self._data.setdefault(model, {"total_time": 0.0, "total_items": 0})
+            day = date.today().isoformat()
+            buckets = [
+                entry,
+                entry.setdefault("by_lang", {}).setdefault(lang or "", {}),
+                entry.setdefault("by_day", {}).setdefault(day, {}),
+            ]
+            for bucket in buckets:
+                bucket["tokens_calls"] = bucket.get("tokens_calls", 0) + usage.calls
+                bucket["tokens_prompt"] = bucket.get("tokens_prompt", 0) + usage.prompt_tokens
+                bucket["tokens_output"] = bucket.get("tokens_output", 0) + usage.output_tokens
+                bucket["tokens_rows"] = bucket.get("tokens_rows", 0) + max(0, rows)
+            by_day = entry["by_day"]
+            for old in sorted(by_day)[:-DAILY_HISTORY_DAYS]:
+                del by_day[old]
+            cost = estimate_cost(model, usage)
+            jobs = self._data.setdefault(JOBS_KEY, [])
+            jobs.append({
+                "time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+                "kind": kind,
+                "model": model,
+                "lang": lang,
+                "rows": rows,
+                "calls": usage.calls,
+                "prompt": usage.prompt_tokens,
+                "output": usage.output_tokens,
+                "glossary": glossary_tokens * usage.calls,
+                "cost_usd": round(cost, 6) if cost is not None else None,
+            })
+            del jobs[:-JOB_HISTORY_LIMIT]
+            self._save()
+
+    def get_usage(self, model: str, lang: Optional[str] = None, day: Optional[str] = None) -> Optional[Tuple[TokenUsage, int]]:
+        """(누적 토큰 사용량, 처리 행 수). lang 또는 day(YYYY-MM-DD)를 주면 그 구간만. 기록이 없으면 None."""
+        with self._lock:
+            bucket = self._data.get(model)
+            if not isinstance(bucket, dict):
+                return None
+            if lang is not None:
+                bucket = (bucket.get("by_lang") or {}).get(lang)
+            elif day is not None:
+                bucket = (bucket.get("by_day") or {}).get(day)
+            if not bucket or bucket.get("tokens_calls", 0) <= 0:
+                return None
+            usage = TokenUsage(int(bucket["tokens_calls"]), int(bucket.get("tokens_prompt", 0)), int(bucket.get("tokens_output", 0)))
+            return (usage, int(bucket.get("tokens_rows", 0)))
+
+    def get_tokens_per_row(self, model: str, lang: Optional[str] = None) -> Optional[Tuple[float, float]]:
+        """
+        행당 평균 (프롬프트 토큰, 출력 토큰) — 모두 번역 사전 추정용.
+        언어별 기록이 충분하면(MIN_ROWS_FOR_ESTIMATE행 이상) 그것을, 아니면 모델 전체 기록을 쓴다.
+        """
+        for key in ((lang, None) if lang else (None,)):
+            found = self.get_usage(model, lang=key)
+            if found is not None and found[1] >= MIN_ROWS_FOR_ESTIMATE:
+                usage, rows = found
+                return (usage.prompt_tokens / rows, usage.output_tokens / rows)
+        return None
+
+    def recent_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 작업별 토큰 기록 (오래된 것 → 최신 순)."""
+        with self._lock:
+            jobs = self._data.get(JOBS_KEY) or []
+            return list(jobs[-limit:]) if limit > 0 else []
+
+    # ── 배치 지연 시계열 ──
+
+    def record_batches(
+        self,
+        model: str,
+        batch_seconds: Iterable[float],
+        rows: int,
+        errors: int = 0,
+        fallbacks: int = 0,
+        day: Optional[date] = None,
+    ) -> None:
+        """
+        작업 1건의 배치별 소요 시간(engine.batch_seconds)을 그날(day, 기본 오늘) 구간에 추가.
+        rows = 완료된 행 수, errors = 오류로 끝난 배치 수, fallbacks = 1줄씩 폴백한 배치 수.
+        """
+        seconds = [float(s) for s in batch_seconds if s >= 0]
+        if not model or not seconds:
+            return
+        with self._lock:
+            entry = self._data.setdefault(model, {"total_time": 0.0, "total_items": 0})
+            latency = entry.setdefault("latency", {})
+            window = latency.setdefault("days", {}).setdefault((day or date.today()).isoformat(), _empty_window())
+            sketch = QuantileSketch.from_dict(window.get("sk"))
+            for value in seconds:
+                sketch.add(value)
+            window["sk"] = sketch.to_dict()
+            window["n"] += len(seconds)
+            window["rows"] += max(0, rows)
+            window["sec"] = round(window["sec"] + sum(seconds), 3)
+            window["err"] += max(0, errors)
+            window["fb"] += max(0, fallbacks)
+            self._compact(latency)
+            self._save()
+
+    def _compact(self, latency: Dict[str, Any]) -> None:
+        """DAILY_HISTORY_DAYS일보다 오래된 일별 구간을 월별 구간(YYYY-MM)으로 합친다."""
+        daily = latency.get("days") or {}
+        cutoff = (date.today() - timedelta(days=DAILY_HISTORY_DAYS)).isoformat()
+        old = [key for key in daily if key < cutoff]
+        if not old:
+            return
+        months = latency.setdefault("months", {})
+        for key in old:
+            _merge_window(months.setdefault(key[:7], _empty_window()), daily.pop(key))
+
+    def _windows(self, model: str, days: Optional[int]) -> List[Dict[str, Any]]:
+        entry = self._data.get(model)
+        if not isinstance(entry, dict):
+            return []
+        latency = entry.get("latency") or {}
+        daily = latency.get("days") or {}
+        if days is None:
+            return list(daily.values()) + list((latency.get("months") or {}).values())
+        cutoff = (date.today() - timedelta(days=max(1, days) - 1)).isoformat()
+        return [window for key, window in daily.items() if key >= cutoff]
+
+    def get_latency(self, model: str, days: Optional[int] = None) -> Optional[LatencySummary]:
+        """
+        배치 지연 분위수·오류율·폴백율. days=N이면 오늘 포함 최근 N일, None이면 전체 기간(월별 구간 포함).
+        기록이 없으면 None.
+        """
+        total = _empty_window()
+        with self._lock:
+            for window in self._windows(model, days):
+                _merge_window(total, window)
+        n = total["n"]
+        if n <= 0:
+            return None
+        sketch = QuantileSketch.from_dict(total["sk"])
+        return LatencySummary(
+            batches=n,
+            rows=total["rows"],
+            p50=round(sketch.quantile(0.5) or 0.0, 3),
+            p95=round(sketch.quantile(0.95) or 0.0, 3),
+            p99=round(sketch.quantile(0.99) or 0.0, 3),
+            mean=round(total["sec"] / n, 3),
+            seconds_per_row=round(total["sec"] / total["rows"], 3) if total["rows"] else 0.0,
+            error_rate=total["err"] / n,
+            fallback_rate=total["fb"] / n,
+        )
+
+    def estimate_seconds(self, model: str, rows: int, batch_size: int, workers: int = 1, days: int = 30) -> Optional[float]:
+        """
+        rows행 번역 예상 소요(초) = 배치 평균 소요 × 배치 수 ÷ 동시 요청 수.
+        최근 days일 기록을 우선 쓰고, 없으면 전체 기간. 기록이 없으면 None.
+        """
+        summary = self.get_latency(model, days) or self.get_latency(model)
+        if summary is None or rows <= 0:
+            return None
+        batches = math.ceil(rows / max(1, batch_size))
+        return summary.mean * batches / max(1, min(workers, batches))
+
+    def unhealthy_models(self, models: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        최근 HEALTH_WINDOW_DAYS일 배치 오류율이 HEALTH_MAX_ERROR_RATE를 넘는 모델 (배치 HEALTH_MIN_BATCHES개 이상 기록된 경우만).
+        자동 모델 선택에서 이 모델들은 다른 모델이 모두 응답하지 않을 때만 쓴다.
+        """
+        with self._lock:
+            names = list(models) if models is not None else [k for k, v in self._data.items() if isinstance(v, dict)]
+        out: List[str] = []
+        for name in names:
+            summary = self.get_latency(name, HEALTH_WINDOW_DAYS)
+            if summary and summary.batches >= HEALTH_MIN_BATCHES and summary.error_rate > HEALTH_MAX_ERROR_RATE:
+                out.append(name)
+        return out
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""텍스트 파일 읽기. 오류는 메시지 박스 대신 결과 값으로 반환한다."""
+
+from typing import NamedTuple, Optional
+
+from .encoding import AUTO_ENCODING, decode_bytes
+
+
+class FileReadResult(NamedTuple):
+    """파일 읽기 결과. 성공 시 content, 실패 시 error에 사유 문자열."""
+
+    content: Optional[str]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.content is not None
+
+
+def read_text_file(path: str, encoding: str = "utf-8") -> FileReadResult:
+    """파일을 지정 인코딩(AUTO_ENCODING이면 자동 감지)으로 읽기. 실패 시 FileReadResult(None, 사유) 반환."""
+    try:
+        if encoding == AUTO_ENCODING:
+            with open(path, "rb") as f:
+                return FileReadResult(decode_bytes(f.read()).text)
+        with open(path, "r", encoding=encoding) as f:
+            return FileReadResult(f.read())
+    except Exception as e:
+        return FileReadResult(None, str(e))
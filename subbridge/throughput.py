@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+번역 전체 경로 처리량 벤치마크 (가짜 백엔드).
+모두 번역과 같은 경로(배치 프롬프트 → API 호출 → 응답 해석 → 폴백 → QA → UI 반영)를
+FakeGeminiClient로 돌리며 배치 크기·동시 요청 수·지연·지터·오류율을 조합별로 측정한다.
+
+    python -m subbridge.throughput --rows 1000 --batch-sizes 10,20 --workers 1,2,4 --latency-ms 800
+    python -m subbridge.throughput --error-rates 0,0.05,0.15 --json sweep.json
+    python -m subbridge.throughput --workers 4 --trace trace.json   # 배치 구간을 Chrome trace로 저장
+
+측정 항목: 행/초, 행당 요청 수, 배치 지연 p50/p95, 첫 행 반영까지 시간(모델 확인 포함).
+시간은 모두 모의 시간(실측 ÷ time_scale)으로 보고한다. time_scale을 줄이면 빨리 끝나지만 CPU 비용이 부풀려진다.
+UI 반영은 별도 스레드가 root.after 큐처럼 순서대로 처리하며, 배치마다 ui_commit_ms만큼 걸린다고 가정한다.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from . import tracing
+from .benchmark import _parse_size, generate_cue_texts
+from .fake_client import FakeGeminiClient, FaultRates
+from .translation import TranslationEngine
+
+# 스윕 기본 조합
+DEFAULT_BATCH_SIZES = (10,)
+DEFAULT_WORKERS = (1, 2, 4)
+DEFAULT_LATENCIES_MS = (800.0,)
+DEFAULT_ERROR_RATES = (0.0, 0.05)
+
+
+class ThroughputResult(NamedTuple):
+    """조합 1개의 측정 결과 (시간은 모의 시간 기준)."""
+
+    batch_size: int
+    workers: int
+    latency_ms: float
+    jitter: float
+    error_rate: float
+    rows: int
+    success: bool
+    seconds: float
+    rows_per_sec: float
+    requests_per_row: float
+    p50_batch_ms: float
+    p95_batch_ms: float
+    first_row_ms: float
+    fallbacks: int
+    error: Optional[str] = None
+
+
+def _quantile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(math.ceil(len(ordered) * q)) - 1))]
+
+
+class _UIThread:
+    """root.after 대역: 콜백을 큐에 넣으면 별도 스레드가 순서대로 실행 (항목마다 commit_ms 소요)."""
+
+    def __init__(self, commit_ms: float, time_scale: float):
+        self._queue: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue()
+        self._delay = max(0.0, commit_ms) * time_scale / 1000.0
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            fn = self._queue.get()
+            if fn is None:
+                return
+            if self._delay:
+                time.sleep(self._delay)
+            fn()
+
+    def after(self, fn: Callable[[], None]) -> None:
+        self._queue.put(fn)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+
+def run_throughput(
+    rows: int = 1000,
+    batch_size: int = 10,
+    workers: int = 1,
+    latency_ms: float = 800.0,
+    jitter: float = 0.35,
+    error_rate: float = 0.0,
+    per_token_ms: float = 0.0,
+    ui_commit_ms: float = 2.0,
+    time_scale: float = 0.05,
+    seed: int = 0,
+    model: str = "gemini-2.5-flash",
+) -> ThroughputResult:
+    """
+    rows행을 한 번 번역하고 측정. error_rate는 배치 응답 불량(깨진 JSON·항목 누락 반씩)의 비율로,
+    작업을 멈추는 429/503은 주입하지 않는다 (폴백 비용 측정용).
+    """
+    data = [
+        {"index": i + 1, "start_ms": i * 3000, "end_ms": i * 3000 + 2500, "original": text, "translated": ""}
+        for i, text in enumerate(generate_cue_texts(rows, seed))
+    ]
+    faults = FaultRates(malformed=error_rate / 2, short=error_rate / 2)
+    client = FakeGeminiClient(
+        seed=seed, latency_ms=latency_ms, latency_sigma=jitter, per_token_ms=per_token_ms,
+        faults=faults, time_scale=time_scale, available_models=[model],
+    )
+    engine = TranslationEngine(model=model, batch_size=batch_size, client=client, max_workers=workers)
+    ui = _UIThread(ui_commit_ms, time_scale)
+    first_commit: List[float] = []
+    start = time.perf_counter()
+
+    def commit(done: List[int]) -> None:
+        # UI 반영 (Treeview 갱신 비용은 _UIThread의 commit_ms로 모의)
+        if done and not first_commit:
+            first_commit.append(time.perf_counter() - start)
+
+    result = engine.translate(data, rows_callback=lambda done: ui.after(lambda d=done: commit(d)))
+    ui.close()
+    wall = time.perf_counter() - start
+    scale = time_scale if time_scale > 0 else 1.0
+    seconds = wall / scale
+    batch_ms = [s * 1000.0 / scale for s in engine.batch_seconds]
+    calls = client.snapshot()["calls"]
+    return ThroughputResult(
+        batch_size=batch_size,
+        workers=workers,
+        latency_ms=latency_ms,
+        jitter=jitter,
+        error_rate=error_rate,
+        rows=rows,
+        success=result.success,
+        seconds=round(seconds, 3),
+        rows_per_sec=round(rows / seconds, 2) if seconds > 0 else 0.0,
+        requests_per_row=round(calls / rows, 3) if rows else 0.0,
+        p50_batch_ms=round(_quantile(batch_ms, 0.5), 1),
+        p95_batch_ms=round(_quantile(batch_ms, 0.95), 1),
+        first_row_ms=round(first_commit[0] * 1000.0 / scale, 1) if first_commit else 0.0,
+        fallbacks=engine.batch_outcomes["fallback"],
+        error=result.error,
+    )
+
+
+def sweep(
+    rows: int = 1000,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    workers: Sequence[int] = DEFAULT_WORKERS,
+    latencies_ms: Sequence[float] = DEFAULT_LATENCIES_MS,
+    jitters: Sequence[float] = (0.35,),
+    error_rates: Sequence[float] = DEFAULT_ERROR_RATES,
+    progress: Optional[Callable[[ThroughputResult], None]] = None,
+    **kwargs: Any,
+) -> List[ThroughputResult]:
+    """모든 조합(배치 크기 × 동시 요청 × 지연 × 지터 × 오류율)을 차례로 측정. kwargs는 run_throughput에 전달."""
+    out: List[ThroughputResult] = []
+    for bs, w, lat, jit, err in itertools.product(batch_sizes, workers, latencies_ms, jitters, error_rates):
+        res = run_throughput(rows=rows, batch_size=bs, workers=w, latency_ms=lat, jitter=jit, error_rate=err, **kwargs)
+        out.append(res)
+        if progress:
+            progress(res)
+    return out
+
+
+_HEADER = f"{'batch':>5} {'workers':>7} {'lat(ms)':>8} {'jitter':>6} {'err':>5} {'rows/s':>8} {'req/row':>7} {'p50(ms)':>8} {'p95(ms)':>8} {'first(ms)':>9} {'fallback':>8}"
+
+
+def _format_result(r: ThroughputResult) -> str:
+    line = (
+        f"{r.batch_size:>5} {r.workers:>7} {r.latency_ms:>8.0f} {r.jitter:>6.2f} {r.error_rate:>5.2f} "
+        f"{r.rows_per_sec:>8.1f} {r.requests_per_row:>7.3f} {r.p50_batch_ms:>8.0f} {r.p95_batch_ms:>8.0f} "
+        f"{r.first_row_ms:>9.0f} {r.fallbacks:>8}"
+    )
+    return line if r.success else f"{line}  실패: {r.error}"
+
+
+def _floats(text: str) -> List[float]:
+    return [float(x) for x in text.split(",") if x.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m subbridge.throughput", description="번역 경로 처리량 스윕 (가짜 백엔드)")
+    parser.add_argument("--rows", default="1000", help="번역할 행 수 (예: 1000, 5k)")
+    parser.add_argument("--batch-sizes", default="10", help="배치 크기 목록")
+    parser.add_argument("--workers", default="1,2,4", help="동시 요청 수 목록")
+    parser.add_argument("--latency-ms", default="800", help="호출 지연 중앙값 목록 (ms)")
+    parser.add_argument("--jitter", default="0.35", help="지연 로그정규 시그마 목록")
+    parser.add_argument("--error-rates", default="0,0.05", help="배치 응답 불량 비율 목록")
+    parser.add_argument("--per-token-ms", type=float, default=0.0, help="출력 토큰당 추가 지연 (ms)")
+    parser.add_argument("--ui-commit-ms", type=float, default=2.0, help="배치당 UI 반영 비용 (ms)")
+    parser.add_argument("--time-scale", type=float, default=0.05, help="실제 대기 배율 (모의 시간 = 실측 ÷ 배율)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    parser.add_argument("--trace", metavar="PATH", help="배치 구간 추적을 Chrome trace JSON으로 저장 (모의 시간이 아닌 실측)")
+    args = parser.parse_args(argv)
+    if args.time_scale <= 0:
+        parser.error("--time-scale은 0보다 커야 합니다.")
+
+    if args.trace:
+        tracing.enable()
+    print(_HEADER)
+    results = sweep(
+        rows=_parse_size(args.rows),
+        batch_sizes=[int(x) for x in _floats(args.batch_sizes)],
+        workers=[int(x) for x in _floats(args.workers)],
+        latencies_ms=_floats(args.latency_ms),
+        jitters=_floats(args.jitter),
+        error_rates=_floats(args.error_rates),
+        progress=lambda r: print(_format_result(r)),
+        per_token_ms=args.per_token_ms,
+        ui_commit_ms=args.ui_commit_ms,
+        time_scale=args.time_scale,
+        seed=args.seed,
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([r._asdict() for r in results], f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+    if args.trace:
+        count = tracing.export_chrome_trace(args.trace)
+        print(f"트레이스 저장: {args.trace} ({count}개 구간)")
+    return 0 if all(r.success for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
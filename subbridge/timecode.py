@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+SRT 타임코드 엔진.
+"00:00:01,000 --> 00:00:02,500" 문자열을 정수 밀리초(start_ms, end_ms)로 한 번만 파싱하고,
+TimecodeTable(array('q') 두 개)로 전체 행에 이동·배율·FPS 변환·2점 동기화·겹침/간격 검사를 일괄 적용한다.
+"""
+
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 자주 쓰는 프레임레이트 (NTSC 계열은 정확한 분수값)
+FPS_23_976 = 24000 / 1001
+FPS_29_97 = 30000 / 1001
+# UI 선택용 (표시명, fps)
+FPS_PRESETS: List[Tuple[str, float]] = [
+    ("23.976", FPS_23_976),
+    ("24", 24.0),
+    ("25", 25.0),
+    ("29.97", FPS_29_97),
+    ("30", 30.0),
+]
+
+# 파싱 불가 타임코드의 start/end 자리 표시 (배열 연산에서 제외)
+INVALID_MS = -1
+
+_TIME_PATTERN = r"(\d+):(\d{1,2}):(\d{1,2})[,.](\d{1,3})"
+_TIMECODE_RE = re.compile(r"\s*" + _TIME_PATTERN + r"\s*-->\s*" + _TIME_PATTERN + r"(.*)$")
+_TIME_RE = re.compile(r"^\s*" + _TIME_PATTERN + r"\s*$")
+
+
+def _ms_from_groups(h: str, m: str, s: str, frac: str) -> int:
+    # 밀리초 자리가 1~2자리인 비표준 파일도 허용 ("1,5" → 500ms)
+    return ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000 + int(frac.ljust(3, "0"))
+
+
+def parse_timecode(timecode: str) -> Optional[Tuple[int, int, str]]:
+    """타임코드 줄 → (start_ms, end_ms, 뒤따르는 좌표 등 나머지 문자열). 형식이 아니면 None."""
+    m = _TIMECODE_RE.match(timecode or "")
+    if not m:
+        return None
+    g = m.groups()
+    return (_ms_from_groups(*g[0:4]), _ms_from_groups(*g[4:8]), g[8])
+
+
+def parse_time_ms(text: str) -> Optional[int]:
+    """'HH:MM:SS,mmm' 한 개 → 밀리초. 형식이 아니면 None."""
+    m = _TIME_RE.match(text or "")
+    if not m:
+        return None
+    return _ms_from_groups(*m.groups())
+
+
+def format_ms(ms: int) -> str:
+    """밀리초 → 'HH:MM:SS,mmm' (음수는 0으로)."""
+    ms = max(0, int(ms))
+    s, milli = divmod(ms, 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d},{milli:03d}"
+
+
+def format_timecode(start_ms: int, end_ms: int, suffix: str = "") -> str:
+    """(start_ms, end_ms) → SRT 타임코드 줄."""
+    return f"{format_ms(start_ms)} --> {format_ms(end_ms)}{suffix}"
+
+
+# 좌표 등 뒤따르는 문자열이 없는 표준 타임코드 줄 길이 ("00:00:00,000 --> 00:00:00,000")
+_PLAIN_TIMECODE_LEN = 29
+
+
+def _timecode_suffix(raw: str) -> str:
+    """타임코드 줄에서 시각 뒤에 붙은 나머지(예: ' X1:10 X2:...') 추출. 표준 길이면 정규식 생략."""
+    if len(raw) <= _PLAIN_TIMECODE_LEN:
+        return ""
+    parsed = parse_timecode(raw)
+    return parsed[2] if parsed else ""
+
+
+def row_timecode(row: Dict[str, Any]) -> str:
+    """행의 저장된 start_ms/end_ms로 타임코드 줄 생성. 값이 없으면 원본 timecode 문자열 그대로."""
+    start, end = row.get("start_ms"), row.get("end_ms")
+    raw = row.get("timecode", "") or ""
+    if not isinstance(start, int) or not isinstance(end, int) or start < 0 or end < 0:
+        return raw
+    return format_timecode(start, end, _timecode_suffix(raw))
+
+
+class TimecodeTable:
+    """전체 행의 시작/종료 시각(ms)을 array('q')로 보관하고 일괄 재타이밍 연산을 제공한다."""
+
+    def __init__(self, starts: Iterable[int], ends: Iterable[int]):
+        self.starts = array("q", starts)
+        self.ends = array("q", ends)
+        if len(self.starts) != len(self.ends):
+            raise ValueError("starts/ends 길이가 다릅니다.")
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "TimecodeTable":
+        """행의 start_ms/end_ms로 생성. 값이 없는 행은 timecode 문자열을 파싱, 실패 시 INVALID_MS."""
+        starts: List[int] = []
+        ends: List[int] = []
+        for r in rows:
+            start, end = r.get("start_ms"), r.get("end_ms")
+            if not isinstance(start, int) or not isinstance(end, int):
+                parsed = parse_timecode(r.get("timecode", ""))
+                start, end = (parsed[0], parsed[1]) if parsed else (INVALID_MS, INVALID_MS)
+            starts.append(start)
+            ends.append(end)
+        return cls(starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    # ── 일괄 재타이밍 (유효하지 않은 행은 그대로 유지) ──
+
+    def _map(self, fn) -> None:
+        self.starts = array("q", [fn(t) if t >= 0 else t for t in self.starts])
+        self.ends = array("q", [fn(t) if t >= 0 else t for t in self.ends])
+
+    def shift(self, delta_ms: int) -> None:
+        """전체를 delta_ms만큼 이동 (0 미만은 0으로 고정)."""
+        d = int(delta_ms)
+        self._map(lambda t: t + d if t + d > 0 else 0)
+
+    def scale(self, factor: float, anchor_ms: int = 0) -> None:
+        """anchor_ms 기준 선형 배율 적용: t' = anchor + (t - anchor) * factor."""
+        if factor <= 0:
+            raise ValueError("배율은 0보다 커야 합니다.")
+        a = int(anchor_ms)
+        self._map(lambda t: max(0, int(round(a + (t - a) * factor))))
+
+    def convert_fps(self, src_fps: float, dst_fps: float) -> None:
+        """src_fps 기준 타이밍을 dst_fps 재생에 맞게 변환 (예: 23.976 → 25는 전체가 짧아짐)."""
+        if src_fps <= 0 or dst_fps <= 0:
+            raise ValueError("fps는 0보다 커야 합니다.")
+        self.scale(src_fps / dst_fps)
+
+    def resync(self, old_a: int, new_a: int, old_b: int, new_b: int) -> None:
+        """두 기준점(old→new)을 지나는 선형 변환으로 전체 동기화 (앞뒤 싱크가 다르게 밀린 경우)."""
+        if old_a == old_b:
+            raise ValueError("두 기준점의 원래 시각이 같습니다.")
+        factor = (new_b - new_a) / (old_b - old_a)
+        if factor <= 0:
+            raise ValueError("기준점 순서가 뒤바뀌었습니다.")
+        self._map(lambda t: max(0, int(round(new_a + (t - old_a) * factor))))
+
+    # ── 검사 ──
+
+    def durations(self) -> array:
+        """행별 표시 시간(ms). 유효하지 않은 행은 0."""
+        return array("q", [e - s if s >= 0 and e >= 0 else 0 for s, e in zip(self.starts, self.ends)])
+
+    def find_overlaps(self) -> List[int]:
+        """다음 행 시작이 현재 행 종료보다 앞선 행 인덱스(0-based) 목록."""
+        s, e = self.starts, self.ends
+        return [i for i in range(len(s) - 1) if e[i] >= 0 and s[i + 1] >= 0 and s[i + 1] < e[i]]
+
+    def find_gaps(self, min_gap_ms: int) -> List[int]:
+        """다음 행과의 간격이 0 이상 min_gap_ms 미만인 행 인덱스(0-based) 목록."""
+        s, e = self.starts, self.ends
+        return [i for i in range(len(s) - 1) if e[i] >= 0 and s[i + 1] >= 0 and 0 <= s[i + 1] - e[i] < min_gap_ms]
+
+    def apply_to_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """start_ms/end_ms와 timecode 문자열(좌표 등 나머지 보존)을 행에 반영."""
+        for r, start, end in zip(rows, self.starts, self.ends):
+            if start < 0 or end < 0:
+                continue
+            r["start_ms"] = start
+            r["end_ms"] = end
+            r["timecode"] = row_timecode(r)
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+가벼운 구간(span) 추적.
+번역 배치의 단계(프롬프트 생성·API 호출·응답 해석·폴백·QA)와 GUI 작업(파일 로드·병합·그리드 갱신)에
+span을 걸어 두고, 켜져 있을 때만 기록해 Chrome trace(Perfetto에서도 열림) JSON으로 내보낸다.
+
+    with tracing.span("api_call", batch=3, model=name) as sp:
+        response = ...
+        sp.set(output_tokens=...)
+
+꺼져 있으면 span()은 공유 no-op 객체를 돌려주므로 비용은 전역 변수 확인 한 번뿐이다.
+기록은 고정 크기 링 버퍼(기본 20만 건)에 쌓이며, 가득 차면 오래된 것부터 버린다.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+DEFAULT_MAX_EVENTS = 200_000
+
+_PID = os.getpid()
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때의 span (아무것도 하지 않음)."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """기록 중인 구간. 종료 시 Chrome trace 완료 이벤트("ph": "X")로 버퍼에 추가된다."""
+
+    __slots__ = ("_tracer", "name", "cat", "attrs", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, attrs: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.attrs = attrs
+        self._start = 0
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        self._tracer._add({
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": (self._start - self._tracer.origin_ns) / 1000.0,
+            "dur": (end - self._start) / 1000.0,
+            "pid": _PID,
+            "tid": threading.get_ident(),
+            "args": self.attrs,
+        })
+
+    def set(self, **attrs: Any) -> None:
+        """구간 도중 알게 된 속성(토큰 수·결과 등) 추가."""
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """span 이벤트 링 버퍼. 스레드별 이름을 함께 기록해 trace 뷰어에서 워커/메인 스레드를 구분한다."""
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS):
+        self.origin_ns = time.perf_counter_ns()
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._threads: Dict[int, str] = {}
+
+    def _add(self, event: Dict[str, Any]) -> None:
+        tid = event["tid"]
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        self._events.append(event)
+
+    def instant(self, name: str, cat: str, attrs: Dict[str, Any]) -> None:
+        self._add({
+            "name": name,
+            "cat": cat,
+            "ph": "i",
+            "s": "t",
+            "ts": (time.perf_counter_ns() - self.origin_ns) / 1000.0,
+            "pid": _PID,
+            "tid": threading.get_ident(),
+            "args": attrs,
+        })
+
+    def events(self) -> List[Dict[str, Any]]:
+        """스레드 이름 메타데이터 + 기록된 이벤트 (Chrome trace traceEvents 형식)."""
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": _PID, "tid": tid, "args": {"name": name}}
+            for tid, name in list(self._threads.items())
+        ]
+        return meta + list(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable(max_events: int = DEFAULT_MAX_EVENTS) -> None:
+    """추적 시작 (이미 켜져 있으면 유지)."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(max_events)
+
+
+def disable() -> None:
+    """추적 중지. 기록된 이벤트도 버린다 (필요하면 먼저 export_chrome_trace)."""
+    global _tracer
+    _tracer = None
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def event_count() -> int:
+    """현재 버퍼에 있는 이벤트 수 (꺼져 있으면 0)."""
+    tracer = _tracer
+    return len(tracer) if tracer is not None else 0
+
+
+def span(name: str, cat: str = "subbridge", **attrs: Any) -> Any:
+    """구간 추적 컨텍스트 매니저. 꺼져 있으면 no-op."""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, cat, attrs)
+
+
+def instant(name: str, cat: str = "subbridge", **attrs: Any) -> None:
+    """시점 이벤트 (예: 취소 요청, 429 수신)."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.instant(name, cat, attrs)
+
+
+def export_chrome_trace(path: Path) -> int:
+    """
+    기록된 이벤트를 Chrome trace JSON({"traceEvents": [...]})으로 저장 (chrome://tracing, ui.perfetto.dev).
+    임시 파일에 쓴 뒤 교체. 반환: 저장한 이벤트 수 (메타데이터 제외). 꺼져 있으면 빈 trace를 저장한다.
+    """
+    tracer = _tracer
+    events = tracer.events() if tracer is not None else []
+    payload = {"traceEvents": events, "displayTimeUnit": "ms"}
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, default=str)
+    os.replace(tmp, path)
+    return sum(1 for e in events if e.get("ph") != "M")
@@ -0,0 +1,902 @@
+# -*- coding: utf-8 -*-
+"""
+Gemini 배치 번역 엔진.
+GUI 상태와 분리되어 행 리스트({"index", "original", "translated", ...})를 받아 "translated"를 채운다.
+google-genai는 실제 API 클라이언트가 필요할 때만 지연 로드한다.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Collection, Dict, List, NamedTuple, Optional, Tuple
+
+from .constants import (
+    AI_MODEL_AUTO,
+    AI_MODEL_FALLBACKS,
+    AI_TRANSLATE_EMPTY_PLACEHOLDER,
+    AI_TRANSLATE_ERROR_PLACEHOLDER,
+    BATCH_CHUNK_SIZE,
+    GLOSSARY_REPAIR_CHUNK_SIZE,
+    PROVENANCE_AI,
+    SHORTEN_CHUNK_SIZE,
+)
+from .cassette import RecordingClient, ReplayClient, replay_spec
+from .fake_client import FakeGeminiClient, GeminiClient, fake_client_spec
+from .glossary import GlossaryMatcher, glossary_text_to_dict
+from .progress import JobProgress
+from .qa import QAProfile, run_qa_checks
+from . import tracing
+from .reflow import reflow_text
+from .usage import JobEstimate, TokenUsage, UsageMeter, estimate_cost, estimate_tokens, usage_tokens
+
+# 카세트 녹화/재생 환경 변수 (subbridge.cassette)
+#   SUBBRIDGE_RECORD_CASSETTE=파일 경로       — 모든 API 호출을 녹화
+#   SUBBRIDGE_REPLAY_CASSETTE=파일 경로[,배율] — API 대신 녹화를 재생 (배율 0 = 대기 없음)
+RECORD_CASSETTE_ENV = "SUBBRIDGE_RECORD_CASSETTE"
+REPLAY_CASSETTE_ENV = "SUBBRIDGE_REPLAY_CASSETTE"
+
+# 429 한도 초과 시 사용자에게 보여줄 메시지
+QUOTA_EXCEEDED_MESSAGE = "API 사용량이 초과되었습니다. 잠시 후 다시 시도하거나 API 키를 확인해주세요. (429)"
+
+# 배치 요청 응답 스키마 (response_mime_type="application/json"과 함께 GenerateContentConfig에 전달)
+BATCH_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {"id": {"type": "STRING"}, "text": {"type": "STRING"}},
+        "required": ["id", "text"],
+    },
+}
+# 배치 응답 처리 결과 집계 키 (StatsManager.record_batch_outcomes로 저장)
+#   structured: 스키마 검증 통과 / repaired: 코드 블록 제거 후 같은 스키마로 통과 / fallback: 1줄씩 재요청
+#   fallback_calls: 폴백으로 발생한 추가 API 호출 수
+BATCH_OUTCOME_KEYS = ("structured", "repaired", "fallback", "fallback_calls")
+
+
+class JobCancelled(Exception):
+    """
+    클라이언트가 호출을 보내지 않고 작업 취소를 알릴 때 발생시키는 예외 (예: fanout.RequestPool 대기 중 취소).
+    엔진은 이를 배치 실패로 보지 않는다 — 1줄씩 폴백하지 않고 행을 그대로 둔 채 작업을 사용자 중단으로 끝낸다.
+    """
+
+
+# run()이 취소로 끝난 배치를 알리는 값 (오류 메시지와 구분)
+_BATCH_CANCELLED = "\0cancelled"
+
+
+class TranslationResult(NamedTuple):
+    """번역 작업 결과. 실패 시 error에 사유 문자열 (429/503/사용자 중단 형식은 GUI와 공유)."""
+
+    success: bool
+    model: Optional[str] = None
+    total: int = 0
+    error: Optional[str] = None
+
+
+def is_gemini_available() -> bool:
+    """google-genai 설치 여부 (모듈을 실제로 import 하지 않고 확인). 가짜 클라이언트 사용 시 항상 True."""
+    if fake_client_spec() is not None or os.environ.get(REPLAY_CASSETTE_ENV):
+        return True
+    try:
+        return importlib.util.find_spec("google.genai") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _load_genai() -> Tuple[Any, Any]:
+    """google-genai 모듈 지연 로드. 미설치 시 (None, None)."""
+    try:
+        from google import genai
+        from google.genai import types as genai_types
+    except ImportError:
+        return (None, None)
+    return (genai, genai_types)
+
+
+def create_client(api_key: Optional[str], record_path: Optional[Path] = None) -> GeminiClient:
+    """
+    API 클라이언트 생성. 우선순위: SUBBRIDGE_REPLAY_CASSETTE(녹화 재생) → SUBBRIDGE_FAKE_GEMINI(가짜) → google-genai.
+    record_path 또는 SUBBRIDGE_RECORD_CASSETTE가 있으면 RecordingClient로 감싸 모든 호출을 녹화한다.
+    """
+    replay = os.environ.get(REPLAY_CASSETTE_ENV)
+    spec = fake_client_spec()
+    client: GeminiClient
+    if replay:
+        path, scale = replay_spec(replay)
+        client = ReplayClient(Path(path), time_scale=scale)
+    elif spec is not None:
+        client = FakeGeminiClient.from_spec(spec)
+    else:
+        genai, _types = _load_genai()
+        if genai is None:
+            raise RuntimeError("Gemini API를 사용하려면 pip install google-genai 를 실행해 주세요.")
+        client = genai.Client(api_key=api_key)
+    record = record_path or os.environ.get(RECORD_CASSETTE_ENV)
+    if record:
+        client = RecordingClient(client, Path(record))
+    return client
+
+
+def _make_config(**kwargs: Any) -> Any:
+    """GenerateContentConfig 생성. SDK 미설치(가짜 클라이언트 등) 시 dict로 대체."""
+    _genai, genai_types = _load_genai()
+    if genai_types is None:
+        return dict(kwargs)
+    return genai_types.GenerateContentConfig(**kwargs)
+
+
+def _is_quota_error(err_msg: str) -> bool:
+    """429 / 할당량 초과 오류 메시지 여부."""
+    lowered = err_msg.lower()
+    return "429" in err_msg or "Resource Exhausted" in err_msg or "quota" in lowered or "exceeded" in lowered
+
+
+def _is_unavailable_error(err_msg: str) -> bool:
+    """503 / 일시 사용 불가 오류 메시지 여부."""
+    return "503" in err_msg or "UNAVAILABLE" in err_msg
+
+
+def map_translation_response_lines(
+    response_lines: List[str],
+    batch_rows: List[Dict[str, Any]],
+    requested_len: int,
+    log_callback: Optional[Any] = None,
+) -> List[str]:
+    """
+    API 응답 줄을 배치 행 수에 맞게 매핑.
+    <br/>로 인한 줄 분리 시 행별로 병합하여 반환.
+    log_callback(msg)가 있으면 로그 메시지 전달, 없으면 print.
+    """
+    response_len = len(response_lines)
+    expected_per_row = [
+        1 + ((r.get("original") or "").count("<br/>"))
+        for r in batch_rows
+    ]
+    total_expected = sum(expected_per_row)
+
+    def _log(msg: str) -> None:
+        if log_callback:
+            log_callback(msg)
+        else:
+            print(msg, file=sys.stderr)
+
+    if response_len == requested_len:
+        return response_lines
+    if response_len == total_expected and response_len > requested_len:
+        lines_final = []
+        idx = 0
+        for take in expected_per_row:
+            chunk = response_lines[idx : idx + take]
+            lines_final.append("<br/>".join(chunk) if chunk else "")
+            idx += take
+        _log(f"<br/> 줄 분리 보정: 요청={requested_len}행, 응답={response_len}줄 -> 행별 병합 후 {len(lines_final)}행")
+        return lines_final
+    if response_len > requested_len:
+        merged = "<br/>".join(response_lines[requested_len - 1 :])
+        lines_final = response_lines[: requested_len - 1] + [merged]
+    else:
+        lines_final = response_lines + [""] * (requested_len - response_len)
+    _log(f"번역 줄 수 불일치 보정: 요청={requested_len}, 응답={response_len} -> {len(lines_final)}줄로 매핑")
+    return lines_final
+
+
+def parse_json_translation_response(raw: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    AI 응답에서 JSON 배열 추출. ```json ... ``` 래퍼 제거 후 json.loads.
+    성공 시 [{"id": "1", "text": "..."}, ...] 형태 리스트 반환, 실패 시 None.
+    """
+    if not (raw or "").strip():
+        return None
+    text = raw.strip()
+    # 마크다운 코드 블록 제거
+    if text.startswith("```"):
+        lines = text.split("\n")
+        out = []
+        in_block = False
+        for line in lines:
+            if line.strip().startswith("```"):
+                in_block = not in_block
+                if in_block and "json" in line.lower():
+                    continue
+                if not in_block:
+                    continue
+            if in_block:
+                out.append(line)
+        text = "\n".join(out)
+    try:
+        data = json.loads(text)
+        if not isinstance(data, list):
+            return None
+        return data
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+def translate_chunk_single_fallback(
+    client: Any,
+    config: Any,
+    model_name: str,
+    batch_rows: List[Dict[str, Any]],
+    target_lang: str,
+    system_instruction: Any = None,
+    log_callback: Optional[Callable[[str], None]] = None,
+    meter: Optional[UsageMeter] = None,
+) -> Tuple[bool, Optional[str]]:
+    """
+    배치 JSON 실패 시 해당 청크만 1줄씩 개별 번역. batch_rows를 직접 수정.
+    성공 시 (True, None), API 오류(429/503 등) 시 (False, err_msg) 반환. meter가 있으면 호출마다 토큰을 누적.
+    """
+    for row in batch_rows:
+        orig = (row.get("original") or "").replace("\r\n", "<br/>").replace("\n", "<br/>").strip()
+        prompt = (
+            f"아래 문장을 **{target_lang}**로 번역해 주세요. `<br/>`는 그대로 두고, 번역 결과 한 줄만 출력.\n\n{orig}"
+        )
+        try:
+            response = client.models.generate_content(
+                model=model_name, contents=prompt, config=config
+            )
+            if meter is not None:
+                meter.add(response)
+            text = (response.text or "").strip()
+            line = text.split("\n")[0].strip() if text else ""
+            row["translated"] = line if line else AI_TRANSLATE_EMPTY_PLACEHOLDER
+        except JobCancelled:
+            raise
+        except Exception as e:
+            if meter is not None:
+                meter.add_failed_call()
+            err_msg = str(e)
+            if _is_quota_error(err_msg):
+                return (False, QUOTA_EXCEEDED_MESSAGE)
+            if _is_unavailable_error(err_msg):
+                return (False, f"503_UNAVAILABLE|{model_name}")
+            row["translated"] = AI_TRANSLATE_ERROR_PLACEHOLDER
+            return (False, f"통신 오류: {err_msg}")
+    return (True, None)
+
+
+def build_system_instruction(target_lang: str, glossary_text: str = "") -> str:
+    """대상 언어·<br/> 보존 규칙·용어집을 포함한 시스템 인스트럭션 생성."""
+    system_instruction = (
+        f"너는 뛰어난 **{target_lang}** 번역 전문가야. 문맥을 고려해 자연스럽게 번역해 줘.\n\n"
+        "【필수 규칙 — <br/> 처리 (최우선)】\n"
+        "- 원본 텍스트에 있는 `<br/>`는 **HTML 태그가 아니라 그대로 복사해야 할 문자 열(문자 그대로)**이다.\n"
+        "- `<br/>`는 번역하지 말고, 삭제하지 말고, 공백·줄바꿈으로 바꾸지 말고, **원문과 동일한 문자 `<br/>` 그대로** 번역 결과에 넣어야 한다.\n"
+        "- 원본에 `Hello<br/>World`가 있으면 번역문에도 반드시 `(번역된앞부분)<br/>(번역된뒷부분)` 형태로 `<br/>`를 그대로 포함할 것.\n"
+        "- `<br/>` 앞뒤 문장만 번역하고, `<br/>` 자체는 한 글자도 바꾸지 말 것."
+    )
+    if (glossary_text or "").strip():
+        system_instruction += (
+            "\n\n【필수 번역 용어집】\n"
+            "다음은 사용자가 지정한 '필수 번역 용어집'이다. 본문에 해당 단어가 나오면 반드시 아래 지정된 대로 번역해야 한다.\n"
+            "---\n"
+            f"{glossary_text.strip()}\n"
+            "---"
+        )
+    return system_instruction
+
+
+def build_batch_prompt(batch_rows: List[Dict[str, Any]], target_lang: str) -> str:
+    """배치 행을 id·text JSON 배열로 묶은 사용자 프롬프트 생성 (id = SRT 순번)."""
+    input_arr = [
+        {"id": str(r.get("index", i + 1)), "text": (r.get("original", "") or "").replace("\r\n", "<br/>").replace("\n", "<br/>").strip()}
+        for i, r in enumerate(batch_rows)
+    ]
+    return (
+        "【필수】 아래는 자막 블록 배열(JSON)이다. 각 항목의 `id`는 순번이므로 **절대 변경·누락·추가하지 마라**. "
+        "각 `text`를 **" + target_lang + "**로 번역한 뒤, **입력과 동일한 id**를 유지하여 아래 형식의 **유효한 JSON 배열만** 출력하라. "
+        "부연 설명·코드 블록 설명·마크다운은 절대 금지. `<br/>`는 번역문에 문자 그대로 포함.\n\n"
+        "입력:\n" + json.dumps(input_arr, ensure_ascii=False) + "\n\n"
+        "출력 형식(이 형식의 JSON 배열만 출력): [{\"id\": \"1\", \"text\": \"번역문\"}, {\"id\": \"2\", \"text\": \"번역문\"}, ...]"
+    )
+
+
+def build_shorten_prompt(batch_rows: List[Dict[str, Any]], target_lang: str, max_chars: int, max_lines: int = 2) -> str:
+    """줄 나눔으로 해결되지 않은 번역문을 한 번에 줄이도록 요청하는 프롬프트 (id = SRT 순번)."""
+    input_arr = [
+        {"id": str(r.get("index", i + 1)), "text": (r.get("translated", "") or "").strip()}
+        for i, r in enumerate(batch_rows)
+    ]
+    return (
+        "【필수】 아래는 이미 **" + target_lang + "**로 번역된 자막 배열(JSON)이다. 각 `text`를 같은 언어로, 의미를 유지하면서 "
+        f"**한 줄 {max_chars}자 이하, 최대 {max_lines}줄**(줄 구분은 `<br/>`)이 되도록 간결하게 줄여라. "
+        "`id`는 **절대 변경·누락·추가하지 마라**. 부연 설명·마크다운은 절대 금지.\n\n"
+        "입력:\n" + json.dumps(input_arr, ensure_ascii=False) + "\n\n"
+        "출력 형식(이 형식의 JSON 배열만 출력): [{\"id\": \"1\", \"text\": \"줄인 문장\"}, ...]"
+    )
+
+
+def build_glossary_repair_prompt(
+    batch_rows: List[Dict[str, Any]], target_lang: str, required: Dict[str, List[Tuple[str, str]]]
+) -> str:
+    """
+    용어집 미준수 행을 다시 번역하도록 요청하는 프롬프트 (id = SRT 순번).
+    required: id → [(원어, 지정 번역어), ...] — 행마다 반드시 써야 할 용어를 함께 보낸다.
+    """
+    input_arr = [
+        {
+            "id": str(r.get("index", i + 1)),
+            "text": (r.get("original", "") or "").replace("\r\n", "<br/>").replace("\n", "<br/>").strip(),
+            "draft": (r.get("translated", "") or "").strip(),
+            "required": [f"{src} → {dst}" for src, dst in required.get(str(r.get("index", i + 1)), [])],
+        }
+        for i, r in enumerate(batch_rows)
+    ]
+    return (
+        "【필수】 아래 자막 배열(JSON)의 `draft`는 `text`를 **" + target_lang + "**로 번역한 초안인데, 필수 용어집을 지키지 않았다. "
+        "각 항목의 `required`에 적힌 용어(원어 → 지정 번역어)를 **지정 번역어 그대로** 사용해 `text`를 다시 번역하라. "
+        "그 밖의 표현은 초안을 최대한 유지하고, `id`는 **절대 변경·누락·추가하지 마라**. `<br/>`는 문자 그대로 유지. 부연 설명·마크다운은 절대 금지.\n\n"
+        "입력:\n" + json.dumps(input_arr, ensure_ascii=False) + "\n\n"
+        "출력 형식(이 형식의 JSON 배열만 출력): [{\"id\": \"1\", \"text\": \"번역문\"}, ...]"
+    )
+
+
+def parse_structured_batch(payload: Any, batch_rows: List[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """
+    구조화 출력(스키마 지정) 응답의 빠른 경로 파서.
+    payload(SDK의 response.parsed 또는 응답 문자열)가 [{"id": str, "text": str}, ...]이고
+    id 집합이 배치 순번과 정확히 일치할 때만 {id: text} 반환, 아니면 None.
+    """
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            return None
+    if not isinstance(payload, list) or len(payload) != len(batch_rows):
+        return None
+    id_to_text: Dict[str, str] = {}
+    for item in payload:
+        if not isinstance(item, dict):
+            return None
+        kid, text = item.get("id"), item.get("text")
+        if kid is None or not isinstance(text, str):
+            return None
+        id_to_text[str(kid)] = text.strip()
+    if set(id_to_text) != {str(r.get("index", 0)) for r in batch_rows}:
+        return None
+    return id_to_text
+
+
+def _apply_id_map(batch_rows: List[Dict[str, Any]], id_to_text: Dict[str, str]) -> None:
+    for row in batch_rows:
+        raw_text = id_to_text.get(str(row.get("index", "")), "").strip()
+        row["translated"] = raw_text if raw_text else AI_TRANSLATE_EMPTY_PLACEHOLDER
+
+
+def _read_batch_response(response: Any, batch_rows: List[Dict[str, Any]]) -> Tuple[Optional[Dict[str, str]], bool]:
+    """
+    배치 응답 해석: (id→text 또는 None, 보정 경로 사용 여부). 구조화 출력 우선, 실패 시 코드 블록만 벗긴 원문을
+    같은 스키마(id·text, id 집합 일치)로 다시 검증한다. 키 별칭·줄 나눔 추정 같은 느슨한 복구는 하지 않는다 — None이면 1줄씩 폴백.
+    """
+    raw = (getattr(response, "text", None) or "").strip()
+    parsed = getattr(response, "parsed", None)
+    id_to_text = parse_structured_batch(parsed if isinstance(parsed, list) else raw, batch_rows)
+    if id_to_text is not None:
+        return id_to_text, False
+    data = parse_json_translation_response(raw)
+    if data is None:
+        return None, False
+    id_to_text = parse_structured_batch(data, batch_rows)
+    return id_to_text, id_to_text is not None
+
+
+class TranslationEngine:
+    """
+    배치 번역 엔진. 한 작업(대상 언어·모델·용어집) 단위로 생성한다.
+    client(GeminiClient)를 주입하지 않으면 create_client(api_key, record_path)로 생성한다.
+    record_path를 주면 호출을 카세트로 녹화하며, 작업이 끝나면 close()로 파일을 닫는다.
+    콜백은 워커 스레드에서 호출되므로, UI 갱신이 필요하면 호출 측에서 메인 스레드로 넘겨야 한다.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        target_lang: str = "English",
+        model: str = AI_MODEL_AUTO,
+        glossary_text: str = "",
+        batch_size: int = BATCH_CHUNK_SIZE,
+        client: Optional[GeminiClient] = None,
+        qa_profile: Optional[QAProfile] = None,
+        record_path: Optional[Path] = None,
+        max_workers: int = 1,
+        avoid_models: Collection[str] = (),
+        model_checked: bool = False,
+    ):
+        self.api_key = api_key
+        self.target_lang = target_lang
+        self.model = model or AI_MODEL_AUTO
+        self.glossary_text = glossary_text or ""
+        self.batch_size = max(1, int(batch_size))
+        # 동시에 요청하는 배치 수 (1 = 기존 순차 처리)
+        self.max_workers = max(1, int(max_workers))
+        # 자동 모델 선택 시 다른 모델이 모두 응답하지 않을 때만 쓸 모델 (예: StatsManager.unhealthy_models())
+        self.avoid_models = frozenset(avoid_models)
+        # 호출 측이 이미 응답을 확인한 모델이면 True — select_model()이 확인 요청 없이 model을 그대로 쓴다 (자동 모드 제외)
+        self.model_checked = bool(model_checked)
+        self._client = client
+        self.record_path = record_path
+        self.qa_profile = qa_profile
+        self.system_instruction = build_system_instruction(self.target_lang, self.glossary_text)
+        self._config: Any = None
+        self._batch_config: Any = None
+        # 마지막 작업의 배치 응답 처리 결과 (BATCH_OUTCOME_KEYS)
+        self.batch_outcomes: Dict[str, int] = dict.fromkeys(BATCH_OUTCOME_KEYS, 0)
+        # 마지막 작업의 배치별 소요 시간(초, 완료 순서) — 폴백 포함
+        self.batch_seconds: List[float] = []
+        # 마지막 작업의 배치별 토큰 사용량(완료 순서, 폴백 호출 포함)과 작업 전체 사용량(모델 확인 호출 포함)
+        self.batch_usage: List[TokenUsage] = []
+        # 마지막 작업에서 중단 오류(429/503/통신 오류)로 끝난 배치 수
+        self.batch_errors = 0
+        self._meter = UsageMeter()
+        # 용어집이 호출마다 시스템 인스트럭션으로 붙는 분량 (프롬프트 토큰 중 용어집 비중 계산용)
+        self.glossary_tokens = estimate_tokens(self.glossary_text)
+        # 배치마다 쓰는 용어집 준수 검사기 (작업 단위로 한 번 컴파일)
+        self.glossary_matcher = GlossaryMatcher(glossary_text_to_dict(self.glossary_text))
+        # 마지막 작업에서 용어집을 지키지 않은 행 → 빠진 원어 목록 (작업 끝 재요청 후에도 남은 것)
+        self.glossary_violations: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def use_auto(self) -> bool:
+        return self.model == AI_MODEL_AUTO
+
+    @property
+    def usage(self) -> TokenUsage:
+        """마지막 작업(translate/shorten)의 토큰 사용량."""
+        return self._meter.usage
+
+    def _get_client(self) -> GeminiClient:
+        if self._client is None:
+            self._client = create_client(self.api_key, self.record_path)
+        return self._client
+
+    def close(self) -> None:
+        """녹화 중이면 카세트 파일을 닫는다."""
+        if isinstance(self._client, RecordingClient):
+            self._client.close()
+
+    def _get_config(self) -> Any:
+        if self._config is None:
+            self._config = _make_config(system_instruction=self.system_instruction)
+        return self._config
+
+    def _get_batch_config(self) -> Any:
+        """배치 요청용: JSON MIME 타입 + 응답 스키마 지정 (모델이 [{id, text}] 배열만 생성)."""
+        if self._batch_config is None:
+            self._batch_config = _make_config(
+                system_instruction=self.system_instruction,
+                response_mime_type="application/json",
+                response_schema=BATCH_RESPONSE_SCHEMA,
+            )
+        return self._batch_config
+
+    def _probe(self, model_name: str) -> bool:
+        try:
+            response = self._get_client().models.generate_content(model=model_name, contents="Hi", config=self._get_config())
+            self._meter.add(response)
+            return True
+        except JobCancelled:
+            return False
+        except Exception:
+            self._meter.add_failed_call()
+            return False
+
+    def select_model(self) -> Optional[str]:
+        """사용할 모델 결정. 자동이면 API 목록 → AI_MODEL_FALLBACKS 순으로 첫 응답 모델. 실패 시 None."""
+        with tracing.span("select_model", auto=self.use_auto) as sp:
+            chosen = self._select_model()
+            sp.set(model=chosen)
+        return chosen
+
+    def _select_model(self) -> Optional[str]:
+        if self.model_checked and not self.use_auto:
+            return self.model
+        client = self._get_client()
+        if not self.use_auto:
+            return self.model if self._probe(self.model) else None
+        candidates: List[str] = []
+        try:
+            for m in client.models.list():
+                name = getattr(m, "name", None) or ""
+                if not name:
+                    continue
+                short_name = name.replace("models/", "", 1) if name.startswith("models/") else name
+                if short_name not in candidates:
+                    candidates.append(short_name)
+        except Exception:
+            pass
+        candidates.extend(name for name in AI_MODEL_FALLBACKS if name not in candidates)
+        # 최근 오류가 잦은 모델은 순서를 유지한 채 맨 뒤로
+        ordered = [n for n in candidates if n not in self.avoid_models] + [n for n in candidates if n in self.avoid_models]
+        for name in ordered:
+            if self._probe(name):
+                return name
+        return None
+
+    def _translate_batch(
+        self,
+        client: Any,
+        config: Any,
+        batch_config: Any,
+        chosen_name: str,
+        rows: List[Dict[str, Any]],
+        batch_indices: List[int],
+        log_callback: Optional[Callable[[str], None]],
+        overflow_callback: Optional[Callable[[str], None]],
+        meter: UsageMeter,
+    ) -> Optional[str]:
+        """
+        배치 1개 번역 (실패 시 1줄씩 폴백) 후 QA. 작업을 중단해야 하는 오류(429/503 등)면 그 메시지, 아니면 None.
+        이 배치의 호출(폴백 포함)별 토큰은 meter에 누적한다.
+        """
+        log = log_callback or (lambda m: None)
+        batch_rows = [rows[i] for i in batch_indices]
+        line_start = batch_rows[0].get("index", batch_indices[0] + 1)
+        line_end = batch_rows[-1].get("index", batch_indices[-1] + 1)
+        with tracing.span("batch", batch=f"{line_start}-{line_end}", model=chosen_name, rows=len(batch_rows)) as batch_span:
+            # JSON 입출력 배치 번역: id 유지로 순번 강제
+            with tracing.span("build_prompt"):
+                user_prompt = build_batch_prompt(batch_rows, self.target_lang)
+
+            batch_ok = False
+            batch_error: Optional[Exception] = None
+            try:
+                with tracing.span("api_call", model=chosen_name) as call_span:
+                    try:
+                        response = client.models.generate_content(
+                            model=chosen_name, contents=user_prompt, config=batch_config
+                        )
+                    except JobCancelled:
+                        raise
+                    except Exception:
+                        meter.add_failed_call()
+                        raise
+                    meter.add(response)
+                    prompt_tokens, output_tokens = usage_tokens(response)
+                    call_span.set(prompt_tokens=prompt_tokens, output_tokens=output_tokens)
+                with tracing.span("parse_response") as parse_span:
+                    id_to_text, repaired = _read_batch_response(response, batch_rows)
+                    parse_span.set(ok=id_to_text is not None, repaired=repaired)
+                if id_to_text is not None:
+                    _apply_id_map(batch_rows, id_to_text)
+                    self._count_outcome("repaired" if repaired else "structured")
+                    batch_ok = True
+            except JobCancelled:
+                # 보내지 않은 요청 — 폴백하지 않고 행을 그대로 둔다
+                batch_span.set(cancelled=True)
+                raise
+            except Exception as e:
+                batch_error = e
+            # 배치 실패 시 단일 번역(1줄씩) 폴백
+            if not batch_ok:
+                if batch_error:
+                    err_msg = str(batch_error)
+                    if _is_quota_error(err_msg):
+                        tracing.instant("quota_exceeded", model=chosen_name)
+                        return QUOTA_EXCEEDED_MESSAGE
+                    if _is_unavailable_error(err_msg):
+                        tracing.instant("unavailable", model=chosen_name)
+                        return f"503_UNAVAILABLE|{chosen_name}"
+                log(f"[경고] 배치 번역 실패 (순번 불일치). 해당 구간(Line {line_start}~{line_end}) 단일 번역으로 재시도합니다.")
+                self._count_outcome("fallback")
+                self._count_outcome("fallback_calls", len(batch_rows))
+                batch_span.set(fallback=True)
+                with tracing.span("fallback", calls=len(batch_rows)):
+                    fallback_ok, fallback_err = translate_chunk_single_fallback(
+                        client, config, chosen_name, batch_rows, self.target_lang, self.system_instruction, log_callback,
+                        meter=meter,
+                    )
+                if not fallback_ok and fallback_err:
+                    return fallback_err
+                for row in batch_rows:
+                    if not (row.get("translated") or "").strip():
+                        row["translated"] = AI_TRANSLATE_ERROR_PLACEHOLDER
+
+            for row in batch_rows:
+                row["provenance"] = PROVENANCE_AI
+            # 빈줄 감지 시 로그
+            empty_count = sum(1 for r in batch_rows if (r.get("translated") or "").strip() == "" or r.get("translated") == AI_TRANSLATE_EMPTY_PLACEHOLDER)
+            if empty_count > 0:
+                log(f"Line {line_start}-{line_end}: 빈 줄 {empty_count}건 감지되어 <빈줄> 처리")
+            # QA 검수: 선택된 QA 기준(줄 길이·CPS·표시 시간 등)·인코딩 깨짐 모두 실시간 로그 출력
+            with tracing.span("qa"):
+                run_qa_checks(batch_rows, log_callback, overflow_callback=overflow_callback, profile=self.qa_profile)
+            # 용어집 준수 검사: 미준수 행은 작업 끝에 한 번에 다시 요청
+            if self.glossary_matcher:
+                with tracing.span("glossary_check") as check_span:
+                    found = self.glossary_matcher.violations(rows, batch_indices)
+                    check_span.set(violations=len(found))
+                if found:
+                    with self._lock:
+                        self.glossary_violations.update(found)
+                    log(f"Line {line_start}-{line_end}: 용어집 미준수 {len(found)}건 — 작업 끝에 다시 요청합니다.")
+        return None
+
+    def _repair_glossary(
+        self,
+        client: Any,
+        batch_config: Any,
+        chosen_name: str,
+        rows: List[Dict[str, Any]],
+        log_callback: Optional[Callable[[str], None]],
+        rows_callback: Optional[Callable[[List[int]], None]],
+    ) -> None:
+        """
+        작업 중 모인 용어집 미준수 행만 GLOSSARY_REPAIR_CHUNK_SIZE행씩 묶어 다시 요청하고, 결과를 다시 검사한다.
+        재요청이 실패해도 작업은 성공으로 두고, 남은 미준수 행은 glossary_violations에 남긴다.
+        """
+        log = log_callback or (lambda m: None)
+        targets = sorted(self.glossary_violations)
+        if not targets:
+            return
+        log(f"용어집 미준수 {len(targets)}건 재요청 (요청 {(len(targets) + GLOSSARY_REPAIR_CHUNK_SIZE - 1) // GLOSSARY_REPAIR_CHUNK_SIZE}회)")
+        with tracing.span("glossary_repair", rows=len(targets)):
+            for start in range(0, len(targets), GLOSSARY_REPAIR_CHUNK_SIZE):
+                chunk = targets[start:start + GLOSSARY_REPAIR_CHUNK_SIZE]
+                batch_rows = [rows[i] for i in chunk]
+                required = {
+                    str(rows[i].get("index", i + 1)): [
+                        (term, self.glossary_matcher.target_for(term)) for term in self.glossary_violations[i]
+                    ]
+                    for i in chunk
+                }
+                prompt = build_glossary_repair_prompt(batch_rows, self.target_lang, required)
+                try:
+                    response = client.models.generate_content(model=chosen_name, contents=prompt, config=batch_config)
+                    self._meter.add(response)
+                except JobCancelled:
+                    log("용어집 재요청 중단 (사용자 중단) — 초안 유지")
+                    break
+                except Exception as e:
+                    self._meter.add_failed_call()
+                    log(f"[경고] 용어집 재요청 실패: {e}")
+                    break
+                id_to_text, _repaired = _read_batch_response(response, batch_rows)
+                if id_to_text is None:
+                    log(f"[경고] 용어집 재요청 응답 순번 불일치 — Line {batch_rows[0].get('index')}~{batch_rows[-1].get('index')} 초안 유지")
+                    continue
+                for row in batch_rows:
+                    text = id_to_text.get(str(row.get("index", "")), "").strip()
+                    if text:
+                        row["translated"] = text
+                if rows_callback is not None:
+                    rows_callback(chunk)
+        remaining = self.glossary_matcher.violations(rows, targets)
+        fixed = len(targets) - len(remaining)
+        self.glossary_violations = remaining
+        log(f"용어집 재요청 결과: {fixed}건 해결, 미준수 {len(remaining)}건 남음")
+
+    def estimate(
+        self,
+        rows: List[Dict[str, Any]],
+        indices: Optional[List[int]] = None,
+        tokens_per_row: Optional[Tuple[float, float]] = None,
+        model: Optional[str] = None,
+    ) -> JobEstimate:
+        """
+        translate() 전 사전 추정 (API 호출 없음).
+        tokens_per_row=(프롬프트, 출력) 과거 평균(StatsManager.get_tokens_per_row)이 있으면 그것으로,
+        없으면 실제로 보낼 배치 프롬프트·시스템 인스트럭션 길이와 원문 길이로 추정한다.
+        model은 비용 단가용 (자동 모드면 호출 측이 예상 모델을 넘긴다).
+        """
+        indices = list(indices) if indices is not None else list(range(len(rows)))
+        total = len(indices)
+        calls = (total + self.batch_size - 1) // self.batch_size
+        if tokens_per_row is not None:
+            prompt_per_row, output_per_row = tokens_per_row
+            usage = TokenUsage(calls, int(round(prompt_per_row * total)), int(round(output_per_row * total)))
+            from_history = True
+        else:
+            system_tokens = estimate_tokens(self.system_instruction)
+            prompt_tokens = output_tokens = 0
+            for start in range(0, total, self.batch_size):
+                batch_rows = [rows[i] for i in indices[start:start + self.batch_size]]
+                prompt_tokens += system_tokens + estimate_tokens(build_batch_prompt(batch_rows, self.target_lang))
+                # 출력: [{"id", "text"}] 배열 — 번역문 길이는 원문과 비슷하다고 가정
+                output_tokens += estimate_tokens(json.dumps(
+                    [{"id": str(r.get("index", "")), "text": r.get("original") or ""} for r in batch_rows],
+                    ensure_ascii=False,
+                ))
+            usage = TokenUsage(calls, prompt_tokens, output_tokens)
+            from_history = False
+        name = model or self.model
+        return JobEstimate(total, usage, estimate_cost(name, usage), from_history)
+
+    def _count_outcome(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self.batch_outcomes[key] += n
+
+    def translate(
+        self,
+        rows: List[Dict[str, Any]],
+        indices: Optional[List[int]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+        overflow_callback: Optional[Callable[[str], None]] = None,
+        batch_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        rows_callback: Optional[Callable[[List[int]], None]] = None,
+        progress: Optional[JobProgress] = None,
+    ) -> TranslationResult:
+        """
+        rows 중 indices(0-based, 없으면 전체) 행을 배치 번역하여 rows[i]["translated"]를 직접 수정.
+        batch_callback(완료 배치 수, 전체 배치 수)·rows_callback(완료된 배치의 행 인덱스)은 배치마다,
+        cancel_check()는 다음 배치 시작 전에 호출. max_workers > 1이면 배치가 끝나는 순서는 뒤섞일 수 있다.
+        progress가 있으면 배치 시작·완료(행 수·토큰·폴백 여부)를 알린다.
+        """
+        self.batch_outcomes = dict.fromkeys(BATCH_OUTCOME_KEYS, 0)
+        self.batch_seconds = []
+        self.batch_usage = []
+        self.batch_errors = 0
+        self.glossary_violations = {}
+        self._meter = UsageMeter()
+        try:
+            indices = list(indices) if indices is not None else list(range(len(rows)))
+            total = len(indices)
+            batch_size = self.batch_size
+            num_batches = (total + batch_size - 1) // batch_size
+            chosen_name = self.select_model()
+            if chosen_name is None:
+                if self.use_auto:
+                    return TranslationResult(False, error="사용 가능한 Gemini 모델을 찾지 못했습니다. API 키와 Google AI Studio 권한을 확인해 주세요.")
+                return TranslationResult(False, error=f"선택한 모델 '{self.model}'을(를) 사용할 수 없습니다.")
+            client = self._get_client()
+            config = self._get_config()
+            batch_config = self._get_batch_config()
+
+            def run(batch_start: int) -> Optional[str]:
+                t0 = time.perf_counter()
+                meter = UsageMeter()
+                batch_indices = indices[batch_start:batch_start + batch_size]
+                batch_id = progress.batch_started(len(batch_indices)) if progress is not None else 0
+                try:
+                    err = self._translate_batch(
+                        client, config, batch_config, chosen_name, rows, batch_indices,
+                        log_callback, overflow_callback, meter,
+                    )
+                except JobCancelled:
+                    # 배치 통계(지연·오류·토큰)에 넣지 않는다 — 폴백 중 취소됐다면 그 전 호출의 토큰만 작업 사용량에 더한다
+                    self._meter.merge(meter.usage)
+                    if progress is not None:
+                        progress.batch_failed(batch_id, meter.usage.total_tokens)
+                    return _BATCH_CANCELLED
+                spent = meter.usage
+                if progress is not None:
+                    if err is not None:
+                        progress.batch_failed(batch_id, spent.total_tokens)
+                    else:
+                        # 배치 안에서 추가 호출이 있었다면 1줄씩 폴백한 것
+                        progress.batch_finished(batch_id, len(batch_indices), spent.total_tokens, fallback=spent.calls > 1)
+                self._meter.merge(spent)
+                with self._lock:
+                    self.batch_seconds.append(time.perf_counter() - t0)
+                    self.batch_usage.append(spent)
+                    if err is not None:
+                        self.batch_errors += 1
+                return err
+
+            def cancel_result(completed_batches: int) -> TranslationResult:
+                completed_rows = min(completed_batches * batch_size, total)
+                first_idx = rows[indices[0]].get("index", 1) if indices else 1
+                last_idx = rows[indices[completed_rows - 1]].get("index", completed_rows) if completed_rows > 0 else 0
+                cancel_info = f"사용자 중단|{chosen_name}|{completed_rows}|{total}|{completed_batches}|{num_batches}|{first_idx}|{last_idx}"
+                return TranslationResult(False, chosen_name, completed_rows, cancel_info)
+
+            def batch_done(batch_idx: int, completed: int) -> None:
+                if rows_callback is not None:
+                    rows_callback(indices[batch_idx * batch_size:(batch_idx + 1) * batch_size])
+                if batch_callback is not None:
+                    batch_callback(completed, num_batches)
+
+            if self.max_workers <= 1 or num_batches <= 1:
+                for batch_idx in range(num_batches):
+                    # 취소 요청이 들어오면 다음 배치부터 중단
+                    if cancel_check is not None and cancel_check():
+                        return cancel_result(batch_idx)
+                    err = run(batch_idx * batch_size)
+                    if err == _BATCH_CANCELLED:
+                        return cancel_result(batch_idx)
+                    if err is not None:
+                        return TranslationResult(False, chosen_name, batch_idx * batch_size, err)
+                    batch_done(batch_idx, batch_idx + 1)
+                self._repair_glossary(client, batch_config, chosen_name, rows, log_callback, rows_callback)
+                return TranslationResult(True, chosen_name, total)
+
+            # 동시 실행: 진행 중 배치를 max_workers개로 제한해 순서대로 제출 → 취소·오류 시 진행 중인 배치만 마무리
+            done_flags = [False] * num_batches
+            first_error: Optional[Tuple[int, str]] = None
+            cancelled = False
+            completed = 0
+            next_batch = 0
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="translate") as pool:
+                pending: Dict[Future, int] = {}
+                while pending or (next_batch < num_batches and first_error is None and not cancelled):
+                    while len(pending) < self.max_workers and next_batch < num_batches and first_error is None and not cancelled:
+                        if cancel_check is not None and cancel_check():
+                            cancelled = True
+                            break
+                        pending[pool.submit(run, next_batch * batch_size)] = next_batch
+                        next_batch += 1
+                    if not pending:
+                        break
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        batch_idx = pending.pop(fut)
+                        err = fut.result()
+                        if err == _BATCH_CANCELLED:
+                            cancelled = True
+                            continue
+                        if err is not None:
+                            if first_error is None or batch_idx < first_error[0]:
+                                first_error = (batch_idx, err)
+                            continue
+                        done_flags[batch_idx] = True
+                        completed += 1
+                        batch_done(batch_idx, completed)
+            # 앞에서부터 연속으로 끝난 배치 수 (재개 위치 안내용)
+            prefix = next((i for i, ok in enumerate(done_flags) if not ok), num_batches)
+            if first_error is not None:
+                return TranslationResult(False, chosen_name, min(prefix * batch_size, total), first_error[1])
+            if cancelled:
+                return cancel_result(prefix)
+            self._repair_glossary(client, batch_config, chosen_name, rows, log_callback, rows_callback)
+            return TranslationResult(True, chosen_name, total)
+        except Exception as e:
+            return TranslationResult(False, error=str(e))
+
+    def shorten(
+        self,
+        rows: List[Dict[str, Any]],
+        indices: List[int],
+        max_chars: int,
+        max_lines: int = 2,
+        log_callback: Optional[Callable[[str], None]] = None,
+    ) -> TranslationResult:
+        """
+        줄 나눔(reflow)으로 해결되지 않은 행(indices, 0-based)의 번역문을 배치 요청으로 줄인다.
+        SHORTEN_CHUNK_SIZE행씩 한 번에 요청하며(행마다 호출하지 않음), 응답이 어긋난 배치는 원문을 유지한다.
+        반환 total = 실제로 줄여진 행 수.
+        """
+        log = log_callback or (lambda m: None)
+        self._meter = UsageMeter()
+        try:
+            chosen_name = self.select_model()
+            if chosen_name is None:
+                return TranslationResult(False, error="사용 가능한 Gemini 모델을 찾지 못했습니다.")
+            client = self._get_client()
+            config = self._get_batch_config()
+            changed = 0
+            for start in range(0, len(indices), SHORTEN_CHUNK_SIZE):
+                batch_rows = [rows[i] for i in indices[start:start + SHORTEN_CHUNK_SIZE]]
+                prompt = build_shorten_prompt(batch_rows, self.target_lang, max_chars, max_lines)
+                try:
+                    response = client.models.generate_content(model=chosen_name, contents=prompt, config=config)
+                    self._meter.add(response)
+                except Exception as e:
+                    self._meter.add_failed_call()
+                    err_msg = str(e)
+                    if _is_quota_error(err_msg):
+                        return TranslationResult(False, chosen_name, changed, QUOTA_EXCEEDED_MESSAGE)
+                    if _is_unavailable_error(err_msg):
+                        return TranslationResult(False, chosen_name, changed, f"503_UNAVAILABLE|{chosen_name}")
+                    return TranslationResult(False, chosen_name, changed, f"통신 오류: {err_msg}")
+                id_to_text, _repaired = _read_batch_response(response, batch_rows)
+                if id_to_text is None:
+                    log(f"[경고] 줄이기 응답 순번 불일치 — Line {batch_rows[0].get('index')}~{batch_rows[-1].get('index')} 원문 유지")
+                    continue
+                for row in batch_rows:
+                    text = id_to_text.get(str(row.get("index", "")), "").strip()
+                    if not text:
+                        continue
+                    # 모델이 한 줄로 돌려준 경우에도 로컬 줄 나눔을 다시 적용
+                    row["translated"] = reflow_text(text, max_chars, max_lines) or text
+                    row["provenance"] = PROVENANCE_AI
+                    changed += 1
+            run_qa_checks([rows[i] for i in indices], log_callback, profile=self.qa_profile)
+            return TranslationResult(True, chosen_name, changed)
+        except Exception as e:
+            return TranslationResult(False, error=str(e))
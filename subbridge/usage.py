@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+토큰 사용량 집계와 비용 계산.
+응답의 usage_metadata(프롬프트/출력 토큰)를 배치·작업 단위로 모으고, MODEL_PRICING 단가로 비용을 환산한다.
+사용 기록이 없을 때의 사전 추정은 estimate_tokens()의 바이트 기반 근사치를 쓴다.
+"""
+
+import threading
+from typing import Any, NamedTuple, Optional, Tuple
+
+from .constants import MODEL_PRICING
+
+
+class TokenUsage(NamedTuple):
+    """API 호출 수와 프롬프트/출력 토큰 합계."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.output_tokens
+
+    def plus(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            self.calls + other.calls,
+            self.prompt_tokens + other.prompt_tokens,
+            self.output_tokens + other.output_tokens,
+        )
+
+
+class JobEstimate(NamedTuple):
+    """작업 시작 전 추정치. from_history=False면 과거 기록 없이 텍스트 길이로만 추정한 값."""
+
+    rows: int
+    usage: TokenUsage
+    cost_usd: Optional[float]
+    from_history: bool
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (Gemini 기준 약 4바이트당 1토큰, UTF-8 기준)."""
+    if not text:
+        return 0
+    return max(1, (len(text.encode("utf-8")) + 3) // 4)
+
+
+def usage_tokens(response: Any) -> Tuple[int, int]:
+    """응답의 (프롬프트 토큰, 출력 토큰). usage_metadata가 없으면 (0, 0)."""
+    meta = getattr(response, "usage_metadata", None)
+    if meta is None:
+        return (0, 0)
+    return (int(getattr(meta, "prompt_token_count", 0) or 0), int(getattr(meta, "candidates_token_count", 0) or 0))
+
+
+def estimate_cost(model: str, usage: TokenUsage) -> Optional[float]:
+    """MODEL_PRICING 기준 비용(USD). 단가를 모르는 모델이면 None."""
+    price = MODEL_PRICING.get(model or "")
+    if price is None:
+        return None
+    input_per_m, output_per_m = price
+    return (usage.prompt_tokens * input_per_m + usage.output_tokens * output_per_m) / 1_000_000
+
+
+def format_usage(usage: TokenUsage, cost_usd: Optional[float] = None) -> str:
+    """로그·대화상자용 한 줄 요약 (예: "호출 12회, 토큰 8,400 (프롬프트 6,000 / 출력 2,400), 약 $0.0079")."""
+    text = (
+        f"호출 {usage.calls:,}회, 토큰 {usage.total_tokens:,} "
+        f"(프롬프트 {usage.prompt_tokens:,} / 출력 {usage.output_tokens:,})"
+    )
+    if cost_usd is not None:
+        text += f", 약 ${cost_usd:.4f}"
+    return text
+
+
+class UsageMeter:
+    """응답을 받을 때마다 add(response)로 누적하는 집계기 (스레드 안전)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._usage = TokenUsage()
+
+    def add(self, response: Any) -> None:
+        prompt, output = usage_tokens(response)
+        self.merge(TokenUsage(1, prompt, output))
+
+    def add_failed_call(self) -> None:
+        """응답 없이 실패한 호출 (토큰은 알 수 없으므로 호출 수만)."""
+        self.merge(TokenUsage(1, 0, 0))
+
+    def merge(self, usage: TokenUsage) -> None:
+        with self._lock:
+            self._usage = self._usage.plus(usage)
+
+    @property
+    def usage(self) -> TokenUsage:
+        with self._lock:
+            return self._usage
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+SRT/TXT 스트리밍 저장.
+전체 출력을 한 문자열로 합치지 않고 chunk_rows행 단위 조각으로 파일에 바로 쓰며,
+같은 폴더의 임시 파일에 기록한 뒤 os.replace로 교체한다 (중간 실패 시 기존 파일 보존).
+공유 상태가 없으므로 여러 언어를 동시에(스레드별로) 내보내도 안전하다.
+"""
+
+import os
+import stat
+import tempfile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .align import format_id_line
+from .timecode import row_timecode
+
+# 한 번에 파일에 쓰는 행 수 (추가 메모리는 이 크기의 조각 하나로 고정)
+WRITE_CHUNK_ROWS = 2000
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# 시작 시 한 번만 읽는다 (os.umask는 프로세스 전체 설정이라 스레드마다 바꿔 읽으면 서로 덮어쓴다)
+_UMASK = _read_umask()
+
+
+def _target_mode(path: str) -> int:
+    """교체할 파일의 권한. 파일이 없으면 일반 open()과 같은 0o666 & ~umask (mkstemp의 0600이 결과에 남지 않게)."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _srt_piece(r: Dict[str, Any]) -> str:
+    trans = (r.get("translated", "") or "").replace("<br/>", "\n")
+    return f"{r['index']}\n{row_timecode(r)}\n{trans}\n\n"
+
+
+def iter_srt_chunks(rows: List[Dict[str, Any]], chunk_rows: int = WRITE_CHUNK_ROWS) -> Iterator[str]:
+    """
+    병합 SRT를 조각 단위로 생성. 조각을 모두 이으면 build_srt_from_merged()와 동일
+    (마지막 행의 끝 공백·빈 줄은 제거).
+    """
+    total = len(rows)
+    for start in range(0, total, chunk_rows):
+        end = min(start + chunk_rows, total)
+        chunk = "".join(_srt_piece(rows[i]) for i in range(start, end))
+        yield chunk.rstrip() if end == total else chunk
+
+
+def iter_txt_chunks(
+    rows: List[Dict[str, Any]], field: str = "original", chunk_rows: int = WRITE_CHUNK_ROWS, with_ids: bool = False
+) -> Iterator[str]:
+    """
+    행의 field 값을 한 줄씩 조각 단위로 생성. 조각을 모두 이으면 extract_text_lines()와 동일 (마지막 줄바꿈 없음).
+    with_ids=True면 줄마다 "[[순번]] " 고정 ID를 붙인다 (외부 도구를 거쳐도 align.split_id_lines()로 위치와 무관하게 매칭).
+    """
+    total = len(rows)
+    for start in range(0, total, chunk_rows):
+        end = min(start + chunk_rows, total)
+        if with_ids:
+            chunk = "\n".join(format_id_line(rows[i].get("index", ""), rows[i].get(field, "") or "") for i in range(start, end))
+        else:
+            chunk = "\n".join(rows[i].get(field, "") or "" for i in range(start, end))
+        yield chunk if end == total else chunk + "\n"
+
+
+def write_chunks_atomic(
+    path: str,
+    chunks: Iterable[str],
+    encoding: str = "utf-8",
+    total_rows: int = 0,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> None:
+    """
+    chunks를 path 옆 임시 파일에 차례로 기록한 뒤 os.replace로 교체. 권한은 기존 파일(없으면 umask 기본값)을 따른다.
+    progress_callback(완료 행 수, 전체 행 수)는 조각마다 호출. 실패 시 임시 파일을 지우고 예외를 다시 발생시킨다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            done = 0
+            for chunk in chunks:
+                f.write(chunk)
+                done = min(done + chunk_rows, total_rows)
+                if progress_callback is not None:
+                    progress_callback(done, total_rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_srt(
+    path: str,
+    rows: List[Dict[str, Any]],
+    encoding: str = "utf-8-sig",
+    progress_callback: Optional[ProgressCallback] = None,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
+) -> None:
+    """병합 SRT(타임코드 + 번역)를 스트리밍·원자적으로 저장."""
+    write_chunks_atomic(
+        path, iter_srt_chunks(rows, chunk_rows), encoding, len(rows), chunk_rows, progress_callback
+    )
+
+
+def write_txt(
+    path: str,
+    rows: List[Dict[str, Any]],
+    field: str = "original",
+    encoding: str = "utf-8",
+    progress_callback: Optional[ProgressCallback] = None,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
+    with_ids: bool = False,
+) -> None:
+    """행의 field(기본: 원본) 텍스트를 블록당 한 줄로 스트리밍·원자적으로 저장. with_ids=True면 줄마다 [[순번]] ID."""
+    write_chunks_atomic(
+        path, iter_txt_chunks(rows, field, chunk_rows, with_ids), encoding, len(rows), chunk_rows, progress_callback
+    )
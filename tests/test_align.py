@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""align_translation_lines 회귀 테스트."""
+
+from subbridge.align import ALIGN_BAND, align_translation_lines
+
+
+def test_no_blocks_with_more_lines_than_band():
+    # 블록이 없으면 띠가 (0, m)에 닿지 않아 역추적에서 IndexError가 났다
+    lines = ["x"] * (ALIGN_BAND * 2 + 20)
+    result = align_translation_lines([], lines)
+    assert result.lines == []
+    assert result.confidence == []
+    assert result.extra_lines == list(range(len(lines)))
+
+
+def test_no_blocks_no_lines():
+    result = align_translation_lines([], [])
+    assert result.lines == [] and result.extra_lines == []
+
+
+def test_missing_line_is_detected():
+    blocks = [{"index": i + 1, "original": f"line number {i} with some words"} for i in range(60)]
+    lines = [f"ligne numéro {i} avec des mots" for i in range(60)]
+    del lines[30]
+    result = align_translation_lines(blocks, lines)
+    assert result.method == "dp"
+    assert len(result.lines) == 60
+    assert result.lines[0] == lines[0] and result.lines[-1] == lines[-1]
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""FakeGeminiClient로 번역 파이프라인을 오프라인 검증 (배치 응답 오류 주입 · 여러 언어 팬아웃)."""
+
+import copy
+
+import pytest
+
+from subbridge.fake_client import FakeGeminiClient, FaultRates
+from subbridge.fanout import FanoutTarget, merged_srt_name, translate_fanout
+from subbridge.srt import parse_srt
+from subbridge.translation import TranslationEngine
+
+MODEL = "gemini-2.5-flash"
+
+
+def _rows(n: int):
+    return [
+        {
+            "index": i + 1,
+            "timecode": f"00:00:{i % 60:02d},000 --> 00:00:{i % 60:02d},500",
+            "original": f"line {i}",
+            "translated": "",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_translate_with_batch_faults(seed):
+    rows = _rows(95)
+    client = FakeGeminiClient(seed=seed, latency_sigma=0.0, faults=FaultRates(malformed=0.2, short=0.2, split_br=0.2))
+    engine = TranslationEngine(client=client, model=MODEL, batch_size=10)
+    result = engine.translate(rows)
+
+    assert result.success and result.total == len(rows)
+    # 구조화·보정·1줄씩 폴백 어느 경로든 모든 행이 제 번역을 받는다
+    assert [r["translated"] for r in rows] == [f"[English] line {i}" for i in range(len(rows))]
+    # 배치마다 결과 하나, 폴백 호출은 폴백한 배치의 행 수만큼
+    outcomes = engine.batch_outcomes
+    assert outcomes["structured"] + outcomes["repaired"] + outcomes["fallback"] == 10
+    assert outcomes["fallback"] <= outcomes["fallback_calls"] <= outcomes["fallback"] * 10
+    # 모델 확인 1회 + 배치 10회 + 폴백 행마다 1회
+    assert client.usage["calls"] == 1 + 10 + outcomes["fallback_calls"]
+
+
+def test_fanout_writes_each_language(tmp_path):
+    rows = _rows(25)
+    before = copy.deepcopy(rows)
+    targets = [FanoutTarget("EN", "English"), FanoutTarget("JA", "日本語")]
+    result = translate_fanout(
+        rows, targets, tmp_path, "video", client=FakeGeminiClient(seed=1, latency_sigma=0.0), model=MODEL
+    )
+
+    assert result.error is None and not result.cancelled
+    assert rows == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(merged_srt_name("video", t.code, MODEL) for t in targets)
+    for lang in result.languages:
+        assert lang.result.success and lang.path is not None
+        blocks = parse_srt(lang.path.read_text(encoding="utf-8-sig"))
+        assert [b["original"] for b in blocks] == [f"[{lang.target.target_lang}] line {i}" for i in range(len(rows))]
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""배치 응답 해석(_read_batch_response) 회귀 테스트."""
+
+import json
+
+from subbridge.fake_client import FakeResponse
+from subbridge.translation import _read_batch_response
+
+ROWS = [{"index": 1, "original": "a"}, {"index": 2, "original": "b"}]
+
+
+def test_structured_response():
+    out = [{"id": "1", "text": "A"}, {"id": "2", "text": "B"}]
+    assert _read_batch_response(FakeResponse(json.dumps(out), parsed=out), ROWS) == ({"1": "A", "2": "B"}, False)
+
+
+def test_code_fence_is_repaired_with_same_schema():
+    out = [{"id": "1", "text": "A"}, {"id": "2", "text": "B"}]
+    response = FakeResponse("```json\n" + json.dumps(out) + "\n```")
+    assert _read_batch_response(response, ROWS) == ({"1": "A", "2": "B"}, True)
+
+
+def test_loose_keys_go_to_fallback():
+    # 키 별칭(id_ / translated)은 스키마 위반 — 추정해 반영하지 않고 1줄씩 폴백한다
+    out = [{"id_": "1", "translated": "A"}, {"id_": "2", "translated": "B"}]
+    assert _read_batch_response(FakeResponse("```json\n" + json.dumps(out) + "\n```"), ROWS) == (None, False)
+
+
+def test_id_mismatch_goes_to_fallback():
+    out = [{"id": "1", "text": "A"}, {"id": "3", "text": "B"}]
+    assert _read_batch_response(FakeResponse(json.dumps(out)), ROWS) == (None, False)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""write_chunks_atomic 권한 회귀 테스트."""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from subbridge.writer import write_txt
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX 권한 비트")
+
+ROWS = [{"index": 1, "original": "a"}, {"index": 2, "original": "b"}]
+
+
+def _mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_new_file_uses_umask_default(tmp_path):
+    # mkstemp의 0600이 결과 파일에 남으면 안 된다
+    path = tmp_path / "out.txt"
+    write_txt(str(path), ROWS)
+    mask = os.umask(0)
+    os.umask(mask)
+    assert _mode(path) == 0o666 & ~mask
+
+
+def test_existing_file_keeps_mode(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("old", encoding="utf-8")
+    os.chmod(path, 0o640)
+    write_txt(str(path), ROWS)
+    assert _mode(path) == 0o640
+    assert path.read_text(encoding="utf-8") == "a\nb"